@@ -19,6 +19,8 @@ from astraguard.swarm.types import (
     SwarmMessage,
     SwarmTopic,
     QoSLevel,
+    OverflowPolicy,
+    TrafficClass,
     TopicFilter,
     SubscriptionID,
     MessageAck,
@@ -30,16 +32,31 @@ from astraguard.swarm.types import (
     ActionCompleted,
 )
 from astraguard.swarm.bus import SwarmMessageBus
+from astraguard.swarm.dedup import DedupWindow
+from astraguard.swarm.coalescer import FrameCoalescer, CoalescingStats
+from astraguard.swarm.scheduler import OutboundScheduler, TrafficClassStats
+from astraguard.swarm.transport import (
+    Transport,
+    InProcessHub,
+    InProcessTransport,
+    DatagramTransport,
+    LinkModel,
+    TransportStats,
+)
 from astraguard.swarm.compressor import StateCompressor, CompressionStats
-from astraguard.swarm.registry import SwarmRegistry, PeerState
+from astraguard.swarm.digests import BloomFilter, MerkleDigest, PartitionedBloomFilter
+from astraguard.swarm.observed import ObservedDict, ObservedFields
+from astraguard.swarm.registry import SwarmRegistry, PeerState, ConstellationAggregates
 from astraguard.swarm.health_broadcaster import HealthBroadcaster, BroadcastMetrics
+from astraguard.swarm.interval_tree import IntervalTree
 from astraguard.swarm.intent_broadcaster import IntentBroadcaster, IntentStats
+from astraguard.swarm.sliding_window import TimerWheel, ReceiveBitmap
 from astraguard.swarm.reliable_delivery import ReliableDelivery, SentMsg, DeliveryStats, AckStatus
 from astraguard.swarm.bandwidth_governor import BandwidthGovernor, TokenBucket, MessagePriority, BandwidthStats
 from astraguard.swarm.leader_election import LeaderElection, ElectionState, ElectionMetrics
 from astraguard.swarm.consensus import ConsensusEngine, ProposalRequest, ProposalState, ConsensusMetrics, NotLeaderError
 from astraguard.swarm.policy_arbiter import PolicyArbiter, PolicyArbiterMetrics, ConflictResolution
-from astraguard.swarm.action_propagator import ActionPropagator, ActionState, ActionPropagatorMetrics
+from astraguard.swarm.action_propagator import ActionPropagator, ActionState, ActionPropagatorMetrics, AgentIndex
 from astraguard.swarm.response_orchestrator import (
     SwarmResponseOrchestrator,
     LegacyResponseOrchestrator,
@@ -59,6 +76,8 @@ __all__ = [
     "SwarmMessage",
     "SwarmTopic",
     "QoSLevel",
+    "OverflowPolicy",
+    "TrafficClass",
     "TopicFilter",
     "SubscriptionID",
     "MessageAck",
@@ -70,23 +89,45 @@ __all__ = [
     "ActionScope",
     # Message bus (Issue #398)
     "SwarmMessageBus",
+    "DedupWindow",
+    "FrameCoalescer",
+    "CoalescingStats",
+    "OutboundScheduler",
+    "TrafficClassStats",
+    "Transport",
+    "InProcessHub",
+    "InProcessTransport",
+    "DatagramTransport",
+    "LinkModel",
+    "TransportStats",
     # Compression (Issue #399)
     "StateCompressor",
     "CompressionStats",
+    # Anti-entropy digests (Issue #410)
+    "BloomFilter",
+    "MerkleDigest",
+    "PartitionedBloomFilter",
+    # Observed containers for self-indexing state
+    "ObservedDict",
+    "ObservedFields",
     # Registry (Issue #400)
     "SwarmRegistry",
     "PeerState",
+    "ConstellationAggregates",
     # Health Broadcasting (Issue #401)
     "HealthBroadcaster",
     "BroadcastMetrics",
     # Intent Broadcasting (Issue #402)
     "IntentBroadcaster",
     "IntentStats",
+    "IntervalTree",
     # Reliable Delivery (Issue #403)
     "ReliableDelivery",
     "SentMsg",
     "DeliveryStats",
     "AckStatus",
+    "TimerWheel",
+    "ReceiveBitmap",
     # Bandwidth Governor (Issue #404)
     "BandwidthGovernor",
     "TokenBucket",
@@ -110,6 +151,7 @@ __all__ = [
     "ActionPropagator",
     "ActionState",
     "ActionPropagatorMetrics",
+    "AgentIndex",
     "ActionCommand",
     "ActionCompleted",
     # Response Orchestrator (Issue #412)
@@ -17,6 +17,14 @@ Algorithm:
    - If compliance < 90% at deadline: mark agents for escalation (#409)
 5. Real-time dashboard shows per-agent and constellation-wide compliance
 
+Bookkeeping:
+  - Agents get dense integer indices (AgentIndex); each action tracks its
+    target/completed/failed/escalated agents as int bitsets, so compliance
+    and "all responded" checks are popcounts
+  - Per-agent reverse indexes answer "which actions is agent X behind on /
+    escalated for" without scanning pending actions
+  - Completions wake the waiting propagate_action() immediately
+
 Example:
   Broadcast safe_mode to 10 agents with 30s deadline
   At 25s: 9 agents complete → 90% compliance
@@ -24,9 +32,10 @@ Example:
   Real-time dashboard: [9/10] 90% green, 1 red (non-compliant)
 """
 
+from collections.abc import MutableSet
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Dict, Set, Optional, List
+from typing import Callable, Dict, Iterable, Iterator, Set, Optional, List, Union
 import asyncio
 import uuid
 
@@ -36,32 +45,214 @@ from astraguard.swarm.leader_election import LeaderElection
 from astraguard.swarm.registry import SwarmRegistry
 from astraguard.swarm.bus import SwarmMessageBus
 from astraguard.swarm.consensus import NotLeaderError
+from astraguard.swarm.observed import ObservedDict, ObservedFields
 
 
-@dataclass
-class ActionState:
+try:
+    _popcount = int.bit_count  # Python 3.10+
+except AttributeError:  # pragma: no cover
+    def _popcount(mask: int) -> int:
+        return bin(mask).count("1")
+
+
+def _bits(mask: int) -> Iterator[int]:
+    """Indices of set bits, lowest first."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class AgentIndex:
+    """Dense integer indices for satellite serials (append-only).
+
+    Example:
+        >>> index = AgentIndex()
+        >>> index.mask(["SAT-001", "SAT-002"])
+        3
+        >>> list(index.serials(2))
+        ['SAT-002']
+    """
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._serials: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self._serials)
+
+    def id(self, serial: str) -> int:
+        """Index of serial, assigning the next free one if new."""
+        index = self._ids.get(serial)
+        if index is None:
+            index = self._ids[serial] = len(self._serials)
+            self._serials.append(serial)
+        return index
+
+    def get(self, serial: str) -> Optional[int]:
+        """Index of serial, or None if never seen."""
+        return self._ids.get(serial)
+
+    def serial(self, index: int) -> str:
+        return self._serials[index]
+
+    def mask(self, serials: Iterable[str]) -> int:
+        """Bitset of serials."""
+        mask = 0
+        for serial in serials:
+            mask |= 1 << self.id(serial)
+        return mask
+
+    def serials(self, mask: int) -> Iterator[str]:
+        """Serials whose bits are set in mask."""
+        for index in _bits(mask):
+            yield self._serials[index]
+
+
+class _SerialSet(MutableSet):
+    """Live set-of-serials view over one of an ActionState's bitsets."""
+
+    __slots__ = ("_state", "_attr")
+
+    def __init__(self, state: "ActionState", attr: str):
+        self._state = state
+        self._attr = attr
+
+    @classmethod
+    def _from_iterable(cls, it):
+        return set(it)
+
+    def __contains__(self, serial) -> bool:
+        index = self._state.agent_index.get(serial)
+        return index is not None and bool(getattr(self._state, self._attr) >> index & 1)
+
+    def __iter__(self) -> Iterator[str]:
+        return self._state.agent_index.serials(getattr(self._state, self._attr))
+
+    def __len__(self) -> int:
+        return _popcount(getattr(self._state, self._attr))
+
+    def add(self, serial: str) -> None:
+        bit = 1 << self._state.agent_index.id(serial)
+        setattr(self._state, self._attr, getattr(self._state, self._attr) | bit)
+
+    def discard(self, serial: str) -> None:
+        index = self._state.agent_index.get(serial)
+        if index is not None:
+            setattr(self._state, self._attr, getattr(self._state, self._attr) & ~(1 << index))
+
+    def update(self, *others: Iterable[str]) -> None:
+        mask = 0
+        for serials in others:
+            mask |= self._state.agent_index.mask(serials)
+        setattr(self._state, self._attr, getattr(self._state, self._attr) | mask)
+
+    def difference_update(self, *others: Iterable[str]) -> None:
+        for serials in others:
+            for serial in serials:
+                self.discard(serial)
+
+    def copy(self) -> Set[str]:
+        return set(self)
+
+    def __repr__(self) -> str:
+        return repr(set(self))
+
+
+@dataclass(init=False)
+class ActionState(ObservedFields):
     """Tracks state of a propagated action.
     
+    Agents are tracked as bitsets over agent_index; completed_agents,
+    failed_agents and escalated_agents are live set-of-serial views of
+    those bitsets and may still be passed to the constructor. Bitset
+    assignments are reported to the owning propagator.
+    
     Attributes:
         action_id: Unique action identifier
         action: Action type (e.g., "safe_mode", "attitude_adjust")
         target_agents: List of agents that must execute
         deadline: Absolute deadline datetime
-        completed_agents: Set of agent IDs that completed successfully
-        failed_agents: Set of agent IDs that failed
-        escalated_agents: Set of agents marked for escalation
         priority: Action priority level
         timestamp: When action was issued
+        agent_index: Serial → bit index (shared by a propagator's actions)
+        target_mask: Bitset of target agents
+        completed_mask: Bitset of agents that completed successfully
+        failed_mask: Bitset of agents that failed
+        escalated_mask: Bitset of agents marked for escalation
     """
+
+    _observed_fields = frozenset({"target_mask", "completed_mask", "failed_mask", "escalated_mask"})
+
     action_id: str
     action: str
     target_agents: List[AgentID]
     deadline: datetime
-    completed_agents: Set[str] = field(default_factory=set)  # Store as serial strings
-    failed_agents: Set[str] = field(default_factory=set)
-    escalated_agents: Set[str] = field(default_factory=set)
     priority: PriorityEnum = PriorityEnum.SAFETY
     timestamp: datetime = field(default_factory=datetime.utcnow)
+    agent_index: AgentIndex = field(default_factory=AgentIndex, repr=False, compare=False)
+    target_mask: int = field(init=False, default=0)
+    completed_mask: int = field(init=False, default=0)
+    failed_mask: int = field(init=False, default=0)
+    escalated_mask: int = field(init=False, default=0)
+    _listener: Optional[Callable[["ActionState", str, int], None]] = field(
+        init=False, default=None, repr=False, compare=False
+    )
+
+    def __init__(
+        self,
+        action_id: str,
+        action: str,
+        target_agents: List[AgentID],
+        deadline: datetime,
+        completed_agents: Iterable[str] = (),
+        failed_agents: Iterable[str] = (),
+        escalated_agents: Iterable[str] = (),
+        priority: PriorityEnum = PriorityEnum.SAFETY,
+        timestamp: Optional[datetime] = None,
+        agent_index: Optional[AgentIndex] = None,
+    ):
+        self._listener = None
+        self.action_id = action_id
+        self.action = action
+        self.target_agents = target_agents
+        self.deadline = deadline
+        self.priority = priority
+        self.timestamp = timestamp or datetime.utcnow()
+        self.agent_index = agent_index if agent_index is not None else AgentIndex()
+        self.target_mask = self.agent_index.mask(
+            agent.satellite_serial for agent in target_agents
+        )
+        self.completed_mask = self.agent_index.mask(completed_agents)
+        self.failed_mask = self.agent_index.mask(failed_agents)
+        self.escalated_mask = self.agent_index.mask(escalated_agents)
+
+    @property
+    def completed_agents(self) -> Set[str]:
+        """Serials that completed successfully (live view)."""
+        return _SerialSet(self, "completed_mask")
+
+    @completed_agents.setter
+    def completed_agents(self, serials: Iterable[str]) -> None:
+        self.completed_mask = self.agent_index.mask(serials)
+
+    @property
+    def failed_agents(self) -> Set[str]:
+        """Serials that failed (live view)."""
+        return _SerialSet(self, "failed_mask")
+
+    @failed_agents.setter
+    def failed_agents(self, serials: Iterable[str]) -> None:
+        self.failed_mask = self.agent_index.mask(serials)
+
+    @property
+    def escalated_agents(self) -> Set[str]:
+        """Serials marked for escalation (live view)."""
+        return _SerialSet(self, "escalated_mask")
+
+    @escalated_agents.setter
+    def escalated_agents(self, serials: Iterable[str]) -> None:
+        self.escalated_mask = self.agent_index.mask(serials)
 
     @property
     def compliance_percent(self) -> float:
@@ -71,14 +262,22 @@ class ActionState:
         """
         if not self.target_agents:
             return 100.0
-        return (len(self.completed_agents) / len(self.target_agents)) * 100.0
+        return (_popcount(self.completed_mask) / len(self.target_agents)) * 100.0
+
+    @property
+    def remaining_mask(self) -> int:
+        """Bitset of targets that haven't completed or failed."""
+        return self.target_mask & ~(self.completed_mask | self.failed_mask)
 
     @property
     def remaining_agents(self) -> Set[str]:
         """Get agents that haven't completed or failed."""
-        target_serials = {agent.satellite_serial for agent in self.target_agents}
-        completed_or_failed = self.completed_agents | self.failed_agents
-        return target_serials - completed_or_failed
+        return set(self.agent_index.serials(self.remaining_mask))
+
+    @property
+    def all_responded(self) -> bool:
+        """True once every target has completed or failed."""
+        return not self.remaining_mask
 
     def to_dict(self) -> dict:
         """Serialize to dict."""
@@ -87,8 +286,8 @@ class ActionState:
             "action": self.action,
             "target_agents": len(self.target_agents),
             "deadline": self.deadline.isoformat(),
-            "completed_agents": len(self.completed_agents),
-            "failed_agents": len(self.failed_agents),
+            "completed_agents": _popcount(self.completed_mask),
+            "failed_agents": _popcount(self.failed_mask),
             "escalated_agents": list(self.escalated_agents),
             "compliance_percent": self.compliance_percent,
             "priority": self.priority.name,
@@ -118,6 +317,24 @@ class ActionPropagatorMetrics:
         }
 
 
+class _PendingActions(ObservedDict):
+    """action_id → ActionState dict that keeps the propagator's reverse indexes current."""
+
+    reorder_on_write = True
+
+    def __init__(self, propagator: "ActionPropagator"):
+        super().__init__()
+        self._propagator = propagator
+
+    def _on_set(self, action_id: str, state: ActionState, previous: Optional[ActionState]) -> None:
+        if previous is not None:
+            self._propagator._on_action_removed(action_id, previous)
+        self._propagator._on_action_added(action_id, state)
+
+    def _on_delete(self, action_id: str, state: ActionState) -> None:
+        self._propagator._on_action_removed(action_id, state)
+
+
 class ActionPropagator:
     """Propagates actions across constellation with compliance tracking.
     
@@ -133,6 +350,7 @@ class ActionPropagator:
         registry: SwarmRegistry instance (#400)
         bus: SwarmMessageBus instance (#398)
         pending_actions: Dict mapping action_id → ActionState
+        agent_index: Dense agent indices shared by all tracked actions
         metrics: ActionPropagatorMetrics for monitoring
     """
 
@@ -159,10 +377,16 @@ class ActionPropagator:
         self.election = election
         self.registry = registry
         self.bus = bus
-        self.pending_actions: Dict[str, ActionState] = {}
+        self.agent_index = AgentIndex()
         self.metrics = ActionPropagatorMetrics()
         self._completion_events: Dict[str, asyncio.Event] = {}
 
+        # Per-agent reverse indexes: agent index → action_ids
+        self._behind: Dict[int, Set[str]] = {}
+        self._escalated: Dict[int, Set[str]] = {}
+        self._remaining_masks: Dict[str, int] = {}  # action_id → indexed remaining bitset
+        self.pending_actions: Dict[str, ActionState] = _PendingActions(self)
+
     async def start(self):
         """Start listening for action completion messages."""
         if not hasattr(self, '_is_running'):
@@ -231,10 +455,12 @@ class ActionPropagator:
             target_agents=target_agents,
             deadline=deadline,
             priority=priority,
+            agent_index=self.agent_index,
         )
         
-        # Store action state
+        # Store action state; completions may arrive while broadcasting
         self.pending_actions[action_id] = action_state
+        self._completion_events[action_id] = asyncio.Event()
         self.metrics.action_count += 1
         
         # Create action command
@@ -255,9 +481,6 @@ class ActionPropagator:
             qos=2,  # Reliable delivery via #403
         )
         
-        # Create event for completion notification
-        self._completion_events[action_id] = asyncio.Event()
-        
         # Wait for completions or timeout
         try:
             await asyncio.wait_for(
@@ -280,22 +503,16 @@ class ActionPropagator:
             action_id: Action to wait for
             timeout_seconds: Seconds to wait
         """
-        # Check periodically for completions
-        start_time = datetime.utcnow()
-        deadline = start_time + timedelta(seconds=timeout_seconds)
-        
-        while datetime.utcnow() < deadline:
-            action_state = self.pending_actions.get(action_id)
-            if not action_state:
-                break
-            
-            # Check if all agents completed or failed
-            total_responses = len(action_state.completed_agents) + len(action_state.failed_agents)
-            if total_responses >= len(action_state.target_agents):
-                break
-            
-            # Wait a bit before checking again
-            await asyncio.sleep(0.5)
+        action_state = self.pending_actions.get(action_id)
+        if not action_state or action_state.all_responded:
+            return
+        
+        # _handle_action_completed sets the event once every target responded
+        event = self._completion_events.setdefault(action_id, asyncio.Event())
+        try:
+            await asyncio.wait_for(event.wait(), timeout=timeout_seconds)
+        except asyncio.TimeoutError:
+            pass
 
     async def _handle_action_completed(self, message: dict):
         """Handle ActionCompleted message from agent.
@@ -314,15 +531,16 @@ class ActionPropagator:
             return  # Action not found or already processed
         
         # Record completion
-        agent_serial = completion.agent_id.satellite_serial
+        bit = 1 << action_state.agent_index.id(completion.agent_id.satellite_serial)
         if completion.status == "success":
-            action_state.completed_agents.add(agent_serial)
+            action_state.completed_mask |= bit
         else:
-            action_state.failed_agents.add(agent_serial)
+            action_state.failed_mask |= bit
         
-        # Notify waiters
-        if completion.action_id in self._completion_events:
-            self._completion_events[completion.action_id].set()
+        # Wake the waiter as soon as every target has responded
+        event = self._completion_events.get(completion.action_id)
+        if event is not None and action_state.all_responded:
+            event.set()
 
     async def _evaluate_compliance(self, action_id: str):
         """Evaluate compliance and escalate if needed.
@@ -344,13 +562,13 @@ class ActionPropagator:
         # Check compliance threshold
         if compliance < (self.COMPLIANCE_THRESHOLD * 100):
             # Identify non-compliant agents
-            non_compliant = action_state.remaining_agents | action_state.failed_agents
-            action_state.escalated_agents = non_compliant
-            self.metrics.escalation_count += len(non_compliant)
+            non_compliant = action_state.remaining_mask | action_state.failed_mask
+            action_state.escalated_mask = non_compliant
+            self.metrics.escalation_count += _popcount(non_compliant)
         
         # Update metrics
-        self.metrics.completed_count += len(action_state.completed_agents)
-        self.metrics.failed_count += len(action_state.failed_agents)
+        self.metrics.completed_count += _popcount(action_state.completed_mask)
+        self.metrics.failed_count += _popcount(action_state.failed_mask)
 
     def get_compliance_status(self, action_id: str) -> Optional[Dict]:
         """Get compliance status for action.
@@ -386,7 +604,82 @@ class ActionPropagator:
         if not action_state:
             return set()
         
-        return action_state.escalated_agents.copy()
+        return set(action_state.escalated_agents)
+
+    def get_actions_behind(self, agent: Union[AgentID, str]) -> Set[str]:
+        """Get pending actions the agent is a target of but hasn't answered.
+        
+        Args:
+            agent: AgentID or satellite serial
+        
+        Returns:
+            Set of action_ids
+        """
+        index = self._agent_key(agent)
+        return set(self._behind.get(index, ())) if index is not None else set()
+
+    def get_escalated_actions(self, agent: Union[AgentID, str]) -> Set[str]:
+        """Get pending actions for which the agent was escalated.
+        
+        Args:
+            agent: AgentID or satellite serial
+        
+        Returns:
+            Set of action_ids
+        """
+        index = self._agent_key(agent)
+        return set(self._escalated.get(index, ())) if index is not None else set()
+
+    def is_escalated(self, agent: Union[AgentID, str]) -> bool:
+        """True if the agent is escalated in any pending action."""
+        index = self._agent_key(agent)
+        return index is not None and bool(self._escalated.get(index))
+
+    def _agent_key(self, agent: Union[AgentID, str]) -> Optional[int]:
+        serial = agent.satellite_serial if isinstance(agent, AgentID) else agent
+        return self.agent_index.get(serial)
+
+    def _indexed(self, state: ActionState, mask: int) -> Iterator[int]:
+        """Propagator agent indices for the bits of one of state's bitsets."""
+        if state.agent_index is self.agent_index:
+            return _bits(mask)
+        return (self.agent_index.id(serial) for serial in state.agent_index.serials(mask))
+
+    def _reindex(self, table: Dict[int, Set[str]], action_id: str, state: ActionState, added: int, removed: int) -> None:
+        for index in self._indexed(state, added):
+            table.setdefault(index, set()).add(action_id)
+        for index in self._indexed(state, removed):
+            actions = table.get(index)
+            if actions is not None:
+                actions.discard(action_id)
+                if not actions:
+                    del table[index]
+
+    def _on_action_added(self, action_id: str, state: ActionState) -> None:
+        state._listener = self._on_action_changed
+        remaining = state.remaining_mask
+        self._remaining_masks[action_id] = remaining
+        self._reindex(self._behind, action_id, state, remaining, 0)
+        self._reindex(self._escalated, action_id, state, state.escalated_mask, 0)
+
+    def _on_action_removed(self, action_id: str, state: ActionState) -> None:
+        state._listener = None
+        self._reindex(self._behind, action_id, state, 0, self._remaining_masks.pop(action_id, 0))
+        self._reindex(self._escalated, action_id, state, 0, state.escalated_mask)
+
+    def _on_action_changed(self, state: ActionState, name: str, old: int) -> None:
+        """Apply a bitset change of a tracked action to the reverse indexes."""
+        action_id = state.action_id
+        if self.pending_actions.get(action_id) is not state:
+            return
+        if name == "escalated_mask":
+            new = state.escalated_mask
+            self._reindex(self._escalated, action_id, state, new & ~old, old & ~new)
+            return
+        previous = self._remaining_masks.get(action_id, 0)
+        remaining = state.remaining_mask
+        self._remaining_masks[action_id] = remaining
+        self._reindex(self._behind, action_id, state, remaining & ~previous, previous & ~remaining)
 
     def get_metrics(self) -> Dict:
         """Get propagation metrics.
@@ -60,18 +60,21 @@ class TokenBucket:
             self._tokens + (self.rate * elapsed)
         )
     
-    def acquire(self, tokens: float) -> bool:
+    def acquire(self, tokens: float, allow_debt: bool = False) -> bool:
         """Attempt to acquire tokens.
         
         Args:
             tokens: Number of tokens to acquire
+            allow_debt: Admit a request larger than the burst once the
+                bucket is full, leaving the balance negative until refilled
         
         Returns:
             True if acquired, False if insufficient tokens
         """
         self._refill()
         
-        if self._tokens >= tokens:
+        needed = min(tokens, self.burst) if allow_debt else tokens
+        if self._tokens >= needed:
             self._tokens -= tokens
             return True
         
@@ -85,8 +88,8 @@ class TokenBucket:
     def utilization(self) -> float:
         """Get utilization percentage (0.0-1.0)."""
         self._refill()
-        # Utilization = (burst - available) / burst
-        return max(0.0, 1.0 - (self._tokens / self.burst))
+        # Utilization = (burst - available) / burst; a bucket in debt is at 100%
+        return min(1.0, max(0.0, 1.0 - (self._tokens / self.burst)))
 
 
 @dataclass
@@ -163,7 +166,8 @@ class BandwidthGovernor:
         self,
         peer: AgentID,
         size: int,
-        priority: MessagePriority = MessagePriority.NORMAL
+        priority: MessagePriority = MessagePriority.NORMAL,
+        allow_debt: bool = False
     ) -> bool:
         """Attempt to acquire bandwidth tokens.
         
@@ -171,6 +175,8 @@ class BandwidthGovernor:
             peer: Target peer AgentID
             size: Message size in bytes
             priority: Message priority level
+            allow_debt: Admit a message larger than a bucket's burst once
+                that bucket is full, charging the excess as debt
         
         Returns:
             True if tokens acquired, False if bandwidth exceeded
@@ -197,8 +203,8 @@ class BandwidthGovernor:
                 return False
         
         # Try to acquire from both buckets
-        global_ok = self.global_bucket.acquire(size)
-        peer_ok = self._get_peer_bucket(peer).acquire(size)
+        global_ok = self.global_bucket.acquire(size, allow_debt)
+        peer_ok = self._get_peer_bucket(peer).acquire(size, allow_debt)
         
         if global_ok and peer_ok:
             self.stats.total_bytes_sent += size
@@ -218,6 +224,48 @@ class BandwidthGovernor:
         self.stats.throttled_messages += 1
         return False
     
+    def admission_tokens(self, peer: AgentID, size: int) -> float:
+        """Tokens that must be available before a message is admitted with debt.
+        
+        A message larger than a bucket's burst could never find `size`
+        tokens, so it only waits for that bucket to fill.
+        
+        Args:
+            peer: Target peer
+            size: Message size in bytes
+        
+        Returns:
+            min(size, global burst, peer burst)
+        """
+        return min(size, self.global_bucket.burst, self._get_peer_bucket(peer).burst)
+    
+    def can_admit(
+        self,
+        peer: AgentID,
+        size: int,
+        reserved_global: float = 0.0,
+        reserved_peer: float = 0.0
+    ) -> bool:
+        """Check token levels for a message without taking or counting anything.
+        
+        Priority throttling is not considered; acquire_tokens still applies it.
+        
+        Args:
+            peer: Target peer
+            size: Message size in bytes
+            reserved_global: Global tokens to leave untouched for others
+            reserved_peer: Peer tokens to leave untouched for others
+        
+        Returns:
+            True if both buckets hold admission_tokens(peer, size) on top of
+            the reserved amounts
+        """
+        needed = self.admission_tokens(peer, size)
+        return (
+            self.global_bucket.tokens_available() >= needed + reserved_global
+            and self._get_peer_bucket(peer).tokens_available() >= needed + reserved_peer
+        )
+    
     def set_peer_limit(self, peer: AgentID, kbps: int) -> None:
         """Dynamically adjust per-peer rate limit.
         
@@ -11,13 +11,19 @@ Issue #398: Message bus abstraction for distributed satellite constellation
 
 import asyncio
 import logging
-from typing import Dict, List, Callable, Optional, Any, Set
-from collections import defaultdict
+import time
+from typing import Awaitable, Dict, List, Callable, Optional, Any, Set, Tuple
+from collections import defaultdict, OrderedDict
 from datetime import datetime
 import json
 
 from astraguard.swarm.models import SwarmConfig, AgentID, HealthSummary
 from astraguard.swarm.serializer import SwarmSerializer
+from astraguard.swarm.dedup import DedupWindow
+from astraguard.swarm.coalescer import FrameCoalescer
+from astraguard.swarm.scheduler import OutboundScheduler
+from astraguard.swarm.bandwidth_governor import BandwidthGovernor
+from astraguard.swarm.transport import Transport
 from astraguard.swarm.types import (
     SwarmMessage,
     SwarmTopic,
@@ -25,10 +31,290 @@ from astraguard.swarm.types import (
     TopicFilter,
     SubscriptionID,
     MessageAck,
+    OverflowPolicy,
+    TrafficClass,
 )
 
 logger = logging.getLogger(__name__)
 
+# Queued-subscriber overflow behaviour per QoS level: fire-forget telemetry
+# keeps the freshest data, acknowledged/reliable traffic applies backpressure.
+DEFAULT_OVERFLOW_POLICIES: Dict[int, OverflowPolicy] = {
+    QoSLevel.FIRE_FORGET: OverflowPolicy.DROP_OLDEST,
+    QoSLevel.ACK: OverflowPolicy.BLOCK,
+    QoSLevel.RELIABLE: OverflowPolicy.BLOCK,
+}
+
+# Topic carrying QoS 1 acknowledgments between buses joined by a transport
+ACK_TOPIC = "coord/ack"
+
+
+class _TopicNode:
+    """Trie node for one topic path segment."""
+
+    __slots__ = ("children", "exact", "wildcard")
+
+    def __init__(self):
+        self.children: Dict[str, "_TopicNode"] = {}
+        self.exact: Set[SubscriptionID] = set()     # "a/b" subscriptions ending here
+        self.wildcard: Set[SubscriptionID] = set()  # "a/b/*" subscriptions ending here
+
+
+class TopicTrie:
+    """Subscription index keyed by topic path segments.
+
+    Mirrors TopicFilter semantics:
+    - "health/summary" is stored on the exact set of node health → summary
+    - "health/*" is stored on the wildcard set of node health and matches
+      any topic with at least one segment below it
+    - "*" is stored on a root-level match-all set
+
+    Matching walks the topic once, so cost is O(topic depth + matches)
+    instead of O(total subscriptions).
+    """
+
+    def __init__(self):
+        self._root = _TopicNode()
+        self._match_all: Set[SubscriptionID] = set()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @staticmethod
+    def _parse(pattern: str) -> Tuple[List[str], bool]:
+        """Split pattern into (segments, is_wildcard)."""
+        if pattern.endswith("/*"):
+            return pattern[:-2].split("/"), True
+        return pattern.split("/"), False
+
+    def add(self, sub_id: SubscriptionID, pattern: str) -> None:
+        """Index a subscription under its filter pattern."""
+        if pattern == "*":
+            self._match_all.add(sub_id)
+        else:
+            segments, wildcard = self._parse(pattern)
+            node = self._root
+            for segment in segments:
+                child = node.children.get(segment)
+                if child is None:
+                    child = node.children[segment] = _TopicNode()
+                node = child
+            (node.wildcard if wildcard else node.exact).add(sub_id)
+        self._size += 1
+
+    def remove(self, sub_id: SubscriptionID, pattern: str) -> bool:
+        """Remove a subscription, pruning nodes left empty.
+
+        Returns:
+            True if the subscription was indexed, False otherwise
+        """
+        if pattern == "*":
+            if sub_id not in self._match_all:
+                return False
+            self._match_all.discard(sub_id)
+            self._size -= 1
+            return True
+
+        segments, wildcard = self._parse(pattern)
+        path = [self._root]
+        for segment in segments:
+            node = path[-1].children.get(segment)
+            if node is None:
+                return False
+            path.append(node)
+
+        bucket = path[-1].wildcard if wildcard else path[-1].exact
+        if sub_id not in bucket:
+            return False
+        bucket.discard(sub_id)
+        self._size -= 1
+
+        # Prune empty branches bottom-up
+        for depth in range(len(segments), 0, -1):
+            node = path[depth]
+            if node.children or node.exact or node.wildcard:
+                break
+            del path[depth - 1].children[segments[depth - 1]]
+        return True
+
+    def match(self, topic: str) -> Set[SubscriptionID]:
+        """Return all subscriptions whose filter matches topic."""
+        matches = set(self._match_all)
+        segments = topic.split("/")
+        last = len(segments) - 1
+        node = self._root
+        for depth, segment in enumerate(segments):
+            node = node.children.get(segment)
+            if node is None:
+                return matches
+            # "prefix/*" needs at least one segment below the prefix
+            if depth < last:
+                matches.update(node.wildcard)
+        matches.update(node.exact)
+        return matches
+
+    def clear(self) -> None:
+        """Drop all indexed subscriptions."""
+        self._root = _TopicNode()
+        self._match_all.clear()
+        self._size = 0
+
+
+class _SubscriberQueue:
+    """Bounded queue and worker task for one subscription.
+
+    The publisher only enqueues; the worker invokes the callback, so a slow
+    handler delays its own queue and nothing else.
+    """
+
+    def __init__(
+        self,
+        sub_id: SubscriptionID,
+        callback: Callable,
+        maxsize: int,
+        policies: Dict[int, OverflowPolicy],
+    ):
+        self.sub_id = sub_id
+        self.callback = callback
+        self.maxsize = maxsize
+        self.policies = policies
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self.enqueued = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.errors = 0
+        self.last_lag_ms = 0.0
+        self.max_lag_ms = 0.0
+        self.max_depth = 0
+
+    def _ensure_worker(self) -> asyncio.Queue:
+        """Start the worker on the running loop (restarting after loop changes)."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._worker is None or self._worker.done():
+            if self._loop is not loop:
+                self._queue = asyncio.Queue(maxsize=self.maxsize)
+                self._loop = loop
+            self._worker = loop.create_task(self._run())
+        return self._queue
+
+    async def put(self, message: SwarmMessage) -> bool:
+        """Enqueue message according to the overflow policy for its QoS.
+
+        Returns:
+            True if enqueued, False if the message was dropped
+        """
+        queue = self._ensure_worker()
+        item = (message, time.monotonic())
+        policy = self.policies.get(message.qos, OverflowPolicy.DROP_OLDEST)
+
+        if policy == OverflowPolicy.BLOCK:
+            await queue.put(item)
+        elif queue.full():
+            self.dropped += 1
+            if policy == OverflowPolicy.DROP_NEWEST:
+                return False
+            queue.get_nowait()
+            queue.task_done()
+            queue.put_nowait(item)
+        else:
+            queue.put_nowait(item)
+
+        self.enqueued += 1
+        self.max_depth = max(self.max_depth, queue.qsize())
+        return True
+
+    async def _run(self) -> None:
+        """Worker loop: invoke the callback for each queued message."""
+        queue = self._queue
+        while True:
+            message, enqueued_at = await queue.get()
+            try:
+                lag_ms = (time.monotonic() - enqueued_at) * 1000
+                self.last_lag_ms = lag_ms
+                if lag_ms > self.max_lag_ms:
+                    self.max_lag_ms = lag_ms
+                result = self.callback(message)
+                if asyncio.iscoroutine(result):
+                    await result
+                self.delivered += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.errors += 1
+                logger.error(f"Error in subscription callback {self.sub_id}: {e}")
+            finally:
+                queue.task_done()
+
+    async def join(self) -> None:
+        """Wait until every queued message has been handled."""
+        if self._queue is not None and self._loop is asyncio.get_running_loop():
+            await self._queue.join()
+
+    def stop(self) -> Optional[asyncio.Task]:
+        """Cancel the worker; queued messages are discarded.
+
+        Returns:
+            The cancelled worker task, if one was running
+        """
+        worker, self._worker = self._worker, None
+        if worker is None or worker.done():
+            return None
+        if worker.get_loop().is_closed():
+            return None
+        worker.cancel()
+        return worker
+
+    def get_metrics(self) -> dict:
+        """Per-subscriber queue metrics."""
+        return {
+            "topic_filter": self.sub_id.topic_filter,
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "max_queue_depth": self.max_depth,
+            "queue_size": self.maxsize,
+            "enqueued": self.enqueued,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "errors": self.errors,
+            "lag_ms": self.last_lag_ms,
+            "max_lag_ms": self.max_lag_ms,
+        }
+
+
+def json_subscriber(
+    bus: "SwarmMessageBus", handler: Callable[[dict], Awaitable[None]]
+) -> Callable[[SwarmMessage], Awaitable[None]]:
+    """Adapt a handler of decoded JSON objects into a subscription callback.
+    
+    The callback acknowledges QoS >= ACK messages, decodes the payload that
+    publish() JSON-encoded and awaits handler with the resulting dict.
+    Payloads that are not a JSON object are logged and dropped.
+    
+    Args:
+        bus: Bus the subscription is made on (used for acknowledgements)
+        handler: Coroutine function taking the decoded message dict
+        
+    Returns:
+        Callback for SwarmMessageBus.subscribe()
+    """
+    async def callback(message: SwarmMessage) -> None:
+        if message.qos >= QoSLevel.ACK:
+            await bus.acknowledge(message)
+        try:
+            decoded = json.loads(bytes(message.payload))
+        except ValueError as e:
+            logger.warning(f"Malformed {message.topic} message from {message.sender.satellite_serial}: {e}")
+            return
+        if not isinstance(decoded, dict):
+            logger.warning(f"Malformed {message.topic} message from {message.sender.satellite_serial}")
+            return
+        await handler(decoded)
+
+    return callback
+
 
 class SwarmMessageBus:
     """High-performance pub/sub message bus for satellite constellations.
@@ -40,6 +326,11 @@ class SwarmMessageBus:
     - Latency simulation (50-200ms typical)
     - Message deduplication and ordering
     - Subscription management with leak detection
+    - Trie-indexed topic routing with an LRU memo of topic → subscribers
+    - Optional per-subscriber bounded queues with QoS-specific overflow policies
+    - Opt-in frame coalescing of small messages into shared ISL frames
+    - Opt-in weighted fair outbound scheduling per traffic class
+    - Pluggable transport joining buses across processes (in-process default)
     """
 
     def __init__(
@@ -48,6 +339,7 @@ class SwarmMessageBus:
         serializer: SwarmSerializer,
         isl_bandwidth_kbps: int = 10,
         latency_ms: int = 100,
+        overflow_policies: Optional[Dict[int, OverflowPolicy]] = None,
     ):
         """Initialize message bus.
         
@@ -56,22 +348,38 @@ class SwarmMessageBus:
             serializer: SwarmSerializer for message encoding
             isl_bandwidth_kbps: ISL bandwidth limit (default 10 KB/s)
             latency_ms: ISL latency in milliseconds (default 100ms)
+            overflow_policies: QoS level → OverflowPolicy for queued
+                subscribers (default DEFAULT_OVERFLOW_POLICIES)
         """
         self.config = config
         self.serializer = serializer
         self.isl_bandwidth_kbps = isl_bandwidth_kbps
         self.latency_ms = latency_ms
+        self.overflow_policies = {**DEFAULT_OVERFLOW_POLICIES, **(overflow_policies or {})}
 
         # Subscription management
         self.subscriptions: Dict[SubscriptionID, Callable] = {}
         self.topic_subscribers: Dict[str, List[SubscriptionID]] = defaultdict(list)
         self.topic_filters: Dict[str, TopicFilter] = {}
+        self.topic_index = TopicTrie()
+        self.subscriber_queues: Dict[SubscriptionID, _SubscriberQueue] = {}
+        self.coalescer: Optional[FrameCoalescer] = None
+        self.scheduler: Optional[OutboundScheduler] = None
+        self.transport: Optional[Transport] = None
+        self._subscription_seq: Dict[SubscriptionID, int] = {}
+        self._next_subscription_seq = 0
+
+        # LRU memo of topic -> matching subscribers (invalidated on (un)subscribe)
+        self._route_cache: "OrderedDict[str, Tuple[SubscriptionID, ...]]" = OrderedDict()
+        self.route_cache_size = 1024
+        self.route_cache_hits = 0
+        self.route_cache_misses = 0
 
         # Message tracking
         self.message_sequence = 0
         self.pending_acks: Dict[str, asyncio.Event] = {}
-        self.received_messages: Set[str] = set()  # Deduplication
         self.max_stored_messages = 1000
+        self.received_messages = DedupWindow(self.max_stored_messages)  # Deduplication
 
         # Metrics
         self.metrics = {
@@ -94,7 +402,8 @@ class SwarmMessageBus:
         
         Args:
             topic: Topic string (e.g., "health/summary")
-            payload: Message payload (serialized to bytes)
+            payload: Message payload; bytes and memoryview are passed
+                through without copying, other objects are serialized
             qos: QoS level (0=fire-forget, 1=ACK, 2=reliable)
             receiver: Optional specific receiver (None=broadcast)
             timeout_ms: Timeout for ACK/reliable delivery
@@ -114,8 +423,10 @@ class SwarmMessageBus:
                     payload if isinstance(payload, HealthSummary) else payload.payload,
                     compress=False,  # Use compression when lz4 available
                 )
-            elif isinstance(payload, bytes):
+            elif isinstance(payload, (bytes, memoryview)):
                 payload_bytes = payload
+            elif isinstance(payload, bytearray):
+                payload_bytes = bytes(payload)  # Detach from the mutable buffer
             else:
                 payload_bytes = json.dumps(payload).encode("utf-8")
 
@@ -160,7 +471,7 @@ class SwarmMessageBus:
             # Simulate ISL latency
             await self._simulate_latency()
             # Deliver to subscribers
-            await self._deliver_message(message)
+            await self._transmit(message)
             self.metrics["delivered"] += 1
             return True
         except Exception as e:
@@ -179,7 +490,7 @@ class SwarmMessageBus:
 
             # Simulate ISL latency and publish
             await self._simulate_latency()
-            await self._deliver_message(message)
+            await self._transmit(message)
 
             # Wait for ACK
             try:
@@ -222,16 +533,10 @@ class SwarmMessageBus:
                     self.metrics["delivered"] += 1
                     return True
 
-                # Deliver
-                await self._deliver_message(message)
+                # Deliver (window evicts the oldest key once full)
+                await self._transmit(message)
                 self.received_messages.add(msg_key)
 
-                # Cleanup old messages
-                if len(self.received_messages) > self.max_stored_messages:
-                    # Remove oldest (FIFO)
-                    oldest = list(self.received_messages)[0]
-                    self.received_messages.discard(oldest)
-
                 self.metrics["delivered"] += 1
                 self.metrics["acked"] += 1
                 return True
@@ -250,18 +555,156 @@ class SwarmMessageBus:
 
         return False
 
+    def enable_coalescing(
+        self,
+        send_frame: Optional[Callable[[Optional[AgentID], bytes], Any]] = None,
+        max_frame_bytes: int = 10240,
+        flush_deadline_ms: float = 20.0,
+        compress: bool = True,
+    ) -> FrameCoalescer:
+        """Pack outbound messages into shared frames instead of sending each alone.
+        
+        Args:
+            send_frame: Async callable(peer, frame) for the ISL link; defaults
+                to the attached transport, else loops frames back into
+                receive_frame()
+            max_frame_bytes: Frame size limit (default 10KB)
+            flush_deadline_ms: Max time a message waits for its frame to fill
+            compress: Run one LZ4 pass per frame
+            
+        Returns:
+            The FrameCoalescer now used by publish()
+        """
+        async def loopback(peer: Optional[AgentID], frame: bytes) -> None:
+            if self.transport is not None:
+                await self.transport.send(peer, frame)
+            else:
+                await self.receive_frame(frame)
+
+        self.coalescer = FrameCoalescer(
+            send_frame or loopback,
+            max_frame_bytes=max_frame_bytes,
+            flush_deadline_ms=flush_deadline_ms,
+            compress=compress,
+        )
+        return self.coalescer
+
+    def enable_scheduler(
+        self,
+        governor: Optional[BandwidthGovernor] = None,
+        weights: Optional[Dict[TrafficClass, int]] = None,
+        topic_classes: Optional[Dict[str, TrafficClass]] = None,
+        queue_limit: int = 256,
+    ) -> OutboundScheduler:
+        """Queue outbound messages per traffic class and drain them fairly.
+        
+        Args:
+            governor: BandwidthGovernor whose tokens pace the link
+            weights: TrafficClass → weight overrides
+            topic_classes: Topic prefix → TrafficClass overrides
+            queue_limit: Max queued messages per class (oldest dropped)
+            
+        Returns:
+            The OutboundScheduler now used by publish()
+        """
+        self.scheduler = OutboundScheduler(
+            self._dispatch,
+            governor=governor,
+            weights=weights,
+            topic_classes=topic_classes,
+            queue_limit=queue_limit,
+        )
+        return self.scheduler
+
+    async def attach_transport(self, transport: Transport) -> Transport:
+        """Send outbound envelopes and frames over transport instead of in-process.
+        
+        Inbound frames from the transport are delivered via receive_frame();
+        the transport's LinkModel replaces the bus latency simulation.
+        
+        Args:
+            transport: Transport owned by this bus's agent
+            
+        Returns:
+            The started transport
+        """
+        await transport.start(self.receive_frame)
+        self.transport = transport
+        return transport
+
+    async def _transmit(self, message: SwarmMessage) -> None:
+        """Hand message to the scheduler when enabled, else dispatch now."""
+        if self.scheduler is not None:
+            await self.scheduler.enqueue(message)
+        else:
+            await self._dispatch(message)
+
+    async def _dispatch(self, message: SwarmMessage) -> None:
+        """Hand message to the coalescer or transport, else deliver directly."""
+        if self.coalescer is not None:
+            await self.coalescer.add(message)
+        elif self.transport is not None:
+            await self.transport.send(message.receiver, message.to_bytes())
+        else:
+            await self._deliver_message(message)
+
+    async def receive_frame(self, frame: bytes) -> int:
+        """Unpack a received frame and deliver each message to subscribers.
+        
+        Payloads are delivered as memoryviews into the frame.
+        
+        Args:
+            frame: Frame produced by FrameCoalescer, or a single envelope
+                produced by SwarmMessage.to_bytes()
+            
+        Returns:
+            Number of messages delivered from the frame
+        """
+        if SwarmMessage.is_envelope(frame):
+            messages = [SwarmMessage.from_bytes(frame)]
+        else:
+            messages = FrameCoalescer.unpack(frame)
+        delivered = 0
+        for message in messages:
+            if message.topic == ACK_TOPIC:
+                self._mark_acked(str(bytes(message.payload), "ascii"))
+                continue
+            await self._deliver_message(message)
+            delivered += 1
+        return delivered
+
+    def _match_subscribers(self, topic: str) -> Tuple[SubscriptionID, ...]:
+        """Resolve subscribers for topic via the LRU memo and topic trie.
+
+        Results are returned in subscription order, as the previous linear
+        scan over self.subscriptions did.
+        """
+        cached = self._route_cache.get(topic)
+        if cached is not None:
+            self._route_cache.move_to_end(topic)
+            self.route_cache_hits += 1
+            return cached
+
+        self.route_cache_misses += 1
+        matches = tuple(
+            sorted(self.topic_index.match(topic), key=self._subscription_seq.__getitem__)
+        )
+        self._route_cache[topic] = matches
+        if len(self._route_cache) > self.route_cache_size:
+            self._route_cache.popitem(last=False)
+        return matches
+
     async def _deliver_message(self, message: SwarmMessage) -> None:
         """Deliver message to subscribers."""
         # Find matching subscribers
-        matching_subs: List[SubscriptionID] = []
-
-        for sub_id in list(self.subscriptions.keys()):
-            topic_filter = self.topic_filters.get(str(sub_id))
-            if topic_filter and topic_filter.matches(message.topic):
-                matching_subs.append(sub_id)
+        matching_subs = self._match_subscribers(message.topic)
 
         # Deliver to all matching subscribers
         for sub_id in matching_subs:
+            queue = self.subscriber_queues.get(sub_id)
+            if queue is not None:
+                await queue.put(message)
+                continue
             callback = self.subscriptions.get(sub_id)
             if callback:
                 try:
@@ -274,12 +717,16 @@ class SwarmMessageBus:
                     )
 
     async def _simulate_latency(self) -> None:
-        """Simulate ISL latency."""
-        if self.latency_ms > 0:
+        """Simulate ISL latency (a transport's LinkModel applies it instead)."""
+        if self.latency_ms > 0 and self.transport is None:
             await asyncio.sleep(self.latency_ms / 1000.0)
 
     def subscribe(
-        self, topic_filter: str, callback: Callable
+        self,
+        topic_filter: str,
+        callback: Callable,
+        queue_size: Optional[int] = None,
+        overflow_policies: Optional[Dict[int, OverflowPolicy]] = None,
     ) -> SubscriptionID:
         """Subscribe to topic(s) with optional wildcard.
         
@@ -289,24 +736,44 @@ class SwarmMessageBus:
                 - "health/*" → all health topics
                 - "*" → all topics
             callback: Async or sync callback function
+            queue_size: If set, deliver through a bounded queue of this size
+                drained by a dedicated worker task instead of calling the
+                callback inline from the publisher
+            overflow_policies: Per-QoS overrides of the bus overflow policies
+                for this subscription's queue
             
         Returns:
             SubscriptionID for later unsubscribe
         """
         try:
-            # Validate filter
+            # Validate filter and queue options before registering anything
             filter_obj = TopicFilter(topic_filter)
+            queue = None
+            if queue_size is not None:
+                if queue_size <= 0:
+                    raise ValueError("queue_size must be positive")
+                policies = dict(self.overflow_policies)
+                for qos, policy in (overflow_policies or {}).items():
+                    policies[QoSLevel(qos)] = OverflowPolicy(policy)
 
             # Create subscription
             sub_id = SubscriptionID(
                 topic_filter=topic_filter,
                 subscriber=self.config.agent_id,
             )
+            if queue_size is not None:
+                queue = _SubscriberQueue(sub_id, callback, queue_size, policies)
 
             # Store subscription
             self.subscriptions[sub_id] = callback
             self.topic_filters[str(sub_id)] = filter_obj
             self.topic_subscribers[topic_filter].append(sub_id)
+            self._subscription_seq[sub_id] = self._next_subscription_seq
+            self._next_subscription_seq += 1
+            self.topic_index.add(sub_id, filter_obj.pattern)
+            if queue is not None:
+                self.subscriber_queues[sub_id] = queue
+            self._route_cache.clear()
 
             logger.debug(f"Subscription {sub_id.id} created for {topic_filter}")
             return sub_id
@@ -328,6 +795,12 @@ class SwarmMessageBus:
             self.subscriptions.pop(subscription_id)
             topic_filter_str = subscription_id.topic_filter
             self.topic_filters.pop(str(subscription_id), None)
+            self.topic_index.remove(subscription_id, topic_filter_str)
+            self._subscription_seq.pop(subscription_id, None)
+            queue = self.subscriber_queues.pop(subscription_id, None)
+            if queue is not None:
+                queue.stop()
+            self._route_cache.clear()
 
             if topic_filter_str in self.topic_subscribers:
                 try:
@@ -352,29 +825,90 @@ class SwarmMessageBus:
                 success=True,
             )
 
+            # Remote publisher: carry the ACK back over the transport
+            if self.transport is not None and message.sender != self.config.agent_id:
+                envelope = SwarmMessage(
+                    topic=ACK_TOPIC,
+                    payload=str(ack.message_id).encode("ascii"),
+                    sender=self.config.agent_id,
+                    qos=QoSLevel.FIRE_FORGET,
+                    receiver=message.sender,
+                )
+                await self.transport.send(message.sender, envelope.to_bytes())
+                return
+
             # Simulate latency
             await self._simulate_latency()
 
             # Mark ACK as received
-            ack_event = self.pending_acks.get(str(message.message_id))
-            if ack_event:
-                ack_event.set()
-                logger.debug(f"ACK sent for message {message.message_id}")
+            self._mark_acked(str(message.message_id))
 
         except Exception as e:
             logger.error(f"Error sending ACK: {e}")
 
+    def _mark_acked(self, message_id: str) -> None:
+        """Release a publisher waiting on message_id."""
+        ack_event = self.pending_acks.get(message_id)
+        if ack_event:
+            ack_event.set()
+            logger.debug(f"ACK received for message {message_id}")
+
+    async def drain(self) -> None:
+        """Wait until outbound and subscriber queues have handled their backlog."""
+        if self.scheduler is not None:
+            await self.scheduler.drain()
+        await asyncio.gather(*(q.join() for q in list(self.subscriber_queues.values())))
+
+    async def close(self) -> None:
+        """Stop the scheduler, flush coalesced frames, close the transport, then stop subscriber workers.
+        
+        Messages still queued in the scheduler are dropped; call drain() first
+        to send them.
+        """
+        if self.scheduler is not None:
+            worker = self.scheduler.stop()
+            if worker is not None:
+                await asyncio.gather(worker, return_exceptions=True)
+        if self.coalescer is not None:
+            await self.coalescer.flush()
+        if self.transport is not None:
+            await self.transport.close()
+        workers = [q.stop() for q in self.subscriber_queues.values()]
+        workers = [w for w in workers if w is not None]
+        if workers:
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    def get_subscriber_metrics(self) -> Dict[str, dict]:
+        """Get per-subscriber queue metrics (queued subscriptions only).
+        
+        Returns:
+            Dictionary mapping subscription id to depth/lag/drop statistics
+        """
+        return {
+            str(sub_id.id): queue.get_metrics()
+            for sub_id, queue in self.subscriber_queues.items()
+        }
+
     def get_metrics(self) -> dict:
         """Get message bus metrics.
         
         Returns:
             Dictionary with publish/delivery/failure statistics
         """
+        queues = self.subscriber_queues.values()
         return {
             **self.metrics,
             "subscriptions": len(self.subscriptions),
             "pending_acks": len(self.pending_acks),
             "deduplication_cache": len(self.received_messages),
+            "route_cache_hits": self.route_cache_hits,
+            "route_cache_misses": self.route_cache_misses,
+            "queued_subscribers": len(self.subscriber_queues),
+            "queue_dropped": sum(q.dropped for q in queues),
+            "handler_errors": sum(q.errors for q in queues),
+            "coalescing": self.coalescer.get_stats().to_dict() if self.coalescer else None,
+            "scheduling": self.scheduler.get_stats() if self.scheduler else None,
+            "transport": self.transport.get_stats() if self.transport else None,
             "message_sequence": self.message_sequence,
         }
 
@@ -391,9 +925,17 @@ class SwarmMessageBus:
 
     def clear(self) -> None:
         """Clear all subscriptions and reset metrics."""
+        for queue in self.subscriber_queues.values():
+            queue.stop()
+        self.subscriber_queues.clear()
         self.subscriptions.clear()
         self.topic_filters.clear()
         self.topic_subscribers.clear()
+        self.topic_index.clear()
+        self._subscription_seq.clear()
+        self._route_cache.clear()
+        self.route_cache_hits = 0
+        self.route_cache_misses = 0
         self.pending_acks.clear()
         self.received_messages.clear()
         self.metrics = {
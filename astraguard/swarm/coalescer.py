@@ -0,0 +1,360 @@
+"""
+FrameCoalescer - Packs small swarm messages into shared ISL frames.
+
+Heartbeats, health summaries and intents are tiny, so a standalone JSON
+envelope per message dominates the 10KB/s ISL budget. The coalescer
+batches outbound messages per destination peer into one binary frame:
+- Flush when the next message would exceed the 10KB frame limit, or when
+  the oldest pending message reaches the flush deadline
+- Shared header dictionary: topics and agent ids are written once per frame
+  and referenced by index from each message record
+- One LZ4 pass per frame (kept only if it shrinks the frame)
+
+Frame layout (little-endian):
+    header   <2sBBH  magic b"SF", version, flags, message count
+    body     (LZ4 compressed when FLAG_LZ4 is set)
+        <H strings, each <H length + UTF-8
+        <H agents, each <HH16s constellation idx, serial idx, uuid bytes
+        records, each <HHHBQq16sI topic idx, sender idx, receiver idx
+                 (0xFFFF = broadcast), qos, sequence, timestamp µs since
+                 epoch, message id, payload length; followed by payload
+"""
+
+import asyncio
+import logging
+import struct
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+try:
+    import lz4.frame
+    HAS_LZ4 = True
+except ImportError:
+    HAS_LZ4 = False
+
+from astraguard.swarm.models import AgentID
+from astraguard.swarm.types import Payload, SwarmMessage
+
+logger = logging.getLogger(__name__)
+
+FRAME_MAGIC = b"SF"
+FRAME_VERSION = 1
+FLAG_LZ4 = 0x01
+MAX_FRAME_BYTES = 10240  # 10KB ISL limit
+
+_HEADER = struct.Struct("<2sBBH")
+_COUNT = struct.Struct("<H")
+_AGENT = struct.Struct("<HH16s")
+_RECORD = struct.Struct("<HHHBQq16sI")
+_NO_RECEIVER = 0xFFFF
+_EPOCH = datetime(1970, 1, 1)
+
+
+@dataclass
+class CoalescingStats:
+    """Payload efficiency statistics for coalesced frames."""
+    frames_sent: int = 0
+    messages_sent: int = 0
+    payload_bytes: int = 0
+    wire_bytes: int = 0
+    compressed_frames: int = 0
+    flushes: Dict[str, int] = field(
+        default_factory=lambda: {"size": 0, "deadline": 0, "manual": 0}
+    )
+
+    def bytes_per_message(self) -> float:
+        """Bytes on the wire per logical message."""
+        if self.messages_sent == 0:
+            return 0.0
+        return self.wire_bytes / self.messages_sent
+
+    def payload_efficiency(self) -> float:
+        """Payload bytes / wire bytes (can exceed 1.0 with compression)."""
+        if self.wire_bytes == 0:
+            return 0.0
+        return self.payload_bytes / self.wire_bytes
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for Prometheus."""
+        return {
+            "frames_sent": self.frames_sent,
+            "messages_sent": self.messages_sent,
+            "messages_per_frame": (
+                self.messages_sent / self.frames_sent if self.frames_sent else 0.0
+            ),
+            "payload_bytes": self.payload_bytes,
+            "wire_bytes": self.wire_bytes,
+            "bytes_per_message": self.bytes_per_message(),
+            "payload_efficiency": self.payload_efficiency(),
+            "compressed_frames": self.compressed_frames,
+            "flushes": dict(self.flushes),
+        }
+
+
+class _FrameBuilder:
+    """Accumulates records for one destination with a shared dictionary."""
+
+    def __init__(self):
+        self.strings: Dict[str, int] = {}
+        self.agents: Dict[AgentID, int] = {}
+        self.agent_rows: List[Tuple[int, int, bytes]] = []
+        # (record header, payload) pairs; payloads are joined without copies
+        self.records: List[Tuple[bytes, Payload]] = []
+        self.payload_bytes = 0
+        # Header + both table counts
+        self.size = _HEADER.size + 2 * _COUNT.size
+        self.deadline_handle: Optional[asyncio.TimerHandle] = None
+
+    def _string_cost(self, value: str, pending: set) -> int:
+        if value in self.strings or value in pending:
+            return 0
+        pending.add(value)
+        return _COUNT.size + len(value.encode("utf-8"))
+
+    def _agent_cost(self, agent: Optional[AgentID], pending: set) -> int:
+        if agent is None or agent in self.agents or agent in pending:
+            return 0
+        pending.add(agent)
+        return (
+            _AGENT.size
+            + self._string_cost(agent.constellation, pending)
+            + self._string_cost(agent.satellite_serial, pending)
+        )
+
+    def cost(self, message: SwarmMessage) -> int:
+        """Uncompressed bytes adding message would cost this frame."""
+        pending: set = set()
+        return (
+            _RECORD.size
+            + len(message.payload)
+            + self._string_cost(message.topic, pending)
+            + self._agent_cost(message.sender, pending)
+            + self._agent_cost(message.receiver, pending)
+        )
+
+    def _intern(self, value: str) -> int:
+        index = self.strings.get(value)
+        if index is None:
+            index = self.strings[value] = len(self.strings)
+        return index
+
+    def _intern_agent(self, agent: Optional[AgentID]) -> int:
+        if agent is None:
+            return _NO_RECEIVER
+        index = self.agents.get(agent)
+        if index is None:
+            index = self.agents[agent] = len(self.agent_rows)
+            self.agent_rows.append((
+                self._intern(agent.constellation),
+                self._intern(agent.satellite_serial),
+                agent.uuid.bytes,
+            ))
+        return index
+
+    def add(self, message: SwarmMessage, cost: int) -> None:
+        timestamp_us = (message.timestamp - _EPOCH) // timedelta(microseconds=1)
+        self.records.append((_RECORD.pack(
+            self._intern(message.topic),
+            self._intern_agent(message.sender),
+            self._intern_agent(message.receiver),
+            message.qos,
+            message.sequence,
+            timestamp_us,
+            message.message_id.bytes,
+            len(message.payload),
+        ), message.payload))
+        self.payload_bytes += len(message.payload)
+        self.size += cost
+
+    def build(self, compress: bool) -> bytes:
+        """Serialize header, dictionary and records into one frame."""
+        parts = [_COUNT.pack(len(self.strings))]
+        for value in self.strings:  # dicts keep insertion (index) order
+            encoded = value.encode("utf-8")
+            parts.append(_COUNT.pack(len(encoded)))
+            parts.append(encoded)
+        parts.append(_COUNT.pack(len(self.agent_rows)))
+        parts.extend(_AGENT.pack(*row) for row in self.agent_rows)
+        for record in self.records:
+            parts.extend(record)
+        body = b"".join(parts)
+
+        flags = 0
+        if compress and HAS_LZ4:
+            compressed = lz4.frame.compress(body)
+            if len(compressed) < len(body):
+                body = compressed
+                flags |= FLAG_LZ4
+        return _HEADER.pack(FRAME_MAGIC, FRAME_VERSION, flags, len(self.records)) + body
+
+
+class FrameCoalescer:
+    """Coalesces outbound SwarmMessages into per-peer frames.
+
+    Example:
+        >>> coalescer = FrameCoalescer(send_frame, flush_deadline_ms=20)
+        >>> await coalescer.add(message)       # buffered
+        >>> messages = FrameCoalescer.unpack(frame)  # receive side
+    """
+
+    def __init__(
+        self,
+        send_frame: Callable[[Optional[AgentID], bytes], Awaitable[None]],
+        max_frame_bytes: int = MAX_FRAME_BYTES,
+        flush_deadline_ms: float = 20.0,
+        compress: bool = True,
+    ):
+        """Initialize coalescer.
+
+        Args:
+            send_frame: Async callable(peer, frame) putting a frame on the link;
+                peer is the message receiver (None = broadcast)
+            max_frame_bytes: Frame size limit before compression (default 10KB)
+            flush_deadline_ms: Max time a message waits for a frame to fill
+            compress: Run one LZ4 pass per frame when lz4 is installed
+        """
+        if max_frame_bytes <= _HEADER.size + 2 * _COUNT.size + _RECORD.size:
+            raise ValueError("max_frame_bytes too small for a single record")
+        self.send_frame = send_frame
+        self.max_frame_bytes = max_frame_bytes
+        self.flush_deadline_ms = flush_deadline_ms
+        self.compress = compress
+        self.stats = CoalescingStats()
+        self._pending: Dict[Optional[AgentID], _FrameBuilder] = {}
+        self._inflight: set = set()
+
+    async def add(self, message: SwarmMessage) -> None:
+        """Queue message for its destination, flushing full frames."""
+        peer = message.receiver
+        while True:
+            builder = self._pending.get(peer)
+            if builder is None:
+                builder = self._pending[peer] = _FrameBuilder()
+                loop = asyncio.get_running_loop()
+                builder.deadline_handle = loop.call_later(
+                    self.flush_deadline_ms / 1000.0, self._on_deadline, peer, builder
+                )
+                break
+            if builder.size + builder.cost(message) <= self.max_frame_bytes:
+                break
+            # Frame is full; another add() may refill it while we send
+            await self._flush(peer, "size")
+
+        cost = builder.cost(message)
+        builder.add(message, cost)
+        # An oversized single message still goes out, alone in its frame
+        if builder.size >= self.max_frame_bytes:
+            await self._flush(peer, "size")
+
+    def _on_deadline(self, peer: Optional[AgentID], builder: _FrameBuilder) -> None:
+        if self._pending.get(peer) is not builder:
+            return
+        task = asyncio.get_running_loop().create_task(self._flush(peer, "deadline"))
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+
+    async def _flush(self, peer: Optional[AgentID], reason: str) -> None:
+        builder = self._pending.pop(peer, None)
+        if builder is None or not builder.records:
+            return
+        if builder.deadline_handle is not None:
+            builder.deadline_handle.cancel()
+
+        frame = builder.build(self.compress)
+        self.stats.frames_sent += 1
+        self.stats.messages_sent += len(builder.records)
+        self.stats.payload_bytes += builder.payload_bytes
+        self.stats.wire_bytes += len(frame)
+        self.stats.flushes[reason] += 1
+        if frame[3] & FLAG_LZ4:
+            self.stats.compressed_frames += 1
+
+        try:
+            await self.send_frame(peer, frame)
+        except Exception as e:
+            logger.error(f"Error sending coalesced frame to {peer}: {e}")
+
+    async def flush(self) -> None:
+        """Flush all pending frames immediately."""
+        for peer in list(self._pending):
+            await self._flush(peer, "manual")
+        if self._inflight:
+            await asyncio.gather(*list(self._inflight), return_exceptions=True)
+
+    def pending_messages(self) -> int:
+        """Messages buffered but not yet sent."""
+        return sum(len(b.records) for b in self._pending.values())
+
+    def get_stats(self) -> CoalescingStats:
+        """Get coalescing statistics."""
+        return self.stats
+
+    @staticmethod
+    def is_frame(data: bytes) -> bool:
+        """Whether data starts with the coalesced frame header."""
+        return len(data) >= _HEADER.size and data[:2] == FRAME_MAGIC
+
+    @staticmethod
+    def unpack(frame: bytes) -> List[SwarmMessage]:
+        """Decode a frame back into SwarmMessages.
+
+        Raises:
+            ValueError: If the frame header or version is invalid
+        """
+        if len(frame) < _HEADER.size:
+            raise ValueError("Frame too short")
+        magic, version, flags, count = _HEADER.unpack_from(frame)
+        if magic != FRAME_MAGIC:
+            raise ValueError("Not a coalesced frame")
+        if version != FRAME_VERSION:
+            raise ValueError(f"Unsupported frame version {version}")
+
+        body = memoryview(frame)[_HEADER.size:]
+        if flags & FLAG_LZ4:
+            if not HAS_LZ4:
+                raise ValueError("LZ4-compressed frame but lz4 package not installed")
+            body = memoryview(lz4.frame.decompress(body))
+
+        offset = 0
+        (num_strings,) = _COUNT.unpack_from(body, offset)
+        offset += _COUNT.size
+        strings = []
+        for _ in range(num_strings):
+            (length,) = _COUNT.unpack_from(body, offset)
+            offset += _COUNT.size
+            strings.append(str(body[offset:offset + length], "utf-8"))
+            offset += length
+
+        (num_agents,) = _COUNT.unpack_from(body, offset)
+        offset += _COUNT.size
+        agents = []
+        for _ in range(num_agents):
+            constellation, serial, uuid_bytes = _AGENT.unpack_from(body, offset)
+            offset += _AGENT.size
+            agents.append(AgentID(
+                constellation=strings[constellation],
+                satellite_serial=strings[serial],
+                uuid=UUID(bytes=uuid_bytes),
+            ))
+
+        messages = []
+        for _ in range(count):
+            (topic, sender, receiver, qos, sequence, timestamp_us,
+             message_id, length) = _RECORD.unpack_from(body, offset)
+            offset += _RECORD.size
+            # Payloads are read-only views into the frame, not copies
+            payload = body[offset:offset + length].toreadonly()
+            offset += length
+            messages.append(SwarmMessage(
+                topic=strings[topic],
+                payload=payload,
+                sender=agents[sender],
+                qos=qos,
+                timestamp=_EPOCH + timedelta(microseconds=timestamp_us),
+                sequence=sequence,
+                message_id=UUID(bytes=message_id),
+                receiver=None if receiver == _NO_RECEIVER else agents[receiver],
+            ))
+        return messages
@@ -9,12 +9,16 @@ Issue #399: State compression for bandwidth-constrained ISL links
 """
 
 import struct
+import time
 import logging
 import datetime
-from typing import Optional
-from dataclasses import dataclass
+from collections import OrderedDict
+from typing import Callable, Optional
+from dataclasses import dataclass, field
 
-from astraguard.swarm.models import HealthSummary
+import numpy as np
+
+from astraguard.swarm.models import AgentID, HealthSummary
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +28,21 @@ QUANTIZATION_OFFSET = 128
 MIN_FLOAT = -1.0
 MAX_FLOAT = 1.0
 
+# LZ4 level by per-message latency budget (µs). Heartbeat payloads are ~40B,
+# where high-compression levels cost ~10x the time for the same output size.
+LZ4_LEVEL_BY_BUDGET_US = (
+    (20.0, 0),    # fast mode
+    (100.0, 3),   # HC, low effort
+)
+LZ4_MAX_LEVEL = 12
+
+# Per-peer streams (compress_for_peer): version 2 header adds a sequence number
+PEER_FORMAT_VERSION = 2
+FLAG_KEYFRAME = 0x02
+DEFAULT_KEYFRAME_INTERVAL = 30
+DEFAULT_MAX_PEERS = 256
+RESYNC_RETRY_FRAMES = 2  # Re-request if no keyframe within this many frames
+
 try:
     import lz4.frame
     HAS_LZ4 = True
@@ -40,22 +59,97 @@ class CompressionStats:
     compressed_size: int
     compression_ratio: float
     stages: dict
+    stage_timings_us: dict = field(default_factory=dict)
 
 
-class StateCompressor:
-    """Multi-stage compression pipeline for HealthSummary anomaly vectors."""
+@dataclass
+class _PeerContext:
+    """Delta state for one peer stream (encoder or decoder side)."""
+    prev_sig: Optional[np.ndarray] = None
+    seq: int = 0  # Encoder: next sequence to send. Decoder: last decoded.
+    since_keyframe: int = 0
+    force_keyframe: bool = False
+    awaiting_keyframe: bool = False
+    resync_seq: int = 0  # Decoder: sequence that triggered the last resync
+
+
+def lz4_level_for_budget(latency_budget_us: Optional[float]) -> int:
+    """Pick an LZ4 compression level that fits a per-message latency budget.
+    
+    Args:
+        latency_budget_us: Time allowed for the LZ4 stage (None = fastest)
+        
+    Returns:
+        lz4.frame compression level
+    """
+    if latency_budget_us is None:
+        return 0
+    for budget, level in LZ4_LEVEL_BY_BUDGET_US:
+        if latency_budget_us < budget:
+            return level
+    return LZ4_MAX_LEVEL
+
 
-    def __init__(self, prev_state: Optional[HealthSummary] = None):
+class StateCompressor:
+    """Multi-stage compression pipeline for HealthSummary anomaly vectors.
+    
+    Stages operate on NumPy arrays; the wire format (``<BBH`` header, float32
+    scalars, uint8 quantized deltas) is unchanged.
+    
+    compress_health()/decompress() share one delta reference (version 1
+    frames). compress_for_peer()/decompress_from_peer() keep an LRU-bounded
+    context per AgentID with keyframes and sequence numbers (version 2).
+    """
+
+    def __init__(
+        self,
+        prev_state: Optional[HealthSummary] = None,
+        compression_level: Optional[int] = None,
+        latency_budget_us: Optional[float] = None,
+        keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL,
+        max_peers: int = DEFAULT_MAX_PEERS,
+        resync_callback: Optional[Callable[[Optional[AgentID]], None]] = None,
+    ):
         """Initialize compressor with optional previous state for delta encoding.
         
         Args:
             prev_state: Previous HealthSummary for delta encoding reference
+            compression_level: Explicit LZ4 level (overrides latency_budget_us)
+            latency_budget_us: LZ4 stage latency budget used to pick a level
+                (default None = fast mode)
+            keyframe_interval: Per-peer streams send a full signature every
+                N messages
+            max_peers: Max encoder and decoder contexts kept each (LRU)
+            resync_callback: Called with the sender AgentID when a gap is
+                detected; should ask that sender to request_keyframe()
         """
-        self.prev_anomaly_sig = (
-            prev_state.anomaly_signature if prev_state else None
+        self.prev_anomaly_sig: Optional[np.ndarray] = (
+            np.asarray(prev_state.anomaly_signature, dtype=np.float64)
+            if prev_state else None
+        )
+        self.compression_level = (
+            compression_level
+            if compression_level is not None
+            else lz4_level_for_budget(latency_budget_us)
         )
         self.stats = None
 
+        if keyframe_interval < 1:
+            raise ValueError("keyframe_interval must be >= 1")
+        self.keyframe_interval = keyframe_interval
+        self.max_peers = max_peers
+        self.resync_callback = resync_callback
+        self._encoders: "OrderedDict[Optional[AgentID], _PeerContext]" = OrderedDict()
+        self._decoders: "OrderedDict[Optional[AgentID], _PeerContext]" = OrderedDict()
+        self.peer_stats = {
+            "keyframes_sent": 0,
+            "deltas_sent": 0,
+            "gaps_detected": 0,
+            "resync_requests": 0,
+            "frames_dropped": 0,
+            "evictions": 0,
+        }
+
     def compress_health(
         self, summary: HealthSummary, use_lz4: bool | None = None
     ) -> bytes:
@@ -76,19 +170,23 @@ class StateCompressor:
             use_lz4 = HAS_LZ4
         
         try:
+            t0 = time.perf_counter_ns()
             # Stage 1: Delta encoding
             delta_data = self._stage1_delta_encode(summary)
+            t1 = time.perf_counter_ns()
 
             # Stage 2: Quantization
             quantized_data = self._stage2_quantize(delta_data)
+            t2 = time.perf_counter_ns()
 
             # Stage 3: LZ4 compression (if available and enabled)
             if use_lz4 and HAS_LZ4:
                 compressed_data = self._stage3_lz4_compress(quantized_data)
             else:
-                compressed_data = quantized_data
+                compressed_data = quantized_data.tobytes()
+            t3 = time.perf_counter_ns()
 
-            # Build output: version (1 byte) + flags (1 byte) + original_size (4 bytes) + data
+            # Build output: version (1 byte) + flags (1 byte) + original_size (2 bytes) + data
             version = 1
             flags = 0x01 if (use_lz4 and HAS_LZ4) else 0x00  # Bit 0: LZ4 enabled
             original_size = self._calculate_original_size(summary)
@@ -99,7 +197,8 @@ class StateCompressor:
 
             # Update statistics
             self._update_stats(
-                summary, delta_data, quantized_data, compressed_data
+                summary, delta_data, quantized_data, compressed_data,
+                timings_ns=(t1 - t0, t2 - t1, t3 - t2),
             )
 
             return output
@@ -125,11 +224,11 @@ class StateCompressor:
             if len(data) < 6:
                 raise ValueError("Data too short for header")
 
-            version, flags, original_size = struct.unpack("<BBH", data[:4])
-            compressed_data = data[4:]
+            version, flags, original_size, _, compressed_data = self._parse_header(data)
 
-            if version != 1:
-                raise ValueError(f"Unsupported compression version: {version}")
+            # Keyframes (version 2) carry a full signature
+            if flags & FLAG_KEYFRAME:
+                self.prev_anomaly_sig = None
 
             # Stage 3 (reverse): LZ4 decompression
             lz4_enabled = bool(flags & 0x01)
@@ -152,149 +251,302 @@ class StateCompressor:
             logger.error(f"Decompression failed: {e}")
             raise ValueError(f"State decompression pipeline error: {e}")
 
-    # ===== Stage 1: Delta Encoding =====
+    # ===== Per-peer contexts =====
 
-    def _stage1_delta_encode(self, summary: HealthSummary) -> bytes:
-        """Stage 1: Delta encode anomaly signature against previous state.
+    def _context(self, contexts: "OrderedDict", peer: Optional[AgentID]) -> "_PeerContext":
+        """Get or create a peer context, evicting the least recently used."""
+        ctx = contexts.get(peer)
+        if ctx is None:
+            ctx = contexts[peer] = _PeerContext()
+            if len(contexts) > self.max_peers:
+                contexts.popitem(last=False)
+                self.peer_stats["evictions"] += 1
+        else:
+            contexts.move_to_end(peer)
+        return ctx
+
+    def request_keyframe(self, peer: Optional[AgentID]) -> None:
+        """Force the next message to peer to be a keyframe (resync answer).
         
-        Reduces 4.2KB → 1.5KB (65% reduction) by storing differences.
+        Args:
+            peer: Destination the resync request came from
         """
-        anomaly_sig = summary.anomaly_signature
+        self._context(self._encoders, peer).force_keyframe = True
+
+    def compress_for_peer(
+        self,
+        peer: Optional[AgentID],
+        summary: HealthSummary,
+        use_lz4: bool | None = None,
+    ) -> bytes:
+        """Compress against the delta state kept for one destination peer.
         
-        if self.prev_anomaly_sig is None:
-            # First message: store full signature
-            delta_values = anomaly_sig
+        Emits version 2 frames: ``<BBH`` header plus a ``<H`` sequence
+        number. Every keyframe_interval messages (or after request_keyframe)
+        the full signature is sent instead of a delta. The reference for the
+        next delta is what the receiver will reconstruct, so quantization
+        error does not accumulate between keyframes.
+        
+        Args:
+            peer: Destination AgentID (None for a broadcast stream)
+            summary: HealthSummary to compress
+            use_lz4: Enable LZ4 compression (stage 3). If None, auto-detect
+            
+        Returns:
+            Compressed bytes with version 2 header
+        """
+        if use_lz4 is None:
+            use_lz4 = HAS_LZ4
+        ctx = self._context(self._encoders, peer)
+
+        keyframe = (
+            ctx.prev_sig is None
+            or ctx.force_keyframe
+            or ctx.since_keyframe >= self.keyframe_interval
+        )
+        prev = None if keyframe else ctx.prev_sig
+        anomaly_sig = np.asarray(summary.anomaly_signature, dtype=np.float64)
+        quantized = self._stage2_quantize(self._delta_encode(summary, anomaly_sig, prev))
+
+        # Track the receiver's reconstruction (closed-loop delta)
+        reconstructed = self._stage2_dequantize(quantized)[2:34].astype(np.float64)
+        if prev is not None:
+            reconstructed += prev[:32]
+        ctx.prev_sig = reconstructed
+
+        # LZ4 frame overhead often exceeds the savings on ~40B deltas; the
+        # flag tells the receiver whether the pass was kept.
+        payload = quantized.tobytes()
+        flags = FLAG_KEYFRAME if keyframe else 0
+        if use_lz4 and HAS_LZ4:
+            compressed = self._stage3_lz4_compress(quantized)
+            if len(compressed) < len(payload):
+                payload = compressed
+                flags |= 0x01
+        header = struct.pack(
+            "<BBHH", PEER_FORMAT_VERSION, flags,
+            self._calculate_original_size(summary), ctx.seq,
+        )
+        ctx.seq = (ctx.seq + 1) & 0xFFFF
+        if keyframe:
+            ctx.since_keyframe = 1
+            ctx.force_keyframe = False
+            self.peer_stats["keyframes_sent"] += 1
         else:
-            # Store deltas relative to previous signature
-            delta_values = [
-                curr - prev
-                for curr, prev in zip(anomaly_sig, self.prev_anomaly_sig)
-            ]
-
-        # Encode as binary: each float32 is 4 bytes × 32 values = 128 bytes per signature
-        # Plus metadata: scalar fields (risk_score, recurrence_score)
-        output = struct.pack("<f", summary.risk_score)
-        output += struct.pack("<f", summary.recurrence_score)
+            ctx.since_keyframe += 1
+            self.peer_stats["deltas_sent"] += 1
+        return header + payload
+
+    def decompress_from_peer(
+        self, peer: Optional[AgentID], data: bytes
+    ) -> Optional[HealthSummary]:
+        """Decompress a version 2 frame using the context for its sender.
+        
+        Deltas that do not directly follow the last decoded sequence (loss,
+        reordering) or arrive before any keyframe cannot be applied; they are
+        dropped and a resync is requested once until the next keyframe.
+        
+        Args:
+            peer: Sender AgentID
+            data: Frame produced by compress_for_peer()
+            
+        Returns:
+            Restored HealthSummary, or None if the frame was dropped
+            
+        Raises:
+            ValueError: If the frame is malformed or not version 2
+        """
+        try:
+            version, flags, original_size, seq, body = self._parse_header(data)
+        except Exception as e:
+            raise ValueError(f"State decompression pipeline error: {e}")
+        if version != PEER_FORMAT_VERSION:
+            raise ValueError(f"Peer decoding requires version {PEER_FORMAT_VERSION} frames")
+
+        ctx = self._context(self._decoders, peer)
+        keyframe = bool(flags & FLAG_KEYFRAME)
+        if not keyframe:
+            if ctx.prev_sig is not None and seq == ctx.seq:
+                # Duplicate of the last applied delta; reference still valid
+                self.peer_stats["frames_dropped"] += 1
+                return None
+            if ctx.prev_sig is None or seq != (ctx.seq + 1) & 0xFFFF:
+                if ctx.prev_sig is not None:
+                    self.peer_stats["gaps_detected"] += 1
+                # Reference is unusable until the next keyframe. Ask again if
+                # the answering keyframe itself seems lost.
+                ctx.prev_sig = None
+                if (
+                    not ctx.awaiting_keyframe
+                    or (seq - ctx.resync_seq) & 0xFFFF >= RESYNC_RETRY_FRAMES
+                ):
+                    ctx.awaiting_keyframe = True
+                    ctx.resync_seq = seq
+                    self.peer_stats["resync_requests"] += 1
+                    if self.resync_callback is not None:
+                        self.resync_callback(peer)
+                self.peer_stats["frames_dropped"] += 1
+                return None
+
+        try:
+            if flags & 0x01:
+                if not HAS_LZ4:
+                    raise ValueError("LZ4 decompression not available")
+                body = self._stage3_lz4_decompress(body)
+            delta_data = self._stage2_dequantize(body)
+            summary, anomaly_sig = self._delta_decode(
+                delta_data, None if keyframe else ctx.prev_sig
+            )
+        except Exception as e:
+            logger.error(f"Decompression failed: {e}")
+            raise ValueError(f"State decompression pipeline error: {e}")
+
+        ctx.prev_sig = anomaly_sig
+        ctx.seq = seq
+        ctx.awaiting_keyframe = False
+        return summary
+
+    def get_peer_stats(self) -> dict:
+        """Get per-peer context statistics.
         
-        # Skip timestamp to avoid serialization issues
-        # Timestamp will be set to current time on deserialization
+        Returns:
+            Dictionary with context counts, keyframe/delta counts, gaps and resyncs
+        """
+        return {
+            **self.peer_stats,
+            "encoder_contexts": len(self._encoders),
+            "decoder_contexts": len(self._decoders),
+        }
 
-        # Encode anomaly signature deltas
-        for delta_val in delta_values:
-            output += struct.pack("<f", delta_val)
+    # ===== Stage 1: Delta Encoding =====
+
+    def _stage1_delta_encode(self, summary: HealthSummary) -> np.ndarray:
+        """Stage 1: Delta encode anomaly signature against previous state.
+        
+        Reduces 4.2KB → 1.5KB (65% reduction) by storing differences.
+        Returns float32 array [risk_score, recurrence_score, *deltas].
+        """
+        anomaly_sig = np.asarray(summary.anomaly_signature, dtype=np.float64)
+        output = self._delta_encode(summary, anomaly_sig, self.prev_anomaly_sig)
 
         # Update state for next delta
         self.prev_anomaly_sig = anomaly_sig
 
         return output
 
+    @staticmethod
+    def _delta_encode(
+        summary: HealthSummary, anomaly_sig: np.ndarray, prev: Optional[np.ndarray]
+    ) -> np.ndarray:
+        """Build the float32 stage 1 block against an explicit reference."""
+        # Deltas are taken in float64 and rounded once to float32, exactly as
+        # struct.pack("<f", curr - prev) did per value.
+        if prev is None:
+            delta_values = anomaly_sig
+        else:
+            n = min(len(anomaly_sig), len(prev))
+            delta_values = anomaly_sig[:n] - prev[:n]
+
+        # Scalar fields (risk_score, recurrence_score) lead the float32 block.
+        # Timestamp is skipped and set to current time on deserialization.
+        output = np.empty(2 + len(delta_values), dtype="<f4")
+        output[0] = summary.risk_score
+        output[1] = summary.recurrence_score
+        output[2:] = delta_values
+        return output
+
     def _stage1_delta_decode(
-        self, delta_data: bytes, original_size: int
+        self, delta_data: np.ndarray, original_size: int
     ) -> HealthSummary:
         """Stage 1 (reverse): Restore from delta encoding."""
-        offset = 0
+        summary, anomaly_sig = self._delta_decode(delta_data, self.prev_anomaly_sig)
+
+        # Update state for next delta
+        self.prev_anomaly_sig = anomaly_sig
 
-        # Unpack scalar fields
-        risk_score = struct.unpack_from("<f", delta_data, offset)[0]
-        offset += 4
+        return summary
 
-        recurrence_score = struct.unpack_from("<f", delta_data, offset)[0]
-        offset += 4
+    @staticmethod
+    def _delta_decode(
+        delta_data: np.ndarray, prev: Optional[np.ndarray]
+    ) -> tuple:
+        """Apply a stage 1 block to an explicit reference.
+        
+        Returns:
+            (HealthSummary, reconstructed signature as float64 array)
+        """
+        risk_score = float(delta_data[0])
+        recurrence_score = float(delta_data[1])
 
         # Timestamp skipped during encoding, use current time
         timestamp = datetime.datetime.utcnow()
 
-        # Unpack anomaly signature deltas
-        anomaly_sig = []
-        for _ in range(32):
-            delta_val = struct.unpack_from("<f", delta_data, offset)[0]
-            offset += 4
+        # Apply deltas if we have previous signature
+        anomaly_sig = delta_data[2:34].astype(np.float64)
+        if prev is not None and len(prev):
+            anomaly_sig += prev[:32]
 
-            # Apply delta if we have previous signature
-            if self.prev_anomaly_sig:
-                value = self.prev_anomaly_sig[len(anomaly_sig)] + delta_val
-            else:
-                value = delta_val
-
-            anomaly_sig.append(value)
-
-        # Update state for next delta
-        self.prev_anomaly_sig = anomaly_sig
-
-        return HealthSummary(
-            anomaly_signature=anomaly_sig,
+        summary = HealthSummary(
+            anomaly_signature=anomaly_sig.tolist(),
             risk_score=risk_score,
             recurrence_score=recurrence_score,
             timestamp=timestamp,
         )
-
-        return summary
+        return summary, anomaly_sig
 
     # ===== Stage 2: 8-bit Quantization =====
 
-    def _stage2_quantize(self, delta_data: bytes) -> bytes:
+    def _stage2_quantize(self, delta_data: np.ndarray) -> np.ndarray:
         """Stage 2: Quantize float32 to uint8 for 25% reduction.
         
         Maps [-1.0, 1.0] to [0, 255] with ±0.01 accuracy.
         Only quantizes anomaly signature, preserves scalar fields.
         """
-        offset = 0
-        output = b""
+        output = np.empty(8 + len(delta_data) - 2, dtype=np.uint8)
 
         # Keep scalar fields unquantized (8 bytes: risk_score (4) + recurrence_score (4))
-        # No timestamp in delta_data anymore
-        output += delta_data[:8]
-        offset = 8
-
-        # Quantize anomaly signature (32 values)
-        while offset < len(delta_data):
-            float_val = struct.unpack_from("<f", delta_data, offset)[0]
-            offset += 4
-
-            # Map to 8-bit range: [-1.0, 1.0] → [0, 255]
-            # Clamp to valid range
-            clamped = max(MIN_FLOAT, min(MAX_FLOAT, float_val))
-
-            # Normalize to [0, 1] then scale to [0, 255]
-            normalized = (clamped - MIN_FLOAT) / (MAX_FLOAT - MIN_FLOAT)
-            quantized = int(round(normalized * 255))
-
-            output += struct.pack("<B", quantized)
+        output[:8] = delta_data[:2].view(np.uint8)
+
+        # Clamp, normalize to [0, 1], scale to [0, 255]; np.rint rounds half
+        # to even like round(), so codes match the scalar implementation.
+        # In-place ufuncs avoid temporaries on these small vectors.
+        values = delta_data[2:].astype(np.float64)
+        np.maximum(values, MIN_FLOAT, out=values)
+        np.minimum(values, MAX_FLOAT, out=values)
+        values -= MIN_FLOAT
+        values /= MAX_FLOAT - MIN_FLOAT
+        values *= 255
+        output[8:] = np.rint(values, out=values)
 
         return output
 
-    def _stage2_dequantize(self, quantized_data: bytes) -> bytes:
+    def _stage2_dequantize(self, quantized_data) -> np.ndarray:
         """Stage 2 (reverse): Dequantize uint8 back to float32."""
-        offset = 0
-        output = b""
+        raw = np.frombuffer(quantized_data, dtype=np.uint8)
+        output = np.empty(2 + len(raw) - 8, dtype="<f4")
 
         # Copy scalar fields (8 bytes)
-        output += quantized_data[:8]
-        offset = 8
-
-        # Dequantize anomaly signature (32 values)
-        while offset < len(quantized_data):
-            quantized = struct.unpack_from("<B", quantized_data, offset)[0]
-            offset += 1
+        output[:2] = raw[:8].view("<f4")
 
-            # Map back: [0, 255] → [-1.0, 1.0]
-            normalized = quantized / 255.0
-            float_val = MIN_FLOAT + normalized * (MAX_FLOAT - MIN_FLOAT)
-
-            output += struct.pack("<f", float_val)
+        # Map back: [0, 255] → [-1.0, 1.0]
+        normalized = raw[8:] / 255.0
+        output[2:] = MIN_FLOAT + normalized * (MAX_FLOAT - MIN_FLOAT)
 
         return output
 
     # ===== Stage 3: LZ4 Compression =====
 
-    def _stage3_lz4_compress(self, quantized_data: bytes) -> bytes:
+    def _stage3_lz4_compress(self, quantized_data: np.ndarray) -> bytes:
         """Stage 3: LZ4 compression for 12% additional reduction."""
         if not HAS_LZ4:
             raise ValueError("LZ4 package not installed")
 
-        return lz4.frame.compress(quantized_data, compression_level=12)
+        # lz4 reads the array buffer directly, no intermediate bytes copy
+        return lz4.frame.compress(
+            memoryview(quantized_data), compression_level=self.compression_level
+        )
 
-    def _stage3_lz4_decompress(self, compressed_data: bytes) -> bytes:
+    def _stage3_lz4_decompress(self, compressed_data) -> bytes:
         """Stage 3 (reverse): LZ4 decompression."""
         if not HAS_LZ4:
             raise ValueError("LZ4 package not installed")
@@ -303,6 +555,24 @@ class StateCompressor:
 
     # ===== Utilities =====
 
+    @staticmethod
+    def _parse_header(data: bytes) -> tuple:
+        """Parse a version 1 or 2 header.
+        
+        Returns:
+            (version, flags, original_size, sequence or None, body memoryview)
+        """
+        if len(data) < 6:
+            raise ValueError("Data too short for header")
+
+        version, flags, original_size = struct.unpack_from("<BBH", data)
+        if version == 1:
+            return version, flags, original_size, None, memoryview(data)[4:]
+        if version == PEER_FORMAT_VERSION:
+            (seq,) = struct.unpack_from("<H", data, 4)
+            return version, flags, original_size, seq, memoryview(data)[6:]
+        raise ValueError(f"Unsupported compression version: {version}")
+
     def _calculate_original_size(self, summary: HealthSummary) -> int:
         """Estimate original size of HealthSummary."""
         # Approximation: 12 bytes (scalars) + 32 × 4 bytes (signature) = 140 bytes
@@ -311,25 +581,31 @@ class StateCompressor:
     def _update_stats(
         self,
         summary: HealthSummary,
-        delta_data: bytes,
-        quantized_data: bytes,
+        delta_data: np.ndarray,
+        quantized_data: np.ndarray,
         compressed_data: bytes,
+        timings_ns: tuple = (0, 0, 0),
     ) -> None:
         """Calculate and store compression statistics."""
         original_size = self._calculate_original_size(summary) * 30  # Approx 4.2KB for 30 messages
         
         self.stats = CompressionStats(
             original_size=original_size,
-            delta_size=len(delta_data),
-            quantized_size=len(quantized_data),
+            delta_size=delta_data.nbytes,
+            quantized_size=quantized_data.nbytes,
             compressed_size=len(compressed_data),
             compression_ratio=1.0
-            - (len(compressed_data) / max(1, len(delta_data))),
+            - (len(compressed_data) / max(1, delta_data.nbytes)),
             stages={
-                "delta": len(delta_data),
-                "quantized": len(quantized_data),
+                "delta": delta_data.nbytes,
+                "quantized": quantized_data.nbytes,
                 "compressed": len(compressed_data),
             },
+            stage_timings_us={
+                "delta": timings_ns[0] / 1000,
+                "quantize": timings_ns[1] / 1000,
+                "lz4": timings_ns[2] / 1000,
+            },
         )
 
     @staticmethod
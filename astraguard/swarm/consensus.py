@@ -6,27 +6,34 @@ Implements consensus protocol for binding global decisions:
 - Leader proposes → Peers vote → Quorum executes
 - 5s timeout fallback prevents deadlock during partitions
 - Proposal deduplication via unique proposal IDs
+- Event-driven quorum: each vote resolves the proposal's future as soon as
+  quorum is met, so many proposals can be in flight at once
+- Peers batch their votes for all pending proposals into one message
 
 Issue #406: Consensus for global actions
 Depends on: #405 (leader election), #400 (registry), #398 (bus), #403 (reliable delivery)
 """
 
 import asyncio
+import statistics
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, Optional, List, Set
+from typing import Deque, Dict, Optional, List, Set, Tuple
 from datetime import datetime, timedelta
 from uuid import uuid4
 import logging
 
 from astraguard.swarm.models import AgentID, SwarmConfig
 from astraguard.swarm.leader_election import LeaderElection
-from astraguard.swarm.bus import SwarmMessageBus
+from astraguard.swarm.bus import SwarmMessageBus, json_subscriber
 from astraguard.swarm.registry import SwarmRegistry
-from astraguard.swarm.types import QoSLevel
+from astraguard.swarm.types import QoSLevel, SubscriptionID
 
 logger = logging.getLogger(__name__)
 
+TIME_TO_QUORUM_SAMPLES = 1024
+
 
 class ProposalState(Enum):
     """Consensus proposal states."""
@@ -65,6 +72,21 @@ class ConsensusMetrics:
     timeout_count: int = 0
     avg_duration_ms: float = 0.0
     last_proposal_id: Optional[str] = None
+    in_flight: int = 0
+    max_in_flight: int = 0
+    vote_batches_sent: int = 0
+    votes_sent: int = 0
+    time_to_quorum_ms: Deque[float] = field(
+        default_factory=lambda: deque(maxlen=TIME_TO_QUORUM_SAMPLES)
+    )
+
+    def time_to_quorum_percentile(self, pct: int) -> float:
+        """Proposal publish → quorum decision latency percentile."""
+        if not self.time_to_quorum_ms:
+            return 0.0
+        if len(self.time_to_quorum_ms) == 1:
+            return self.time_to_quorum_ms[0]
+        return statistics.quantiles(self.time_to_quorum_ms, n=100)[pct - 1]
 
     def to_dict(self) -> Dict:
         """Export metrics as dictionary."""
@@ -75,6 +97,13 @@ class ConsensusMetrics:
             "timeout_count": self.timeout_count,
             "avg_duration_ms": self.avg_duration_ms,
             "last_proposal_id": self.last_proposal_id or "none",
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "vote_batches_sent": self.vote_batches_sent,
+            "votes_sent": self.votes_sent,
+            "time_to_quorum_p50_ms": self.time_to_quorum_percentile(50),
+            "time_to_quorum_p95_ms": self.time_to_quorum_percentile(95),
+            "time_to_quorum_p99_ms": self.time_to_quorum_percentile(99),
         }
 
 
@@ -101,6 +130,7 @@ class ConsensusEngine:
     PROPOSAL_REQUEST_TOPIC = "coord/proposal_request"
     VOTE_GRANT_TOPIC = "coord/vote_grant"
     VOTE_DENY_TOPIC = "coord/vote_deny"
+    VOTE_BATCH_TOPIC = "coord/vote_batch"
     ACTION_APPROVED_TOPIC = "coord/action_approved"
     DEFAULT_TIMEOUT_SECONDS = 5
 
@@ -117,6 +147,8 @@ class ConsensusEngine:
         election: LeaderElection,
         registry: SwarmRegistry,
         bus: SwarmMessageBus,
+        batch_votes: bool = True,
+        vote_batch_window_ms: float = 0.0,
     ):
         """
         Initialize consensus engine.
@@ -126,11 +158,17 @@ class ConsensusEngine:
             election: LeaderElection for leader validation
             registry: SwarmRegistry for peer discovery
             bus: SwarmMessageBus for message delivery (QoS=2)
+            batch_votes: Send this peer's votes for all pending proposals as
+                one VOTE_BATCH message instead of one message per vote
+            vote_batch_window_ms: How long a batch collects votes before it
+                is sent (0 = flush on the next loop iteration)
         """
         self.config = config
         self.election = election
         self.registry = registry
         self.bus = bus
+        self.batch_votes = batch_votes
+        self.vote_batch_window_ms = vote_batch_window_ms
 
         # Proposal tracking
         self.pending_proposals: Dict[str, ProposalRequest] = {}
@@ -138,12 +176,21 @@ class ConsensusEngine:
         self.proposal_denials: Dict[str, Dict[AgentID, str]] = {}
         self.executed_proposals: Set[str] = set()
 
+        # Quorum waiters: proposal_id → (future, action)
+        self._quorum_waiters: Dict[str, Tuple[asyncio.Future, str]] = {}
+        self._membership_task: Optional[asyncio.Task] = None
+
+        # Outgoing vote batch (peer side)
+        self._vote_grants: List[str] = []
+        self._vote_denials: Dict[str, str] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+
         # Metrics
         self.metrics = ConsensusMetrics()
 
         # Task management
         self._running = False
-        self._subscription_ids = []
+        self._subscription_ids: List[SubscriptionID] = []
 
     async def start(self) -> None:
         """Start consensus engine and subscribe to vote messages."""
@@ -155,30 +202,29 @@ class ConsensusEngine:
         logger.info(f"Starting consensus engine for {self.config.agent_id.satellite_serial}")
 
         # Subscribe to vote messages
-        self.bus.subscribe(
-            self.PROPOSAL_REQUEST_TOPIC,
-            self._handle_proposal_request,
-            qos=QoSLevel.RELIABLE,
-        )
-        self.bus.subscribe(
-            self.VOTE_GRANT_TOPIC,
-            self._handle_vote_grant,
-            qos=QoSLevel.RELIABLE,
-        )
-        self.bus.subscribe(
-            self.VOTE_DENY_TOPIC,
-            self._handle_vote_deny,
-            qos=QoSLevel.RELIABLE,
-        )
-        self.bus.subscribe(
-            self.ACTION_APPROVED_TOPIC,
-            self._handle_action_approved,
-            qos=QoSLevel.RELIABLE,
-        )
+        for topic, handler in (
+            (self.PROPOSAL_REQUEST_TOPIC, self._handle_proposal_request),
+            (self.VOTE_GRANT_TOPIC, self._handle_vote_grant),
+            (self.VOTE_DENY_TOPIC, self._handle_vote_deny),
+            (self.VOTE_BATCH_TOPIC, self._handle_vote_batch),
+            (self.ACTION_APPROVED_TOPIC, self._handle_action_approved),
+        ):
+            self._subscription_ids.append(
+                self.bus.subscribe(topic, json_subscriber(self.bus, handler))
+            )
 
     async def stop(self) -> None:
-        """Stop consensus engine."""
+        """Stop consensus engine, sending any votes still batched."""
         self._running = False
+        for subscription in self._subscription_ids:
+            self.bus.unsubscribe(subscription)
+        self._subscription_ids = []
+        for task in (self._flush_task, self._membership_task):
+            if task is not None and not task.done():
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+        self._flush_task = self._membership_task = None
+        await self._send_vote_batch()
         logger.info("Consensus engine stopped")
 
     async def propose(self, action: str, params: Dict = None, timeout: Optional[int] = None) -> bool:
@@ -212,6 +258,8 @@ class ConsensusEngine:
         self.pending_proposals[proposal_id] = proposal
         self.proposal_votes[proposal_id] = {self.config.agent_id}  # Vote for self
         self.proposal_denials[proposal_id] = {}
+        self.metrics.in_flight += 1
+        self.metrics.max_in_flight = max(self.metrics.max_in_flight, self.metrics.in_flight)
 
         logger.info(f"Proposing {action} (id={proposal_id[:8]}..., timeout={timeout}s)")
 
@@ -229,14 +277,22 @@ class ConsensusEngine:
                 self._wait_for_quorum(proposal_id, action),
                 timeout=timeout
             )
+            self.metrics.time_to_quorum_ms.append(
+                (datetime.now() - start_time).total_seconds() * 1000
+            )
         except asyncio.TimeoutError:
             logger.warning(f"Proposal {proposal_id[:8]}... timed out after {timeout}s, using fallback")
             approved = await self._fallback_decision(proposal_id, action)
             self.metrics.timeout_count += 1
+        finally:
+            self.metrics.in_flight -= 1
 
         # Record metrics
         elapsed_ms = (datetime.now() - start_time).total_seconds() * 1000
         self.metrics.proposal_count += 1
+        self.metrics.avg_duration_ms += (
+            elapsed_ms - self.metrics.avg_duration_ms
+        ) / self.metrics.proposal_count
         self.metrics.last_proposal_id = proposal_id
         if approved:
             self.metrics.approved_count += 1
@@ -261,27 +317,95 @@ class ConsensusEngine:
 
         return approved
 
+    def _alive_count(self) -> int:
+        """Alive peers (including self) used for the quorum requirement.
+
+        Registries other than SwarmRegistry only need get_alive_peers().
+        """
+        if isinstance(self.registry, SwarmRegistry):
+            return self.registry.get_alive_count()
+        return len(self.registry.get_alive_peers())
+
+    def _check_quorum(self, proposal_id: str, action: str) -> Optional[bool]:
+        """Decide a proposal from the votes so far.
+        
+        Returns:
+            True if quorum granted, False if every alive peer responded
+            without quorum, None if still undecided
+        """
+        alive_count = self._alive_count()
+        quorum_fraction = self.PROPOSAL_TYPES.get(action, {}).get("quorum_fraction", 2/3)
+        quorum_size = max(1, int(alive_count * quorum_fraction))
+
+        # Check if quorum achieved
+        votes = self.proposal_votes.get(proposal_id, ())
+        if len(votes) >= quorum_size:
+            return True
+
+        # Check if quorum impossible (too many denials)
+        denials = self.proposal_denials.get(proposal_id, {})
+        if len(votes) + len(denials) == alive_count:
+            # All peers have responded
+            return False
+        return None
+
+    def _record_grant(self, proposal_id: str, voter: AgentID) -> None:
+        """Count a granting vote and resolve the proposal if decided."""
+        votes = self.proposal_votes.get(proposal_id)
+        if votes is not None:
+            votes.add(voter)
+            self._on_vote(proposal_id)
+
+    def _record_denial(self, proposal_id: str, voter: AgentID, reason: str) -> None:
+        """Count a denying vote and resolve the proposal if decided."""
+        denials = self.proposal_denials.get(proposal_id)
+        if denials is not None:
+            denials[voter] = reason
+            self._on_vote(proposal_id)
+
+    def _on_vote(self, proposal_id: str) -> None:
+        """Resolve the proposal's quorum future once it is decided."""
+        waiter = self._quorum_waiters.get(proposal_id)
+        if waiter is None or waiter[0].done():
+            return
+        decided = self._check_quorum(proposal_id, waiter[1])
+        if decided is not None:
+            waiter[0].set_result(decided)
+
     async def _wait_for_quorum(self, proposal_id: str, action: str) -> bool:
-        """Wait for quorum votes to be received."""
-        while True:
-            # Calculate quorum requirement
-            alive_peers = self.registry.get_alive_peers()
-            quorum_fraction = self.PROPOSAL_TYPES.get(action, {}).get("quorum_fraction", 2/3)
-            quorum_size = max(1, int(len(alive_peers) * quorum_fraction))
-
-            # Check if quorum achieved
-            votes = self.proposal_votes.get(proposal_id, set())
-            if len(votes) >= quorum_size:
-                return True
-
-            # Check if quorum impossible (too many denials)
-            denials = self.proposal_denials.get(proposal_id, {})
-            total_responded = len(votes) + len(denials)
-            if total_responded == len(alive_peers):
-                # All peers have responded
-                return len(votes) >= quorum_size
-
-            await asyncio.sleep(0.1)
+        """Wait for quorum votes to be received.
+        
+        Resolved by vote arrival (and registry membership changes) rather
+        than polling.
+        """
+        decided = self._check_quorum(proposal_id, action)
+        if decided is not None:
+            return decided
+
+        future = asyncio.get_running_loop().create_future()
+        self._quorum_waiters[proposal_id] = (future, action)
+        self._watch_membership()
+        try:
+            return await future
+        finally:
+            self._quorum_waiters.pop(proposal_id, None)
+            if not self._quorum_waiters and self._membership_task is not None:
+                self._membership_task.cancel()
+                self._membership_task = None
+
+    def _watch_membership(self) -> None:
+        """Re-check waiting proposals when the alive set changes."""
+        if not isinstance(self.registry, SwarmRegistry):
+            return
+        if self._membership_task is None or self._membership_task.done():
+            self._membership_task = asyncio.create_task(self._membership_loop())
+
+    async def _membership_loop(self) -> None:
+        version = self.registry.alive_version
+        while self._quorum_waiters:
+            version = await self.registry.wait_for_change(version)
+            for proposal_id in list(self._quorum_waiters):
+                self._on_vote(proposal_id)
 
     async def _fallback_decision(self, proposal_id: str, action: str) -> bool:
         """Fallback decision when timeout occurs (leader accepts)."""
@@ -306,7 +430,9 @@ class ConsensusEngine:
             approved = await self._evaluate_proposal(action, params)
 
             # Send vote
-            if approved:
+            if self.batch_votes:
+                self._queue_vote(proposal_id, approved, "local_constraint")
+            elif approved:
                 await self.bus.publish(
                     self.VOTE_GRANT_TOPIC,
                     {"proposal_id": proposal_id, "voter_id": self.config.agent_id.satellite_serial},
@@ -322,6 +448,53 @@ class ConsensusEngine:
         except Exception as e:
             logger.error(f"Error handling proposal request: {e}")
 
+    def _queue_vote(self, proposal_id: str, approved: bool, reason: str) -> None:
+        """Add a vote to the outgoing batch, scheduling a flush if needed."""
+        if approved:
+            self._vote_grants.append(proposal_id)
+        else:
+            self._vote_denials[proposal_id] = reason
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_votes())
+
+    async def _flush_votes(self) -> None:
+        """Collect votes for one batch window, then send them together."""
+        await asyncio.sleep(self.vote_batch_window_ms / 1000.0)
+        await self._send_vote_batch()
+
+    async def _send_vote_batch(self) -> None:
+        """Publish all queued votes as one VOTE_BATCH message to the leader."""
+        if not self._vote_grants and not self._vote_denials:
+            return
+        grants, self._vote_grants = self._vote_grants, []
+        denials, self._vote_denials = self._vote_denials, {}
+        try:
+            await self.bus.publish(
+                self.VOTE_BATCH_TOPIC,
+                {
+                    "voter_id": self.config.agent_id.satellite_serial,
+                    "grants": grants,
+                    "denials": denials,
+                },
+                qos=QoSLevel.RELIABLE,
+                receiver=self.election.get_leader(),
+            )
+            self.metrics.vote_batches_sent += 1
+            self.metrics.votes_sent += len(grants) + len(denials)
+        except Exception as e:
+            logger.error(f"Error sending vote batch: {e}")
+
+    async def _handle_vote_batch(self, message: dict) -> None:
+        """Handle a batch of votes from one peer."""
+        try:
+            voter = AgentID.create("astra-v3.0", message.get("voter_id", ""))
+            for proposal_id in message.get("grants", ()):
+                self._record_grant(proposal_id, voter)
+            for proposal_id, reason in message.get("denials", {}).items():
+                self._record_denial(proposal_id, voter, reason)
+        except Exception as e:
+            logger.error(f"Error handling vote batch: {e}")
+
     async def _handle_vote_grant(self, message: dict) -> None:
         """Handle incoming vote grant from peer."""
         try:
@@ -332,7 +505,7 @@ class ConsensusEngine:
                 return
 
             voter = AgentID.create("astra-v3.0", voter_id)
-            self.proposal_votes[proposal_id].add(voter)
+            self._record_grant(proposal_id, voter)
             logger.debug(f"Vote grant for {proposal_id[:8]}... from {voter_id}")
 
         except Exception as e:
@@ -349,7 +522,7 @@ class ConsensusEngine:
                 return
 
             voter = AgentID.create("astra-v3.0", voter_id)
-            self.proposal_denials[proposal_id][voter] = reason
+            self._record_denial(proposal_id, voter, reason)
             logger.debug(f"Vote deny for {proposal_id[:8]}... from {voter_id} ({reason})")
 
         except Exception as e:
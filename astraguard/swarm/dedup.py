@@ -0,0 +1,93 @@
+"""
+DedupWindow - Bounded FIFO deduplication window.
+
+Used by SwarmMessageBus (message keys) and ReliableDelivery (sequence
+numbers) to reject duplicates over the most recent N ids:
+- O(1) insert, lookup and eviction
+- Fixed memory budget: a preallocated ring of N slots plus an index dict
+- Evicts strictly in arrival order (oldest first)
+"""
+
+from typing import Dict, Hashable, Iterator, List, Optional
+
+
+class DedupWindow:
+    """Remembers the last `capacity` ids in arrival order.
+
+    Ids live in a fixed-size ring; an index dict maps each id to its slot.
+    When the ring wraps, the id in the slot being overwritten is evicted
+    from the index, so memory never exceeds `capacity` entries.
+
+    Example:
+        >>> window = DedupWindow(capacity=2)
+        >>> window.add("a"), window.add("a")
+        (True, False)
+        >>> window.add("b"); window.add("c")  # evicts "a"
+        True
+        True
+        >>> "a" in window
+        False
+    """
+
+    __slots__ = ("capacity", "_ring", "_index", "_head", "evictions")
+
+    def __init__(self, capacity: int = 1000):
+        """Initialize dedup window.
+
+        Args:
+            capacity: Maximum number of ids remembered
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._ring: List[Optional[Hashable]] = [None] * capacity
+        self._index: Dict[Hashable, int] = {}
+        self._head = 0  # Next slot to write (oldest entry once full)
+        self.evictions = 0
+
+    def add(self, key: Hashable) -> bool:
+        """Record an id.
+
+        Args:
+            key: Message id or sequence number
+
+        Returns:
+            True if the id is new, False if it is already in the window
+        """
+        if key in self._index:
+            return False
+
+        slot = self._head
+        old = self._ring[slot]
+        # The slot may be empty or hold an id that was discarded
+        if old is not None and self._index.get(old) == slot:
+            del self._index[old]
+            self.evictions += 1
+        self._ring[slot] = key
+        self._index[key] = slot
+        self._head = (slot + 1) % self.capacity
+        return True
+
+    def discard(self, key: Hashable) -> None:
+        """Forget an id; its ring slot is reclaimed when overwritten."""
+        self._index.pop(key, None)
+
+    def clear(self) -> None:
+        """Forget all ids."""
+        self._ring = [None] * self.capacity
+        self._index.clear()
+        self._head = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        """Iterate live ids from oldest to newest."""
+        for offset in range(self.capacity):
+            slot = (self._head + offset) % self.capacity
+            key = self._ring[slot]
+            if key is not None and self._index.get(key) == slot:
+                yield key
@@ -0,0 +1,242 @@
+"""
+Compact set digests for swarm anti-entropy.
+
+Used by SwarmAdaptiveMemory to avoid blind peer traffic:
+- BloomFilter: fixed-size membership summary a node broadcasts so peers
+  only query it for keys it may hold (no false negatives)
+- PartitionedBloomFilter: a BloomFilter split by key hash into parts that
+  each fit one message
+- MerkleDigest: order-independent hash tree over key → version entries;
+  two replicas compare hashes top-down and exchange only the buckets that
+  differ, so convergence costs O(differences) rather than O(keys)
+"""
+
+import hashlib
+import math
+import struct
+from typing import Dict, Iterator, List, Optional, Set
+
+
+def _hash128(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+class BloomFilter:
+    """Bit array with k hash positions per key (Kirsch-Mitzenmacher double hashing).
+
+    Example:
+        >>> bloom = BloomFilter.for_capacity(1000, false_positive_rate=0.01)
+        >>> bloom.add("pattern-001")
+        >>> "pattern-001" in bloom
+        True
+    """
+
+    __slots__ = ("num_bits", "num_hashes", "count", "_bits")
+
+    _HEADER = struct.Struct("<IB")
+
+    def __init__(self, num_bits: int = 8192, num_hashes: int = 4):
+        """Initialize an empty filter.
+
+        Args:
+            num_bits: Filter size in bits (rounded up to a whole byte)
+            num_hashes: Bit positions set per key
+        """
+        if num_bits <= 0 or num_hashes <= 0:
+            raise ValueError("num_bits and num_hashes must be positive")
+        self.num_bits = (num_bits + 7) // 8 * 8
+        self.num_hashes = num_hashes
+        self.count = 0
+        self._bits = bytearray(self.num_bits // 8)
+
+    @classmethod
+    def for_capacity(cls, capacity: int, false_positive_rate: float = 0.01) -> "BloomFilter":
+        """Size a filter for `capacity` keys at the target false-positive rate."""
+        if not 0.0 < false_positive_rate < 1.0:
+            raise ValueError("false_positive_rate must be in (0, 1)")
+        capacity = max(1, capacity)
+        num_bits = math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2)
+        num_hashes = max(1, round(num_bits / capacity * math.log(2)))
+        return cls(max(64, num_bits), num_hashes)
+
+    def _positions(self, key: str) -> Iterator[int]:
+        digest = _hash128(key.encode())
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, key: str) -> None:
+        """Insert a key."""
+        for pos in self._positions(key):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        """False means definitely absent; True means possibly present."""
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def size_bytes(self) -> int:
+        """Encoded size."""
+        return self._HEADER.size + len(self._bits)
+
+    def to_bytes(self) -> bytes:
+        """Encode as header (num_bits, num_hashes) + bit array."""
+        return self._HEADER.pack(self.num_bits, self.num_hashes) + bytes(self._bits)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "BloomFilter":
+        """Decode a filter produced by to_bytes()."""
+        num_bits, num_hashes = cls._HEADER.unpack_from(data)
+        bits = data[cls._HEADER.size:]
+        if len(bits) * 8 != num_bits:
+            raise ValueError("Bloom filter payload does not match header")
+        bloom = cls(num_bits, num_hashes)
+        bloom._bits[:] = bits
+        bloom.count = -1  # Unknown after decoding
+        return bloom
+
+
+class PartitionedBloomFilter:
+    """Independent BloomFilters, each covering the keys that hash to it.
+
+    Lets a filter too large for one message travel as several, each usable
+    on arrival. A partition not received yet (None) answers True, so there
+    are still no false negatives.
+
+    Example:
+        >>> bloom = PartitionedBloomFilter.for_capacity(50000, 0.01, partitions=8)
+        >>> bloom.add("pattern-001")
+        >>> "pattern-001" in bloom.partitions[bloom.partition_of("pattern-001", 8)]
+        True
+    """
+
+    __slots__ = ("partitions",)
+
+    def __init__(self, partitions: List[Optional[BloomFilter]]):
+        if not partitions:
+            raise ValueError("at least one partition is required")
+        self.partitions = partitions
+
+    @classmethod
+    def for_capacity(
+        cls, capacity: int, false_positive_rate: float = 0.01, partitions: int = 1
+    ) -> "PartitionedBloomFilter":
+        """Split `capacity` keys evenly over `partitions` filters."""
+        shape = BloomFilter.for_capacity(math.ceil(max(1, capacity) / partitions), false_positive_rate)
+        return cls([BloomFilter(shape.num_bits, shape.num_hashes) for _ in range(partitions)])
+
+    @staticmethod
+    def partition_of(key: str, partitions: int) -> int:
+        """Partition holding a key (independent of the bit positions)."""
+        digest = hashlib.blake2b(key.encode(), digest_size=4, person=b"bloom-partition")
+        return int.from_bytes(digest.digest(), "little") % partitions
+
+    def add(self, key: str) -> None:
+        """Insert a key (ignored if its partition is unknown)."""
+        bloom = self.partitions[self.partition_of(key, len(self.partitions))]
+        if bloom is not None:
+            bloom.add(key)
+
+    def __contains__(self, key: str) -> bool:
+        bloom = self.partitions[self.partition_of(key, len(self.partitions))]
+        return bloom is None or key in bloom
+
+
+class MerkleDigest:
+    """Two-level hash tree over key → version entries.
+
+    Keys hash into LEAVES buckets; a leaf is the XOR of its entries' hashes,
+    so inserts, updates and removals are O(1) and independent of order.
+    Internal nodes (FANOUT children each) are recomputed lazily for the
+    branches that changed.
+
+    Node addressing: depth 0 is the root, depth 1 has FANOUT nodes, depth 2
+    has LEAVES = FANOUT ** 2 leaves. children(depth, index) returns the child
+    hashes used to descend one level during comparison.
+    """
+
+    FANOUT = 16
+    LEAVES = FANOUT * FANOUT
+
+    def __init__(self):
+        self._versions: Dict[str, str] = {}
+        self._entry: Dict[str, int] = {}
+        self._buckets: List[Set[str]] = [set() for _ in range(self.LEAVES)]
+        self._leaves: List[int] = [0] * self.LEAVES
+        self._branches: List[bytes] = [b""] * self.FANOUT
+        self._dirty: Set[int] = set(range(self.FANOUT))
+        self._root: bytes = b""
+
+    @classmethod
+    def bucket_of(cls, key: str) -> int:
+        """Leaf bucket for a key."""
+        return hashlib.blake2b(key.encode(), digest_size=2).digest()[0] % cls.LEAVES
+
+    def set(self, key: str, version: str) -> None:
+        """Record (or update) a key's version."""
+        if self._versions.get(key) == version:
+            return
+        bucket = self.bucket_of(key)
+        entry = int.from_bytes(_hash128(f"{key}\0{version}".encode()), "little")
+        self._leaves[bucket] ^= self._entry.get(key, 0) ^ entry
+        self._entry[key] = entry
+        self._versions[key] = version
+        self._buckets[bucket].add(key)
+        self._mark(bucket)
+
+    def discard(self, key: str) -> None:
+        """Remove a key if present."""
+        if key not in self._versions:
+            return
+        bucket = self.bucket_of(key)
+        self._leaves[bucket] ^= self._entry.pop(key)
+        del self._versions[key]
+        self._buckets[bucket].discard(key)
+        self._mark(bucket)
+
+    def clear(self) -> None:
+        """Remove every key."""
+        self.__init__()
+
+    def _mark(self, bucket: int) -> None:
+        self._dirty.add(bucket // self.FANOUT)
+        self._root = b""
+
+    def _branch(self, index: int) -> bytes:
+        if index in self._dirty:
+            start = index * self.FANOUT
+            self._branches[index] = _hash128(
+                b"".join(leaf.to_bytes(16, "little") for leaf in self._leaves[start:start + self.FANOUT])
+            )
+            self._dirty.discard(index)
+        return self._branches[index]
+
+    def root(self) -> str:
+        """Root hash (hex); equal roots mean identical key → version sets."""
+        if not self._root:
+            self._root = _hash128(b"".join(self._branch(i) for i in range(self.FANOUT)))
+        return self._root.hex()
+
+    def children(self, depth: int, index: int = 0) -> List[str]:
+        """Hex hashes of a node's children (depth 0 → branches, depth 1 → leaves)."""
+        if depth == 0:
+            return [self._branch(i).hex() for i in range(self.FANOUT)]
+        if depth == 1:
+            start = index * self.FANOUT
+            return [leaf.to_bytes(16, "little").hex() for leaf in self._leaves[start:start + self.FANOUT]]
+        raise ValueError("children() is defined for depth 0 and 1")
+
+    def bucket_versions(self, bucket: int) -> Dict[str, str]:
+        """Key → version entries in one leaf bucket."""
+        return {key: self._versions[key] for key in self._buckets[bucket]}
+
+    def __len__(self) -> int:
+        return len(self._versions)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._versions
@@ -7,21 +7,28 @@ Issue #401: Communication protocols - health state broadcasting
 - HMAC signatures for authenticity over noisy ISL
 - Congestion detection: backoff 30s→60s→120s during anomaly storms
 - Integration: Registry (#400), Bus (#398), Compressor (#399)
+- Binary broadcast payload: compressed health and raw HMAC digest are
+  carried as bytes, never hex-encoded inside a JSON string
+- Health travels as a per-sender delta stream with periodic keyframes;
+  a receiver that misses a frame unicasts a resync request on
+  RESYNC_TOPIC and the sender answers with a keyframe
 """
 
 import asyncio
 import hashlib
 import hmac
-import json
 import logging
+import struct
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Dict, List, Optional, Set, Union
+from uuid import UUID
 
 from astraguard.swarm.models import AgentID, HealthSummary, SwarmConfig
 from astraguard.swarm.registry import SwarmRegistry
 from astraguard.swarm.bus import SwarmMessageBus
 from astraguard.swarm.compressor import StateCompressor
+from astraguard.swarm.types import QoSLevel, SubscriptionID, SwarmMessage
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +37,17 @@ BROADCAST_INTERVAL = 30  # seconds (normal)
 CONGESTION_THRESHOLD = 0.7  # 70% utilization triggers backoff
 HEALTH_DELTA_THRESHOLD = 0.95  # Skip broadcast if health unchanged >95%
 BROADCAST_TOPIC = "health/"
+RESYNC_TOPIC = "health/resync/"
+
+# Binary broadcast layout (version 1, little-endian):
+#   <2sB16sqBH  magic "HB", version, agent uuid, timestamp µs since epoch,
+#               constellation length, compressed health length
+#   constellation, compressed health, HMAC-SHA256 digest of everything before
+BROADCAST_MAGIC = b"HB"
+BROADCAST_VERSION = 1
+_BROADCAST_HEADER = struct.Struct("<2sB16sqBH")
+_SIGNATURE_SIZE = hashlib.sha256().digest_size
+_EPOCH = datetime(1970, 1, 1)
 
 
 @dataclass
@@ -40,6 +58,10 @@ class BroadcastMetrics:
     successful_broadcasts: int = 0
     failed_broadcasts: int = 0
     skipped_broadcasts: int = 0
+    received_broadcasts: int = 0
+    rejected_broadcasts: int = 0
+    resync_requests_sent: int = 0
+    resync_requests_received: int = 0
     average_latency_ms: float = 0.0
     current_interval: float = BROADCAST_INTERVAL
     current_congestion_level: float = 0.0
@@ -55,7 +77,8 @@ class HealthBroadcaster:
         registry: SwarmRegistry,
         bus: SwarmMessageBus,
         compressor: StateCompressor,
-        private_key: Optional[bytes] = None
+        private_key: Optional[bytes] = None,
+        peer_keys: Optional[Dict[AgentID, bytes]] = None,
     ):
         """Initialize health broadcaster.
         
@@ -66,17 +89,24 @@ class HealthBroadcaster:
             bus: SwarmMessageBus for pub/sub
             compressor: StateCompressor for health data compression
             private_key: Optional private key for HMAC signing (default: agent_id.to_bytes())
+            peer_keys: Optional HMAC keys for verifying peers' broadcasts
+                (default: derived from each peer's AgentID like our own)
         """
         self.config = config
         self.agent_id = agent_id
         self.registry = registry
         self.bus = bus
         self.compressor = compressor
-        # Use agent_id's constellation + serial as key material
-        key_material = f"{agent_id.constellation}:{agent_id.satellite_serial}".encode()
-        self.private_key = private_key or key_material
+        self.private_key = private_key or self._default_key(agent_id)
+        self.peer_keys: Dict[AgentID, bytes] = dict(peer_keys or {})
+        # Gaps found while decoding are answered over the bus
+        if self.compressor.resync_callback is None:
+            self.compressor.resync_callback = self._request_resync
         
         self._broadcast_task: Optional[asyncio.Task] = None
+        self._resync_tasks: Set[asyncio.Task] = set()
+        self._subscriptions: List[SubscriptionID] = []
+        self._wakeup: Optional[asyncio.Event] = None
         self._is_running = False
         self._last_health_hash: Optional[str] = None
         self._current_interval = BROADCAST_INTERVAL
@@ -91,6 +121,12 @@ class HealthBroadcaster:
             return
         
         self._is_running = True
+        self._wakeup = asyncio.Event()
+        constellation = self.agent_id.constellation
+        self._subscriptions = [
+            self.bus.subscribe(BROADCAST_TOPIC + constellation, self._on_health_broadcast),
+            self.bus.subscribe(RESYNC_TOPIC + constellation, self._on_resync_request),
+        ]
         self._broadcast_task = asyncio.create_task(self._broadcast_loop())
         logger.info("HealthBroadcaster started")
     
@@ -100,12 +136,17 @@ class HealthBroadcaster:
             return
         
         self._is_running = False
+        for subscription in self._subscriptions:
+            self.bus.unsubscribe(subscription)
+        self._subscriptions = []
         if self._broadcast_task:
             self._broadcast_task.cancel()
             try:
                 await self._broadcast_task
             except asyncio.CancelledError:
                 pass
+        for task in list(self._resync_tasks):
+            task.cancel()
         
         logger.info(f"HealthBroadcaster stopped. Metrics: {self.metrics}")
     
@@ -120,8 +161,8 @@ class HealthBroadcaster:
                 # Broadcast health
                 await self._broadcast_health()
                 
-                # Sleep with current interval
-                await asyncio.sleep(self._current_interval)
+                # Sleep with current interval; a resync request ends it early
+                await self._sleep(self._current_interval)
                 
             except asyncio.CancelledError:
                 break
@@ -129,6 +170,14 @@ class HealthBroadcaster:
                 logger.error(f"Error in broadcast loop: {e}", exc_info=True)
                 await asyncio.sleep(self._current_interval)
     
+    async def _sleep(self, seconds: float) -> None:
+        """Sleep until the next broadcast is due or a keyframe is requested."""
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
+        self._wakeup.clear()
+    
     async def _broadcast_health(self):
         """Broadcast current health state with compression and HMAC signature."""
         try:
@@ -147,40 +196,116 @@ class HealthBroadcaster:
                 self.metrics.skipped_broadcasts += 1
                 return
             
-            # Compress health state
-            compressed_health = self.compressor.compress(health)
+            # Compress against the broadcast stream (delta or keyframe)
+            compressed_health = self.compressor.compress_for_peer(None, health)
             
-            # Create signed payload
-            payload = {
-                "agent_id": self.agent_id.uuid.hex,
-                "constellation": self.agent_id.constellation,
-                "compressed_health": compressed_health.hex(),
-                "timestamp": datetime.utcnow().isoformat(),
-            }
+            # Create signed binary payload
+            payload = self.encode_broadcast(compressed_health)
             
-            # Add HMAC signature
-            payload["signature"] = self._sign_payload(payload)
+            # Update hash for next comparison before publishing, so a resync
+            # request handled while the publish is in flight still forces
+            # the next broadcast
+            self._last_health_hash = self._hash_health(health)
             
             # Publish to bus with QoS=1 (at least once)
             start_time = datetime.utcnow()
-            await self.bus.publish(
+            delivered = await self.bus.publish(
                 topic=BROADCAST_TOPIC + self.agent_id.constellation,
-                payload=json.dumps(payload),
+                payload=payload,
                 qos=1,  # AT_LEAST_ONCE
                 receiver=None  # Broadcast to all
             )
             
             # Record metrics
             latency_ms = (datetime.utcnow() - start_time).total_seconds() * 1000
-            self._update_metrics(True, latency_ms)
-            
-            # Update hash for next comparison
-            self._last_health_hash = self._hash_health(health)
+            self._update_metrics(delivered, latency_ms)
             
         except Exception as e:
             logger.error(f"Error broadcasting health: {e}", exc_info=True)
+            self._last_health_hash = None
             self._update_metrics(False, 0.0)
     
+    async def _on_health_broadcast(self, message: SwarmMessage) -> None:
+        """Verify a peer's broadcast and record its health in the registry.
+        
+        Frames that cannot be applied (gap before a keyframe) are dropped by
+        the compressor, which calls _request_resync for the sender.
+        """
+        sender = message.sender
+        if sender == self.agent_id:
+            return
+        if message.qos >= QoSLevel.ACK:
+            await self.bus.acknowledge(message)
+        try:
+            decoded = self.decode_broadcast(message.payload, self.peer_key(sender))
+            if (
+                decoded is None
+                or decoded["agent_id"] != sender.uuid
+                or decoded["constellation"] != self.agent_id.constellation
+            ):
+                self.metrics.rejected_broadcasts += 1
+                logger.warning(f"Rejected health broadcast from {sender.satellite_serial}")
+                return
+            health = self.compressor.decompress_from_peer(
+                sender, decoded["compressed_health"]
+            )
+        except ValueError as e:
+            self.metrics.rejected_broadcasts += 1
+            logger.warning(f"Malformed health broadcast from {sender.satellite_serial}: {e}")
+            return
+        if health is None:
+            return
+        self.metrics.received_broadcasts += 1
+        self.registry.record_peer_health(sender, health)
+    
+    def _request_resync(self, peer: Optional[AgentID]) -> None:
+        """Ask peer for a keyframe (compressor resync_callback)."""
+        if peer is None:
+            return
+        try:
+            task = asyncio.get_running_loop().create_task(self._send_resync(peer))
+        except RuntimeError:
+            logger.warning("No event loop running; resync request not sent")
+            return
+        self._resync_tasks.add(task)
+        task.add_done_callback(self._resync_tasks.discard)
+    
+    async def _send_resync(self, peer: AgentID) -> None:
+        """Unicast a resync request to the sender of a broken stream."""
+        sent = await self.bus.publish(
+            topic=RESYNC_TOPIC + self.agent_id.constellation,
+            payload=self.agent_id.uuid.bytes,
+            qos=QoSLevel.FIRE_FORGET,  # Compressor re-asks if still missing
+            receiver=peer,
+        )
+        if sent:
+            self.metrics.resync_requests_sent += 1
+        else:
+            logger.warning(f"Resync request to {peer.satellite_serial} not sent")
+    
+    async def _on_resync_request(self, message: SwarmMessage) -> None:
+        """Answer a peer's resync request with a keyframe right away."""
+        if message.sender == self.agent_id:
+            return
+        if message.receiver is not None and message.receiver != self.agent_id:
+            return
+        self.metrics.resync_requests_received += 1
+        self.compressor.request_keyframe(None)
+        # Send even if our health is unchanged since the last broadcast
+        self._last_health_hash = None
+        if self._wakeup is not None:
+            self._wakeup.set()
+    
+    def peer_key(self, agent_id: AgentID) -> bytes:
+        """HMAC key used to verify broadcasts from agent_id."""
+        key = self.peer_keys.get(agent_id)
+        return key if key is not None else self._default_key(agent_id)
+    
+    @staticmethod
+    def _default_key(agent_id: AgentID) -> bytes:
+        """Key material derived from the agent's constellation + serial."""
+        return f"{agent_id.constellation}:{agent_id.satellite_serial}".encode()
+    
     def _should_broadcast(self, health: HealthSummary) -> bool:
         """Check if health has changed enough to broadcast.
         
@@ -200,8 +325,79 @@ class HealthBroadcaster:
         data = f"{health.risk_score}:{health.recurrence_score}:{','.join(str(x) for x in health.anomaly_signature[:8])}"
         return hashlib.sha256(data.encode()).hexdigest()
     
+    def encode_broadcast(
+        self, compressed_health: bytes, timestamp: Optional[datetime] = None
+    ) -> bytes:
+        """Build the signed binary broadcast payload.
+        
+        Args:
+            compressed_health: StateCompressor output
+            timestamp: Broadcast time (default: now, UTC)
+            
+        Returns:
+            Header + constellation + compressed health + 32B HMAC digest
+        """
+        timestamp = timestamp or datetime.utcnow()
+        constellation = self.agent_id.constellation.encode("utf-8")
+        body = b"".join((
+            _BROADCAST_HEADER.pack(
+                BROADCAST_MAGIC,
+                BROADCAST_VERSION,
+                self.agent_id.uuid.bytes,
+                (timestamp - _EPOCH) // timedelta(microseconds=1),
+                len(constellation),
+                len(compressed_health),
+            ),
+            constellation,
+            compressed_health,
+        ))
+        return body + hmac.new(self.private_key, body, hashlib.sha256).digest()
+
+    @staticmethod
+    def decode_broadcast(
+        data: Union[bytes, memoryview], public_key: bytes
+    ) -> Optional[dict]:
+        """Verify and decode a binary broadcast without copying its health data.
+        
+        Args:
+            data: Payload produced by encode_broadcast()
+            public_key: Agent's public key (same as private for HMAC)
+            
+        Returns:
+            Dict with agent_id (UUID), constellation, compressed_health
+            (memoryview into data) and timestamp, or None if the signature
+            is invalid
+            
+        Raises:
+            ValueError: If the payload is malformed or the version unsupported
+        """
+        view = memoryview(data)
+        if len(view) < _BROADCAST_HEADER.size + _SIGNATURE_SIZE:
+            raise ValueError("Broadcast payload too short")
+        (magic, version, agent_uuid, timestamp_us,
+         constellation_len, health_len) = _BROADCAST_HEADER.unpack_from(view)
+        if magic != BROADCAST_MAGIC:
+            raise ValueError("Not a health broadcast payload")
+        if version != BROADCAST_VERSION:
+            raise ValueError(f"Unsupported broadcast version {version}")
+        body_len = _BROADCAST_HEADER.size + constellation_len + health_len
+        if len(view) != body_len + _SIGNATURE_SIZE:
+            raise ValueError("Broadcast payload length mismatch")
+
+        expected_sig = hmac.new(public_key, view[:body_len], hashlib.sha256).digest()
+        if not hmac.compare_digest(view[body_len:], expected_sig):
+            return None
+
+        offset = _BROADCAST_HEADER.size
+        return {
+            "agent_id": UUID(bytes=agent_uuid),
+            "constellation": str(view[offset:offset + constellation_len], "utf-8"),
+            "compressed_health": view[offset + constellation_len:body_len].toreadonly(),
+            "timestamp": _EPOCH + timedelta(microseconds=timestamp_us),
+        }
+
     def _sign_payload(self, payload: dict) -> str:
-        """Create HMAC signature for payload authenticity.
+        """Create HMAC signature for a legacy JSON payload.
         
         Signature covers: agent_id, constellation, compressed_health, timestamp
         """
@@ -216,7 +412,7 @@ class HealthBroadcaster:
     
     @staticmethod
     def verify_signature(payload: dict, public_key: bytes) -> bool:
-        """Verify HMAC signature of received health broadcast.
+        """Verify HMAC signature of a legacy JSON health broadcast.
         
         Args:
             payload: Health broadcast message
@@ -6,13 +6,19 @@ Issue #402: Communication protocols - intent signal exchange
 - QoS=2 reliable delivery (prep for Issue #403)
 - Conflict scoring: geometric overlap + temporal overlap + priority
 - Integration: Registry (#400), Bus (#398), Compressor (#399)
+
+Active intents are indexed so a conflict check does not score every one of
+them: per action type, by execution window (IntervalTree) and, for
+attitude_adjust, by target angle (uniform angle buckets). Expired intents
+leave the index through a deadline heap.
 """
 
 import asyncio
+import heapq
 import json
 import logging
-from dataclasses import dataclass
-from typing import Dict, List, Optional
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 import math
 
@@ -21,6 +27,7 @@ from astraguard.swarm.models import AgentID
 from astraguard.swarm.registry import SwarmRegistry
 from astraguard.swarm.bus import SwarmMessageBus
 from astraguard.swarm.compressor import StateCompressor
+from astraguard.swarm.interval_tree import IntervalTree
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +35,8 @@ logger = logging.getLogger(__name__)
 INTENT_HISTORY_SIZE = 100  # Keep last N intents per agent
 INTENT_TIMEOUT = 300  # Intent expires after 5 minutes
 CONFLICT_THRESHOLD = 0.6  # 0.0-1.0, flag if >= this value
+ANGLE_BUCKET_DEGREES = 5.0  # Width of the attitude_adjust target angle grid
+_BOUND_SLACK = 1e-9  # Guards bucket bounds against float rounding
 
 
 @dataclass
@@ -39,6 +48,42 @@ class IntentStats:
     failed_broadcasts: int = 0
     conflicts_detected: int = 0
     average_conflict_score: float = 0.0
+    conflict_checks: int = 0
+    candidates_scored: int = 0
+
+
+@dataclass
+class _IndexedIntent:
+    """Active intent plus the keys it is indexed under."""
+
+    intent: IntentMessage
+    entry_id: int
+    deadline: datetime
+    start: datetime
+    end: Optional[datetime] = None  # None: duration not a non-negative number
+    bucket: Optional[int] = None  # None: not placed in the angle/time grid
+
+    @property
+    def safety(self) -> bool:
+        return self.intent.priority == PriorityEnum.SAFETY
+
+
+@dataclass
+class _IntentBucket:
+    """Intents of one action type in one angle bucket, indexed by time window."""
+
+    tree: IntervalTree = field(default_factory=IntervalTree)
+    entries: Dict[int, _IndexedIntent] = field(default_factory=dict)
+    non_safety: int = 0
+
+
+@dataclass
+class _ActionIndex:
+    """Active intents of one action type."""
+
+    buckets: Dict[int, _IntentBucket] = field(default_factory=dict)
+    irregular: Dict[int, _IndexedIntent] = field(default_factory=dict)
+    count: int = 0
 
 
 class IntentBroadcaster:
@@ -66,6 +111,13 @@ class IntentBroadcaster:
         self.stats = IntentStats()
         self.sequence_counter = 0
         
+        # Active intent index (mirrors the unexpired part of intent_history)
+        self._active: Dict[int, _IndexedIntent] = {}
+        self._history_entries: Dict[AgentID, List[int]] = {}
+        self._by_action: Dict[str, _ActionIndex] = {}
+        self._expiry_heap: List[Tuple[datetime, int]] = []
+        self._next_entry_id = 0
+        
         logger.info("IntentBroadcaster initialized")
     
     async def publish_intent(self, intent: IntentMessage) -> bool:
@@ -135,26 +187,102 @@ class IntentBroadcaster:
         - Temporal overlap (duration overlap)
         - Priority override (SAFETY beats others)
         
+        Returns the same maximum as scoring every active intent, but only
+        scores candidates that can raise it: any intent of another action
+        type scores exactly 0.2, and same-type intents are searched through
+        the angle buckets and time windows with an upper bound per bucket.
+        
         Returns:
             Float 0.0-1.0 where 1.0 = complete conflict
         """
         if not self.intent_history:
             return 0.0
         
-        # Collect all non-expired intents
-        known_intents = self._get_active_intents()
-        
-        if not known_intents:
+        self._expire(datetime.utcnow())
+        if not self._active:
             return 0.0
         
-        # Compute scores against each known intent
-        scores = []
-        for known in known_intents:
-            score = self._compute_pairwise_conflict(new_intent, known)
-            scores.append(score)
+        self.stats.conflict_checks += 1
+        same = self._by_action.get(new_intent.action_type)
+        same_count = same.count if same is not None else 0
         
-        # Return max conflict (worst case)
-        return max(scores) if scores else 0.0
+        # Different action types: every such pair scores 0.2
+        best = 0.2 if len(self._active) > same_count else 0.0
+        if same_count:
+            best = self._max_same_action_conflict(new_intent, same, best)
+        return best
+    
+    def _max_same_action_conflict(
+        self, new_intent: IntentMessage, index: _ActionIndex, best: float
+    ) -> float:
+        """Max pairwise conflict against intents of the same action type.
+        
+        Buckets are visited in order of their upper bound (geometric bound x
+        full temporal overlap) and the search stops once no bucket can beat
+        the best score. Inside a bucket the interval tree yields the
+        overlapping windows; non-overlapping intents score geometric x 0.1
+        and are only looked at while that floor could still win.
+        """
+        probe = self._make_entry(new_intent, -1)
+        if probe.bucket is None:
+            # Unindexable parameters: score every same-type intent
+            for entry in self._iter_action(index):
+                best = self._score(new_intent, entry, best)
+            return best
+        
+        for entry in index.irregular.values():
+            best = self._score(new_intent, entry, best)
+        
+        scale = 0.5 if probe.safety else 1.0
+        attitude = new_intent.action_type == "attitude_adjust"
+        if attitude:
+            angle = new_intent.parameters.get("target_angle", 0)
+            bounds = sorted(
+                ((self._angle_bound(angle, key), key) for key in index.buckets),
+                reverse=True,
+            )
+        else:
+            bounds = [(0.5, key) for key in index.buckets]
+        
+        for geometric_bound, key in bounds:
+            if min(1.0, geometric_bound * scale) + _BOUND_SLACK <= best:
+                break
+            bucket = index.buckets[key]
+            overlapping = list(bucket.tree.overlapping(probe.start, probe.end))
+            for entry in overlapping:
+                best = self._score(new_intent, entry, best)
+            
+            floor_bound = min(1.0, geometric_bound * 0.1 * scale)
+            if floor_bound + _BOUND_SLACK <= best or len(overlapping) == len(bucket.entries):
+                continue
+            if attitude:
+                for entry in bucket.entries.values():
+                    best = self._score(new_intent, entry, best)
+            else:
+                # Constant geometric score: the floor only depends on priority
+                overlapping_non_safety = sum(1 for entry in overlapping if not entry.safety)
+                floor = 0.5 * 0.1
+                if probe.safety:
+                    floor *= 0.5
+                if bucket.non_safety == overlapping_non_safety:
+                    floor *= 0.5  # Only SAFETY intents left outside the window
+                best = max(best, min(1.0, floor))
+        return best
+    
+    def _score(self, new_intent: IntentMessage, entry: _IndexedIntent, best: float) -> float:
+        self.stats.candidates_scored += 1
+        return max(best, self._compute_pairwise_conflict(new_intent, entry.intent))
+    
+    @staticmethod
+    def _angle_bound(angle: float, key: int) -> float:
+        """Upper bound of the geometric score against any angle in bucket key."""
+        low = key * ANGLE_BUCKET_DEGREES
+        high = low + ANGLE_BUCKET_DEGREES
+        near = 0.0 if low <= angle <= high else min(abs(angle - low), abs(angle - high))
+        far = max(abs(angle - low), abs(angle - high))
+        # Wrapped distance min(d, 360 - d) is concave in d: minimal at an end
+        distance = min(min(near, 360 - near), min(far, 360 - far))
+        return max(0.0, 1.0 - distance / 180.0)
     
     def _compute_pairwise_conflict(
         self, intent_a: IntentMessage, intent_b: IntentMessage
@@ -269,26 +397,109 @@ class IntentBroadcaster:
         """Store intent in local history."""
         if intent.sender not in self.intent_history:
             self.intent_history[intent.sender] = []
+            self._history_entries[intent.sender] = []
         
         history = self.intent_history[intent.sender]
         history.append(intent)
+        entries = self._history_entries[intent.sender]
+        entries.append(self._index_intent(intent))
         
         # Trim to size limit
         if len(history) > INTENT_HISTORY_SIZE:
             self.intent_history[intent.sender] = history[-INTENT_HISTORY_SIZE:]
+            for entry_id in entries[:-INTENT_HISTORY_SIZE]:
+                self._unindex_intent(entry_id)
+            self._history_entries[intent.sender] = entries[-INTENT_HISTORY_SIZE:]
     
     def _get_active_intents(self) -> List[IntentMessage]:
         """Get all non-expired intents from history."""
-        now = datetime.utcnow()
-        active = []
+        self._expire(datetime.utcnow())
+        return [entry.intent for entry in self._active.values()]
+    
+    def _make_entry(self, intent: IntentMessage, entry_id: int) -> _IndexedIntent:
+        """Describe an intent by its time window and angle bucket.
         
-        for agent_id, intents in self.intent_history.items():
-            for intent in intents:
-                age = (now - intent.timestamp).total_seconds()
-                if age < INTENT_TIMEOUT:
-                    active.append(intent)
+        Intents whose duration or target angle is not numeric get no bucket;
+        they score with constant geometric/temporal factors and are always
+        checked directly.
+        """
+        entry = _IndexedIntent(
+            intent=intent,
+            entry_id=entry_id,
+            deadline=intent.timestamp + timedelta(seconds=INTENT_TIMEOUT),
+            start=intent.timestamp,
+        )
+        parameters = intent.parameters
+        duration = parameters.get("duration", 0)
+        if not isinstance(duration, (int, float)) or not 0 <= duration < math.inf:
+            return entry
+        try:
+            entry.end = intent.timestamp + timedelta(seconds=duration)
+        except OverflowError:
+            return entry
+        if intent.action_type != "attitude_adjust":
+            entry.bucket = 0
+            return entry
+        angle = parameters.get("target_angle", 0)
+        if isinstance(angle, (int, float)) and math.isfinite(angle):
+            entry.bucket = math.floor(angle / ANGLE_BUCKET_DEGREES)
+        return entry
+    
+    def _index_intent(self, intent: IntentMessage) -> int:
+        """Add an intent to the active index and its expiry to the heap."""
+        entry_id = self._next_entry_id
+        self._next_entry_id += 1
+        entry = self._make_entry(intent, entry_id)
+        self._active[entry_id] = entry
+        heapq.heappush(self._expiry_heap, (entry.deadline, entry_id))
         
-        return active
+        index = self._by_action.get(intent.action_type)
+        if index is None:
+            index = self._by_action[intent.action_type] = _ActionIndex()
+        index.count += 1
+        if entry.bucket is None:
+            index.irregular[entry_id] = entry
+        else:
+            bucket = index.buckets.get(entry.bucket)
+            if bucket is None:
+                bucket = index.buckets[entry.bucket] = _IntentBucket()
+            bucket.tree.add(entry.start, entry.end, entry, key=entry_id)
+            bucket.entries[entry_id] = entry
+            bucket.non_safety += not entry.safety
+        return entry_id
+    
+    def _unindex_intent(self, entry_id: int) -> None:
+        """Drop an intent from the active index (no-op if already gone)."""
+        entry = self._active.pop(entry_id, None)
+        if entry is None:
+            return
+        action_type = entry.intent.action_type
+        index = self._by_action[action_type]
+        index.count -= 1
+        if entry.bucket is None:
+            del index.irregular[entry_id]
+        else:
+            bucket = index.buckets[entry.bucket]
+            bucket.tree.remove(entry.start, entry_id)
+            del bucket.entries[entry_id]
+            bucket.non_safety -= not entry.safety
+            if not bucket.entries:
+                del index.buckets[entry.bucket]
+        if not index.count:
+            del self._by_action[action_type]
+    
+    def _expire(self, now: datetime) -> None:
+        """Pop intents whose timeout has passed off the deadline heap."""
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            _, entry_id = heapq.heappop(heap)
+            self._unindex_intent(entry_id)
+    
+    @staticmethod
+    def _iter_action(index: _ActionIndex):
+        yield from index.irregular.values()
+        for bucket in index.buckets.values():
+            yield from bucket.entries.values()
     
     def _update_average_conflict(self, new_score: float):
         """Update running average conflict score."""
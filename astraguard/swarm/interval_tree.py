@@ -0,0 +1,150 @@
+"""
+Dynamic interval tree for time-window overlap queries.
+
+Used by IntentBroadcaster to find active intents whose execution window
+overlaps a new intent without scanning every active intent:
+- Treap ordered by (start, key), each node augmented with the maximum end
+  in its subtree so whole subtrees ending before the query are skipped
+- Half-open intervals [start, end); endpoints only need to be comparable
+  (datetime, float, ...)
+- O(log n) expected insert/remove, O(log n + k) overlap query
+"""
+
+import random
+from typing import Any, Hashable, Iterator, Optional, Tuple
+
+
+class _Node:
+    __slots__ = ("start", "end", "key", "value", "priority", "left", "right", "max_end")
+
+    def __init__(self, start, end, key, value, priority: float):
+        self.start = start
+        self.end = end
+        self.key = key
+        self.value = value
+        self.priority = priority
+        self.left: Optional["_Node"] = None
+        self.right: Optional["_Node"] = None
+        self.max_end = end
+
+    def update(self) -> None:
+        max_end = self.end
+        if self.left is not None and self.left.max_end > max_end:
+            max_end = self.left.max_end
+        if self.right is not None and self.right.max_end > max_end:
+            max_end = self.right.max_end
+        self.max_end = max_end
+
+
+class IntervalTree:
+    """Set of [start, end) intervals keyed by a unique tie-breaker.
+
+    Example:
+        >>> tree = IntervalTree()
+        >>> tree.add(0, 10, "a", key=1)
+        >>> tree.add(20, 30, "b", key=2)
+        >>> list(tree.overlapping(5, 25))
+        ['a', 'b']
+    """
+
+    def __init__(self, seed: Optional[int] = None):
+        """Initialize an empty tree.
+
+        Args:
+            seed: Optional seed for node priorities (deterministic shape)
+        """
+        self._root: Optional[_Node] = None
+        self._size = 0
+        self._random = random.Random(seed)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, start, end, value: Any, key: Hashable) -> None:
+        """Insert an interval.
+
+        Args:
+            start: Inclusive start
+            end: Exclusive end
+            value: Payload returned by overlapping()
+            key: Unique tie-breaker among intervals with the same start
+        """
+        node = _Node(start, end, key, value, self._random.random())
+        self._root = self._insert(self._root, node)
+        self._size += 1
+
+    def remove(self, start, key: Hashable) -> bool:
+        """Remove the interval inserted with (start, key).
+
+        Returns:
+            True if it was present
+        """
+        self._root, found = self._remove(self._root, (start, key))
+        if found:
+            self._size -= 1
+        return found
+
+    def overlapping(self, start, end) -> Iterator[Any]:
+        """Yield values whose interval overlaps [start, end)."""
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node is None or not node.max_end > start:
+                continue
+            stack.append(node.left)
+            if node.start < end:
+                if node.end > start:
+                    yield node.value
+                stack.append(node.right)
+
+    def _insert(self, node: Optional[_Node], new: _Node) -> _Node:
+        if node is None:
+            return new
+        if new.priority > node.priority:
+            new.left, new.right = self._split(node, (new.start, new.key))
+            new.update()
+            return new
+        if (new.start, new.key) < (node.start, node.key):
+            node.left = self._insert(node.left, new)
+        else:
+            node.right = self._insert(node.right, new)
+        node.update()
+        return node
+
+    def _remove(self, node: Optional[_Node], target: Tuple) -> Tuple[Optional[_Node], bool]:
+        if node is None:
+            return None, False
+        current = (node.start, node.key)
+        if target == current:
+            return self._merge(node.left, node.right), True
+        if target < current:
+            node.left, found = self._remove(node.left, target)
+        else:
+            node.right, found = self._remove(node.right, target)
+        node.update()
+        return node, found
+
+    def _split(self, node: Optional[_Node], at: Tuple) -> Tuple[Optional[_Node], Optional[_Node]]:
+        """Split into (< at, >= at)."""
+        if node is None:
+            return None, None
+        if (node.start, node.key) < at:
+            node.right, right = self._split(node.right, at)
+            node.update()
+            return node, right
+        left, node.left = self._split(node.left, at)
+        node.update()
+        return left, node
+
+    def _merge(self, left: Optional[_Node], right: Optional[_Node]) -> Optional[_Node]:
+        if left is None:
+            return right
+        if right is None:
+            return left
+        if left.priority > right.priority:
+            left.right = self._merge(left.right, right)
+            left.update()
+            return left
+        right.left = self._merge(left, right.left)
+        right.update()
+        return right
@@ -2,9 +2,12 @@
 Leader Election Engine with Raft-Inspired Timeouts
 
 Implements Raft-inspired leader election protocol with:
-- Randomized election timeouts (150-300ms)
+- Randomized election timeouts (150-300ms), armed as timers rather than polled
+- Pre-vote round so a partitioned or lagging agent cannot force an election
 - AgentID lexicographic tiebreaker
-- 10-second heartbeat lease for split-brain protection
+- 10-second leader lease renewed by quorum-acknowledged heartbeats, shortened
+  on the leader side by a bounded clock-drift assumption
+- Heartbeat interval that backs off while leadership is stable
 - Quorum-based voting (N/2 + 1)
 - State machine: FOLLOWER → CANDIDATE → LEADER
 
@@ -16,14 +19,14 @@ import asyncio
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Dict, Optional, Set
+from typing import Dict, List, Optional, Set
 from random import randint
 import logging
 
 from astraguard.swarm.models import AgentID, SwarmConfig
-from astraguard.swarm.bus import SwarmMessageBus
+from astraguard.swarm.bus import SwarmMessageBus, json_subscriber
 from astraguard.swarm.registry import SwarmRegistry
-from astraguard.swarm.types import QoSLevel
+from astraguard.swarm.types import QoSLevel, SubscriptionID
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +46,10 @@ class ElectionMetrics:
     current_state: str = ElectionState.FOLLOWER.value
     last_leader_id: Optional[str] = None
     lease_remaining_ms: float = 0.0
+    pre_vote_count: int = 0
+    heartbeats_sent: int = 0
+    lease_acks_received: int = 0
+    heartbeat_interval_ms: float = 0.0
 
     def to_dict(self) -> Dict[str, any]:
         """Export metrics as dictionary."""
@@ -52,6 +59,10 @@ class ElectionMetrics:
             "current_state": self.current_state,
             "last_leader_id": self.last_leader_id or "none",
             "lease_remaining_ms": self.lease_remaining_ms,
+            "pre_vote_count": self.pre_vote_count,
+            "heartbeats_sent": self.heartbeats_sent,
+            "lease_acks_received": self.lease_acks_received,
+            "heartbeat_interval_ms": self.heartbeat_interval_ms,
         }
 
 
@@ -60,23 +71,40 @@ class LeaderElection:
     Raft-inspired leader election with randomized timeouts.
     
     Algorithm:
-    1. FOLLOWER waits for heartbeat (10s lease)
-    2. On timeout, becomes CANDIDATE with random(150-300ms) election delay
-    3. Candidate broadcasts RequestVote to alive peers
-    4. Voters grant vote if candidate has higher AgentID or same ID with higher uptime
+    1. FOLLOWER sleeps until its leader lease (10s) plus random(150-300ms) lapses
+    2. It then broadcasts a PreVote for term + 1; peers still holding a lease
+       for a live leader stay silent, so no term is burned
+    3. On pre-vote quorum, becomes CANDIDATE and broadcasts one RequestVote
+    4. Voters grant vote (unicast) if candidate has higher AgentID or same ID
+       with higher uptime, and they hold no lease for another leader
     5. On quorum (N/2 + 1), candidate becomes LEADER
-    6. LEADER sends AppendEntries heartbeat every 1s to maintain lease
-    7. Split-brain prevented via lease expiry + deterministic tiebreaker
+    6. LEADER starts heartbeat rounds; followers extend their lease on receipt
+       and unicast a lease ack. A quorum of acks renews the leader lease from
+       the round start, shortened by 2 * CLOCK_DRIFT_BOUND
+    7. Each confirmed round with unchanged membership doubles the heartbeat
+       interval up to MAX_HEARTBEAT_INTERVAL_MS; an unconfirmed round or a
+       membership change resets it
+    8. Split-brain prevented via lease expiry + deterministic tiebreaker
+
+    Timeouts are awaited with asyncio timers and woken early by state changes,
+    so a follower under a stable leader wakes about once per lease rather
+    than every 50ms.
     """
 
     # Configuration constants
     ELECTION_TIMEOUT_MIN_MS = 150
     ELECTION_TIMEOUT_MAX_MS = 300
     HEARTBEAT_INTERVAL_MS = 1000
+    MAX_HEARTBEAT_INTERVAL_MS = 3000   # At least 3 renewals per leader lease
+    HEARTBEAT_BACKOFF = 2.0
     LEASE_VALIDITY_SECONDS = 10
+    CLOCK_DRIFT_BOUND = 0.05           # Max clock rate error per agent
     HEARTBEAT_TOPIC = "coord/heartbeat"
     VOTE_REQUEST_TOPIC = "coord/vote_request"
     VOTE_GRANT_TOPIC = "coord/vote_grant"
+    PRE_VOTE_REQUEST_TOPIC = "coord/pre_vote_request"
+    PRE_VOTE_GRANT_TOPIC = "coord/pre_vote_grant"
+    LEASE_ACK_TOPIC = "coord/lease_ack"
 
     def __init__(
         self,
@@ -106,6 +134,20 @@ class LeaderElection:
         self.current_term: int = 0
         self.votes_received: Set[AgentID] = set()
         self.election_start_time: Optional[datetime] = None
+        self.pre_votes_received: Set[AgentID] = set()
+        self._pre_vote_term: Optional[int] = None
+        self._requested_term: Optional[int] = None
+        self._election_timeout_ms: int = self.ELECTION_TIMEOUT_MAX_MS
+        self._election_jitter: timedelta = self._random_timeout()
+        self._election_not_before: datetime = datetime.min
+
+        # Heartbeat rounds (leader side)
+        self.heartbeat_interval_ms: float = self.HEARTBEAT_INTERVAL_MS
+        self._heartbeat_seq: int = 0
+        self._round_started: Optional[datetime] = None
+        self._round_acks: Set[AgentID] = set()
+        self._round_confirmed: bool = True
+        self._round_alive_version: Optional[int] = None
 
         # Metrics
         self.metrics = ElectionMetrics()
@@ -113,7 +155,10 @@ class LeaderElection:
         # Task management
         self._election_task: Optional[asyncio.Task] = None
         self._heartbeat_task: Optional[asyncio.Task] = None
+        self._subscriptions: List[SubscriptionID] = []
         self._running = False
+        self._wake: Optional[asyncio.Event] = None
+        self._wake_loop: Optional[asyncio.AbstractEventLoop] = None
 
     def is_leader(self) -> bool:
         """Check if this agent is current leader with valid lease."""
@@ -149,29 +194,28 @@ class LeaderElection:
         self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
 
         # Subscribe to vote and heartbeat messages
-        self.bus.subscribe(
-            self.VOTE_REQUEST_TOPIC,
-            self._handle_vote_request,
-            qos=QoSLevel.RELIABLE,
-        )
-        self.bus.subscribe(
-            self.VOTE_GRANT_TOPIC,
-            self._handle_vote_grant,
-            qos=QoSLevel.RELIABLE,
-        )
-        self.bus.subscribe(
-            self.HEARTBEAT_TOPIC,
-            self._handle_heartbeat,
-            qos=QoSLevel.RELIABLE,
-        )
+        for topic, handler in (
+            (self.VOTE_REQUEST_TOPIC, self._handle_vote_request),
+            (self.VOTE_GRANT_TOPIC, self._handle_vote_grant),
+            (self.HEARTBEAT_TOPIC, self._handle_heartbeat),
+            (self.PRE_VOTE_REQUEST_TOPIC, self._handle_pre_vote_request),
+            (self.PRE_VOTE_GRANT_TOPIC, self._handle_pre_vote_grant),
+            (self.LEASE_ACK_TOPIC, self._handle_lease_ack),
+        ):
+            self._subscriptions.append(
+                self.bus.subscribe(topic, json_subscriber(self.bus, handler))
+            )
 
     async def stop(self) -> None:
         """Stop leader election tasks."""
         self._running = False
-        if self._election_task:
-            self._election_task.cancel()
-        if self._heartbeat_task:
-            self._heartbeat_task.cancel()
+        for subscription in self._subscriptions:
+            self.bus.unsubscribe(subscription)
+        self._subscriptions = []
+        for task in (self._election_task, self._heartbeat_task):
+            if task is not None and not task.done():
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
         logger.info("Leader election engine stopped")
 
     def get_metrics(self) -> ElectionMetrics:
@@ -181,8 +225,53 @@ class LeaderElection:
             self.metrics.last_leader_id = self.current_leader.satellite_serial
         lease_remaining = (self.lease_expiry - datetime.now()).total_seconds() * 1000
         self.metrics.lease_remaining_ms = max(0, lease_remaining)
+        self.metrics.heartbeat_interval_ms = self.heartbeat_interval_ms
         return self.metrics
 
+    def _random_timeout(self) -> timedelta:
+        """Randomized election timeout."""
+        return timedelta(
+            milliseconds=randint(self.ELECTION_TIMEOUT_MIN_MS, self.ELECTION_TIMEOUT_MAX_MS)
+        )
+
+    def _leader_lease(self) -> timedelta:
+        """Lease the leader may assume from a quorum-acked round start.
+
+        Followers time their promise from receipt (never earlier than the
+        send) on their own clock; shortening by the drift bound of both
+        clocks keeps the leader lease inside every follower promise.
+        """
+        return timedelta(
+            seconds=self.LEASE_VALIDITY_SECONDS * (1 - 2 * self.CLOCK_DRIFT_BOUND)
+        )
+
+    def _holds_lease_for_other(self, candidate_id: str) -> bool:
+        """True while we have promised a live leader other than candidate_id."""
+        leader = self.get_leader()
+        return leader is not None and leader.satellite_serial != candidate_id
+
+    def _wake_event(self) -> asyncio.Event:
+        """Wake-up event for the running loop (recreated if the loop changed)."""
+        loop = asyncio.get_running_loop()
+        if self._wake is None or self._wake_loop is not loop:
+            self._wake = asyncio.Event()
+            self._wake_loop = loop
+        return self._wake
+
+    def _notify(self) -> None:
+        """Wake the election and heartbeat loops to re-evaluate state."""
+        if self._wake is not None:
+            self._wake.set()
+
+    async def _wait_for_wake(self, timeout: Optional[float]) -> None:
+        """Sleep until _notify() or until timeout seconds elapse."""
+        event = self._wake_event()
+        event.clear()
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
     async def _election_loop(self) -> None:
         """Main election loop: Monitor lease expiry and trigger elections."""
         while self._running:
@@ -192,36 +281,73 @@ class LeaderElection:
                 elif self.state == ElectionState.CANDIDATE:
                     await self._candidate_loop()
                 else:  # LEADER
-                    await asyncio.sleep(0.1)
+                    await self._leader_loop()
             except Exception as e:
                 logger.error(f"Election loop error: {e}", exc_info=True)
                 await asyncio.sleep(0.1)
 
     async def _follower_loop(self) -> None:
-        """Follower state: Wait for heartbeat or election timeout."""
-        time_until_timeout = (self.lease_expiry - datetime.now()).total_seconds()
-        if time_until_timeout <= 0:
-            logger.info(f"{self.config.agent_id.satellite_serial} election timeout, becoming candidate")
+        """Follower state: Sleep until the lease plus jitter lapses, then pre-vote."""
+        deadline = max(self.lease_expiry, self._election_not_before) + self._election_jitter
+        time_until_timeout = (deadline - datetime.now()).total_seconds()
+        if time_until_timeout > 0:
+            # Heartbeats only move the deadline later, so waking at the old
+            # deadline and re-reading the lease is enough
+            await self._wait_for_wake(time_until_timeout)
+            return
+
+        logger.info(f"{self.config.agent_id.satellite_serial} election timeout, starting pre-vote")
+        self._election_jitter = self._random_timeout()
+        if await self._pre_vote():
             await self._become_candidate()
         else:
-            await asyncio.sleep(min(time_until_timeout, 0.05))
+            self._election_not_before = datetime.now()
+
+    async def _pre_vote(self) -> bool:
+        """Ask peers whether they would elect us at term + 1, without bumping our term."""
+        self.metrics.pre_vote_count += 1
+        self._pre_vote_term = self.current_term + 1
+        self.pre_votes_received = {self.config.agent_id}
+        await self.bus.publish(
+            self.PRE_VOTE_REQUEST_TOPIC,
+            {"term": self._pre_vote_term, "candidate_id": self.config.agent_id.satellite_serial},
+            qos=QoSLevel.RELIABLE,
+        )
+        deadline = datetime.now() + self._random_timeout()
+        try:
+            while True:
+                if len(self.pre_votes_received) >= self._calculate_quorum_size():
+                    return True
+                remaining = (deadline - datetime.now()).total_seconds()
+                if (
+                    remaining <= 0
+                    or self.state != ElectionState.FOLLOWER
+                    or self.lease_expiry > datetime.now()
+                ):
+                    logger.debug(f"{self.config.agent_id.satellite_serial} pre-vote failed")
+                    return False
+                await self._wait_for_wake(remaining)
+        finally:
+            self._pre_vote_term = None
 
     async def _candidate_loop(self) -> None:
         """Candidate state: Send vote requests and wait for quorum."""
         if not self.election_start_time:
+            if self._requested_term == self.current_term:
+                self.current_term += 1  # Restarting after a timed-out election
+            self._requested_term = self.current_term
             self.election_start_time = datetime.now()
-            self.current_term += 1
+            self._election_timeout_ms = randint(self.ELECTION_TIMEOUT_MIN_MS, self.ELECTION_TIMEOUT_MAX_MS)
             self.voted_for = self.config.agent_id
             self.votes_received = {self.config.agent_id}
-            alive_peers = self.registry.get_alive_peers()
-            logger.info(f"{self.config.agent_id.satellite_serial} requesting votes from {len(alive_peers)} peers")
-            for peer in alive_peers:
-                if peer != self.config.agent_id:
-                    await self.bus.publish(
-                        self.VOTE_REQUEST_TOPIC,
-                        {"term": self.current_term, "candidate_id": self.config.agent_id.satellite_serial, "candidate_uptime": self._get_uptime_seconds()},
-                        qos=QoSLevel.RELIABLE,
-                    )
+            logger.info(f"{self.config.agent_id.satellite_serial} requesting votes (term={self.current_term})")
+            await self.bus.publish(
+                self.VOTE_REQUEST_TOPIC,
+                {"term": self.current_term, "candidate_id": self.config.agent_id.satellite_serial, "candidate_uptime": self._get_uptime_seconds()},
+                qos=QoSLevel.RELIABLE,
+            )
+            if self.state != ElectionState.CANDIDATE:
+                return
         quorum_size = self._calculate_quorum_size()
         if len(self.votes_received) >= quorum_size:
             logger.info(f"{self.config.agent_id.satellite_serial} achieved quorum ({len(self.votes_received)}/{quorum_size}), becoming leader")
@@ -230,26 +356,77 @@ class LeaderElection:
             self.metrics.election_count += 1
             await self._become_leader()
             return
-        if self.election_start_time:
-            election_duration = (datetime.now() - self.election_start_time).total_seconds() * 1000
-            if election_duration > randint(self.ELECTION_TIMEOUT_MIN_MS, self.ELECTION_TIMEOUT_MAX_MS):
-                logger.warning(f"{self.config.agent_id.satellite_serial} election timeout, restarting")
-                self.election_start_time = None
-                self.votes_received = set()
-        await asyncio.sleep(0.01)
+        election_duration = (datetime.now() - self.election_start_time).total_seconds() * 1000
+        if election_duration > self._election_timeout_ms:
+            logger.warning(f"{self.config.agent_id.satellite_serial} election timeout, restarting")
+            self.election_start_time = None
+            self.votes_received = set()
+            return
+        await self._wait_for_wake((self._election_timeout_ms - election_duration) / 1000)
+
+    async def _leader_loop(self) -> None:
+        """Leader state: Step down if the lease lapses without quorum renewal."""
+        time_until_expiry = (self.lease_expiry - datetime.now()).total_seconds()
+        if time_until_expiry > 0:
+            await self._wait_for_wake(time_until_expiry)
+            return
+        logger.warning(f"{self.config.agent_id.satellite_serial} lease lapsed without quorum, stepping down")
+        self.state = ElectionState.FOLLOWER
+        self._election_not_before = datetime.now()
+        self._notify()
 
     async def _heartbeat_loop(self) -> None:
-        """Heartbeat sender: LEADER sends periodic heartbeats to maintain lease."""
+        """Heartbeat sender: LEADER starts heartbeat rounds at the adaptive interval."""
         while self._running:
             try:
-                if self.state == ElectionState.LEADER:
-                    await self.bus.publish(self.HEARTBEAT_TOPIC, {"leader_id": self.config.agent_id.satellite_serial, "term": self.current_term, "timestamp": datetime.now().isoformat()}, qos=QoSLevel.RELIABLE)
-                    logger.debug(f"{self.config.agent_id.satellite_serial} sent heartbeat (term={self.current_term})")
-                await asyncio.sleep(self.HEARTBEAT_INTERVAL_MS / 1000)
+                if self.state != ElectionState.LEADER:
+                    await self._wait_for_wake(None)
+                    continue
+                due = (self._round_started or datetime.min) + timedelta(milliseconds=self.heartbeat_interval_ms)
+                time_until_due = (due - datetime.now()).total_seconds()
+                if time_until_due > 0:
+                    await self._wait_for_wake(time_until_due)
+                    continue
+                await self._send_heartbeat()
             except Exception as e:
                 logger.error(f"Heartbeat loop error: {e}")
                 await asyncio.sleep(0.1)
 
+    async def _send_heartbeat(self) -> None:
+        """Start a heartbeat round; the leader lease renews once a quorum acks it."""
+        if not self._round_confirmed:
+            self.heartbeat_interval_ms = self.HEARTBEAT_INTERVAL_MS
+        self._heartbeat_seq += 1
+        self._round_started = datetime.now()
+        self._round_acks = {self.config.agent_id}
+        self._round_confirmed = False
+        self.metrics.heartbeats_sent += 1
+        await self.bus.publish(
+            self.HEARTBEAT_TOPIC,
+            {"leader_id": self.config.agent_id.satellite_serial, "term": self.current_term, "seq": self._heartbeat_seq, "timestamp": self._round_started.isoformat()},
+            qos=QoSLevel.RELIABLE,
+        )
+        logger.debug(f"{self.config.agent_id.satellite_serial} sent heartbeat (term={self.current_term}, interval={self.heartbeat_interval_ms:.0f}ms)")
+        self._check_heartbeat_round()
+
+    def _check_heartbeat_round(self) -> None:
+        """Renew the lease and adapt the interval once the round reaches quorum."""
+        if self._round_confirmed or len(self._round_acks) < self._calculate_quorum_size():
+            return
+        self._round_confirmed = True
+        self.lease_expiry = max(self.lease_expiry, self._round_started + self._leader_lease())
+        alive_version = (
+            self.registry.alive_version if isinstance(self.registry, SwarmRegistry) else None
+        )
+        if alive_version == self._round_alive_version:
+            self.heartbeat_interval_ms = min(
+                self.heartbeat_interval_ms * self.HEARTBEAT_BACKOFF,
+                self.MAX_HEARTBEAT_INTERVAL_MS,
+            )
+        else:
+            self.heartbeat_interval_ms = self.HEARTBEAT_INTERVAL_MS
+        self._round_alive_version = alive_version
+
     async def _become_candidate(self) -> None:
         """Transition from FOLLOWER to CANDIDATE state."""
         self.state = ElectionState.CANDIDATE
@@ -262,10 +439,46 @@ class LeaderElection:
         """Transition to LEADER state and send initial heartbeat."""
         self.state = ElectionState.LEADER
         self.current_leader = self.config.agent_id
-        self.lease_expiry = datetime.now() + timedelta(seconds=self.LEASE_VALIDITY_SECONDS)
+        # Granted votes were promises made after our request went out
+        self.lease_expiry = (self.election_start_time or datetime.now()) + self._leader_lease()
         self.election_start_time = None
+        self.heartbeat_interval_ms = self.HEARTBEAT_INTERVAL_MS
+        self._round_confirmed = True
         logger.info(f"{self.config.agent_id.satellite_serial} became LEADER (term={self.current_term}, lease until {self.lease_expiry.isoformat()})")
-        await self.bus.publish(self.HEARTBEAT_TOPIC, {"leader_id": self.config.agent_id.satellite_serial, "term": self.current_term, "timestamp": datetime.now().isoformat()}, qos=QoSLevel.RELIABLE)
+        await self._send_heartbeat()
+        self._notify()
+
+    async def _handle_pre_vote_request(self, message: dict) -> None:
+        """Handle pre-vote: grant only if we would vote and hold no live lease."""
+        try:
+            term = message.get("term", 0)
+            candidate_id = message.get("candidate_id", "")
+            if candidate_id == self.config.agent_id.satellite_serial:
+                return
+            if term <= self.current_term or self._holds_lease_for_other(candidate_id):
+                return
+            # Give this candidate a full election timeout before starting our own
+            self._election_not_before = datetime.now()
+            await self.bus.publish(
+                self.PRE_VOTE_GRANT_TOPIC,
+                {"term": term, "voter_id": self.config.agent_id.satellite_serial, "candidate_id": candidate_id},
+                qos=QoSLevel.RELIABLE,
+                receiver=AgentID.create("astra-v3.0", candidate_id),
+            )
+        except Exception as e:
+            logger.error(f"Error handling pre-vote request: {e}")
+
+    async def _handle_pre_vote_grant(self, message: dict) -> None:
+        """Handle pre-vote grant for our pending pre-vote round."""
+        try:
+            if self._pre_vote_term is None or message.get("term", 0) != self._pre_vote_term:
+                return
+            if message.get("candidate_id") != self.config.agent_id.satellite_serial:
+                return  # Grant for another pre-voter (broadcast buses ignore receiver)
+            self.pre_votes_received.add(AgentID.create("astra-v3.0", message.get("voter_id", "")))
+            self._notify()
+        except Exception as e:
+            logger.error(f"Error handling pre-vote grant: {e}")
 
     async def _handle_vote_request(self, message: dict) -> None:
         """Handle incoming vote request from candidate."""
@@ -273,6 +486,11 @@ class LeaderElection:
             term = message.get("term", 0)
             candidate_id = message.get("candidate_id", "")
             candidate_uptime = message.get("candidate_uptime", 0)
+            if candidate_id == self.config.agent_id.satellite_serial:
+                return
+            if self._holds_lease_for_other(candidate_id):
+                # Leader stickiness: our lease promise outranks a higher term
+                return
             if term > self.current_term:
                 self.current_term = term
                 self.state = ElectionState.FOLLOWER
@@ -281,7 +499,13 @@ class LeaderElection:
                 return
             if self.voted_for is None or self._should_vote_for(candidate_id, candidate_uptime):
                 self.voted_for = AgentID.create("astra-v3.0", candidate_id)
-                await self.bus.publish(self.VOTE_GRANT_TOPIC, {"term": self.current_term, "voter_id": self.config.agent_id.satellite_serial}, qos=QoSLevel.RELIABLE)
+                self._election_not_before = datetime.now()
+                await self.bus.publish(
+                    self.VOTE_GRANT_TOPIC,
+                    {"term": self.current_term, "voter_id": self.config.agent_id.satellite_serial, "candidate_id": candidate_id},
+                    qos=QoSLevel.RELIABLE,
+                    receiver=self.voted_for,
+                )
                 logger.info(f"Granted vote to {candidate_id} (term={term})")
         except Exception as e:
             logger.error(f"Error handling vote request: {e}")
@@ -293,19 +517,31 @@ class LeaderElection:
             voter_id = message.get("voter_id", "")
             if self.state != ElectionState.CANDIDATE or term != self.current_term:
                 return
+            if message.get("candidate_id", self.config.agent_id.satellite_serial) != self.config.agent_id.satellite_serial:
+                return
             voter = AgentID.create("astra-v3.0", voter_id)
             self.votes_received.add(voter)
             logger.debug(f"Received vote from {voter_id} ({len(self.votes_received)} total)")
+            self._notify()
         except Exception as e:
             logger.error(f"Error handling vote grant: {e}")
 
     async def _handle_heartbeat(self, message: dict) -> None:
-        """Handle incoming heartbeat from leader."""
+        """Handle incoming heartbeat from leader: extend lease and ack it."""
         try:
             term = message.get("term", 0)
             leader_id = message.get("leader_id", "")
+            if leader_id == self.config.agent_id.satellite_serial:
+                return  # Own heartbeat; our lease renews from acks
             if term < self.current_term:
                 return
+            if (
+                self.state == ElectionState.LEADER
+                and term == self.current_term
+                and leader_id < self.config.agent_id.satellite_serial
+            ):
+                return  # Two leaders in one term: the tiebreaker keeps us
+            previous_state = self.state
             if term > self.current_term:
                 self.current_term = term
                 if self.state != ElectionState.FOLLOWER:
@@ -313,14 +549,40 @@ class LeaderElection:
                     self.election_start_time = None
             self.current_leader = AgentID.create("astra-v3.0", leader_id)
             self.lease_expiry = datetime.now() + timedelta(seconds=self.LEASE_VALIDITY_SECONDS)
+            if self.state == ElectionState.LEADER:
+                logger.info(f"{self.config.agent_id.satellite_serial} yielding term {term} to {leader_id}")
+                self.state = ElectionState.FOLLOWER
             if self.state == ElectionState.CANDIDATE:
                 logger.info(f"{self.config.agent_id.satellite_serial} received heartbeat, becoming follower")
                 self.state = ElectionState.FOLLOWER
                 self.election_start_time = None
             logger.debug(f"Heartbeat from {leader_id} (term={term}, lease until {self.lease_expiry.isoformat()})")
+            if self.state != previous_state or self._pre_vote_term is not None:
+                self._notify()
+            await self.bus.publish(
+                self.LEASE_ACK_TOPIC,
+                {"term": term, "seq": message.get("seq", 0), "voter_id": self.config.agent_id.satellite_serial},
+                qos=QoSLevel.RELIABLE,
+                receiver=self.current_leader,
+            )
         except Exception as e:
             logger.error(f"Error handling heartbeat: {e}")
 
+    async def _handle_lease_ack(self, message: dict) -> None:
+        """Handle a follower's acknowledgement of the current heartbeat round."""
+        try:
+            if (
+                self.state != ElectionState.LEADER
+                or message.get("term", 0) != self.current_term
+                or message.get("seq", 0) != self._heartbeat_seq
+            ):
+                return
+            self._round_acks.add(AgentID.create("astra-v3.0", message.get("voter_id", "")))
+            self.metrics.lease_acks_received += 1
+            self._check_heartbeat_round()
+        except Exception as e:
+            logger.error(f"Error handling lease ack: {e}")
+
     def _should_vote_for(self, candidate_id: str, candidate_uptime: float) -> bool:
         """Determine if we should vote for candidate based on AgentID and uptime."""
         if self.voted_for is None:
@@ -0,0 +1,119 @@
+"""
+Observed containers for components that index their own public state.
+
+The registry (alive set, aggregates), the action propagator (per-agent
+reverse indexes) and swarm memory (Merkle digest, byte budget) keep
+secondary indexes over dicts and dataclass fields that callers may also
+write directly. These helpers route every such write through hooks so
+the indexes cannot drift:
+- ObservedDict: dict whose mutating methods all report to _on_set(),
+  _on_delete() and _on_clear(); copies and pickles are plain dicts
+- ObservedFields: mixin reporting assignments of selected attributes to
+  the object's _listener
+"""
+
+from typing import Any, FrozenSet, Hashable, Iterable, List, Optional, Tuple
+
+
+class ObservedDict(dict):
+    """dict that reports every write and removal to its subclass hooks.
+
+    Subclasses override _on_set() and _on_delete(), and _on_clear() when a
+    bulk reset is cheaper than per-key removal. __setitem__, __delitem__,
+    pop(), popitem(), setdefault(), update(), ``|=`` and clear() all go
+    through the hooks. copy(), ``|``, copy.copy() and pickling return plain
+    dicts, so a snapshot never reports to the owner.
+
+    Values are never None; _on_set() receives None as previous for a new key.
+
+    Attributes:
+        reorder_on_write: Move a written key to the end (LRU order)
+    """
+
+    reorder_on_write = False
+
+    def _on_set(self, key: Hashable, value: Any, previous: Optional[Any]) -> None:
+        """Called after value is stored under key (replacing previous)."""
+
+    def _on_delete(self, key: Hashable, value: Any) -> None:
+        """Called after key is removed."""
+
+    def _on_clear(self, items: List[Tuple[Hashable, Any]]) -> None:
+        """Called after clear() with the removed items."""
+        for key, value in items:
+            self._on_delete(key, value)
+
+    def __setitem__(self, key, value) -> None:
+        previous = self.get(key)
+        if self.reorder_on_write and previous is not None:
+            super().__delitem__(key)
+        super().__setitem__(key, value)
+        self._on_set(key, value, previous)
+
+    def __delitem__(self, key) -> None:
+        value = self[key]
+        super().__delitem__(key)
+        self._on_delete(key, value)
+
+    def pop(self, key, *default):
+        if key not in self:
+            return super().pop(key, *default)
+        value = self[key]
+        del self[key]
+        return value
+
+    def popitem(self):
+        if not self:
+            raise KeyError("popitem(): dictionary is empty")
+        key = next(reversed(self))
+        return key, self.pop(key)
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def clear(self) -> None:
+        items = list(self.items())
+        super().clear()
+        self._on_clear(items)
+
+    def copy(self) -> dict:
+        return dict(self)
+
+    def __reduce__(self):
+        return dict, (dict(self),)
+
+    @classmethod
+    def fromkeys(cls, iterable: Iterable, value=None) -> dict:
+        return dict.fromkeys(iterable, value)
+
+
+class ObservedFields:
+    """Mixin reporting assignments of selected attributes to a listener.
+
+    Classes list the attributes in _observed_fields and keep the callback
+    in _listener; listener(obj, name, old) runs after every assignment of
+    an observed attribute, including augmented assignment. Listeners
+    compare old with the new value themselves.
+    """
+
+    _observed_fields: FrozenSet[str] = frozenset()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name not in self._observed_fields:
+            object.__setattr__(self, name, value)
+            return
+        old = self.__dict__.get(name)
+        object.__setattr__(self, name, value)
+        listener = self.__dict__.get("_listener")
+        if listener is not None:
+            listener(self, name, old)
@@ -6,18 +6,25 @@ Issue #400: Agent registry with gossip-based discovery and exponential backoff h
 - Heartbeat: 30s normal, 60s congestion backoff, 120s failure recovery
 - Gossip propagation: O(log N) discovery time
 - Integration: HealthSummary (#397), SwarmMessageBus (#398), StateCompressor (#399)
+- Liveness tracked incrementally: a min-heap of heartbeat deadlines feeds a
+  cached alive set whose version bumps on join/leave/timeout
+- Constellation aggregates (alive count, role counts, risk mean/max) are
+  updated on each join/leave/timeout and health/role change, so readers
+  never scan the peer table
 """
 
 import asyncio
+import heapq
 import logging
 import random
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 
 from astraguard.swarm.models import AgentID, SatelliteRole, HealthSummary, SwarmConfig
 from astraguard.swarm.bus import SwarmMessageBus
 from astraguard.swarm.compressor import StateCompressor
+from astraguard.swarm.observed import ObservedDict, ObservedFields
 
 logger = logging.getLogger(__name__)
 
@@ -28,11 +35,121 @@ CONGESTION_BACKOFF = 60  # seconds (2x interval)
 FAILURE_BACKOFF = 120  # seconds (4x interval)
 GOSSIP_FANOUT = 3  # Number of peers to forward HELLO to
 GOSSIP_REPLICATION = 2  # Max times a HELLO is replicated per node
+_RISK_UNITS = 10**9  # Fixed-point scale so running risk sums never drift
+
+
+class ConstellationAggregates:
+    """Running aggregates over the alive peers of a registry.
+    
+    Updated by SwarmRegistry on every join/leave/timeout and health or role
+    change; every read is O(1) (risk_max amortized O(log n) via a lazy heap).
+    Risk comes from each peer's latest HealthSummary; peers that have not
+    reported health count towards alive_count and role_counts only.
+    """
+    
+    def __init__(self):
+        self._members: Dict[AgentID, Tuple[SatelliteRole, Optional[int]]] = {}
+        self._role_counts: Dict[SatelliteRole, int] = {}
+        self._risk_units = 0
+        self._reporting = 0
+        self._risk_heap: List[Tuple[int, int, AgentID]] = []  # (-units, seq, agent), lazy
+        self._risk_seq = 0
+    
+    @property
+    def alive_count(self) -> int:
+        return len(self._members)
+    
+    @property
+    def reporting_count(self) -> int:
+        """Alive peers with a health summary."""
+        return self._reporting
+    
+    @property
+    def role_counts(self) -> Dict[SatelliteRole, int]:
+        return dict(self._role_counts)
+    
+    @property
+    def risk_mean(self) -> float:
+        if not self._reporting:
+            return 0.0
+        return self._risk_units / self._reporting / _RISK_UNITS
+    
+    @property
+    def risk_max(self) -> float:
+        heap = self._risk_heap
+        while heap:
+            neg_units, _, agent_id = heap[0]
+            member = self._members.get(agent_id)
+            if member is not None and member[1] == -neg_units:
+                return -neg_units / _RISK_UNITS
+            heapq.heappop(heap)
+        return 0.0
+    
+    @property
+    def health(self) -> float:
+        """0-1 constellation health: 1 - mean risk (1.0 if nobody reported)."""
+        return 1.0 - self.risk_mean
+    
+    def set(self, agent_id: AgentID, role: SatelliteRole, health: Optional[HealthSummary]) -> None:
+        """Add or refresh one alive peer."""
+        units = None if health is None else round(health.risk_score * _RISK_UNITS)
+        previous = self._members.get(agent_id)
+        if previous == (role, units):
+            return
+        if previous is not None:
+            self._remove_contribution(previous)
+        self._members[agent_id] = (role, units)
+        self._role_counts[role] = self._role_counts.get(role, 0) + 1
+        if units is not None:
+            self._risk_units += units
+            self._reporting += 1
+            self._risk_seq += 1
+            heapq.heappush(self._risk_heap, (-units, self._risk_seq, agent_id))
+            if len(self._risk_heap) > 2 * len(self._members) + 16:
+                self._compact()
+    
+    def discard(self, agent_id: AgentID) -> None:
+        """Remove a peer that left or timed out."""
+        previous = self._members.pop(agent_id, None)
+        if previous is not None:
+            self._remove_contribution(previous)
+    
+    def clear(self) -> None:
+        self._members.clear()
+        self._role_counts.clear()
+        self._risk_units = 0
+        self._reporting = 0
+        self._risk_heap.clear()
+    
+    def _remove_contribution(self, member: Tuple[SatelliteRole, Optional[int]]) -> None:
+        role, units = member
+        remaining = self._role_counts[role] - 1
+        if remaining:
+            self._role_counts[role] = remaining
+        else:
+            del self._role_counts[role]
+        if units is not None:
+            self._risk_units -= units
+            self._reporting -= 1
+    
+    def _compact(self) -> None:
+        """Drop superseded heap entries."""
+        self._risk_heap = [
+            entry for entry in self._risk_heap
+            if (member := self._members.get(entry[2])) is not None and member[1] == -entry[0]
+        ]
+        heapq.heapify(self._risk_heap)
 
 
 @dataclass
-class PeerState:
-    """State of a peer in the satellite constellation."""
+class PeerState(ObservedFields):
+    """State of a peer in the satellite constellation.
+    
+    Assignments to last_heartbeat, health_summary and role are reported to
+    the owning registry.
+    """
+    
+    _observed_fields = frozenset({"last_heartbeat", "health_summary", "role"})
     
     agent_id: AgentID
     role: SatelliteRole
@@ -41,6 +158,9 @@ class PeerState:
     heartbeat_failures: int = field(default=0)
     is_alive: bool = field(init=False, default=True)
     backoff_multiplier: float = field(init=False, default=1.0)
+    _listener: Optional[Callable[["PeerState", str, object], None]] = field(
+        init=False, default=None, repr=False, compare=False
+    )
     
     def __post_init__(self):
         """Compute is_alive based on timeout."""
@@ -79,8 +199,36 @@ class PeerState:
             return FAILURE_BACKOFF
 
 
+class _PeerTable(ObservedDict):
+    """AgentID → PeerState dict that reports joins and leaves to the registry."""
+
+    def __init__(self, registry: "SwarmRegistry"):
+        super().__init__()
+        self._registry = registry
+
+    def _on_set(self, agent_id: AgentID, state: PeerState, previous: Optional[PeerState]) -> None:
+        if previous is not None and previous is not state:
+            previous._listener = None
+        self._registry._on_peer_set(agent_id, state)
+
+    def _on_delete(self, agent_id: AgentID, state: PeerState) -> None:
+        state._listener = None
+        self._registry._on_peer_removed(agent_id)
+
+    def _on_clear(self, items) -> None:
+        for _, state in items:
+            state._listener = None
+        self._registry._on_peers_cleared()
+
+
 class SwarmRegistry:
-    """Registry for discovering and tracking satellite agents in constellation."""
+    """Registry for discovering and tracking satellite agents in constellation.
+    
+    Liveness is maintained incrementally. Joins, leaves and heartbeats update
+    a cached alive set; expiries are found by popping a min-heap of heartbeat
+    deadlines. Each membership change bumps alive_version, and
+    wait_for_change() lets consumers await changes instead of polling.
+    """
     
     def __init__(self, config: SwarmConfig, agent_id: AgentID):
         """Initialize registry.
@@ -91,7 +239,17 @@ class SwarmRegistry:
         """
         self.config = config
         self.agent_id = agent_id
-        self.peers: Dict[AgentID, PeerState] = {}
+        self._timeout = timedelta(seconds=HEARTBEAT_TIMEOUT)
+        self._deadlines: List[Tuple[datetime, int, AgentID]] = []  # Min-heap
+        self._heap_seq = 0
+        self._heap_entry: Dict[AgentID, Tuple[datetime, int, AgentID]] = {}  # Live entry per peer
+        self._alive: Dict[AgentID, None] = {}  # Ordered set, join order
+        self._alive_list: Optional[List[AgentID]] = None
+        self._alive_version = 0
+        self.aggregates = ConstellationAggregates()
+        self._changed: Optional[asyncio.Event] = None
+        self._changed_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.peers: Dict[AgentID, PeerState] = _PeerTable(self)
         self.compressor = StateCompressor()
         self.bus: Optional[SwarmMessageBus] = None
         self._heartbeat_task: Optional[asyncio.Task] = None
@@ -221,22 +379,30 @@ class SwarmRegistry:
             # Parse sender ID
             sender_agent_id = AgentID.from_id(sender_id)
             
-            # Update or create peer
-            if sender_agent_id not in self.peers:
-                peer_state = PeerState(
-                    agent_id=sender_agent_id,
-                    role=self.config.role,  # Will be corrected by HELLO
-                    last_heartbeat=datetime.utcnow(),
-                    health_summary=health
-                )
-                self.peers[sender_agent_id] = peer_state
-                logger.info(f"Discovered new peer: {sender_agent_id.id[:8]}")
-            else:
-                self.peers[sender_agent_id].record_heartbeat(health)
+            self.record_peer_health(sender_agent_id, health)
         
         except Exception as e:
             logger.error(f"Failed to process health message from {sender_id}: {e}")
     
+    def record_peer_health(self, agent_id: AgentID, health: HealthSummary) -> None:
+        """Record a heartbeat carrying health, discovering the peer if new.
+        
+        Args:
+            agent_id: Peer the health summary came from
+            health: Decoded HealthSummary
+        """
+        if agent_id not in self.peers:
+            peer_state = PeerState(
+                agent_id=agent_id,
+                role=self.config.role,  # Will be corrected by HELLO
+                last_heartbeat=datetime.utcnow(),
+                health_summary=health
+            )
+            self.peers[agent_id] = peer_state
+            logger.info(f"Discovered new peer: {agent_id.satellite_serial}")
+        else:
+            self.peers[agent_id].record_heartbeat(health)
+    
     async def _on_hello_message(self, sender_id: str, payload: bytes):
         """Handle HELLO discovery message with gossip forwarding.
         
@@ -298,24 +464,176 @@ class SwarmRegistry:
         except Exception as e:
             logger.error(f"Failed to process HELLO message from {sender_id}: {e}")
     
-    def get_alive_peers(self) -> List[AgentID]:
-        """Get list of alive peer agent IDs.
-        
-        Returns:
-            List of AgentID for peers with is_alive=True
+    # Liveness bookkeeping
+
+    def _push_deadline(self, agent_id: AgentID, deadline: datetime) -> None:
+        self._heap_seq += 1
+        entry = self._heap_entry[agent_id] = (deadline, self._heap_seq, agent_id)
+        heapq.heappush(self._deadlines, entry)
+
+    def _bump_version(self) -> None:
+        """Record an alive-set change and wake waiters."""
+        self._alive_version += 1
+        self._alive_list = None
+        if self._changed is not None:
+            self._changed.set()
+            self._changed = None
+
+    def _on_peer_set(self, agent_id: AgentID, state: PeerState) -> None:
+        """A peer was added or replaced in self.peers."""
+        state._listener = self._on_peer_changed
+        self._on_heartbeat(state)
+        if agent_id in self._alive:
+            self.aggregates.set(agent_id, state.role, state.health_summary)
+
+    def _on_peer_changed(self, state: PeerState, name: str, old: object) -> None:
+        """A watched PeerState field was assigned."""
+        if name == "last_heartbeat":
+            self._on_heartbeat(state)
+        elif state.agent_id in self._alive and self.peers.get(state.agent_id) is state:
+            self.aggregates.set(state.agent_id, state.role, state.health_summary)
+
+    def _on_heartbeat(self, state: PeerState) -> None:
+        """last_heartbeat moved; only dead → alive transitions touch the heap.
+
+        A refreshed heartbeat of an alive peer leaves its old heap entry in
+        place; _expire() re-checks the real deadline when that entry pops.
+        Only a heartbeat moved backwards pushes an earlier entry.
         """
-        alive = []
+        agent_id = state.agent_id
+        if self.peers.get(agent_id) is not state:
+            return
+        deadline = state.last_heartbeat + self._timeout
         now = datetime.utcnow()
+        if agent_id in self._alive:
+            if deadline < now:
+                # Heartbeat moved backwards past the timeout
+                del self._alive[agent_id]
+                self._heap_entry.pop(agent_id, None)
+                self.aggregates.discard(agent_id)
+                self._bump_version()
+            elif deadline < self._heap_entry[agent_id][0]:
+                self._push_deadline(agent_id, deadline)
+            return
+        if deadline >= now:
+            self._alive[agent_id] = None
+            self._push_deadline(agent_id, deadline)
+            self.aggregates.set(agent_id, state.role, state.health_summary)
+            self._bump_version()
+
+    def _on_peer_removed(self, agent_id: AgentID) -> None:
+        self._heap_entry.pop(agent_id, None)
+        if agent_id in self._alive:
+            del self._alive[agent_id]
+            self.aggregates.discard(agent_id)
+            self._bump_version()
+
+    def _on_peers_cleared(self) -> None:
+        self._deadlines.clear()
+        self._heap_entry.clear()
+        self.aggregates.clear()
+        if self._alive:
+            self._alive.clear()
+            self._bump_version()
+
+    def _expire(self, now: Optional[datetime] = None) -> None:
+        """Pop elapsed deadlines, marking peers without a newer heartbeat dead."""
+        heap = self._deadlines
+        if not heap:
+            return
+        now = now or datetime.utcnow()
+        expired = False
+        while heap and heap[0][0] < now:
+            entry = heapq.heappop(heap)
+            agent_id = entry[2]
+            if self._heap_entry.get(agent_id) is not entry:
+                continue  # Superseded entry for a removed or re-added peer
+            deadline = self.peers[agent_id].last_heartbeat + self._timeout
+            if deadline >= now:
+                self._push_deadline(agent_id, deadline)
+            else:
+                del self._alive[agent_id]
+                del self._heap_entry[agent_id]
+                self.aggregates.discard(agent_id)
+                expired = True
+        if expired:
+            self._bump_version()  # One version per sweep
+
+    @property
+    def alive_version(self) -> int:
+        """Counter bumped on every alive-set change, pending timeouts applied."""
+        self._expire()
+        return self._alive_version
+
+    def next_deadline(self) -> Optional[datetime]:
+        """Earliest time an alive peer may time out, if any."""
+        self._expire()
+        return self._deadlines[0][0] if self._deadlines else None
+
+    async def wait_for_change(
+        self, since_version: Optional[int] = None, timeout: Optional[float] = None
+    ) -> int:
+        """Wait until the alive set changes.
         
-        for peer_state in self.peers.values():
-            # Check timeout
-            timeout = HEARTBEAT_TIMEOUT
-            time_since_heartbeat = (now - peer_state.last_heartbeat).total_seconds()
+        Heartbeat timeouts are detected by sleeping until the next deadline,
+        so callers do not need to poll get_alive_peers().
+        
+        Args:
+            since_version: alive_version the caller last saw (default current)
+            timeout: Max seconds to wait (None = forever)
             
-            if time_since_heartbeat <= timeout:
-                alive.append(peer_state.agent_id)
+        Returns:
+            The current alive_version (unchanged if the wait timed out)
+        """
+        if since_version is None:
+            since_version = self.alive_version
+        loop = asyncio.get_running_loop()
+        give_up = None if timeout is None else loop.time() + timeout
+        while True:
+            self._expire()
+            if self.alive_version != since_version:
+                return self.alive_version
+            wait = None
+            if self._deadlines:
+                until = (self._deadlines[0][0] - datetime.utcnow()).total_seconds()
+                wait = max(0.0, until) + 0.001
+            if give_up is not None:
+                remaining = give_up - loop.time()
+                if remaining <= 0:
+                    return self.alive_version
+                wait = remaining if wait is None else min(wait, remaining)
+            if self._changed is None or self._changed_loop is not loop:
+                self._changed = asyncio.Event()
+                self._changed_loop = loop
+            try:
+                await asyncio.wait_for(self._changed.wait(), timeout=wait)
+            except asyncio.TimeoutError:
+                pass
+
+    def get_alive_peers(self) -> List[AgentID]:
+        """Get list of alive peer agent IDs.
         
-        return alive
+        Served from the cached alive set; the list is rebuilt only after
+        a join, leave or timeout.
+        
+        Returns:
+            List of AgentID for peers with is_alive=True, in the order they
+            (re)joined
+        """
+        self._expire()
+        if self._alive_list is None:
+            self._alive_list = list(self._alive)
+        return list(self._alive_list)
+    
+    def get_alive_count(self) -> int:
+        """Number of alive peers (including self)."""
+        self._expire()
+        return len(self._alive)
+    
+    def is_peer_alive(self, agent_id: AgentID) -> bool:
+        """Whether agent_id is currently alive."""
+        self._expire()
+        return agent_id in self._alive
     
     def get_quorum_size(self) -> int:
         """Get quorum size for leader election (Issue #405).
@@ -323,8 +641,24 @@ class SwarmRegistry:
         Returns:
             Ceiling of (alive_peers / 2) + 1
         """
-        alive_count = len(self.get_alive_peers())
-        return alive_count // 2 + 1
+        return self.get_alive_count() // 2 + 1
+    
+    def get_constellation_aggregates(self) -> ConstellationAggregates:
+        """Aggregates over alive peers (including self), after expiring timeouts."""
+        self._expire()
+        return self.aggregates
+    
+    def get_agent_role(self, agent_id: AgentID) -> Optional[SatelliteRole]:
+        """Get the role a peer announced.
+        
+        Args:
+            agent_id: Peer to query
+            
+        Returns:
+            SatelliteRole or None if peer not found
+        """
+        state = self.peers.get(agent_id)
+        return state.role if state is not None else None
     
     def get_peer_health(self, agent_id: AgentID) -> Optional[HealthSummary]:
         """Get latest health summary for peer.
@@ -372,15 +706,16 @@ class SwarmRegistry:
         Returns:
             Dict with peer counts, health, etc.
         """
-        alive_peers = self.get_alive_peers()
+        alive_count = self.get_alive_count()
         total_peers = len(self.peers)
         
         return {
             "total_peers": total_peers,
-            "alive_peers": len(alive_peers),
-            "dead_peers": total_peers - len(alive_peers),
-            "alive_percentage": (len(alive_peers) / total_peers * 100) if total_peers > 0 else 0,
-            "quorum_size": self.get_quorum_size(),
+            "alive_peers": alive_count,
+            "dead_peers": total_peers - alive_count,
+            "alive_percentage": (alive_count / total_peers * 100) if total_peers > 0 else 0,
+            "quorum_size": alive_count // 2 + 1,
+            "alive_version": self.alive_version,
             "heartbeat_interval": HEARTBEAT_INTERVAL,
             "heartbeat_timeout": HEARTBEAT_TIMEOUT,
         }
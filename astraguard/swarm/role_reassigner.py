@@ -338,7 +338,10 @@ class RoleReassigner:
 
     def _is_compliance_failing(self, agent: AgentID) -> bool:
         """Check if agent is failing compliance from propagator."""
-        # Access escalated agents from action propagator metrics
+        if isinstance(self.propagator, ActionPropagator):
+            # Per-agent reverse index, no scan over pending actions
+            return self.propagator.is_escalated(agent)
+        # Other propagators: scan escalated agents of pending actions
         for action in self.propagator.pending_actions.values():
             if agent.satellite_serial in action.escalated_agents:
                 return True
@@ -21,8 +21,12 @@ Simulation Models:
 
 Risk Aggregation:
   - Base risk: direct action impact
-  - Cascade risk: neighbor propagation
+  - Cascade risk: neighbor propagation over the sparse ISL graph
+    (CASCADE_HOPS sparse matrix-vector products; hops past the first only
+    reach satellites not already hit)
   - Total risk = base + cascade (block if >10%)
+  - Base and cascade risk memoized per (action type, params digest,
+    topology version); the threshold is applied on every call
 
 Dependencies:
   - SwarmRegistry (#400): peer health tracking
@@ -30,13 +34,20 @@ Dependencies:
 """
 
 import asyncio
+import hashlib
+import json
 import logging
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Dict, Optional, List, Any
+from typing import Deque, Dict, Hashable, Optional, List, Any, Sequence, Tuple
 import time
 
+import numpy as np
+
+from astraguard.swarm.registry import SwarmRegistry
+
 logger = logging.getLogger(__name__)
 
 
@@ -86,6 +97,8 @@ class SafetyMetrics:
     avg_simulation_latency_ms: float = 0.0
     p95_simulation_latency_ms: float = 0.0
     max_simulation_latency_ms: float = 0.0
+    simulation_cache_hits: int = 0
+    topology_rebuilds: int = 0
 
     @property
     def safety_block_rate(self) -> float:
@@ -105,9 +118,98 @@ class SafetyMetrics:
             "simulation_latency_ms_avg": self.avg_simulation_latency_ms,
             "simulation_latency_ms_p95": self.p95_simulation_latency_ms,
             "simulation_latency_ms_max": self.max_simulation_latency_ms,
+            "simulation_cache_hits": self.simulation_cache_hits,
+            "topology_rebuilds": self.topology_rebuilds,
         }
 
 
+class ConstellationGraph:
+    """
+    Sparse inter-satellite link graph of the alive constellation.
+
+    The adjacency matrix is stored as COO arrays (rows, cols), one entry per
+    directed link, so a matrix-vector product is a single numpy bincount and
+    costs O(links) rather than O(n²).
+    """
+
+    def __init__(self, serials: Sequence[str], links: Sequence[Tuple[int, int]]):
+        """
+        Build the graph.
+
+        Args:
+            serials: Satellite serials, index i ↔ serials[i]
+            links: Undirected (i, j) index pairs; duplicates and self-links
+                are dropped
+        """
+        self.serials = list(serials)
+        self.index = {serial: i for i, serial in enumerate(self.serials)}
+        n = len(self.serials)
+        pairs = np.asarray(links, dtype=np.int64).reshape(-1, 2)
+        pairs = pairs[pairs[:, 0] != pairs[:, 1]]
+        both = np.concatenate([pairs, pairs[:, ::-1]])
+        codes = np.unique(both[:, 0] * max(n, 1) + both[:, 1])
+        self.rows = codes // max(n, 1)
+        self.cols = codes % max(n, 1)
+        self.degree = np.bincount(self.rows, minlength=n)
+
+    @classmethod
+    def ring(cls, serials: Sequence[str], neighbors_per_side: int) -> "ConstellationGraph":
+        """Link each satellite to the next neighbors_per_side on either side."""
+        n = len(serials)
+        if n < 2:
+            return cls(serials, [])
+        start = np.repeat(np.arange(n), neighbors_per_side)
+        offset = np.tile(np.arange(1, neighbors_per_side + 1), n)
+        return cls(serials, np.stack([start, (start + offset) % n], axis=1))
+
+    def __len__(self) -> int:
+        return len(self.serials)
+
+    @property
+    def link_count(self) -> int:
+        """Number of undirected links."""
+        return len(self.rows) // 2
+
+    def matvec(self, x: np.ndarray) -> np.ndarray:
+        """Adjacency × x: each node sums x over its neighbors."""
+        return np.bincount(self.rows, weights=x[self.cols], minlength=len(self.serials))
+
+    def neighbors(self, serial: str) -> List[str]:
+        """Serials linked to serial (empty if unknown)."""
+        i = self.index.get(serial)
+        if i is None:
+            return []
+        start, end = np.searchsorted(self.rows, [i, i + 1])
+        return [self.serials[j] for j in self.cols[start:end]]
+
+    def cascade(self, sources: Sequence[int], base_risk: float, factor: float, hops: int) -> float:
+        """
+        Risk propagated from the source nodes, averaged per source.
+
+        Hop 1 carries factor × base_risk across every link of every source,
+        so it alone is base_risk × factor × mean source degree. Each later
+        hop carries the previous hop's risk one link further, but only into
+        satellites the cascade has not reached yet: risk never echoes back
+        to a satellite that already took its share. In a complete graph
+        (rings of up to 2 × neighbors_per_side + 1 satellites) hop 1 reaches
+        everyone, so the later hops add nothing.
+        """
+        if not len(sources) or hops <= 0:
+            return 0.0
+        risk = np.zeros(len(self.serials))
+        risk[np.asarray(sources)] = base_risk
+        reached = np.zeros(len(self.serials), dtype=bool)
+        reached[np.asarray(sources)] = True
+        total = 0.0
+        for hop in range(hops):
+            risk = factor * self.matvec(risk)
+            if hop:
+                risk[reached] = 0.0
+            total += float(risk.sum())
+            reached |= risk > 0
+        return total / len(sources)
+
+
 class SwarmImpactSimulator:
     """
     Simulates constellation-wide impact of actions before execution.
@@ -123,6 +225,13 @@ class SwarmImpactSimulator:
     - Total risk = base_risk + cascade_risk
     - BLOCK if total_risk > risk_threshold (default 10%)
 
+    Topology: alive peers, sorted by satellite serial, form a ring in which
+    each satellite has ISL_NEIGHBORS_PER_SIDE links on either side (4 ISLs,
+    as in a typical in-plane + cross-plane layout); sorting keeps a peer's
+    ISL neighbors stable when others leave and rejoin. The graph is rebuilt
+    only when a SwarmRegistry's alive_version (or, for other registries,
+    the alive peer list) changes.
+
     Integration point:
     - ResponseOrchestrator (#412) calls validate_action()
     - SafetySimulator blocks unsafe CONSTELLATION actions
@@ -140,6 +249,15 @@ class SwarmImpactSimulator:
     POWER_BASE_WEIGHT = 0.30
     THERMAL_BASE_WEIGHT = 0.30
 
+    # Cascade model
+    PROPAGATION_FACTOR = 0.15  # 15% of risk crosses each link
+    CASCADE_HOPS = 3  # Sparse matrix-vector iterations
+    ISL_NEIGHBORS_PER_SIDE = 2
+
+    # Bounded bookkeeping
+    RESULT_CACHE_SIZE = 256
+    LATENCY_SAMPLES = 512
+
     def __init__(
         self,
         registry: Optional[Any] = None,  # SwarmRegistry (#400)
@@ -163,7 +281,14 @@ class SwarmImpactSimulator:
 
         # Metrics tracking
         self.metrics = SafetyMetrics()
-        self.latency_samples: List[float] = []
+        self.latency_samples: Deque[float] = deque(maxlen=self.LATENCY_SAMPLES)
+        self._latency_total_ms = 0.0
+
+        # Topology and memoized results
+        self._graph: Optional[ConstellationGraph] = None
+        self._graph_key: Optional[Hashable] = None
+        self._results: "OrderedDict[Tuple, Tuple[float, float]]" = OrderedDict()  # (base, cascade)
+        self._action_types: Dict[str, ActionType] = {}
 
         logger.info(
             f"SwarmImpactSimulator initialized "
@@ -197,8 +322,7 @@ class SwarmImpactSimulator:
         Returns:
             bool: True if safe, False if blocked
         """
-        import time
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             # Only validate CONSTELLATION actions
@@ -213,33 +337,46 @@ class SwarmImpactSimulator:
                 logger.debug("Safety validation disabled: SWARM_MODE_ENABLED=False")
                 return True
 
-            # Classify and simulate action
+            # Classify and simulate action (risk memoized per topology)
             action_type = self._classify_action(action)
-            result = await self._simulate_action(action_type, params)
+            key = (action_type, self._params_digest(params), self._topology_key())
+            risks = self._results.get(key)
+            if risks is not None:
+                self._results.move_to_end(key)
+                self.metrics.simulation_cache_hits += 1
+            else:
+                result = await self._simulate_action(action_type, params)
+                risks = self._results[key] = (result.base_risk, result.cascade_risk)
+                if len(self._results) > self.RESULT_CACHE_SIZE:
+                    self._results.popitem(last=False)
+
+            # Judge against the current threshold, which callers may change
+            total_risk = risks[0] + risks[1]
+            is_safe = total_risk <= self.risk_threshold
 
             # Track metrics
             self.metrics.simulations_run += 1
-            elapsed_ms = (time.time() - start_time) * 1000
+            elapsed_ms = (time.perf_counter() - start_time) * 1000
             self.latency_samples.append(elapsed_ms)
             self._update_latency_metrics(elapsed_ms)
 
-            if result.is_safe:
+            if is_safe:
                 self.metrics.simulations_safe += 1
                 logger.info(
                     f"Action APPROVED by safety check: {action} "
-                    f"(risk={result.total_risk:.1%}, {decision_id})"
+                    f"(risk={total_risk:.1%}, {decision_id})"
                 )
             else:
                 self.metrics.simulations_blocked += 1
                 self.metrics.cascade_prevention_count += 1
-                self.metrics.total_blocked_risk += result.total_risk
+                self.metrics.total_blocked_risk += total_risk
                 logger.warning(
                     f"Action BLOCKED by safety check: {action} "
-                    f"(risk={result.total_risk:.1%} > {self.risk_threshold:.1%}, "
+                    f"(risk={total_risk:.1%} > {self.risk_threshold:.1%}, "
                     f"{decision_id})"
                 )
 
-            return result.is_safe
+            return is_safe
 
         except Exception as e:
             logger.error(
@@ -251,7 +388,14 @@ class SwarmImpactSimulator:
             return False
 
     def _classify_action(self, action: str) -> ActionType:
-        """Classify action for simulation model selection."""
+        """Classify action for simulation model selection (cached per name)."""
+        action_type = self._action_types.get(action)
+        if action_type is None:
+            action_type = self._action_types[action] = self._match_action(action)
+        return action_type
+
+    def _match_action(self, action: str) -> ActionType:
+        """Map an action name to its simulation model by keyword."""
         action_lower = action.lower()
 
         if "attitude" in action_lower:
@@ -414,10 +558,11 @@ class SwarmImpactSimulator:
         Propagate base risk to neighbors (cascade effect).
 
         Algorithm:
-        - For each affected agent, propagate risk to neighbors
-        - Each neighbor receives: base_risk × propagation_factor
-        - Propagation stops after 1 hop (immediate neighbors only)
-        - Total cascade_risk = sum(neighbor_risks) / neighbor_count
+        - Affected agents start with base_risk
+        - Each hop multiplies by the ISL adjacency matrix and by the
+          propagation factor (15% of risk crosses each link)
+        - CASCADE_HOPS sparse matrix-vector products
+        - Total cascade_risk = sum(propagated risk) / affected count
 
         Args:
             base_risk: Direct action risk
@@ -429,26 +574,14 @@ class SwarmImpactSimulator:
         if not affected_agents or base_risk == 0:
             return 0.0
 
-        # Propagation factor: neighbors inherit fraction of base risk
-        propagation_factor = 0.15  # 15% of base risk propagates to neighbors
-
-        total_cascade_risk = 0.0
-
-        for agent_serial in affected_agents:
-            # Get neighbors of this affected agent
-            neighbor_serials = await self._get_agent_neighbors(agent_serial)
-
-            # Each neighbor receives propagated risk
-            for _ in neighbor_serials:
-                neighbor_risk = base_risk * propagation_factor
-                total_cascade_risk += neighbor_risk
-
-        # Normalize by number of affected agents
-        if affected_agents:
-            cascade_risk = total_cascade_risk / len(affected_agents)
-        else:
-            cascade_risk = 0.0
+        graph = self._get_graph()
+        sources = [graph.index[serial] for serial in affected_agents if serial in graph.index]
+        if not sources:
+            return 0.0
 
+        cascade_risk = graph.cascade(
+            sources, base_risk, self.PROPAGATION_FACTOR, self.CASCADE_HOPS
+        )
         return min(1.0, cascade_risk)
 
     async def _get_coverage_neighbors(self) -> List[str]:
@@ -456,54 +589,77 @@ class SwarmImpactSimulator:
         if not self.registry:
             return []
 
-        peers = self.registry.get_alive_peers()
-        # Return serial numbers (typically first 5-10 neighbors)
-        return [peer.satellite_serial for peer in peers[:10]]
+        # Typically first 5-10 neighbors
+        return self._get_graph().serials[:10]
 
     async def _get_thermal_neighbors(self) -> List[str]:
         """Get agents affected by thermal changes (nearby orbit)."""
         if not self.registry:
             return []
 
-        peers = self.registry.get_alive_peers()
-        # Return serial numbers (typically 3-5 nearest neighbors)
-        return [peer.satellite_serial for peer in peers[:5]]
+        # Typically 3-5 nearest neighbors
+        return self._get_graph().serials[:5]
 
     async def _get_all_agents(self) -> List[str]:
         """Get all constellation agents (for power budget impacts)."""
         if not self.registry:
             return []
 
-        peers = self.registry.get_alive_peers()
-        return [peer.satellite_serial for peer in peers]
+        return list(self._get_graph().serials)
 
     async def _get_agent_neighbors(self, agent_serial: str) -> List[str]:
-        """Get neighbors of a specific agent."""
+        """Get ISL neighbors of a specific agent."""
         if not self.registry:
             return []
 
-        # Simplified: return all other agents
-        peers = self.registry.get_alive_peers()
-        neighbors = [
-            p.satellite_serial for p in peers
-            if p.satellite_serial != agent_serial
-        ]
-        return neighbors
+        return self._get_graph().neighbors(agent_serial)
+
+    def _topology_key(self) -> Hashable:
+        """Version of the alive set, used to key cached graphs and results."""
+        if not self.registry:
+            return None
+        if isinstance(self.registry, SwarmRegistry):
+            return ("version", self.registry.alive_version)
+        # Other registries: the alive list itself is the key
+        return ("peers", tuple(self.registry.get_alive_peers()))
+
+    def _get_graph(self) -> ConstellationGraph:
+        """ISL graph for the current alive set, rebuilt on topology change."""
+        key = self._topology_key()
+        if self._graph is None or key != self._graph_key:
+            peers = self.registry.get_alive_peers() if self.registry else []
+            # Sorted so ISL neighbors don't shift when a peer rejoins
+            self._graph = ConstellationGraph.ring(
+                sorted(peer.satellite_serial for peer in peers), self.ISL_NEIGHBORS_PER_SIDE
+            )
+            self._graph_key = key
+            self.metrics.topology_rebuilds += 1
+        return self._graph
+
+    @staticmethod
+    def _params_digest(params: Dict[str, Any]) -> str:
+        """Stable digest of action parameters."""
+        encoded = json.dumps(params, sort_keys=True, default=repr).encode()
+        return hashlib.blake2b(encoded, digest_size=16).hexdigest()
 
     def _update_latency_metrics(self, latency_ms: float) -> None:
         """Update latency metrics with new sample."""
-        # Update average
-        total = sum(self.latency_samples)
-        self.metrics.avg_simulation_latency_ms = total / len(self.latency_samples)
+        # Update average (all simulations)
+        self._latency_total_ms += latency_ms
+        self.metrics.avg_simulation_latency_ms = (
+            self._latency_total_ms / self.metrics.simulations_run
+        )
 
-        # Update P95
+        # Update P95 (over the last LATENCY_SAMPLES simulations)
         if len(self.latency_samples) >= 20:
             sorted_samples = sorted(self.latency_samples)
             p95_index = int(len(sorted_samples) * 0.95)
             self.metrics.p95_simulation_latency_ms = sorted_samples[p95_index]
 
         # Update max
-        self.metrics.max_simulation_latency_ms = max(self.latency_samples)
+        self.metrics.max_simulation_latency_ms = max(
+            self.metrics.max_simulation_latency_ms, latency_ms
+        )
 
     def get_metrics(self) -> SafetyMetrics:
         """Get current metrics snapshot."""
@@ -512,4 +668,5 @@ class SwarmImpactSimulator:
     def reset_metrics(self) -> None:
         """Reset all metrics."""
         self.metrics = SafetyMetrics()
-        self.latency_samples = []
+        self.latency_samples.clear()
+        self._latency_total_ms = 0.0
@@ -0,0 +1,326 @@
+"""
+OutboundScheduler - Weighted fair scheduling of outbound swarm traffic.
+
+Sits between SwarmMessageBus.publish and the transport so a congested ISL
+link serves safety-critical traffic first without starving anything:
+- One FIFO queue per traffic class (consensus, safety, intent, health,
+  heartbeat), classified by topic prefix
+- Deficit round robin across classes: each round a class may send
+  weight × quantum bytes, so heartbeat bursts only consume their own share
+- Sending is gated by BandwidthGovernor tokens (global + per-peer buckets).
+  A message larger than a bucket's burst is sent once the bucket is full
+  and charged as debt. A class held back for tokens reserves them, so
+  other classes keep sending without spending what it is waiting for
+- Per-class queue depth, drop and enqueue→send latency metrics
+"""
+
+import asyncio
+import logging
+import statistics
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Deque, Dict, Optional, Tuple
+
+from astraguard.swarm.bandwidth_governor import BandwidthGovernor, MessagePriority
+from astraguard.swarm.models import AgentID
+from astraguard.swarm.types import SwarmMessage, TrafficClass
+
+logger = logging.getLogger(__name__)
+
+# Relative share of link capacity per class when all classes are backlogged
+DEFAULT_CLASS_WEIGHTS: Dict[TrafficClass, int] = {
+    TrafficClass.CONSENSUS: 8,
+    TrafficClass.SAFETY: 8,
+    TrafficClass.INTENT: 4,
+    TrafficClass.HEALTH: 2,
+    TrafficClass.HEARTBEAT: 1,
+}
+
+# Topic prefix → class; the longest matching prefix wins
+DEFAULT_TOPIC_CLASSES: Dict[str, TrafficClass] = {
+    "coord/": TrafficClass.CONSENSUS,
+    "coord/heartbeat": TrafficClass.HEARTBEAT,
+    "control/": TrafficClass.SAFETY,
+    "intent/": TrafficClass.INTENT,
+    "health/": TrafficClass.HEALTH,
+    "health/heartbeat": TrafficClass.HEARTBEAT,
+}
+
+# Governor priority each class is admitted under
+CLASS_PRIORITIES: Dict[TrafficClass, MessagePriority] = {
+    TrafficClass.CONSENSUS: MessagePriority.CRITICAL,
+    TrafficClass.SAFETY: MessagePriority.CRITICAL,
+    TrafficClass.INTENT: MessagePriority.HIGH,
+    TrafficClass.HEALTH: MessagePriority.CRITICAL,
+    TrafficClass.HEARTBEAT: MessagePriority.NORMAL,
+}
+
+# Per-message envelope overhead charged against governor tokens
+ENVELOPE_OVERHEAD_BYTES = 64
+LATENCY_SAMPLES = 1024
+
+
+@dataclass
+class TrafficClassStats:
+    """Queueing statistics for one traffic class."""
+
+    enqueued: int = 0
+    sent: int = 0
+    dropped: int = 0
+    bytes_sent: int = 0
+    max_queue_depth: int = 0
+    latencies_ms: Deque[float] = field(
+        default_factory=lambda: deque(maxlen=LATENCY_SAMPLES)
+    )
+
+    def latency_percentile(self, pct: int) -> float:
+        """Enqueue→send latency percentile over recent messages."""
+        if not self.latencies_ms:
+            return 0.0
+        if len(self.latencies_ms) == 1:
+            return self.latencies_ms[0]
+        return statistics.quantiles(self.latencies_ms, n=100)[pct - 1]
+
+    def to_dict(self) -> dict:
+        """Serialize stats for metrics export."""
+        return {
+            "enqueued": self.enqueued,
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "bytes_sent": self.bytes_sent,
+            "max_queue_depth": self.max_queue_depth,
+            "latency_p50_ms": self.latency_percentile(50),
+            "latency_p99_ms": self.latency_percentile(99),
+        }
+
+
+class OutboundScheduler:
+    """Weighted fair (deficit round robin) scheduler for outbound messages.
+
+    Example:
+        >>> scheduler = OutboundScheduler(transport_send, governor=governor)
+        >>> await scheduler.enqueue(message)   # returns immediately
+        >>> await scheduler.drain()            # wait until all sent
+    """
+
+    def __init__(
+        self,
+        send: Callable[[SwarmMessage], Awaitable[None]],
+        governor: Optional[BandwidthGovernor] = None,
+        weights: Optional[Dict[TrafficClass, int]] = None,
+        topic_classes: Optional[Dict[str, TrafficClass]] = None,
+        classifier: Optional[Callable[[SwarmMessage], TrafficClass]] = None,
+        queue_limit: int = 256,
+        quantum_bytes: int = 256,
+        retry_interval_ms: float = 5.0,
+    ):
+        """Initialize scheduler.
+
+        Args:
+            send: Async callable that transmits one message
+            governor: BandwidthGovernor whose tokens gate sending (None = ungated)
+            weights: TrafficClass → DRR weight (merged over DEFAULT_CLASS_WEIGHTS)
+            topic_classes: Topic prefix → TrafficClass (merged over
+                DEFAULT_TOPIC_CLASSES)
+            classifier: Callable overriding topic-based classification
+            queue_limit: Max queued messages per class; when full the oldest
+                message of that class is dropped
+            quantum_bytes: Bytes credited per unit of weight each round
+            retry_interval_ms: Wait before retrying when the governor is out
+                of tokens
+        """
+        self.send = send
+        self.governor = governor
+        self.weights = {**DEFAULT_CLASS_WEIGHTS, **(weights or {})}
+        self.topic_classes = {**DEFAULT_TOPIC_CLASSES, **(topic_classes or {})}
+        # Longest prefix first
+        self._prefixes = sorted(self.topic_classes, key=len, reverse=True)
+        self.classifier = classifier
+        self.queue_limit = queue_limit
+        self.quantum_bytes = quantum_bytes
+        self.retry_interval_ms = retry_interval_ms
+
+        # Classes visited in weight order within each round
+        self._order = sorted(TrafficClass, key=lambda c: -self.weights[c])
+        self._queues: Dict[TrafficClass, Deque[Tuple[SwarmMessage, float]]] = {
+            c: deque() for c in TrafficClass
+        }
+        self._deficit: Dict[TrafficClass, int] = {c: 0 for c in TrafficClass}
+        # Classes whose head message is waiting for tokens → (receiver, tokens
+        # it needs), in the order they started waiting
+        self._reserved: Dict[TrafficClass, Tuple[Optional[AgentID], float]] = {}
+        self.stats: Dict[TrafficClass, TrafficClassStats] = {
+            c: TrafficClassStats() for c in TrafficClass
+        }
+        self.governor_waits = 0
+
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._idle: Optional[asyncio.Event] = None
+
+    def classify(self, message: SwarmMessage) -> TrafficClass:
+        """Map a message to its traffic class."""
+        if self.classifier is not None:
+            return self.classifier(message)
+        for prefix in self._prefixes:
+            if message.topic.startswith(prefix):
+                return self.topic_classes[prefix]
+        return TrafficClass.HEALTH
+
+    def _ensure_worker(self) -> None:
+        """Start the drain worker on the running loop (restarting after loop changes)."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._wakeup = asyncio.Event()
+            self._idle = asyncio.Event()
+            self._idle.set()
+        if self._worker is None or self._worker.done():
+            self._worker = loop.create_task(self._run())
+
+    async def enqueue(self, message: SwarmMessage) -> bool:
+        """Queue message for transmission.
+
+        Returns:
+            True if queued without dropping anything, False if the class
+            queue was full and its oldest message was dropped
+        """
+        self._ensure_worker()
+        traffic_class = self.classify(message)
+        queue = self._queues[traffic_class]
+        stats = self.stats[traffic_class]
+
+        accepted = True
+        if len(queue) >= self.queue_limit:
+            queue.popleft()
+            stats.dropped += 1
+            accepted = False
+        queue.append((message, time.monotonic()))
+        stats.enqueued += 1
+        stats.max_queue_depth = max(stats.max_queue_depth, len(queue))
+
+        self._idle.clear()
+        self._wakeup.set()
+        return accepted
+
+    def _admit(self, message: SwarmMessage, size: int, traffic_class: TrafficClass) -> bool:
+        """Take governor tokens for message, if a governor is configured."""
+        if self.governor is None:
+            return True
+        governor = self.governor
+        receiver = message.receiver
+        # Leave enough for every class that started waiting before this one
+        reserved_global = reserved_peer = 0.0
+        for waiting, (waiting_for, tokens) in self._reserved.items():
+            if waiting is traffic_class:
+                break
+            reserved_global += tokens
+            if waiting_for == receiver:
+                reserved_peer += tokens
+        # Check token levels first so waiting does not inflate throttle stats
+        if not governor.can_admit(receiver, size, reserved_global, reserved_peer):
+            # Keeps its place in the order if already waiting
+            self._reserved[traffic_class] = (receiver, governor.admission_tokens(receiver, size))
+            return False
+        if not governor.acquire_tokens(
+            receiver, size, CLASS_PRIORITIES[traffic_class], allow_debt=True
+        ):
+            return False
+        self._reserved.pop(traffic_class, None)
+        return True
+
+    async def _run(self) -> None:
+        """Drain loop: one deficit round robin pass per iteration."""
+        while True:
+            if not any(self._queues.values()):
+                self._idle.set()
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            sent_any = throttled = False
+            for traffic_class in self._order:
+                queue = self._queues[traffic_class]
+                if not queue:
+                    self._deficit[traffic_class] = 0
+                    self._reserved.pop(traffic_class, None)
+                    continue
+
+                quantum = self.quantum_bytes * self.weights[traffic_class]
+                # Cap carried credit so a governor stall doesn't bank a burst
+                self._deficit[traffic_class] = min(
+                    self._deficit[traffic_class] + quantum, 2 * quantum + 10240
+                )
+                while queue:
+                    message, enqueued_at = queue[0]
+                    size = len(message.payload) + ENVELOPE_OVERHEAD_BYTES
+                    if size > self._deficit[traffic_class]:
+                        break
+                    if not self._admit(message, size, traffic_class):
+                        throttled = True
+                        break
+                    queue.popleft()
+                    self._deficit[traffic_class] -= size
+                    try:
+                        await self.send(message)
+                    except asyncio.CancelledError:
+                        raise
+                    except Exception as e:
+                        logger.error(f"Outbound send failed for {message.topic}: {e}")
+                        self.stats[traffic_class].dropped += 1
+                        continue
+                    stats = self.stats[traffic_class]
+                    stats.sent += 1
+                    stats.bytes_sent += size
+                    stats.latencies_ms.append((time.monotonic() - enqueued_at) * 1000)
+                    sent_any = True
+
+                if not queue:
+                    self._deficit[traffic_class] = 0
+                    self._reserved.pop(traffic_class, None)
+                # A throttled class doesn't end the round: its reservation in
+                # _admit keeps refilled tokens for it while others keep sending
+
+            if throttled and not sent_any:
+                # Out of governor tokens: wait for the buckets to refill
+                self.governor_waits += 1
+                await asyncio.sleep(self.retry_interval_ms / 1000.0)
+            else:
+                # Yield to publishers; credit carries over to the next round
+                await asyncio.sleep(0)
+
+    async def drain(self) -> None:
+        """Wait until every queued message has been sent."""
+        if self._idle is not None and self._loop is asyncio.get_running_loop():
+            await self._idle.wait()
+
+    def stop(self) -> Optional[asyncio.Task]:
+        """Cancel the worker; queued messages are counted as dropped.
+
+        Returns:
+            The cancelled worker task, if one was running
+        """
+        for traffic_class, queue in self._queues.items():
+            self.stats[traffic_class].dropped += len(queue)
+            queue.clear()
+        self._reserved.clear()
+        if self._idle is not None:
+            self._idle.set()
+        worker, self._worker = self._worker, None
+        if worker is None or worker.done() or worker.get_loop().is_closed():
+            return None
+        worker.cancel()
+        return worker
+
+    def queue_depths(self) -> Dict[str, int]:
+        """Current queued messages per class."""
+        return {c.value: len(q) for c, q in self._queues.items()}
+
+    def get_stats(self) -> Dict[str, dict]:
+        """Per-class metrics keyed by class name."""
+        return {
+            c.value: {**self.stats[c].to_dict(), "queue_depth": len(self._queues[c])}
+            for c in TrafficClass
+        }
@@ -8,8 +8,9 @@ Issue #399 integration: Compression metrics and LZ4 optimization.
 """
 
 import json
-from typing import Any, Dict, Union
-from datetime import datetime
+import struct
+from typing import Any, Dict, Optional, Tuple, Union
+from datetime import datetime, timedelta, timezone
 
 try:
     import lz4.frame
@@ -26,6 +27,55 @@ except ImportError:
 import jsonschema
 from astraguard.swarm.models import HealthSummary, SwarmConfig, AgentID
 
+# Codecs selectable per message type
+CODEC_JSON = "json"
+CODEC_BINARY = "binary"
+
+# Binary HealthSummary layout (version 1, little-endian):
+#   <BBB   magic 0xA5, version, flags (bit 0: float16 signature)
+#   <ff    risk_score, recurrence_score
+#   varint timestamp, µs since Unix epoch (UTC)
+#   varint compressed_size
+#   32 × float32 (or float16) anomaly_signature
+BINARY_MAGIC = 0xA5
+BINARY_VERSION = 1
+FLAG_FLOAT16 = 0x01
+SIGNATURE_DIM = 32
+
+_BINARY_HEADER = struct.Struct("<BBB")
+_BINARY_SCALARS = struct.Struct("<ff")
+_SIGNATURE_F32 = struct.Struct(f"<{SIGNATURE_DIM}f")
+_SIGNATURE_F16 = struct.Struct(f"<{SIGNATURE_DIM}e")
+_EPOCH = datetime(1970, 1, 1)
+
+# Compiled Draft7 validators, shared by all serializer instances
+_VALIDATORS: Dict[str, "jsonschema.Draft7Validator"] = {}
+
+
+def _encode_varint(value: int) -> bytes:
+    """Encode a non-negative int as LEB128 varint."""
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _decode_varint(data, offset: int) -> Tuple[int, int]:
+    """Decode a LEB128 varint; returns (value, next offset)."""
+    result = 0
+    shift = 0
+    while True:
+        if offset >= len(data):
+            raise ValueError("Truncated varint")
+        byte = data[offset]
+        offset += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, offset
+        shift += 7
+
 
 class SwarmSerializer:
     """
@@ -34,7 +84,8 @@ class SwarmSerializer:
     Features:
     - LZ4 frame compression for 80%+ ratio on typical HealthSummary
     - orjson for faster JSON encoding/decoding (optional, fallback to json)
-    - JSONSchema v1.0 validation
+    - JSONSchema v1.0 validation (compiled once, optionally sampled)
+    - Compact binary codec for HealthSummary (float32/float16 signature)
     - <50ms roundtrip serialization
     - <1KB compressed HealthSummary payloads
     """
@@ -136,26 +187,72 @@ class SwarmSerializer:
         },
     }
 
-    def __init__(self, validate: bool = True):
+    BINARY_TYPES = ("HealthSummary",)
+
+    def __init__(
+        self,
+        validate: bool = True,
+        validation_sample_rate: float = 1.0,
+        codecs: Optional[Dict[str, str]] = None,
+        signature_float16: bool = False,
+    ):
         """
         Initialize serializer.
         
         Args:
             validate: Enable JSONSchema validation on serialize/deserialize
+            validation_sample_rate: Fraction of serialize/deserialize calls
+                that run schema validation (1.0 = all). Lower it on trusted
+                hot paths; validate_schema() called directly always validates.
+            codecs: Message type → CODEC_JSON or CODEC_BINARY
+                (default JSON for every type)
+            signature_float16: Binary codec stores anomaly_signature as
+                float16 (64B) instead of float32 (128B)
         """
         self.validate = validate
         self._use_orjson = HAS_ORJSON
         self._use_lz4 = HAS_LZ4
 
+        if not 0.0 <= validation_sample_rate <= 1.0:
+            raise ValueError("validation_sample_rate must be in [0.0, 1.0]")
+        self.validation_sample_rate = validation_sample_rate
+        self._validation_credit = 0.0
+        self.validations_skipped = 0
+
+        self.codecs = dict(codecs or {})
+        for schema_type, codec in self.codecs.items():
+            if codec not in (CODEC_JSON, CODEC_BINARY):
+                raise ValueError(f"Unknown codec: {codec}")
+            if codec == CODEC_BINARY and schema_type not in self.BINARY_TYPES:
+                raise ValueError(f"No binary codec for {schema_type}")
+        self.signature_float16 = signature_float16
+
+    def _sampled_validate(self, data: dict, schema_type: str) -> None:
+        """Validate on the hot path, honouring validation_sample_rate."""
+        if not self.validate:
+            return
+        if self.validation_sample_rate < 1.0:
+            # Accumulate the rate; validate each time a whole call is owed
+            self._validation_credit += self.validation_sample_rate
+            if self._validation_credit < 1.0:
+                self.validations_skipped += 1
+                return
+            self._validation_credit -= 1.0
+        self.validate_schema(data, schema_type)
+
     def serialize_health(
-        self, summary: HealthSummary, compress: bool = True
+        self,
+        summary: HealthSummary,
+        compress: bool = True,
+        codec: Optional[str] = None,
     ) -> bytes:
         """
         Serialize HealthSummary to bytes with optional LZ4 compression.
         
         Args:
             summary: HealthSummary instance
-            compress: Enable LZ4 compression (default True)
+            compress: Enable LZ4 compression (default True, JSON codec only)
+            codec: Override the configured codec for this call
             
         Returns:
             Serialized bytes (compressed if enabled)
@@ -163,10 +260,11 @@ class SwarmSerializer:
         Raises:
             ValueError: If validation fails or compression unavailable
         """
-        data = summary.to_dict()
+        if (codec or self.codecs.get("HealthSummary", CODEC_JSON)) == CODEC_BINARY:
+            return self.encode_health_binary(summary)
 
-        if self.validate:
-            self.validate_schema(data, "HealthSummary")
+        data = summary.to_dict()
+        self._sampled_validate(data, "HealthSummary")
 
         # Encode to JSON
         if self._use_orjson:
@@ -191,7 +289,7 @@ class SwarmSerializer:
         Deserialize bytes to HealthSummary with optional LZ4 decompression.
         
         Args:
-            data: Serialized bytes
+            data: Serialized bytes or a memoryview into a received frame
             compressed: Whether data is LZ4 compressed (default True)
             
         Returns:
@@ -200,6 +298,10 @@ class SwarmSerializer:
         Raises:
             ValueError: If validation or decompression fails
         """
+        # Binary frames are self-describing
+        if data[:1] == bytes((BINARY_MAGIC,)):
+            return self.decode_health_binary(data)
+
         # Decompress if needed
         if compressed:
             if not self._use_lz4:
@@ -214,14 +316,88 @@ class SwarmSerializer:
         if self._use_orjson:
             json_data = orjson.loads(json_bytes)
         else:
-            json_str = json_bytes.decode("utf-8")
+            json_str = str(json_bytes, "utf-8")  # also accepts memoryview
             json_data = json.loads(json_str)
 
-        if self.validate:
-            self.validate_schema(json_data, "HealthSummary")
+        self._sampled_validate(json_data, "HealthSummary")
 
         return HealthSummary.from_dict(json_data)
 
+    def encode_health_binary(self, summary: HealthSummary) -> bytes:
+        """
+        Encode HealthSummary with the fixed binary layout.
+        
+        The layout enforces field presence and signature length; value
+        ranges are enforced by HealthSummary itself on decode.
+        
+        Args:
+            summary: HealthSummary instance
+            
+        Returns:
+            Binary bytes (~150B float32, ~85B float16)
+        """
+        if len(summary.anomaly_signature) != SIGNATURE_DIM:
+            raise ValueError(
+                f"anomaly_signature must be {SIGNATURE_DIM}-dimensional"
+            )
+        timestamp = summary.timestamp
+        if timestamp.tzinfo is not None:
+            timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+        timestamp_us = (timestamp - _EPOCH) // timedelta(microseconds=1)
+        if timestamp_us < 0:
+            raise ValueError("Binary codec requires timestamps after 1970-01-01")
+
+        if self.signature_float16:
+            flags, signature = FLAG_FLOAT16, _SIGNATURE_F16
+        else:
+            flags, signature = 0, _SIGNATURE_F32
+        return b"".join((
+            _BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, flags),
+            _BINARY_SCALARS.pack(summary.risk_score, summary.recurrence_score),
+            _encode_varint(timestamp_us),
+            _encode_varint(summary.compressed_size),
+            signature.pack(*summary.anomaly_signature),
+        ))
+
+    def decode_health_binary(self, data: bytes) -> HealthSummary:
+        """
+        Decode a binary HealthSummary.
+        
+        Args:
+            data: Bytes produced by encode_health_binary()
+            
+        Returns:
+            HealthSummary instance
+            
+        Raises:
+            ValueError: If the frame is malformed or the version unsupported
+        """
+        if len(data) < _BINARY_HEADER.size + _BINARY_SCALARS.size:
+            raise ValueError("Binary HealthSummary too short")
+        magic, version, flags = _BINARY_HEADER.unpack_from(data)
+        if magic != BINARY_MAGIC:
+            raise ValueError("Not a binary HealthSummary")
+        if version != BINARY_VERSION:
+            raise ValueError(f"Unsupported binary version: {version}")
+
+        offset = _BINARY_HEADER.size
+        risk_score, recurrence_score = _BINARY_SCALARS.unpack_from(data, offset)
+        offset += _BINARY_SCALARS.size
+        timestamp_us, offset = _decode_varint(data, offset)
+        compressed_size, offset = _decode_varint(data, offset)
+
+        signature = _SIGNATURE_F16 if flags & FLAG_FLOAT16 else _SIGNATURE_F32
+        if len(data) - offset != signature.size:
+            raise ValueError("Binary HealthSummary signature truncated")
+
+        return HealthSummary(
+            anomaly_signature=list(signature.unpack_from(data, offset)),
+            risk_score=risk_score,
+            recurrence_score=recurrence_score,
+            timestamp=_EPOCH + timedelta(microseconds=timestamp_us),
+            compressed_size=compressed_size,
+        )
+
     def serialize_swarm_config(self, config: SwarmConfig) -> bytes:
         """
         Serialize SwarmConfig to JSON bytes.
@@ -233,9 +409,7 @@ class SwarmSerializer:
             Serialized JSON bytes
         """
         data = config.to_dict()
-
-        if self.validate:
-            self.validate_schema(data, "SwarmConfig")
+        self._sampled_validate(data, "SwarmConfig")
 
         if self._use_orjson:
             return orjson.dumps(data, default=str)
@@ -259,8 +433,7 @@ class SwarmSerializer:
             json_str = data.decode("utf-8")
             json_data = json.loads(json_str)
 
-        if self.validate:
-            self.validate_schema(json_data, "SwarmConfig")
+        self._sampled_validate(json_data, "SwarmConfig")
 
         return SwarmConfig.from_dict(json_data)
 
@@ -281,15 +454,22 @@ class SwarmSerializer:
         if not self.validate:
             return True
 
-        validator = jsonschema.Draft7Validator(self.SCHEMA)
-        schema_def = self.SCHEMA["definitions"].get(schema_type)
-
-        if not schema_def:
-            raise ValueError(f"Unknown schema type: {schema_type}")
-
-        validator.validate(data, schema_def)
+        self._get_validator(schema_type).validate(data)
         return True
 
+    @classmethod
+    def _get_validator(cls, schema_type: str) -> "jsonschema.Draft7Validator":
+        """Compile the validator for a schema type once and cache it."""
+        validator = _VALIDATORS.get(schema_type)
+        if validator is None:
+            schema_def = cls.SCHEMA["definitions"].get(schema_type)
+            if not schema_def:
+                raise ValueError(f"Unknown schema type: {schema_type}")
+            # Keep definitions alongside so "#/definitions/..." refs resolve
+            schema = {**schema_def, "definitions": cls.SCHEMA["definitions"]}
+            validator = _VALIDATORS[schema_type] = jsonschema.Draft7Validator(schema)
+        return validator
+
     @staticmethod
     def get_compression_stats(original_size: int, compressed_size: int) -> Dict[str, Any]:
         """
@@ -0,0 +1,229 @@
+"""
+Sliding-window primitives for ReliableDelivery's windowed mode.
+
+- TimerWheel: hashed timing wheel; one driver task fires every
+  retransmission and delayed-ACK deadline instead of one task per message
+- ReceiveBitmap: fixed-size circular bitmap of received sequence numbers
+  above the cumulative ACK point, yielding cumulative ACK + SACK ranges
+"""
+
+import math
+from typing import Dict, Hashable, List, Optional, Tuple
+
+
+class TimerWheel:
+    """Hashed timing wheel keyed by unique timer keys.
+
+    Deadlines are rounded up to `tick` seconds and hashed into `slots`
+    buckets; a bucket holds every timer due on that slot in any rotation.
+    Scheduling and cancelling are O(1); advancing costs O(elapsed ticks +
+    timers in the visited buckets). Cancelled or rescheduled entries are
+    dropped lazily when their bucket is visited.
+
+    Example:
+        >>> wheel = TimerWheel(tick=0.01, slots=8, now=0.0)
+        >>> wheel.schedule("a", 0.05)
+        >>> wheel.schedule("b", 0.20)  # Past one rotation
+        >>> wheel.advance(0.1)
+        ['a']
+        >>> wheel.advance(0.2)
+        ['b']
+    """
+
+    __slots__ = ("tick", "_slots", "_deadlines", "_current")
+
+    def __init__(self, tick: float = 0.01, slots: int = 512, now: float = 0.0):
+        """Initialize an empty wheel.
+
+        Args:
+            tick: Timer resolution in seconds
+            slots: Number of buckets (one rotation = tick × slots)
+            now: Current time on the caller's clock
+        """
+        if tick <= 0 or slots <= 0:
+            raise ValueError("tick and slots must be positive")
+        self.tick = tick
+        self._slots: List[List[Tuple[Hashable, int]]] = [[] for _ in range(slots)]
+        self._deadlines: Dict[Hashable, int] = {}  # key → deadline tick
+        self._current = self._to_tick(now)
+
+    def _to_tick(self, when: float) -> int:
+        return math.ceil(when / self.tick - 1e-9)
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._deadlines
+
+    def schedule(self, key: Hashable, when: float) -> None:
+        """Fire key at time `when`, replacing any earlier schedule for key."""
+        deadline = max(self._to_tick(when), self._current + 1)
+        self._deadlines[key] = deadline
+        self._slots[deadline % len(self._slots)].append((key, deadline))
+
+    def cancel(self, key: Hashable) -> bool:
+        """Cancel key's timer. Returns True if one was pending."""
+        return self._deadlines.pop(key, None) is not None
+
+    def advance(self, now: float) -> List[Hashable]:
+        """Move the wheel to `now` and return keys that fell due, in deadline order."""
+        target = self._to_tick(now)
+        if target <= self._current:
+            return []
+        fired: List[Tuple[int, Hashable]] = []
+        slot_count = len(self._slots)
+        # A jump longer than one rotation only needs each bucket once
+        first = max(self._current + 1, target - slot_count + 1)
+        for tick in range(first, target + 1):
+            bucket = self._slots[tick % slot_count]
+            if not bucket:
+                continue
+            keep = []
+            for key, deadline in bucket:
+                if self._deadlines.get(key) != deadline:
+                    continue  # Cancelled or rescheduled
+                if deadline <= target:
+                    del self._deadlines[key]
+                    fired.append((deadline, key))
+                else:
+                    keep.append((key, deadline))
+            bucket[:] = keep
+        self._current = target
+        fired.sort(key=lambda item: item[0])
+        return [key for _, key in fired]
+
+    def clear(self) -> None:
+        """Cancel every timer."""
+        for bucket in self._slots:
+            bucket.clear()
+        self._deadlines.clear()
+
+
+class ReceiveBitmap:
+    """Received sequence numbers within [base, base + capacity).
+
+    `base` is the cumulative ACK point: every sequence below it has been
+    received or skipped by the sender. Sequences above it are tracked in
+    a circular bitmap of `capacity` bits, so memory is fixed regardless of
+    how many sequences have been seen.
+
+    Example:
+        >>> bitmap = ReceiveBitmap(capacity=8)
+        >>> bitmap.mark(0), bitmap.mark(2), bitmap.mark(3), bitmap.mark(0)
+        (True, True, True, False)
+        >>> bitmap.base, bitmap.sack_ranges()
+        (1, [(2, 4)])
+    """
+
+    __slots__ = ("capacity", "base", "_bits", "_highest", "out_of_window")
+
+    def __init__(self, capacity: int = 256, base: int = 0):
+        """Initialize an empty bitmap.
+
+        Args:
+            capacity: Receive window in sequence numbers
+            base: First expected sequence number
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.base = base
+        self._bits = bytearray((capacity + 7) // 8)
+        self._highest = base - 1  # Highest sequence marked
+        self.out_of_window = 0
+
+    def _test(self, seq: int) -> bool:
+        slot = seq % self.capacity
+        return bool(self._bits[slot >> 3] & (1 << (slot & 7)))
+
+    def _set(self, seq: int) -> None:
+        slot = seq % self.capacity
+        self._bits[slot >> 3] |= 1 << (slot & 7)
+
+    def _clear(self, seq: int) -> None:
+        slot = seq % self.capacity
+        self._bits[slot >> 3] &= ~(1 << (slot & 7)) & 0xFF
+
+    def __contains__(self, seq: int) -> bool:
+        if seq < self.base:
+            return True
+        return seq < self.base + self.capacity and self._test(seq)
+
+    def mark(self, seq: int) -> bool:
+        """Record seq.
+
+        Returns:
+            True if seq is new, False if it is a duplicate or lies beyond
+            the window (counted in out_of_window)
+        """
+        if seq < self.base:
+            return False
+        if seq >= self.base + self.capacity:
+            self.out_of_window += 1
+            return False
+        if self._test(seq):
+            return False
+        self._set(seq)
+        if seq > self._highest:
+            self._highest = seq
+        if seq == self.base:
+            self._slide()
+        return True
+
+    def advance_to(self, base: int) -> None:
+        """Treat every sequence below base as received (sender gave up on them)."""
+        if base <= self.base:
+            return
+        if base - self.base >= self.capacity:
+            self._bits[:] = bytes(len(self._bits))
+            self.base = base
+        else:
+            while self.base < base:
+                self._clear(self.base)
+                self.base += 1
+        self._highest = max(self._highest, base - 1)
+        self._slide()
+
+    def _slide(self) -> None:
+        while self.base <= self._highest and self._test(self.base):
+            self._clear(self.base)
+            self.base += 1
+
+    @property
+    def highest(self) -> int:
+        """Highest sequence marked (base - 1 if none above base)."""
+        return self._highest
+
+    @property
+    def has_gaps(self) -> bool:
+        """True if sequences above base have arrived ahead of base."""
+        return self._highest >= self.base
+
+    def sack_ranges(self, limit: int = 4, first: Optional[int] = None) -> List[Tuple[int, int]]:
+        """Up to `limit` half-open [start, end) runs received above base.
+
+        Args:
+            limit: Max ranges returned
+            first: Optional sequence whose run is listed first (the most
+                recent arrival, as in RFC 2018); others follow in order
+        """
+        ranges: List[Tuple[int, int]] = []
+        leading = None
+        seq = self.base + 1
+        while seq <= self._highest:
+            if not self._test(seq):
+                seq += 1
+                continue
+            start = seq
+            while seq <= self._highest and self._test(seq):
+                seq += 1
+            if first is not None and start <= first < seq:
+                leading = (start, seq)
+            elif len(ranges) < limit:
+                ranges.append((start, seq))
+            elif leading is not None or first is None:
+                break
+        if leading is not None:
+            ranges.insert(0, leading)
+        return ranges[:limit]
@@ -13,17 +13,23 @@ Features:
   - Cache hit rate >90% with intelligent refresh
   - Zero breaking changes to existing AgenticDecisionLoop API
   - Feature flag: SWARM_MODE_ENABLED
+  - Constellation health/quorum read from the registry's incrementally
+    maintained aggregates (step cost independent of constellation size)
+  - Decision latency p50/p95/p99 from a streaming quantile sketch
 """
 
 import asyncio
+import itertools
 import logging
+import math
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Dict, Optional, Any, List
+from typing import Deque, Dict, Optional, Any, List
 from enum import Enum
 
 from astraguard.swarm.models import AgentID, SatelliteRole
-from astraguard.swarm.registry import SwarmRegistry
+from astraguard.swarm.registry import ConstellationAggregates, SwarmRegistry
 from astraguard.swarm.leader_election import LeaderElection
 from astraguard.swarm.swarm_memory import SwarmAdaptiveMemory
 
@@ -80,6 +86,9 @@ class GlobalContext:
     role: SatelliteRole                 # Agent's role (Issue #397)
     cache_fresh: bool = True            # Within 100ms TTL
     cache_timestamp: datetime = field(default_factory=datetime.utcnow)
+    risk_mean: float = 0.0              # Mean risk of alive peers reporting health
+    risk_max: float = 0.0               # Worst risk of alive peers reporting health
+    role_counts: Dict[SatelliteRole, int] = field(default_factory=dict)  # Alive peers per role
 
     def is_stale(self, ttl_seconds: float = 0.1) -> bool:
         """Check if context cache is stale (>100ms old)."""
@@ -87,17 +96,84 @@ class GlobalContext:
         return age > ttl_seconds
 
 
+class LatencySketch:
+    """Streaming quantile sketch with bounded relative error.
+
+    Values fall into logarithmic buckets of ratio gamma = (1+a)/(1-a), so any
+    quantile is returned within relative accuracy a using O(1) work per add
+    and memory bounded by max_buckets (the lowest buckets are merged first).
+    """
+
+    MIN_VALUE = 1e-6  # Values at or below this are counted as zero
+
+    def __init__(self, relative_accuracy: float = 0.01, max_buckets: int = 2048):
+        if not 0.0 < relative_accuracy < 1.0:
+            raise ValueError(f"relative_accuracy must be in (0, 1), got {relative_accuracy}")
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._buckets: Dict[int, int] = {}
+        self._zero_count = 0
+        self.count = 0
+        self.max = 0.0
+
+    def add(self, value: float) -> None:
+        """Record one observation."""
+        self.count += 1
+        if value > self.max:
+            self.max = value
+        if value <= self.MIN_VALUE:
+            self._zero_count += 1
+            return
+        key = math.ceil(math.log(value) / self._log_gamma)
+        self._buckets[key] = self._buckets.get(key, 0) + 1
+        if len(self._buckets) > self.max_buckets:
+            lowest, second = sorted(self._buckets)[:2]
+            self._buckets[second] += self._buckets.pop(lowest)
+
+    def quantile(self, q: float) -> float:
+        """Estimate the q-quantile (0-1); 0.0 when empty."""
+        if self.count == 0:
+            return 0.0
+        rank = q * (self.count - 1)
+        seen = self._zero_count
+        if rank < seen:
+            return 0.0
+        for key in sorted(self._buckets):
+            seen += self._buckets[key]
+            if seen > rank:
+                # Bucket midpoint in relative terms, never above the true max
+                return min(self.max, 2 * self._gamma ** key / (self._gamma + 1))
+        return self.max
+
+    def clear(self) -> None:
+        self._buckets.clear()
+        self._zero_count = 0
+        self.count = 0
+        self.max = 0.0
+
+
 @dataclass
 class SwarmDecisionMetrics:
     """Metrics for swarm decision loop."""
     decision_count: int = 0
-    decision_latency_ms: float = 0.0  # p95
     global_context_cache_hits: int = 0
     global_context_cache_misses: int = 0
     decision_divergence_count: int = 0
     leader_decisions: int = 0
     follower_decisions: int = 0
     reasoning_fallback_count: int = 0
+    latency_sketch: LatencySketch = field(default_factory=LatencySketch, repr=False)
+
+    @property
+    def decision_latency_ms(self) -> float:
+        """p95 step latency."""
+        return self.latency_sketch.quantile(0.95)
+
+    def latency_percentile(self, pct: int) -> float:
+        """Step latency percentile in milliseconds."""
+        return self.latency_sketch.quantile(pct / 100)
 
     @property
     def cache_hit_rate(self) -> float:
@@ -111,7 +187,10 @@ class SwarmDecisionMetrics:
         """Export metrics for Prometheus."""
         return {
             "decision_count": self.decision_count,
-            "decision_latency_ms_p95": self.decision_latency_ms,
+            "decision_latency_ms_p50": self.latency_percentile(50),
+            "decision_latency_ms_p95": self.latency_percentile(95),
+            "decision_latency_ms_p99": self.latency_percentile(99),
+            "decision_latency_ms_max": self.latency_sketch.max,
             "cache_hit_rate": self.cache_hit_rate,
             "cache_hits": self.global_context_cache_hits,
             "cache_misses": self.global_context_cache_misses,
@@ -178,9 +257,9 @@ class SwarmDecisionLoop:
         # Metrics
         self.metrics = SwarmDecisionMetrics()
 
-        # Decision history (for convergence checking)
-        self._decision_history: List[Decision] = []
+        # Decision history (for convergence checking), oldest dropped first
         self._max_history = 50  # Keep last 50 decisions
+        self._decision_history: Deque[Decision] = deque(maxlen=self._max_history)
 
         logger.info(f"SwarmDecisionLoop initialized for {agent_id.satellite_serial}")
 
@@ -202,7 +281,7 @@ class SwarmDecisionLoop:
             Decision with action, confidence, reasoning
         """
         import time
-        step_start = time.time()
+        step_start = time.perf_counter()
 
         try:
             # 1. Get global context (100ms TTL cache)
@@ -220,16 +299,11 @@ class SwarmDecisionLoop:
 
             # 3. Track decision
             self._decision_history.append(decision)
-            if len(self._decision_history) > self._max_history:
-                self._decision_history.pop(0)
 
             # 4. Update metrics
             self.metrics.decision_count += 1
-            step_time_ms = (time.time() - step_start) * 1000
-            self.metrics.decision_latency_ms = max(
-                self.metrics.decision_latency_ms,
-                step_time_ms  # Approximate p95 with max
-            )
+            step_time_ms = (time.perf_counter() - step_start) * 1000
+            self.metrics.latency_sketch.add(step_time_ms)
 
             logger.debug(
                 f"Decision made: {decision.decision_type.value} "
@@ -271,9 +345,19 @@ class SwarmDecisionLoop:
 
         # 3. Gather context from integration points
         leader_id = await self.election.get_leader()
-        alive_peers = self.registry.get_alive_peers()
-        constellation_health = self._calculate_constellation_health(alive_peers)
-        quorum_size = len(alive_peers)
+        aggregates = self._get_aggregates()
+        if aggregates is not None:
+            constellation_health = aggregates.health
+            quorum_size = aggregates.alive_count
+            risk_mean, risk_max = aggregates.risk_mean, aggregates.risk_max
+            role_counts = aggregates.role_counts
+        else:
+            # Registry without aggregates: scan the alive peers
+            alive_peers = self.registry.get_alive_peers()
+            constellation_health = self._calculate_constellation_health(alive_peers)
+            quorum_size = len(alive_peers)
+            risk_mean = risk_max = 0.0
+            role_counts = {}
         role = self.registry.get_agent_role(self.agent_id)
         recent_decisions = await self._get_recent_decisions()
 
@@ -286,6 +370,9 @@ class SwarmDecisionLoop:
             role=role,
             cache_fresh=True,
             cache_timestamp=datetime.utcnow(),
+            risk_mean=risk_mean,
+            risk_max=risk_max,
+            role_counts=role_counts,
         )
 
         # 5. Cache and return
@@ -298,6 +385,12 @@ class SwarmDecisionLoop:
 
         return new_context
 
+    def _get_aggregates(self) -> Optional[ConstellationAggregates]:
+        """Registry-maintained constellation aggregates, if the registry has them."""
+        if isinstance(self.registry, SwarmRegistry):
+            return self.registry.get_constellation_aggregates()
+        return None
+
     async def _leader_decision(
         self, local_telemetry: Dict[str, Any], global_context: GlobalContext
     ) -> Decision:
@@ -422,6 +515,10 @@ class SwarmDecisionLoop:
         """
         Calculate constellation health as average of peer health.
 
+        Scans every peer; only used when the registry does not maintain
+        ConstellationAggregates. A summary without health_score counts as
+        1 - risk_score, matching ConstellationAggregates.health.
+
         Args:
             alive_peers: List of alive peer IDs
 
@@ -435,7 +532,10 @@ class SwarmDecisionLoop:
         for peer in alive_peers:
             peer_health = self.registry.get_peer_health(peer)
             if peer_health:
-                health_scores.append(peer_health.health_score)
+                score = getattr(peer_health, "health_score", None)
+                if score is None:
+                    score = 1.0 - peer_health.risk_score
+                health_scores.append(score)
 
         if not health_scores:
             return 1.0
@@ -455,7 +555,7 @@ class SwarmDecisionLoop:
         recent = []
         cutoff_time = datetime.utcnow() - timedelta(minutes=window_minutes)
 
-        for decision in self._decision_history[-20:]:  # Last 20 decisions
+        for decision in self._latest_decisions(20):
             if decision.timestamp >= cutoff_time:
                 recent.append(decision.action)
 
@@ -503,6 +603,13 @@ class SwarmDecisionLoop:
         self.metrics = SwarmDecisionMetrics()
         self._decision_history.clear()
 
+    def _latest_decisions(self, limit: int) -> List[Decision]:
+        """Last `limit` decisions, oldest first."""
+        if limit <= 0:
+            return []
+        skip = max(0, len(self._decision_history) - limit)
+        return list(itertools.islice(self._decision_history, skip, None))
+
     async def get_decision_history(self, limit: int = 10) -> List[Decision]:
         """
         Get recent decision history (for debugging/monitoring).
@@ -513,4 +620,4 @@ class SwarmDecisionLoop:
         Returns:
             List of recent decisions
         """
-        return self._decision_history[-limit:]
+        return self._latest_decisions(limit)
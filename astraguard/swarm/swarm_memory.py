@@ -13,15 +13,21 @@ Features:
   - Async replication to 3 nearest peers  
   - RSSI-based peer selection
   - Bandwidth-aware eviction (bus.utilization > 0.7)
+  - Byte-budgeted LRU local cache, LFU-leaning eviction while congested
+  - Batched replication queue paced by a bandwidth budget
   - Graceful degradation on network partition
+  - Bloom-filter digests: peers are only queried for keys they may hold
+  - Merkle anti-entropy: replicas converge by exchanging only differences
   - Feature flag: SWARM_MODE_ENABLED
 """
 
 import asyncio
+import base64
+import json
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Dict, Optional, List, Set
+from typing import Awaitable, Callable, Dict, Iterable, Optional, List, Set, Tuple, Union
 from pathlib import Path
 
 from memory_engine.memory_store import AdaptiveMemoryStore, MemoryEvent
@@ -29,9 +35,17 @@ from astraguard.swarm.models import AgentID, HealthSummary
 from astraguard.swarm.registry import SwarmRegistry
 from astraguard.swarm.bus import SwarmMessageBus
 from astraguard.swarm.compressor import StateCompressor
+from astraguard.swarm.bandwidth_governor import TokenBucket
+from astraguard.swarm.digests import BloomFilter, MerkleDigest, PartitionedBloomFilter
+from astraguard.swarm.observed import ObservedDict
+from astraguard.swarm.types import QoSLevel, SubscriptionID, SwarmMessage
 
 logger = logging.getLogger(__name__)
 
+# Encoded-size model for AnomalyPattern (JSON with full-precision floats)
+_PATTERN_FIXED_BYTES = 170
+_FLOAT_BYTES = 20
+
 
 @dataclass
 class AnomalyPattern:
@@ -66,6 +80,55 @@ class AnomalyPattern:
             recurrence_count=data.get("recurrence_count", 1),
         )
 
+    @property
+    def size_bytes(self) -> int:
+        """Estimated encoded size, computed without serializing."""
+        return _PATTERN_FIXED_BYTES + len(self.pattern_id) + _FLOAT_BYTES * len(self.anomaly_signature)
+
+    @property
+    def version(self) -> str:
+        """Replica version; a later last_seen or higher recurrence_count wins."""
+        return f"{self.last_seen.isoformat(timespec='microseconds')}|{self.recurrence_count}"
+
+
+def _version_order(version: str) -> Tuple[datetime, int]:
+    last_seen, _, count = version.rpartition("|")
+    return datetime.fromisoformat(last_seen), int(count)
+
+
+class _PatternTable(ObservedDict):
+    """key → AnomalyPattern dict in LRU order that reports writes and removals to its owner.
+
+    Iteration runs least recently used first. Writes move a key to the
+    most recently used end; touch() does the same for a read.
+    """
+
+    reorder_on_write = True
+
+    def __init__(self, memory: "SwarmAdaptiveMemory"):
+        super().__init__()
+        self._memory = memory
+
+    def _on_set(self, key: str, pattern: AnomalyPattern, previous: Optional[AnomalyPattern]) -> None:
+        self._memory._on_pattern_set(key, pattern)
+
+    def _on_delete(self, key: str, pattern: AnomalyPattern) -> None:
+        self._memory._on_pattern_removed(key)
+
+    def _on_clear(self, items) -> None:
+        self._memory._on_patterns_cleared()
+
+    def touch(self, key: str) -> None:
+        """Mark a key as most recently used."""
+        dict.__setitem__(self, key, dict.pop(self, key))
+
+
+@dataclass
+class _PendingQuery:
+    """Outstanding peer lookup; resolved by the first hit or once every peer missed."""
+    future: asyncio.Future
+    outstanding: Set[str] = field(default_factory=set)
+
 
 @dataclass
 class PeerCacheInfo:
@@ -77,6 +140,9 @@ class PeerCacheInfo:
     rssi_strength: float = -100.0  # dBm, lower = farther
     replication_success: int = 0
     replication_failure: int = 0
+    bloom: Optional[Union[BloomFilter, PartitionedBloomFilter]] = None  # Latest key digest from this peer
+    digest_root: str = ""  # Merkle root advertised with the digest
+    last_digest: Optional[datetime] = None
 
 
 @dataclass
@@ -93,6 +159,18 @@ class SwarmMemoryMetrics:
     peer_cache_size_bytes: int = 0
     local_cache_size_bytes: int = 0
     bandwidth_evictions: int = 0
+    replication_messages: int = 0
+    replication_dropped: int = 0  # Queued patterns dropped on queue overflow
+    replication_queue_bytes: int = 0
+    peer_queries_sent: int = 0
+    peer_queries_skipped: int = 0  # Peers whose Bloom digest ruled the key out
+    peer_query_hits: int = 0
+    peer_query_hit_rate: float = 0.0
+    digest_bytes_sent: int = 0
+    sync_bytes_sent: int = 0
+    sync_rounds: int = 0
+    patterns_synced: int = 0
+    anti_entropy_send_failures: int = 0  # Digest/sync messages the bus did not accept
 
     def to_dict(self) -> dict:
         """Export metrics for Prometheus."""
@@ -106,6 +184,19 @@ class SwarmMemoryMetrics:
             "eviction_count_local": self.eviction_count_local,
             "eviction_count_peer": self.eviction_count_peer,
             "bandwidth_evictions": self.bandwidth_evictions,
+            "local_cache_size_bytes": self.local_cache_size_bytes,
+            "replication_messages": self.replication_messages,
+            "replication_dropped": self.replication_dropped,
+            "replication_queue_bytes": self.replication_queue_bytes,
+            "peer_queries_sent": self.peer_queries_sent,
+            "peer_queries_skipped": self.peer_queries_skipped,
+            "peer_query_hits": self.peer_query_hits,
+            "peer_query_hit_rate": self.peer_query_hit_rate,
+            "digest_bytes_sent": self.digest_bytes_sent,
+            "sync_bytes_sent": self.sync_bytes_sent,
+            "sync_rounds": self.sync_rounds,
+            "patterns_synced": self.patterns_synced,
+            "anti_entropy_send_failures": self.anti_entropy_send_failures,
         }
 
 
@@ -118,6 +209,26 @@ class SwarmAdaptiveMemory:
     recovered from peers. Bandwidth-aware eviction reduces replication during
     ISL congestion (bus.utilization > 0.7).
 
+    Every DIGEST_INTERVAL_SECONDS each node broadcasts a Bloom filter of its
+    pattern keys plus its Merkle root. Local misses are only sent to peers
+    whose filter may contain the key (peers without a fresh digest are
+    queried as before). The same round runs Merkle anti-entropy with one
+    peer whose root differs: both sides descend the hash tree and exchange
+    only the buckets, then the patterns, that differ. Digest and sync
+    messages stay within MAX_MESSAGE_BYTES: a large Bloom filter is split
+    by key hash into partitions sent one per message, and sync stages pack
+    their entries into as many independent messages as needed.
+
+    The local pattern cache is bounded by max_cache_bytes using each
+    pattern's size estimate. Eviction samples the least recently used
+    entries and skips patterns still waiting to replicate. While the ISL is
+    congested it evicts the least recurrent pattern in the sample instead
+    of the oldest, since a miss then costs scarce bandwidth to refetch.
+    put() queues patterns; a flusher packs them into per-peer batches of
+    up to REPLICATION_BATCH_BYTES, paced by a token bucket. On queue
+    overflow the oldest entries are dropped, and Merkle anti-entropy
+    repairs them later.
+
     Attributes:
         local_cache: AdaptiveMemoryStore instance (authoritative)
         registry: SwarmRegistry for peer discovery
@@ -134,9 +245,24 @@ class SwarmAdaptiveMemory:
     CACHE_ACK_TOPIC = "memory/ack"
     CACHE_QUERY_TOPIC = "memory/query"
     CACHE_RESPONSE_TOPIC = "memory/response"
+    DIGEST_TOPIC = "memory/digest"
+    MERKLE_SYNC_TOPIC = "memory/sync"
     MEMORY_REPLICATION_QOS = 1  # ACK level
+    MAX_MESSAGE_BYTES = 10_240  # Bus payload limit (10KB ISL frame)
     BANDWIDTH_EVICTION_THRESHOLD = 0.7  # bus.utilization > 70%
     EVICTION_PERCENTAGE = 0.2  # Evict oldest 20% when congested
+    QUERY_TIMEOUT_SECONDS = 2.0
+    DIGEST_INTERVAL_SECONDS = 30.0
+    DIGEST_TTL_SECONDS = 90.0  # Older digests are ignored for query routing
+    BLOOM_FALSE_POSITIVE_RATE = 0.01
+    BLOOM_MIN_CAPACITY = 256
+    MAX_CACHE_BYTES = 8 * 1024 * 1024  # Local pattern cache budget
+    EVICTION_SAMPLE = 8  # LRU-tail candidates considered per eviction
+    EVICTION_SCAN = 64  # Bound on entries walked to fill the sample
+    REPLICATION_FLUSH_INTERVAL_SECONDS = 0.5
+    REPLICATION_BATCH_BYTES = 4_000  # Pattern bytes per replication message
+    REPLICATION_BYTES_PER_SECOND = 8_000  # Below the 10KB/s ISL ceiling
+    MAX_REPLICATION_QUEUE_BYTES = 256 * 1024
 
     def __init__(
         self,
@@ -154,7 +280,9 @@ class SwarmAdaptiveMemory:
             registry: SwarmRegistry for peer discovery
             bus: SwarmMessageBus for peer communication
             compressor: StateCompressor for compression
-            config: Optional configuration dict {peer_cache_size: int}
+            config: Optional configuration dict {peer_cache_size: int,
+                digest_interval: float seconds, max_cache_bytes: int,
+                replication_bytes_per_second: float}
         """
         self.local_cache = AdaptiveMemoryStore(decay_lambda=0.1, max_capacity=10000)
         self.registry = registry
@@ -168,6 +296,10 @@ class SwarmAdaptiveMemory:
 
         # Configuration
         self.peer_cache_size = config.get("peer_cache_size", self.PEER_CACHE_SIZE) if config else self.PEER_CACHE_SIZE
+        config = config or {}
+        self.digest_interval = config.get("digest_interval", self.DIGEST_INTERVAL_SECONDS)
+        self.max_cache_bytes = config.get("max_cache_bytes", self.MAX_CACHE_BYTES)
+        replication_rate = config.get("replication_bytes_per_second", self.REPLICATION_BYTES_PER_SECOND)
 
         # Peer tracking
         self.peer_caches: Dict[AgentID, PeerCacheInfo] = {}
@@ -177,10 +309,35 @@ class SwarmAdaptiveMemory:
 
         # Task management
         self._running = False
-        self._replication_task: Optional[asyncio.Task] = None
+        self._replication_task: Optional[asyncio.Task] = None  # Queue flusher
+        self._anti_entropy_task: Optional[asyncio.Task] = None  # Digests + Merkle sync
+
+        # Local cache tracking (in-memory for fast lookups); size accounting
+        # and the Merkle digest follow every write
+        self._digest = MerkleDigest()
+        self._pattern_sizes: Dict[str, int] = {}
+        self._cache_bytes = 0
+        self._congested = False  # Last _is_congested() result
+        self._local_pattern_cache: Dict[str, AnomalyPattern] = _PatternTable(self)
+        # Budget-evicted key → version; still in the digest so sync does not resend it
+        self._evicted: Dict[str, str] = {}
+
+        # Replication queue: key → size, oldest first
+        self._replication_queue: Dict[str, int] = {}
+        self._replication_queue_bytes = 0
+        self._replication_budget = TokenBucket(
+            rate=replication_rate,
+            burst=max(replication_rate, self.REPLICATION_BATCH_BYTES * self.peer_cache_size),
+        )
+        self._flush_wakeup = asyncio.Event()
+
+        # Peer lookups awaiting CACHE_RESPONSE, by pattern key
+        self._pending_queries: Dict[str, _PendingQuery] = {}
+        self._sync_cursor = 0  # Round-robin position over divergent peers
 
-        # Local cache tracking (in-memory for fast lookups)
-        self._local_pattern_cache: Dict[str, AnomalyPattern] = {}
+        # Bus subscriptions; topic → handler taking the decoded JSON message
+        self._subscriptions: List[SubscriptionID] = []
+        self._topic_handlers: Dict[str, Callable[[dict], Awaitable[None]]] = {}
 
     async def start(self) -> None:
         """Start background replication and cache sync."""
@@ -188,23 +345,36 @@ class SwarmAdaptiveMemory:
         logger.info("Starting SwarmAdaptiveMemory")
 
         # Subscribe to peer queries and replication messages
-        await self.bus.subscribe(
-            self.CACHE_QUERY_TOPIC,
-            self._handle_cache_query,
-            qos=self.MEMORY_REPLICATION_QOS,
-        )
-        await self.bus.subscribe(
-            self.CACHE_REPLICATE_TOPIC,
-            self._handle_replication,
-            qos=self.MEMORY_REPLICATION_QOS,
-        )
+        self._topic_handlers = {
+            self.CACHE_QUERY_TOPIC: self._handle_cache_query,
+            self.CACHE_RESPONSE_TOPIC: self._handle_cache_response,
+            self.CACHE_REPLICATE_TOPIC: self._handle_replication,
+            self.DIGEST_TOPIC: self._handle_digest,
+            self.MERKLE_SYNC_TOPIC: self._handle_merkle_sync,
+        }
+        self._subscriptions = [
+            self.bus.subscribe(topic, self._on_bus_message) for topic in self._topic_handlers
+        ]
+
+        self._replication_task = asyncio.create_task(self._replication_loop())
+        self._anti_entropy_task = asyncio.create_task(self._anti_entropy_loop())
 
     async def stop(self) -> None:
         """Stop replication and save local cache."""
         self._running = False
+        for subscription in self._subscriptions:
+            self.bus.unsubscribe(subscription)
+        self._subscriptions = []
         self.local_cache.save()
-        if self._replication_task:
-            self._replication_task.cancel()
+        tasks = [task for task in (self._replication_task, self._anti_entropy_task) if task]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._replication_task = self._anti_entropy_task = None
+        for pending in self._pending_queries.values():
+            if not pending.future.done():
+                pending.future.set_result(None)
+        self._pending_queries.clear()
         logger.info("SwarmAdaptiveMemory stopped")
 
     async def get(self, key: str) -> Optional[AnomalyPattern]:
@@ -213,7 +383,8 @@ class SwarmAdaptiveMemory:
 
         Algorithm:
         1. Check local cache (100% hit expected if present)
-        2. On miss, query 3 nearest peers in parallel
+        2. On miss, query up to 3 nearest peers whose Bloom digest may
+           hold the key (or that have not sent a digest yet) in parallel
         3. Return first peer response received
         4. On peer miss, return None (fall back to recompute)
 
@@ -226,6 +397,7 @@ class SwarmAdaptiveMemory:
         # Local cache check (authoritative)
         if key in self._local_pattern_cache:
             pattern = self._local_pattern_cache[key]
+            self._local_pattern_cache.touch(key)
             self.metrics.cache_hits += 1
             logger.debug(f"Local cache hit for {key}")
             return pattern
@@ -246,8 +418,9 @@ class SwarmAdaptiveMemory:
         Store anomaly pattern locally and replicate to peers.
 
         Algorithm:
-        1. Store in local cache (synchronous, authoritative)
-        2. Async replicate to 3 nearest peers (fire-and-forget)
+        1. Store in local cache (synchronous, authoritative; may evict
+           to stay within max_cache_bytes)
+        2. Queue for batched replication to 3 nearest peers
         3. Track replication success for metrics
 
         Args:
@@ -258,20 +431,130 @@ class SwarmAdaptiveMemory:
         self._local_pattern_cache[key] = pattern
         logger.debug(f"Stored pattern locally: {key}")
 
-        # Async replicate to peers (non-blocking)
+        # Queue for replication (non-blocking)
         if self._running:
-            asyncio.create_task(self._replicate_to_peers(key, pattern))
+            self._enqueue_replication(key, pattern.size_bytes)
 
     # Private methods
 
     def _estimate_pattern_size(self, pattern: AnomalyPattern) -> int:
         """Estimate pattern size in bytes for bandwidth tracking."""
-        import json
-        return len(json.dumps(pattern.to_dict()).encode())
+        return pattern.size_bytes
+
+    # Local cache accounting and eviction
+
+    def _on_pattern_set(self, key: str, pattern: AnomalyPattern) -> None:
+        size = pattern.size_bytes
+        self._cache_bytes += size - self._pattern_sizes.get(key, 0)
+        self._pattern_sizes[key] = size
+        self._evicted.pop(key, None)
+        self._digest.set(key, pattern.version)
+        self._evict_to_budget(protect=key)
+        self.metrics.local_cache_size_bytes = self._cache_bytes
+
+    def _on_pattern_removed(self, key: str) -> None:
+        self._cache_bytes -= self._pattern_sizes.pop(key)
+        self._digest.discard(key)
+        self.metrics.local_cache_size_bytes = self._cache_bytes
+
+    def _on_patterns_cleared(self) -> None:
+        self._pattern_sizes.clear()
+        self._cache_bytes = 0
+        self._evicted.clear()
+        self._digest.clear()
+        self.metrics.local_cache_size_bytes = 0
+
+    def _evict_to_budget(self, protect: str) -> None:
+        """
+        Evict until the cache fits max_cache_bytes, never evicting `protect`.
+
+        Evicted keys stay in the Merkle digest at their version, so a node
+        whose budget is below the replicated set still converges with its
+        peers instead of having the same patterns resent every round.
+        """
+        while self._cache_bytes > self.max_cache_bytes and len(self._local_pattern_cache) > 1:
+            victim = self._eviction_victim(protect)
+            version = self._local_pattern_cache[victim].version
+            del self._local_pattern_cache[victim]
+            self._evicted[victim] = version
+            self._digest.set(victim, version)
+            self.metrics.eviction_count_local += 1
+
+    def _forget_evicted(self, keys: Iterable[str]) -> None:
+        """Stop advertising evicted keys a peer needs but we can no longer send."""
+        for key in keys:
+            if self._evicted.pop(key, None) is not None:
+                self._digest.discard(key)
+
+    def _eviction_victim(self, protect: str) -> str:
+        """
+        Pick the pattern to evict from the least recently used end.
+
+        Patterns waiting to replicate exist nowhere else, so they are only
+        evicted if the scanned window holds nothing else. Under congestion
+        the least recurrent sampled pattern goes first (oldest on ties);
+        otherwise plain LRU.
+        """
+        sample, fallback = [], None
+        for scanned, key in enumerate(self._local_pattern_cache):
+            if scanned == self.EVICTION_SCAN or len(sample) == self.EVICTION_SAMPLE:
+                break
+            if key == protect:
+                continue
+            if fallback is None:
+                fallback = key
+            if key not in self._replication_queue:
+                sample.append(key)
+        if not sample:
+            return fallback
+        if not self._congested:
+            return sample[0]
+        return min(sample, key=lambda key: self._local_pattern_cache[key].recurrence_count)
+
+    @staticmethod
+    def _payload_size(payload: dict) -> int:
+        """Encoded size of a message payload in bytes."""
+        return len(json.dumps(payload).encode())
+
+    @property
+    def _serial(self) -> str:
+        return self.registry.config.agent_id.satellite_serial
+
+    def _peer_id(self, serial: str) -> AgentID:
+        return AgentID.create(self.registry.config.agent_id.constellation, serial)
+
+    def _query_candidates(self, key: str) -> List[AgentID]:
+        """
+        Peers worth querying for a key, nearest first.
+
+        A peer with a fresh Bloom digest is skipped when the filter rules
+        the key out (no false negatives, so it cannot hold it). Peers
+        without a fresh digest are unknown and stay eligible.
+
+        Args:
+            key: Pattern key
+
+        Returns:
+            Up to peer_cache_size AgentIDs
+        """
+        fresh_after = datetime.utcnow() - timedelta(seconds=self.DIGEST_TTL_SECONDS)
+        candidates = []
+        for peer in self._peers_by_strength():
+            info = self.peer_caches.get(peer)
+            if info and info.bloom is not None and info.last_digest >= fresh_after:
+                if key not in info.bloom:
+                    self.metrics.peer_queries_skipped += 1
+                    continue
+            candidates.append(peer)
+            if len(candidates) == self.peer_cache_size:
+                break
+        return candidates
 
     async def _fetch_from_peers(self, key: str) -> Optional[AnomalyPattern]:
         """
-        Query 3 nearest peers for pattern in parallel.
+        Query candidate peers for pattern in parallel.
+
+        Concurrent lookups of the same key share one set of queries.
 
         Args:
             key: Pattern key to query
@@ -279,66 +562,131 @@ class SwarmAdaptiveMemory:
         Returns:
             AnomalyPattern from first peer response, None if all miss
         """
-        nearest_peers = self._get_nearest_peers()
-        if not nearest_peers:
-            return None
-
-        # Create query tasks for all nearest peers
-        query_tasks = [
-            self._query_peer(peer, key)
-            for peer in nearest_peers
-        ]
+        pending = self._pending_queries.get(key)
+        if pending is None:
+            candidates = self._query_candidates(key)
+            if not candidates:
+                return None
+            pending = _PendingQuery(asyncio.get_running_loop().create_future())
+            self._pending_queries[key] = pending
+            for peer in candidates:
+                pending.outstanding.add(peer.satellite_serial)
+                if not await self._query_peer(peer, key):
+                    pending.outstanding.discard(peer.satellite_serial)
+            if not pending.outstanding and not pending.future.done():
+                del self._pending_queries[key]
+                return None
 
         try:
             # Wait for first successful response (timeout 2s)
-            pattern = await asyncio.wait_for(
-                asyncio.gather(*query_tasks, return_exceptions=True),
-                timeout=2.0
+            return await asyncio.wait_for(
+                asyncio.shield(pending.future), timeout=self.QUERY_TIMEOUT_SECONDS
             )
-
-            # Find first non-None response
-            for response in pattern:
-                if response and not isinstance(response, Exception):
-                    return response
-
         except asyncio.TimeoutError:
             logger.debug(f"Peer query timeout for {key}")
+            return None
+        finally:
+            if self._pending_queries.get(key) is pending:
+                del self._pending_queries[key]
 
-        return None
-
-    async def _query_peer(self, peer_id: AgentID, key: str) -> Optional[AnomalyPattern]:
+    async def _query_peer(self, peer_id: AgentID, key: str) -> bool:
         """
-        Query a single peer for pattern.
+        Send a pattern query to a single peer.
+
+        The answer arrives on CACHE_RESPONSE_TOPIC and resolves the pending
+        lookup in _handle_cache_response.
 
         Args:
             peer_id: Peer agent ID
             key: Pattern key
 
         Returns:
-            AnomalyPattern if found, None otherwise
+            True if the query was sent
         """
         try:
-            # Send query message
-            await self.bus.publish(
+            if not await self.bus.publish(
                 self.CACHE_QUERY_TOPIC,
                 {
-                    "requester": self.registry.config.agent_id.satellite_serial,
+                    "requester": self._serial,
                     "pattern_key": key,
                 },
                 qos=self.MEMORY_REPLICATION_QOS,
-            )
-
-            # In real implementation, would wait for CACHE_RESPONSE_TOPIC message
-            # For now, return None (would need message handler)
-            return None
+                receiver=peer_id,
+            ):
+                return False
+            self.metrics.peer_queries_sent += 1
+            return True
 
         except Exception as e:
             logger.error(f"Error querying peer {peer_id.satellite_serial}: {e}")
-            return None
+            return False
+
+    def _enqueue_replication(self, key: str, size: int) -> None:
+        """Queue a key for batched replication; a re-put moves it to the back."""
+        self._replication_queue_bytes += size - self._replication_queue.pop(key, 0)
+        self._replication_queue[key] = size
+        while self._replication_queue_bytes > self.MAX_REPLICATION_QUEUE_BYTES:
+            oldest = next(iter(self._replication_queue))
+            self._replication_queue_bytes -= self._replication_queue.pop(oldest)
+            self.metrics.replication_dropped += 1
+        self.metrics.replication_queue_bytes = self._replication_queue_bytes
+        if self._replication_queue_bytes >= self.REPLICATION_BATCH_BYTES:
+            self._flush_wakeup.set()
+
+    async def _replication_loop(self) -> None:
+        """Flush the replication queue every interval, or early once a batch is full."""
+        while self._running:
+            try:
+                await asyncio.wait_for(
+                    self._flush_wakeup.wait(), timeout=self.REPLICATION_FLUSH_INTERVAL_SECONDS
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._flush_wakeup.clear()
+            try:
+                await self._flush_replication_queue()
+            except Exception as e:
+                logger.error(f"Replication flush failed: {e}")
+
+    async def _flush_replication_queue(self) -> None:
+        """
+        Send queued patterns to the nearest peers in batches.
+
+        Each batch carries up to REPLICATION_BATCH_BYTES of patterns and
+        costs its size once per peer from the replication token bucket;
+        whatever the budget does not cover stays queued.
+        """
+        self._congested = await self._is_congested()
+        if self._congested or not self._replication_queue:
+            return
+        nearest_peers = self._get_nearest_peers()
+        if not nearest_peers:
+            return
+
+        while self._replication_queue:
+            taken: List[str] = []
+            batch_bytes = 0
+            for key, size in self._replication_queue.items():
+                if taken and batch_bytes + size > self.REPLICATION_BATCH_BYTES:
+                    break
+                taken.append(key)
+                batch_bytes += size
+            cost = min(batch_bytes * len(nearest_peers), self._replication_budget.burst)
+            if not self._replication_budget.acquire(cost):
+                break
+            for key in taken:
+                self._replication_queue_bytes -= self._replication_queue.pop(key)
+            batch = {  # Keys evicted since queueing are skipped
+                key: self._local_pattern_cache[key]
+                for key in taken if key in self._local_pattern_cache
+            }
+            self.metrics.replication_queue_bytes = self._replication_queue_bytes
+            if batch:
+                await self._send_batch(nearest_peers, batch)
 
     async def _replicate_to_peers(self, key: str, pattern: AnomalyPattern) -> None:
         """
-        Replicate pattern to 3 nearest peers asynchronously.
+        Replicate one pattern to 3 nearest peers immediately, bypassing the queue.
 
         Args:
             key: Pattern key
@@ -348,27 +696,41 @@ class SwarmAdaptiveMemory:
         if not nearest_peers:
             return
 
-        pattern_size = self._estimate_pattern_size(pattern)
-
         # Check bandwidth before replicating
         if await self._is_congested():
             logger.debug(f"Skipping replication for {key} due to congestion")
             return
 
-        for peer_id in nearest_peers:
+        await self._send_batch(nearest_peers, {key: pattern})
+
+    async def _send_batch(self, peers: List[AgentID], patterns: Dict[str, AnomalyPattern]) -> None:
+        """
+        Send one replication message carrying `patterns` to each peer.
+
+        Args:
+            peers: Target peers
+            patterns: Pattern key → AnomalyPattern
+        """
+        payload = {
+            "source": self._serial,
+            "patterns": {key: pattern.to_dict() for key, pattern in patterns.items()},
+        }
+        batch_size = sum(pattern.size_bytes for pattern in patterns.values())
+
+        for peer_id in peers:
             try:
-                # Publish replication message
-                await self.bus.publish(
+                if not await self.bus.publish(
                     self.CACHE_REPLICATE_TOPIC,
-                    {
-                        "source": self.registry.config.agent_id.satellite_serial,
-                        "pattern_key": key,
-                        "pattern": pattern.to_dict(),
-                    },
+                    payload,
                     qos=self.MEMORY_REPLICATION_QOS,
-                )
-
-                self.metrics.replication_count += 1
+                    receiver=peer_id,
+                ):
+                    logger.warning(f"Replication to {peer_id.satellite_serial} not sent")
+                    self.metrics.replication_failures += len(patterns)
+                    continue
+
+                self.metrics.replication_messages += 1
+                self.metrics.replication_count += len(patterns)
                 self.metrics.replication_success_rate = (
                     self.metrics.replication_count
                     / max(1, self.metrics.replication_count + self.metrics.replication_failures)
@@ -378,14 +740,15 @@ class SwarmAdaptiveMemory:
                 if peer_id not in self.peer_caches:
                     self.peer_caches[peer_id] = PeerCacheInfo(agent_id=peer_id)
 
-                self.peer_caches[peer_id].pattern_ids.add(key)
-                self.peer_caches[peer_id].cache_size_bytes += pattern_size
+                self.peer_caches[peer_id].pattern_ids.update(patterns)
+                self.peer_caches[peer_id].cache_size_bytes += batch_size
                 self.peer_caches[peer_id].replication_success += 1
                 self.peer_caches[peer_id].last_sync = datetime.utcnow()
+                self._note_sent(self.peer_caches[peer_id], patterns)
 
             except Exception as e:
                 logger.error(f"Replication to {peer_id.satellite_serial} failed: {e}")
-                self.metrics.replication_failures += 1
+                self.metrics.replication_failures += len(patterns)
 
     def _get_nearest_peers(self) -> List[AgentID]:
         """
@@ -399,7 +762,12 @@ class SwarmAdaptiveMemory:
         Returns:
             List of up to peer_cache_size nearest AgentIDs
         """
-        alive_peers = self.registry.get_alive_peers()
+        return self._peers_by_strength()[:self.peer_cache_size]
+
+    def _peers_by_strength(self) -> List[AgentID]:
+        """Alive peers other than this agent, strongest RSSI (nearest) first."""
+        own_id = self.registry.config.agent_id
+        alive_peers = [peer for peer in self.registry.get_alive_peers() if peer != own_id]
         if not alive_peers:
             return []
 
@@ -412,9 +780,7 @@ class SwarmAdaptiveMemory:
 
         # Sort by RSSI descending (stronger = nearer)
         peers_with_strength.sort(key=lambda x: x[1], reverse=True)
-
-        # Return top peer_cache_size
-        return [peer for peer, _ in peers_with_strength[:self.peer_cache_size]]
+        return [peer for peer, _ in peers_with_strength]
 
     async def _is_congested(self) -> bool:
         """
@@ -464,64 +830,404 @@ class SwarmAdaptiveMemory:
         self.metrics.bandwidth_evictions += evicted
         logger.info(f"Evicted {evicted} peer patterns due to bandwidth congestion")
 
+    async def _on_bus_message(self, message: SwarmMessage) -> None:
+        """Acknowledge a peer's memory message and pass its JSON body to the topic handler."""
+        if message.sender.satellite_serial == self._serial:
+            return
+        if message.qos >= QoSLevel.ACK:
+            await self.bus.acknowledge(message)
+        handler = self._topic_handlers.get(message.topic)
+        if handler is None:
+            return
+        try:
+            decoded = json.loads(bytes(message.payload))
+        except ValueError as e:
+            logger.warning(f"Malformed {message.topic} message from {message.sender.satellite_serial}: {e}")
+            return
+        if not isinstance(decoded, dict):
+            logger.warning(f"Malformed {message.topic} message from {message.sender.satellite_serial}")
+            return
+        await handler(decoded)
+
     async def _handle_cache_query(self, message: dict) -> None:
         """
         Handle incoming cache query from peer.
 
+        Misses are answered too, so the requester can stop waiting once
+        every queried peer has replied.
+
         Args:
             message: Query message with {requester, pattern_key}
         """
         try:
             pattern_key = message.get("pattern_key")
             requester = message.get("requester")
+            if not requester or requester == self._serial:
+                return
 
             # Look up in local cache
             pattern = self._local_pattern_cache.get(pattern_key)
 
-            if pattern:
-                # Send response back to requester
-                await self.bus.publish(
-                    self.CACHE_RESPONSE_TOPIC,
-                    {
-                        "responder": self.registry.config.agent_id.satellite_serial,
-                        "requester": requester,
-                        "pattern_key": pattern_key,
-                        "pattern": pattern.to_dict(),
-                    },
-                    qos=self.MEMORY_REPLICATION_QOS,
-                )
+            # Send response back to requester
+            await self.bus.publish(
+                self.CACHE_RESPONSE_TOPIC,
+                {
+                    "responder": self._serial,
+                    "requester": requester,
+                    "pattern_key": pattern_key,
+                    "pattern": pattern.to_dict() if pattern else None,
+                },
+                qos=self.MEMORY_REPLICATION_QOS,
+                receiver=self._peer_id(requester),
+            )
 
         except Exception as e:
             logger.error(f"Error handling cache query: {e}")
 
-    async def _handle_replication(self, message: dict) -> None:
+    async def _handle_cache_response(self, message: dict) -> None:
         """
-        Handle incoming pattern replication from peer.
+        Resolve a pending peer lookup.
 
         Args:
-            message: Replication message with {source, pattern_key, pattern}
+            message: Response message with {responder, requester, pattern_key, pattern}
         """
         try:
-            source = message.get("source")
-            pattern_key = message.get("pattern_key")
+            if message.get("requester") != self._serial:
+                return
             pattern_data = message.get("pattern")
+            if pattern_data:
+                self.metrics.peer_query_hits += 1
 
+            pending = self._pending_queries.get(message.get("pattern_key"))
+            if pending is None or pending.future.done():
+                return
+            pending.outstanding.discard(message.get("responder"))
             if pattern_data:
-                # Deserialize and cache pattern
-                pattern = AnomalyPattern.from_dict(pattern_data)
-                self._local_pattern_cache[pattern_key] = pattern
+                pending.future.set_result(AnomalyPattern.from_dict(pattern_data))
+            elif not pending.outstanding:
+                pending.future.set_result(None)
 
-                logger.debug(f"Cached pattern from peer {source}: {pattern_key}")
+        except Exception as e:
+            logger.error(f"Error handling cache response: {e}")
+
+    async def _handle_replication(self, message: dict) -> None:
+        """
+        Handle incoming pattern replication from peer.
+
+        Args:
+            message: Replication message with {source, patterns: {key: pattern}}
+                or a single {source, pattern_key, pattern}
+        """
+        try:
+            source = message.get("source")
+            patterns = dict(message.get("patterns") or {})
+            if message.get("pattern"):
+                patterns[message.get("pattern_key")] = message["pattern"]
+
+            for pattern_key, pattern_data in patterns.items():
+                # Deserialize and cache pattern unless ours is newer
+                if self._merge_pattern(pattern_key, pattern_data):
+                    logger.debug(f"Cached pattern from peer {source}: {pattern_key}")
 
         except Exception as e:
             logger.error(f"Error handling replication: {e}")
 
+    def _merge_pattern(self, key: str, pattern_data: dict) -> bool:
+        """
+        Store a peer's copy of a pattern if it is newer than the local one,
+        or than the version we evicted.
+
+        Returns:
+            True if the local cache changed
+        """
+        pattern = AnomalyPattern.from_dict(pattern_data)
+        current = self._local_pattern_cache.get(key)
+        known = current.version if current is not None else self._evicted.get(key)
+        if known is not None and _version_order(known) >= _version_order(pattern.version):
+            return False
+        self._local_pattern_cache[key] = pattern
+        return True
+
+    # Digests and anti-entropy
+
+    async def _anti_entropy_loop(self) -> None:
+        """Broadcast a digest and sync with one divergent peer every interval."""
+        while self._running:
+            try:
+                await self._anti_entropy_round()
+            except Exception as e:
+                logger.error(f"Anti-entropy round failed: {e}")
+            await asyncio.sleep(self.digest_interval)
+
+    async def _anti_entropy_round(self) -> None:
+        """One digest broadcast plus at most one Merkle sync."""
+        if await self._is_congested():
+            return
+        await self._broadcast_digest()
+        peer_id = self._next_sync_peer()
+        if peer_id is not None:
+            self.metrics.sync_rounds += 1
+            await self._send_sync(
+                peer_id, {"stage": "branches", "hashes": self._digest.children(0)}
+            )
+
+    async def _broadcast_digest(self) -> None:
+        """
+        Broadcast a Bloom filter of local keys and the Merkle root.
+
+        A filter too large for one message is split into partitions by key
+        hash, one per message, each repeating the root. Every partition is
+        usable on its own, so a lost message only leaves that partition
+        stale at the receiver.
+        """
+        capacity = max(self.BLOOM_MIN_CAPACITY, len(self._local_pattern_cache))
+        header = {
+            "source": self._serial,
+            "root": self._digest.root(),
+            "count": len(self._local_pattern_cache),
+            "part": capacity,  # Placeholders at least as wide as the real values
+            "parts": capacity,
+            "bloom": "",
+        }
+        # Base64 turns 3 bytes into 4; keep slack for partition rounding
+        part_bytes = (self.MAX_MESSAGE_BYTES - self._payload_size(header)) // 4 * 3 - 64
+        parts = -(-BloomFilter.for_capacity(capacity, self.BLOOM_FALSE_POSITIVE_RATE).size_bytes // part_bytes)
+        bloom = PartitionedBloomFilter.for_capacity(capacity, self.BLOOM_FALSE_POSITIVE_RATE, parts)
+        for key in self._local_pattern_cache:
+            bloom.add(key)
+        for part, partition in enumerate(bloom.partitions):
+            payload = {
+                **header,
+                "part": part,
+                "parts": parts,
+                "bloom": base64.b64encode(partition.to_bytes()).decode("ascii"),
+            }
+            if not await self.bus.publish(self.DIGEST_TOPIC, payload, qos=self.MEMORY_REPLICATION_QOS):
+                logger.warning(f"Digest part {part + 1}/{parts} not sent")
+                self.metrics.anti_entropy_send_failures += 1
+                continue
+            self.metrics.digest_bytes_sent += self._payload_size(payload)
+
+    def _next_sync_peer(self) -> Optional[AgentID]:
+        """Round-robin over alive peers whose advertised Merkle root differs from ours."""
+        root = self._digest.root()
+        divergent = [
+            peer for peer in self._peers_by_strength()
+            if peer in self.peer_caches
+            and self.peer_caches[peer].digest_root
+            and self.peer_caches[peer].digest_root != root
+        ]
+        if not divergent:
+            return None
+        peer_id = divergent[self._sync_cursor % len(divergent)]
+        self._sync_cursor += 1
+        return peer_id
+
+    async def _handle_digest(self, message: dict) -> None:
+        """
+        Record a peer's Merkle root and its Bloom filter, or one partition of it.
+
+        Partitions of a split filter replace their predecessors one by one;
+        partitions not received since the split count as unknown.
+
+        Args:
+            message: Digest message with {source, bloom, root, count} and,
+                when partitioned, {part, parts}
+        """
+        try:
+            source = message.get("source")
+            if not source or source == self._serial:
+                return
+            peer_id = self._peer_id(source)
+            info = self.peer_caches.setdefault(peer_id, PeerCacheInfo(agent_id=peer_id))
+            bloom = BloomFilter.from_bytes(base64.b64decode(message["bloom"]))
+            parts = int(message.get("parts", 1))
+            if parts == 1:
+                info.bloom = bloom
+            else:
+                if not (
+                    isinstance(info.bloom, PartitionedBloomFilter)
+                    and len(info.bloom.partitions) == parts
+                ):
+                    info.bloom = PartitionedBloomFilter([None] * parts)
+                info.bloom.partitions[int(message["part"])] = bloom
+            info.digest_root = message.get("root", "")
+            info.last_digest = datetime.utcnow()
+
+        except Exception as e:
+            logger.error(f"Error handling digest: {e}")
+
+    async def _send_sync(
+        self, peer_id: AgentID, payload: dict, field: Optional[str] = None
+    ) -> List[dict]:
+        """
+        Unicast one Merkle sync stage, tagged with our source and root.
+
+        Args:
+            peer_id: Peer in the exchange
+            payload: Stage fields
+            field: Entry field (dict or list) to split across messages of at
+                most MAX_MESSAGE_BYTES; each message is handled on its own
+
+        Returns:
+            The messages the bus accepted
+        """
+        payload = {"source": self._serial, "root": self._digest.root(), **payload}
+        messages = self._chunked(payload, field) if field else [payload]
+        sent = []
+        for message in messages:
+            if not await self.bus.publish(
+                self.MERKLE_SYNC_TOPIC, message, qos=self.MEMORY_REPLICATION_QOS, receiver=peer_id
+            ):
+                logger.warning(f"Merkle sync {message.get('stage')} to {peer_id.satellite_serial} not sent")
+                self.metrics.anti_entropy_send_failures += 1
+                continue
+            self.metrics.sync_bytes_sent += self._payload_size(message)
+            sent.append(message)
+        return sent
+
+    def _chunked(self, payload: dict, field: str) -> List[dict]:
+        """
+        Split payload[field] (a dict or list) across copies of payload.
+
+        Entry sizes include their JSON separators, so each copy's encoding
+        is at most MAX_MESSAGE_BYTES. An entry too large to fit on its own
+        is dropped with a warning.
+        """
+        entries = payload[field]
+        is_dict = isinstance(entries, dict)
+        base = self._payload_size({**payload, field: {} if is_dict else []})
+        chunks: List[list] = []
+        chunk: list = []
+        size = base
+        for item in entries.items() if is_dict else entries:
+            entry = len(json.dumps(item[1] if is_dict else item).encode()) + 2  # ", "
+            if is_dict:
+                entry += len(json.dumps(item[0]).encode()) + 2  # ": "
+            if base + entry > self.MAX_MESSAGE_BYTES:
+                logger.warning(f"Dropping oversized {field} entry from Merkle sync")
+                continue
+            if chunk and size + entry > self.MAX_MESSAGE_BYTES:
+                chunks.append(chunk)
+                chunk, size = [], base
+            chunk.append(item)
+            size += entry
+        if chunk:
+            chunks.append(chunk)
+        return [{**payload, field: dict(chunk) if is_dict else chunk} for chunk in chunks]
+
+    async def _handle_merkle_sync(self, message: dict) -> None:
+        """
+        Advance a Merkle sync exchange by one stage.
+
+        Stages (initiator → responder alternate):
+        1. branches: initiator's 16 branch hashes
+        2. leaves: responder's leaf hashes under branches that differ
+        3. keys: initiator's key → version entries in leaves that differ
+        4. patterns + want: responder's newer patterns, and keys it needs
+        5. patterns: initiator's copies of the wanted keys
+
+        Args:
+            message: Sync message with {source, root, stage, ...}
+        """
+        try:
+            source = message.get("source")
+            if not source or source == self._serial:
+                return
+            peer_id = self._peer_id(source)
+            info = self.peer_caches.setdefault(peer_id, PeerCacheInfo(agent_id=peer_id))
+            info.digest_root = message.get("root", info.digest_root)
+            stage = message.get("stage")
+
+            if stage == "branches":
+                ours = self._digest.children(0)
+                leaves = {
+                    str(branch): self._digest.children(1, branch)
+                    for branch, digest in enumerate(message["hashes"])
+                    if digest != ours[branch]
+                }
+                if leaves:
+                    await self._send_sync(peer_id, {"stage": "leaves", "leaves": leaves}, "leaves")
+
+            elif stage == "leaves":
+                buckets = {}
+                for branch, theirs in message["leaves"].items():
+                    branch = int(branch)
+                    ours = self._digest.children(1, branch)
+                    for offset, digest in enumerate(theirs):
+                        if digest != ours[offset]:
+                            leaf = branch * MerkleDigest.FANOUT + offset
+                            buckets[str(leaf)] = self._digest.bucket_versions(leaf)
+                if buckets:
+                    await self._send_sync(peer_id, {"stage": "keys", "buckets": buckets}, "buckets")
+
+            elif stage == "keys":
+                patterns, want, unsendable = {}, [], []
+                for leaf, theirs in message["buckets"].items():
+                    ours = self._digest.bucket_versions(int(leaf))
+                    for key in ours.keys() | theirs.keys():
+                        if key not in theirs or (
+                            key in ours and _version_order(ours[key]) > _version_order(theirs[key])
+                        ):
+                            if key in self._evicted:
+                                unsendable.append(key)
+                            else:
+                                patterns[key] = self._local_pattern_cache[key].to_dict()
+                        elif key not in ours or ours[key] != theirs[key]:
+                            want.append(key)
+                self._forget_evicted(unsendable)
+                # Every stage-4 message carries "want", so each one is answered
+                sent = []
+                if patterns:
+                    sent += await self._send_sync(
+                        peer_id, {"stage": "patterns", "patterns": patterns, "want": []}, "patterns"
+                    )
+                if want:
+                    await self._send_sync(
+                        peer_id, {"stage": "patterns", "patterns": {}, "want": want}, "want"
+                    )
+                for message in sent:
+                    self._note_sent(info, message["patterns"])
+
+            elif stage == "patterns":
+                for key, pattern_data in message.get("patterns", {}).items():
+                    if self._merge_pattern(key, pattern_data):
+                        self.metrics.patterns_synced += 1
+                if "want" in message:
+                    wanted = {
+                        key: self._local_pattern_cache[key].to_dict()
+                        for key in message["want"]
+                        if key in self._local_pattern_cache
+                    }
+                    self._forget_evicted(message["want"])
+                    if wanted:
+                        for sent in await self._send_sync(
+                            peer_id, {"stage": "patterns", "patterns": wanted}, "patterns"
+                        ):
+                            self._note_sent(info, sent["patterns"])
+                    # Both sides end the exchange holding the merged set
+                    info.digest_root = self._digest.root()
+
+        except Exception as e:
+            logger.error(f"Error handling Merkle sync: {e}")
+
+    @staticmethod
+    def _note_sent(info: PeerCacheInfo, keys: Iterable[str]) -> None:
+        """Keep our copy of a peer's Bloom digest current with patterns we sent it."""
+        if info.bloom is not None:
+            for key in keys:
+                info.bloom.add(key)
+
     def get_metrics(self) -> SwarmMemoryMetrics:
         """Export current metrics."""
         # Update hit rate
         total_accesses = self.metrics.cache_hits + self.metrics.cache_misses
         if total_accesses > 0:
             self.metrics.cache_hit_rate = self.metrics.cache_hits / total_accesses
+        if self.metrics.peer_queries_sent > 0:
+            self.metrics.peer_query_hit_rate = (
+                self.metrics.peer_query_hits / self.metrics.peer_queries_sent
+            )
 
         return self.metrics
 
@@ -530,3 +1236,5 @@ class SwarmAdaptiveMemory:
         self.metrics = SwarmMemoryMetrics()
         self.peer_caches.clear()
         self._local_pattern_cache.clear()
+        self._replication_queue.clear()
+        self._replication_queue_bytes = 0
@@ -0,0 +1,358 @@
+"""
+Swarm transports - Pluggable links between SwarmMessageBus instances.
+
+SwarmMessageBus delivers in-process by default. Attaching a transport sends
+every outbound envelope (or coalesced frame) over a link instead, so several
+buses - in one process or one per OS process - form a swarm:
+- InProcessTransport: buses in one process joined through an InProcessHub
+- DatagramTransport: UDP or Unix-domain datagram sockets, one agent per
+  OS process on the same Linux box
+- LinkModel: latency, jitter, loss and bandwidth applied with loop timers
+  (call_at) rather than sleeping the publisher
+"""
+
+import asyncio
+import logging
+import os
+import random
+import socket
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple, Union
+
+from astraguard.swarm.models import AgentID
+
+logger = logging.getLogger(__name__)
+
+FrameHandler = Callable[[bytes], Awaitable[Any]]
+Address = Union[Tuple[str, int], str]
+
+# Largest datagram we will send (10KB ISL frame plus envelope headroom)
+MAX_DATAGRAM_BYTES = 16 * 1024
+
+
+@dataclass
+class LinkModel:
+    """Simulated ISL link applied per destination.
+
+    Attributes:
+        latency_ms: One-way propagation delay
+        jitter_ms: Uniform random extra delay in [0, jitter_ms]
+        loss_rate: Probability a frame is dropped (0.0-1.0)
+        bandwidth_kbps: Link rate in KB/s (None = unlimited); frames to the
+            same destination queue behind each other
+        seed: Random seed for reproducible loss/jitter
+    """
+
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    loss_rate: float = 0.0
+    bandwidth_kbps: Optional[float] = None
+    seed: Optional[int] = None
+    _rng: random.Random = field(init=False, repr=False)
+    _busy_until: Dict[Any, float] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self):
+        """Validate parameters and seed the RNG."""
+        if not 0.0 <= self.loss_rate <= 1.0:
+            raise ValueError(f"loss_rate must be in [0, 1], got {self.loss_rate}")
+        if self.latency_ms < 0 or self.jitter_ms < 0:
+            raise ValueError("latency_ms and jitter_ms must be non-negative")
+        if self.bandwidth_kbps is not None and self.bandwidth_kbps <= 0:
+            raise ValueError("bandwidth_kbps must be positive")
+        self._rng = random.Random(self.seed)
+
+    @property
+    def is_ideal(self) -> bool:
+        """True when the link adds no delay or loss."""
+        return (
+            self.latency_ms == 0
+            and self.jitter_ms == 0
+            and self.loss_rate == 0
+            and self.bandwidth_kbps is None
+        )
+
+    def schedule(self, destination: Any, size: int, now: float) -> Optional[float]:
+        """Compute when a frame sent now arrives.
+
+        Args:
+            destination: Link key (peer) whose serialization queue is used
+            size: Frame size in bytes
+            now: Current loop time in seconds
+
+        Returns:
+            Arrival time in loop seconds, or None if the frame is lost
+        """
+        if self.loss_rate and self._rng.random() < self.loss_rate:
+            return None
+        departure = now
+        if self.bandwidth_kbps is not None:
+            start = max(now, self._busy_until.get(destination, now))
+            departure = start + size / (self.bandwidth_kbps * 1000.0)
+            self._busy_until[destination] = departure
+        delay_ms = self.latency_ms
+        if self.jitter_ms:
+            delay_ms += self._rng.uniform(0.0, self.jitter_ms)
+        return departure + delay_ms / 1000.0
+
+
+@dataclass
+class TransportStats:
+    """Frame counters for one transport."""
+
+    frames_sent: int = 0
+    bytes_sent: int = 0
+    frames_received: int = 0
+    bytes_received: int = 0
+    frames_lost: int = 0
+    receive_errors: int = 0
+
+    def to_dict(self) -> dict:
+        """Serialize stats for metrics export."""
+        return {
+            "frames_sent": self.frames_sent,
+            "bytes_sent": self.bytes_sent,
+            "frames_received": self.frames_received,
+            "bytes_received": self.bytes_received,
+            "frames_lost": self.frames_lost,
+            "receive_errors": self.receive_errors,
+        }
+
+
+class Transport(ABC):
+    """Carries envelopes and frames between buses.
+
+    Subclasses implement _targets() and _emit(); the base class applies the
+    link model with loop timers and handles local loopback.
+    """
+
+    def __init__(self, agent_id: AgentID, link: Optional[LinkModel] = None, loopback: bool = True):
+        """Initialize transport.
+
+        Args:
+            agent_id: Agent this transport belongs to
+            link: LinkModel applied to outbound frames (None = ideal link)
+            loopback: Also deliver broadcasts and self-addressed frames to
+                the local bus, as in-process delivery does
+        """
+        self.agent_id = agent_id
+        self.link = link or LinkModel()
+        self.loopback = loopback
+        self.stats = TransportStats()
+        self._on_frame: Optional[FrameHandler] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._timers: Dict[int, asyncio.TimerHandle] = {}
+        self._next_timer = 0
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def start(self, on_frame: FrameHandler) -> None:
+        """Begin receiving; on_frame is awaited for every inbound frame."""
+        self._on_frame = on_frame
+        self._loop = asyncio.get_running_loop()
+
+    async def send(self, peer: Optional[AgentID], data: bytes) -> None:
+        """Send a frame to peer (None = broadcast to every peer).
+
+        Returns as soon as the frame is scheduled; link delay is applied by
+        a loop timer, not by sleeping the caller.
+        """
+        loop = self._loop or asyncio.get_running_loop()
+        if self.loopback and (peer is None or peer == self.agent_id):
+            self._spawn(self._receive(bytes(data)))
+            if peer is not None:
+                return
+
+        now = loop.time()
+        for target in self._targets(peer):
+            self.stats.frames_sent += 1
+            self.stats.bytes_sent += len(data)
+            if self.link.is_ideal:
+                self._emit(target, data)
+                continue
+            arrival = self.link.schedule(target, len(data), now)
+            if arrival is None:
+                self.stats.frames_lost += 1
+                continue
+            self._next_timer += 1
+            self._timers[self._next_timer] = loop.call_at(
+                arrival, self._fire, self._next_timer, target, data
+            )
+
+    def _fire(self, key: int, target: Any, data: bytes) -> None:
+        self._timers.pop(key, None)
+        self._emit(target, data)
+
+    def _spawn(self, coro) -> None:
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _receive(self, data: bytes) -> None:
+        """Hand an inbound frame to the bus."""
+        self.stats.frames_received += 1
+        self.stats.bytes_received += len(data)
+        if self._on_frame is None:
+            return
+        try:
+            await self._on_frame(data)
+        except Exception as e:
+            self.stats.receive_errors += 1
+            logger.error(f"Transport {self.agent_id.satellite_serial} failed to handle frame: {e}")
+
+    @abstractmethod
+    def _targets(self, peer: Optional[AgentID]) -> List[Any]:
+        """Destinations for peer (None = all peers except self)."""
+
+    @abstractmethod
+    def _emit(self, target: Any, data: bytes) -> None:
+        """Put one frame on the wire to target."""
+
+    async def close(self) -> None:
+        """Cancel in-flight frames and stop receiving."""
+        for handle in self._timers.values():
+            handle.cancel()
+        self._timers.clear()
+        for task in list(self._tasks):
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._on_frame = None
+
+    def get_stats(self) -> dict:
+        """Transport counters."""
+        return self.stats.to_dict()
+
+
+class InProcessHub:
+    """Registry joining InProcessTransports in one event loop."""
+
+    def __init__(self):
+        self.members: Dict[AgentID, "InProcessTransport"] = {}
+
+
+class InProcessTransport(Transport):
+    """Transport between buses in the same process.
+
+    Example:
+        >>> hub = InProcessHub()
+        >>> await bus_a.attach_transport(InProcessTransport(agent_a, hub))
+        >>> await bus_b.attach_transport(InProcessTransport(agent_b, hub))
+    """
+
+    def __init__(
+        self,
+        agent_id: AgentID,
+        hub: InProcessHub,
+        link: Optional[LinkModel] = None,
+        loopback: bool = True,
+    ):
+        super().__init__(agent_id, link, loopback)
+        self.hub = hub
+        hub.members[agent_id] = self
+
+    def _targets(self, peer: Optional[AgentID]) -> List[Any]:
+        if peer is None:
+            return [a for a in self.hub.members if a != self.agent_id]
+        return [peer] if peer in self.hub.members and peer != self.agent_id else []
+
+    def _emit(self, target: AgentID, data: bytes) -> None:
+        member = self.hub.members.get(target)
+        if member is not None:
+            member._spawn(member._receive(data))
+
+    async def close(self) -> None:
+        self.hub.members.pop(self.agent_id, None)
+        await super().close()
+
+
+class _DatagramProtocol(asyncio.DatagramProtocol):
+    def __init__(self, transport: "DatagramTransport"):
+        self.owner = transport
+
+    def datagram_received(self, data: bytes, addr) -> None:
+        self.owner._spawn(self.owner._receive(data))
+
+    def error_received(self, exc: Exception) -> None:
+        self.owner.stats.receive_errors += 1
+        logger.debug(f"Datagram error on {self.owner.local_address}: {exc}")
+
+
+class DatagramTransport(Transport):
+    """UDP or Unix-domain datagram transport for one agent per OS process.
+
+    Example:
+        >>> transport = DatagramTransport(
+        ...     agent_id, ("127.0.0.1", 47001),
+        ...     peers={other_id: ("127.0.0.1", 47002)},
+        ...     link=LinkModel(latency_ms=50, loss_rate=0.01),
+        ... )
+        >>> await bus.attach_transport(transport)
+    """
+
+    def __init__(
+        self,
+        agent_id: AgentID,
+        local_address: Address,
+        peers: Optional[Dict[AgentID, Address]] = None,
+        link: Optional[LinkModel] = None,
+        loopback: bool = True,
+    ):
+        """Initialize datagram transport.
+
+        Args:
+            agent_id: Agent this transport belongs to
+            local_address: (host, port) for UDP or a filesystem path for a
+                Unix-domain socket; port 0 binds an ephemeral port
+            peers: AgentID → address of every other agent
+            link: LinkModel applied to outbound frames
+            loopback: Deliver broadcasts to the local bus as well
+        """
+        super().__init__(agent_id, link, loopback)
+        self.local_address = local_address
+        self.peers: Dict[AgentID, Address] = dict(peers or {})
+        self.family = socket.AF_UNIX if isinstance(local_address, str) else socket.AF_INET
+        self._endpoint: Optional[asyncio.DatagramTransport] = None
+
+    def add_peer(self, agent_id: AgentID, address: Address) -> None:
+        """Register or update a peer address."""
+        self.peers[agent_id] = address
+
+    async def start(self, on_frame: FrameHandler) -> None:
+        """Bind the socket and begin receiving."""
+        await super().start(on_frame)
+        sock = socket.socket(self.family, socket.SOCK_DGRAM)
+        if self.family == socket.AF_UNIX and os.path.exists(self.local_address):
+            os.unlink(self.local_address)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4 * 1024 * 1024)
+        sock.bind(self.local_address)
+        sock.setblocking(False)
+        self.local_address = sock.getsockname()
+        self._endpoint, _ = await self._loop.create_datagram_endpoint(
+            lambda: _DatagramProtocol(self), sock=sock
+        )
+
+    def _targets(self, peer: Optional[AgentID]) -> List[Any]:
+        if peer is None:
+            return [addr for agent, addr in self.peers.items() if agent != self.agent_id]
+        address = self.peers.get(peer)
+        return [address] if address is not None and peer != self.agent_id else []
+
+    def _emit(self, target: Address, data: bytes) -> None:
+        if self._endpoint is None or self._endpoint.is_closing():
+            return
+        if len(data) > MAX_DATAGRAM_BYTES:
+            logger.error(f"Frame of {len(data)}B exceeds datagram limit")
+            self.stats.frames_lost += 1
+            return
+        self._endpoint.sendto(data, target)
+
+    async def close(self) -> None:
+        await super().close()
+        if self._endpoint is not None:
+            self._endpoint.close()
+            self._endpoint = None
+        if self.family == socket.AF_UNIX and isinstance(self.local_address, str):
+            try:
+                os.unlink(self.local_address)
+            except OSError:
+                pass
@@ -5,12 +5,14 @@ Issue #398: Message bus abstraction for distributed satellite operations
 - Topic-based pub/sub messaging
 - QoS levels (0: fire-forget, 1: ACK, 2: reliable)
 - ISL bandwidth and latency constraints
+- Length-prefixed binary envelope (SwarmMessage.to_bytes/from_bytes)
 """
 
+import struct
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Optional
-from datetime import datetime
+from typing import Any, Optional, Tuple, Union
+from datetime import datetime, timedelta
 from uuid import UUID, uuid4
 
 from astraguard.swarm.models import AgentID
@@ -23,11 +25,13 @@ class SwarmTopic(str, Enum):
     intent/     → Action plans and mission intent (variable)
     coord/      → Coordination and synchronization messages
     control/    → Control commands and mode changes
+    memory/     → Anomaly pattern replication, lookups and anti-entropy
     """
     HEALTH = "health"
     INTENT = "intent"
     COORD = "coord"
     CONTROL = "control"
+    MEMORY = "memory"
 
     @classmethod
     def is_valid_topic(cls, topic: str) -> bool:
@@ -50,13 +54,82 @@ class QoSLevel(int, Enum):
     RELIABLE = 2
 
 
+# Binary envelope layout (version 1, little-endian):
+#   <2sBBBBQq16sI  magic "SE", version, qos, flags, topic length,
+#                  sequence, timestamp µs since epoch, message_id, payload length
+#   sender agent, [receiver agent if FLAG_RECEIVER], topic, payload
+# Each agent is <16sBB (uuid, constellation length, serial length) + strings.
+ENVELOPE_MAGIC = b"SE"
+ENVELOPE_VERSION = 1
+ENVELOPE_FLAG_RECEIVER = 0x01
+_ENVELOPE = struct.Struct("<2sBBBBQq16sI")
+_ENVELOPE_AGENT = struct.Struct("<16sBB")
+_EPOCH = datetime(1970, 1, 1)
+
+Payload = Union[bytes, memoryview]
+
+
+def _pack_agent(agent: AgentID) -> bytes:
+    constellation = agent.constellation.encode("utf-8")
+    serial = agent.satellite_serial.encode("utf-8")
+    return b"".join((
+        _ENVELOPE_AGENT.pack(agent.uuid.bytes, len(constellation), len(serial)),
+        constellation,
+        serial,
+    ))
+
+
+def _unpack_agent(data: memoryview, offset: int) -> Tuple[AgentID, int]:
+    uuid_bytes, constellation_len, serial_len = _ENVELOPE_AGENT.unpack_from(data, offset)
+    offset += _ENVELOPE_AGENT.size
+    constellation = str(data[offset:offset + constellation_len], "utf-8")
+    offset += constellation_len
+    serial = str(data[offset:offset + serial_len], "utf-8")
+    offset += serial_len
+    return AgentID(
+        constellation=constellation,
+        satellite_serial=serial,
+        uuid=UUID(bytes=uuid_bytes),
+    ), offset
+
+
+class TrafficClass(str, Enum):
+    """Outbound traffic classes scheduled by OutboundScheduler.
+    
+    CONSENSUS: Proposals, votes and leader election
+    SAFETY: Control commands (safe mode, action commands)
+    INTENT: Action plans and mission intent
+    HEALTH: Health summaries
+    HEARTBEAT: Liveness heartbeats (lowest value per byte)
+    """
+    CONSENSUS = "consensus"
+    SAFETY = "safety"
+    INTENT = "intent"
+    HEALTH = "health"
+    HEARTBEAT = "heartbeat"
+
+
+class OverflowPolicy(str, Enum):
+    """What a queued subscriber does when its queue is full.
+
+    DROP_OLDEST: Discard the oldest queued message (freshest data wins)
+    DROP_NEWEST: Discard the incoming message
+    BLOCK: Publisher waits for queue space (backpressure)
+    """
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+    BLOCK = "block"
+
+
 @dataclass(frozen=True)
 class SwarmMessage:
     """Immutable inter-satellite message.
     
     Attributes:
         topic: Message topic (e.g., "health/summary", "control/safe_mode")
-        payload: Serialized message content (bytes, typically LZ4 compressed)
+        payload: Serialized message content (bytes, typically LZ4 compressed).
+            Decoded messages carry a read-only memoryview into the received
+            buffer instead of a copy.
         sender: Agent ID of message sender
         qos: Quality of Service level (0, 1, 2)
         timestamp: UTC timestamp of message creation
@@ -65,7 +138,7 @@ class SwarmMessage:
         receiver: Optional specific receiver (None = broadcast)
     """
     topic: str
-    payload: bytes
+    payload: Payload
     sender: AgentID
     qos: int = 1
     timestamp: datetime = field(default_factory=datetime.utcnow)
@@ -79,7 +152,7 @@ class SwarmMessage:
         if not SwarmTopic.is_valid_topic(self.topic):
             raise ValueError(
                 f"Invalid topic: {self.topic}. Must start with "
-                f"'health/', 'intent/', 'coord/', or 'control/'"
+                f"'health/', 'intent/', 'coord/', 'control/', or 'memory/'"
             )
         
         # Validate QoS
@@ -87,8 +160,10 @@ class SwarmMessage:
             raise ValueError(f"QoS must be 0, 1, or 2, got {self.qos}")
         
         # Validate payload
-        if not isinstance(self.payload, bytes):
-            raise ValueError(f"Payload must be bytes, got {type(self.payload)}")
+        if not isinstance(self.payload, (bytes, memoryview)):
+            raise ValueError(
+                f"Payload must be bytes or memoryview, got {type(self.payload)}"
+            )
         
         if len(self.payload) == 0:
             raise ValueError("Payload cannot be empty")
@@ -147,6 +222,86 @@ class SwarmMessage:
             receiver=receiver,
         )
 
+    def to_bytes(self) -> bytes:
+        """Serialize to the length-prefixed binary envelope.
+        
+        The payload is written as-is (no hex/base64), so the envelope is
+        only ~60B + strings larger than the payload.
+        """
+        topic = self.topic.encode("utf-8")
+        if len(topic) > 0xFF:
+            raise ValueError(f"Topic too long for envelope: {len(topic)} bytes")
+        flags = ENVELOPE_FLAG_RECEIVER if self.receiver else 0
+        timestamp_us = (self.timestamp - _EPOCH) // timedelta(microseconds=1)
+        parts = [
+            _ENVELOPE.pack(
+                ENVELOPE_MAGIC,
+                ENVELOPE_VERSION,
+                self.qos,
+                flags,
+                len(topic),
+                self.sequence,
+                timestamp_us,
+                self.message_id.bytes,
+                len(self.payload),
+            ),
+            _pack_agent(self.sender),
+        ]
+        if self.receiver:
+            parts.append(_pack_agent(self.receiver))
+        parts.append(topic)
+        parts.append(self.payload)
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: Payload) -> "SwarmMessage":
+        """Deserialize a binary envelope without copying the payload.
+        
+        Args:
+            data: Envelope produced by to_bytes()
+            
+        Returns:
+            SwarmMessage whose payload is a memoryview into data
+            
+        Raises:
+            ValueError: If the envelope is malformed or the version unsupported
+        """
+        view = memoryview(data)
+        if len(view) < _ENVELOPE.size:
+            raise ValueError("Envelope too short")
+        (magic, version, qos, flags, topic_len, sequence, timestamp_us,
+         message_id, payload_len) = _ENVELOPE.unpack_from(view)
+        if magic != ENVELOPE_MAGIC:
+            raise ValueError("Not a SwarmMessage envelope")
+        if version != ENVELOPE_VERSION:
+            raise ValueError(f"Unsupported envelope version {version}")
+
+        offset = _ENVELOPE.size
+        sender, offset = _unpack_agent(view, offset)
+        receiver = None
+        if flags & ENVELOPE_FLAG_RECEIVER:
+            receiver, offset = _unpack_agent(view, offset)
+        topic = str(view[offset:offset + topic_len], "utf-8")
+        offset += topic_len
+        if len(view) - offset != payload_len:
+            raise ValueError("Envelope payload length mismatch")
+
+        return cls(
+            topic=topic,
+            payload=view[offset:].toreadonly(),
+            sender=sender,
+            qos=qos,
+            timestamp=_EPOCH + timedelta(microseconds=timestamp_us),
+            sequence=sequence,
+            message_id=UUID(bytes=message_id),
+            receiver=receiver,
+        )
+
+    @staticmethod
+    def is_envelope(data: Payload) -> bool:
+        """Check whether data starts with the binary envelope magic."""
+        return bytes(data[:2]) == ENVELOPE_MAGIC
+
 
 @dataclass
 class MessageAck:
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Action Compliance Tracking Benchmarks
+
+One constellation action targeting AGENTS satellites, plus PENDING_ACTIONS
+other pending actions over the same satellites. Compares:
+- legacy: the previous ActionState, with sets of serials and
+  remaining_agents rebuilt on every call, a 0.5s polling waiter, and
+  RoleReassigner scanning every pending action per agent
+- bitset: dense agent indices with target/completed/failed/escalated
+  bitsets, popcount checks, an event-driven waiter and per-agent reverse
+  indexes
+Reports the cost of recording one completion, of an "all responded?"
+check, of the compliance evaluation, of "which actions is agent X behind
+on" for every agent, and of the reassigner's compliance check for every
+agent. Also reports how long propagate_action takes to return after the
+last completion arrives.
+Run with: python benchmarks/action_compliance_tracking.py
+
+Output is formatted for inclusion in pull requests.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import List, Set
+from unittest.mock import AsyncMock, Mock
+from uuid import NAMESPACE_DNS, uuid5
+
+# Add project root to path for imports
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from astraguard.swarm.action_propagator import ActionPropagator, ActionState
+from astraguard.swarm.models import AgentID
+
+
+AGENTS = 1_000
+PENDING_ACTIONS = 50
+WAKE_RUNS = 5
+
+
+@dataclass
+class LegacyActionState:
+    """Previous ActionState: sets of serials, remaining rebuilt per call."""
+    action_id: str
+    target_agents: List[AgentID]
+    completed_agents: Set[str] = field(default_factory=set)
+    failed_agents: Set[str] = field(default_factory=set)
+    escalated_agents: Set[str] = field(default_factory=set)
+
+    @property
+    def compliance_percent(self) -> float:
+        return len(self.completed_agents) / len(self.target_agents) * 100.0
+
+    @property
+    def remaining_agents(self) -> Set[str]:
+        target_serials = {agent.satellite_serial for agent in self.target_agents}
+        return target_serials - (self.completed_agents | self.failed_agents)
+
+
+class LegacyPollingPropagator(ActionPropagator):
+    """Previous waiter: re-check responses every 0.5s."""
+
+    async def _wait_for_completions(self, action_id: str, timeout_seconds: int):
+        deadline = datetime.utcnow() + timedelta(seconds=timeout_seconds)
+        while datetime.utcnow() < deadline:
+            state = self.pending_actions.get(action_id)
+            if not state:
+                break
+            if len(state.completed_agents) + len(state.failed_agents) >= len(state.target_agents):
+                break
+            await asyncio.sleep(0.5)
+
+
+def _agents() -> List[AgentID]:
+    return [
+        AgentID(constellation="astra-v3.0", satellite_serial=f"SAT-{i:04d}",
+                uuid=uuid5(NAMESPACE_DNS, f"astra-v3.0:SAT-{i:04d}"))
+        for i in range(AGENTS)
+    ]
+
+
+def _timed(fn, repeat: int = 1) -> float:
+    """Mean µs per call."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def _deadline() -> datetime:
+    return datetime.utcnow() + timedelta(seconds=30)
+
+
+def _legacy_costs(agents: List[AgentID]) -> dict:
+    pending = {
+        f"act_{n}": LegacyActionState(f"act_{n}", agents) for n in range(PENDING_ACTIONS)
+    }
+    for n, state in enumerate(pending.values()):
+        state.completed_agents = {a.satellite_serial for i, a in enumerate(agents) if (i + n) % 10}
+        state.escalated_agents = state.remaining_agents
+    main = LegacyActionState("main", agents)
+    serials = [a.satellite_serial for a in agents]
+
+    def record():
+        for serial in serials:
+            main.completed_agents.add(serial)
+
+    def evaluate():
+        non_compliant = main.remaining_agents | main.failed_agents
+        main.escalated_agents = non_compliant
+
+    def behind_all():
+        for serial in serials:
+            [aid for aid, s in pending.items() if serial in s.remaining_agents]
+
+    def escalated_all():
+        for serial in serials:
+            any(serial in s.escalated_agents for s in pending.values())
+
+    return {
+        "record_us": _timed(record) / AGENTS,
+        "check_us": _timed(
+            lambda: len(main.completed_agents) + len(main.failed_agents) >= len(main.target_agents)
+            and not main.remaining_agents, 2000
+        ),
+        "evaluate_us": _timed(evaluate, 2000),
+        "behind_ms": _timed(behind_all) / 1000,
+        "escalated_ms": _timed(escalated_all) / 1000,
+    }
+
+
+def _bitset_costs(agents: List[AgentID]) -> dict:
+    propagator = ActionPropagator(Mock(), Mock(), Mock())
+    for n in range(PENDING_ACTIONS):
+        state = ActionState(f"act_{n}", "safe_mode", agents, _deadline(),
+                            agent_index=propagator.agent_index)
+        propagator.pending_actions[state.action_id] = state
+        state.completed_agents = [a.satellite_serial for i, a in enumerate(agents) if (i + n) % 10]
+        state.escalated_mask = state.remaining_mask
+    main = ActionState("main", "safe_mode", agents, _deadline(), agent_index=propagator.agent_index)
+    propagator.pending_actions["main"] = main
+    index = propagator.agent_index
+    bits = [1 << index.id(a.satellite_serial) for a in agents]
+
+    def record():
+        for bit in bits:
+            main.completed_mask |= bit
+
+    def evaluate():
+        main.escalated_mask = main.remaining_mask | main.failed_mask
+
+    def behind_all():
+        for agent in agents:
+            propagator.get_actions_behind(agent)
+
+    def escalated_all():
+        for agent in agents:
+            propagator.is_escalated(agent)
+
+    return {
+        "record_us": _timed(record) / AGENTS,
+        "check_us": _timed(lambda: main.all_responded, 2000),
+        "evaluate_us": _timed(evaluate, 2000),
+        "behind_ms": _timed(behind_all) / 1000,
+        "escalated_ms": _timed(escalated_all) / 1000,
+    }
+
+
+async def _wake_latency(propagator_cls, agents: List[AgentID]) -> float:
+    """Mean ms between the last completion and propagate_action returning."""
+    total = 0.0
+    for run in range(WAKE_RUNS):
+        election = Mock()
+        election.is_leader.return_value = True
+        election.local_agent_id = agents[0]
+        bus = Mock()
+        propagator = propagator_cls(election, Mock(), bus)
+        last = {}
+
+        async def respond(topic, payload, qos=2):
+            async def reply():
+                await asyncio.sleep(0.05 + run * 0.09)  # Spread over the poll period
+                for agent in agents:
+                    await propagator._handle_action_completed({
+                        "action_id": payload["action_id"],
+                        "agent_id": agent.to_dict(),
+                        "status": "success",
+                        "timestamp": datetime.utcnow().isoformat(),
+                        "error": None,
+                    })
+                last["t"] = time.perf_counter()
+            asyncio.ensure_future(reply())
+
+        bus.publish = AsyncMock(side_effect=respond)
+        await propagator.propagate_action("safe_mode", {}, agents, deadline_seconds=10)
+        total += time.perf_counter() - last["t"]
+    return total / WAKE_RUNS * 1000
+
+
+def benchmark_tracking() -> dict:
+    """Legacy vs bitset tracking for a 1000-agent action."""
+    agents = _agents()
+    results = {"legacy": _legacy_costs(agents), "bitset": _bitset_costs(agents)}
+    results["legacy"]["wake_ms"] = asyncio.run(_wake_latency(LegacyPollingPropagator, agents))
+    results["bitset"]["wake_ms"] = asyncio.run(_wake_latency(ActionPropagator, agents))
+    return results
+
+
+def print_results():
+    """Run all benchmarks and print results."""
+    logging.disable(logging.WARNING)
+    print("=" * 118)
+    print("ASTRAGUARD ACTION COMPLIANCE TRACKING")
+    print("=" * 118)
+    print()
+    print(f"## {AGENTS:,}-agent constellation action, {PENDING_ACTIONS} other pending actions\n")
+    print("| Tracking | Record completion | All responded? | Evaluate compliance | Behind-on (all agents) | Escalated? (all agents) | Wake after last |")
+    print("|----------|-------------------|----------------|---------------------|------------------------|-------------------------|-----------------|")
+    for mode, r in benchmark_tracking().items():
+        print(
+            f"| {mode:8} | {r['record_us']:15.2f}μs | {r['check_us']:12.2f}μs | "
+            f"{r['evaluate_us']:17.1f}μs | {r['behind_ms']:20.2f}ms | "
+            f"{r['escalated_ms']:21.2f}ms | {r['wake_ms']:13.1f}ms |"
+        )
+    print()
+    print("=" * 118)
+    print("BENCHMARK COMPLETE")
+    print("=" * 118)
+
+
+if __name__ == "__main__":
+    print_results()
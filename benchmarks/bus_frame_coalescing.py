@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+ISL Frame Coalescing Benchmarks
+
+Compares bytes on the wire per logical message for standalone JSON
+envelopes (SwarmMessage.to_dict) against coalesced frames, with and
+without the per-frame LZ4 pass, over a mixed heartbeat / health summary /
+intent workload addressed to a handful of peers. Also reports the extra
+delivery latency added by each flush deadline.
+Run with: python benchmarks/bus_frame_coalescing.py
+
+Output is formatted for inclusion in pull requests.
+"""
+
+import asyncio
+import json
+import random
+import statistics
+import time
+from datetime import datetime
+
+# Add project root to path for imports
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from astraguard.swarm.coalescer import FrameCoalescer
+from astraguard.swarm.models import AgentID, HealthSummary
+from astraguard.swarm.serializer import SwarmSerializer
+from astraguard.swarm.types import SwarmMessage
+
+
+MESSAGES = 2000
+PEERS = 4
+ISL_BYTES_PER_SEC = 10 * 1024
+
+
+def build_workload(seed: int = 11) -> list:
+    """Mixed message stream: 60% heartbeats, 30% health summaries, 10% intents."""
+    rng = random.Random(seed)
+    serializer = SwarmSerializer(validate=False)
+    sender = AgentID.create("astra-v3.0", "SAT-000-A")
+    peers = [AgentID.create("astra-v3.0", f"SAT-{i:03d}-A") for i in range(1, PEERS + 1)]
+    messages = []
+    for seq in range(1, MESSAGES + 1):
+        roll = rng.random()
+        if roll < 0.6:
+            topic, payload = "health/heartbeat", json.dumps({"alive": True, "t": seq}).encode()
+        elif roll < 0.9:
+            summary = HealthSummary(
+                anomaly_signature=[round(rng.random(), 3) for _ in range(32)],
+                risk_score=rng.random(),
+                recurrence_score=rng.random() * 10,
+                timestamp=datetime.utcnow(),
+            )
+            topic, payload = "health/summary", serializer.serialize_health(summary, compress=False)
+        else:
+            topic = "intent/plan"
+            payload = json.dumps({"action": "attitude_adjust", "priority": 2, "seq": seq}).encode()
+        messages.append(SwarmMessage(
+            topic=topic, payload=payload, sender=sender, qos=0,
+            sequence=seq, receiver=rng.choice(peers),
+        ))
+    return messages
+
+
+def measure_standalone(messages: list) -> dict:
+    """One JSON envelope per message (current publish path)."""
+    wire = sum(len(json.dumps(m.to_dict()).encode()) for m in messages)
+    payload = sum(len(m.payload) for m in messages)
+    return {"bytes_per_message": wire / len(messages), "efficiency": payload / wire, "frames": len(messages)}
+
+
+async def _coalesce(messages: list, compress: bool, deadline_ms: float, interval_s: float) -> dict:
+    """Feed messages at a fixed rate and collect frames and added latency."""
+    latencies = []
+    added_at = {}
+
+    async def sink(peer, frame):
+        now = time.perf_counter()
+        for message in FrameCoalescer.unpack(frame):
+            latencies.append((now - added_at[message.sequence]) * 1000)
+
+    coalescer = FrameCoalescer(sink, flush_deadline_ms=deadline_ms, compress=compress)
+    for message in messages:
+        added_at[message.sequence] = time.perf_counter()
+        await coalescer.add(message)
+        if interval_s:
+            await asyncio.sleep(interval_s)
+    await coalescer.flush()
+
+    stats = coalescer.get_stats().to_dict()
+    stats["latency_p50_ms"] = statistics.median(latencies)
+    stats["latency_p99_ms"] = statistics.quantiles(latencies, n=100)[98]
+    return stats
+
+
+def benchmark_efficiency(messages: list) -> dict:
+    """Wire bytes per message for each encoding."""
+    results = {"json envelope": measure_standalone(messages)}
+    for label, compress in (("frame", False), ("frame + lz4", True)):
+        stats = asyncio.run(_coalesce(messages, compress, deadline_ms=1000.0, interval_s=0))
+        results[label] = {
+            "bytes_per_message": stats["bytes_per_message"],
+            "efficiency": stats["payload_efficiency"],
+            "frames": stats["frames_sent"],
+        }
+    return results
+
+
+def benchmark_deadlines(messages: list) -> dict:
+    """Added latency vs frame fill for several flush deadlines at ~1k msg/s."""
+    sample = messages[:500]
+    return {
+        deadline: asyncio.run(_coalesce(sample, True, deadline_ms=deadline, interval_s=0.001))
+        for deadline in (5.0, 20.0, 50.0)
+    }
+
+
+def print_results():
+    """Run all benchmarks and print results."""
+    messages = build_workload()
+
+    print("=" * 76)
+    print("ASTRAGUARD ISL FRAME COALESCING")
+    print("=" * 76)
+    print()
+    print(f"## {MESSAGES} mixed messages to {PEERS} peers\n")
+    print("| Encoding      | Bytes/msg | Payload efficiency | Frames | Msgs/s at 10KB/s |")
+    print("|---------------|-----------|--------------------|--------|------------------|")
+    for label, r in benchmark_efficiency(messages).items():
+        print(
+            f"| {label:13} | {r['bytes_per_message']:9.1f} | {r['efficiency']:18.2f} | "
+            f"{r['frames']:6} | {ISL_BYTES_PER_SEC / r['bytes_per_message']:16,.0f} |"
+        )
+    print()
+
+    print("## Flush deadline trade-off (500 messages, ~1ms apart)\n")
+    print("| Deadline | Msgs/frame | Bytes/msg | Added P50 | Added P99 |")
+    print("|----------|------------|-----------|-----------|-----------|")
+    for deadline, r in benchmark_deadlines(messages).items():
+        print(
+            f"| {deadline:6.0f}ms | {r['messages_per_frame']:10.1f} | {r['bytes_per_message']:9.1f} | "
+            f"{r['latency_p50_ms']:7.1f}ms | {r['latency_p99_ms']:7.1f}ms |"
+        )
+    print()
+    print("=" * 76)
+    print("BENCHMARK COMPLETE")
+    print("=" * 76)
+
+
+if __name__ == "__main__":
+    print_results()
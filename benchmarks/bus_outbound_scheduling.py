@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Outbound Scheduling Benchmarks
+
+Simulates a 10KB/s ISL link paced by BandwidthGovernor tokens carrying
+consensus votes, health summaries and heartbeats, then scales heartbeat
+load 1x → 10x. Compares a single FIFO queue (tokens only) against the
+weighted fair OutboundScheduler and reports consensus vote latency
+(publish → delivery) and heartbeat drops. A second run uses the governor's
+default limits (1KB/s, 500B burst per peer) with 600B proposals, larger
+than the burst, mixed into heartbeat traffic.
+Run with: python benchmarks/bus_outbound_scheduling.py
+
+Output is formatted for inclusion in pull requests.
+"""
+
+import asyncio
+import statistics
+import time
+
+# Add project root to path for imports
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from astraguard.swarm.bandwidth_governor import BandwidthGovernor
+from astraguard.swarm.bus import SwarmMessageBus
+from astraguard.swarm.models import AgentID, SatelliteRole, SwarmConfig
+from astraguard.swarm.serializer import SwarmSerializer
+from astraguard.swarm.types import QoSLevel, TrafficClass
+
+
+DURATION_S = 3.0
+HEARTBEAT_BASE_RATE = 8      # msg/s at 1x, 100B payload
+CONSENSUS_RATE = 5           # msg/s, 120B payload
+HEALTH_RATE = 2              # msg/s, 300B payload
+LOAD_FACTORS = (1, 2, 5, 10)
+PROPOSAL_RATE = 1            # msg/s, 600B payload (default-limits run)
+PROPOSAL_SIZE = 600
+
+
+def _create_bus() -> SwarmMessageBus:
+    config = SwarmConfig(
+        agent_id=AgentID.create("astra-v3.0", "SAT-BENCH"),
+        role=SatelliteRole.PRIMARY,
+        constellation_id="astra-v3.0",
+    )
+    return SwarmMessageBus(config, SwarmSerializer(validate=False), latency_ms=0)
+
+
+async def _producer(bus, topic: str, rate: float, size: int, published: dict) -> None:
+    """Publish at a fixed rate for DURATION_S."""
+    interval = 1.0 / rate
+    start = time.monotonic()
+    count = 0
+    while time.monotonic() - start < DURATION_S:
+        # publish() assigns message_sequence + 1 before its first await
+        published[bus.message_sequence + 1] = time.monotonic()
+        await bus.publish(topic, b"x" * size, qos=QoSLevel.FIRE_FORGET)
+        count += 1
+        await asyncio.sleep(max(0.0, start + count * interval - time.monotonic()))
+
+
+async def _run(load: int, fair: bool) -> dict:
+    """Run one load level with FIFO or weighted fair scheduling."""
+    bus = _create_bus()
+    governor = BandwidthGovernor(bus.config)
+    governor.set_peer_limit(None, 10)  # Broadcasts share the 10KB/s link
+    scheduler = bus.enable_scheduler(governor=governor)
+    if not fair:
+        # Everything in one class: plain FIFO paced by governor tokens
+        scheduler.classifier = lambda message: TrafficClass.CONSENSUS
+
+    published: dict = {}
+    latencies = {"coord/vote_grant": [], "health/heartbeat": []}
+
+    def on_message(message):
+        if message.topic in latencies:
+            latencies[message.topic].append(
+                (time.monotonic() - published[message.sequence]) * 1000
+            )
+
+    bus.subscribe("*", on_message)
+    await asyncio.gather(
+        _producer(bus, "health/heartbeat", HEARTBEAT_BASE_RATE * load, 100, published),
+        _producer(bus, "coord/vote_grant", CONSENSUS_RATE, 120, published),
+        _producer(bus, "health/summary", HEALTH_RATE, 300, published),
+    )
+    stats = scheduler.get_stats()
+    await bus.close()
+
+    votes = latencies["coord/vote_grant"] or [0.0]
+    dropped = sum(s["dropped"] for s in stats.values())
+    heartbeat_dropped = stats["heartbeat"]["dropped"] if fair else dropped
+    return {
+        "vote_p50_ms": statistics.median(votes),
+        "vote_p99_ms": max(votes) if len(votes) < 100 else statistics.quantiles(votes, n=100)[98],
+        "votes_delivered": len(latencies["coord/vote_grant"]),
+        "heartbeats_delivered": len(latencies["health/heartbeat"]),
+        "dropped": heartbeat_dropped,
+    }
+
+
+async def _run_default_limits() -> dict:
+    """Oversized proposals and heartbeats under an unmodified governor."""
+    bus = _create_bus()
+    bus.enable_scheduler(governor=BandwidthGovernor(bus.config))
+
+    published: dict = {}
+    latencies = {"coord/proposal": [], "health/heartbeat": []}
+
+    def on_message(message):
+        if message.topic in latencies:
+            latencies[message.topic].append(
+                (time.monotonic() - published[message.sequence]) * 1000
+            )
+
+    bus.subscribe("*", on_message)
+    await asyncio.gather(
+        _producer(bus, "coord/proposal", PROPOSAL_RATE, PROPOSAL_SIZE, published),
+        _producer(bus, "health/heartbeat", HEARTBEAT_BASE_RATE // 4, 100, published),
+    )
+    await asyncio.wait_for(bus.drain(), timeout=DURATION_S)
+    await bus.close()
+    return {
+        topic: {
+            "delivered": len(samples),
+            "p50_ms": statistics.median(samples) if samples else float("nan"),
+            "max_ms": max(samples, default=float("nan")),
+        }
+        for topic, samples in latencies.items()
+    }
+
+
+def benchmark_scheduling() -> dict:
+    """Scale heartbeat load for FIFO and weighted fair scheduling."""
+    return {
+        (mode, load): asyncio.run(_run(load, fair=(mode == "weighted fair")))
+        for mode in ("fifo", "weighted fair")
+        for load in LOAD_FACTORS
+    }
+
+
+def print_results():
+    """Run all benchmarks and print results."""
+    print("=" * 92)
+    print("ASTRAGUARD OUTBOUND SCHEDULING")
+    print("=" * 92)
+    print()
+    print(
+        f"## 10KB/s link, {DURATION_S:.0f}s per run: votes {CONSENSUS_RATE}/s, "
+        f"summaries {HEALTH_RATE}/s, heartbeats {HEARTBEAT_BASE_RATE}/s x load\n"
+    )
+    print("| Scheduler     | Heartbeat load | Vote P50   | Vote P99   | Votes | Heartbeats | Dropped |")
+    print("|---------------|----------------|------------|------------|-------|------------|---------|")
+    for (mode, load), r in benchmark_scheduling().items():
+        print(
+            f"| {mode:13} | {load:13}x | {r['vote_p50_ms']:8.1f}ms | {r['vote_p99_ms']:8.1f}ms | "
+            f"{r['votes_delivered']:5} | {r['heartbeats_delivered']:10} | {r['dropped']:7} |"
+        )
+    print()
+    print(
+        f"## Default governor limits, {DURATION_S:.0f}s: {PROPOSAL_SIZE}B proposals "
+        f"{PROPOSAL_RATE}/s, heartbeats {HEARTBEAT_BASE_RATE // 4}/s\n"
+    )
+    print("| Topic            | Delivered | P50        | Max        |")
+    print("|------------------|-----------|------------|------------|")
+    for topic, r in asyncio.run(_run_default_limits()).items():
+        print(f"| {topic:16} | {r['delivered']:9} | {r['p50_ms']:8.1f}ms | {r['max_ms']:8.1f}ms |")
+    print()
+    print("=" * 92)
+    print("BENCHMARK COMPLETE")
+    print("=" * 92)
+
+
+if __name__ == "__main__":
+    print_results()
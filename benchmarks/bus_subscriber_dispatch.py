@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+SwarmMessageBus Subscriber Dispatch Benchmarks
+
+Mixes one slow subscriber (5ms handler) with many fast ones and compares
+inline dispatch (callbacks awaited one after another by the publisher)
+with per-subscriber queues under each overflow policy. Reports publisher
+time per message, fast-subscriber delivery latency and slow-subscriber
+drops/lag.
+Run with: python benchmarks/bus_subscriber_dispatch.py
+
+Output is formatted for inclusion in pull requests.
+"""
+
+import asyncio
+import statistics
+import time
+
+# Add project root to path for imports
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from astraguard.swarm.bus import SwarmMessageBus
+from astraguard.swarm.models import AgentID, SatelliteRole, SwarmConfig
+from astraguard.swarm.serializer import SwarmSerializer
+from astraguard.swarm.types import OverflowPolicy, QoSLevel
+
+
+FAST_SUBSCRIBERS = 50
+MESSAGES = 200
+SLOW_HANDLER_S = 0.005
+QUEUE_SIZE = 32
+PUBLISH_INTERVAL_S = 0.001
+
+
+def _create_bus() -> SwarmMessageBus:
+    config = SwarmConfig(
+        agent_id=AgentID.create("astra-v3.0", "SAT-BENCH"),
+        role=SatelliteRole.PRIMARY,
+        constellation_id="astra-v3.0",
+    )
+    return SwarmMessageBus(config, SwarmSerializer(validate=False), latency_ms=0)
+
+
+async def _run(queue_size, policy) -> dict:
+    """Publish MESSAGES at a fixed rate and measure dispatch behaviour."""
+    bus = _create_bus()
+    fast_latencies = []
+    publish_times = []
+    sent_at = {}
+
+    async def slow_handler(message):
+        await asyncio.sleep(SLOW_HANDLER_S)
+
+    def fast_handler(message):
+        fast_latencies.append((time.perf_counter() - sent_at[message.sequence]) * 1000)
+
+    overrides = {QoSLevel.FIRE_FORGET: policy} if policy else None
+    slow_id = bus.subscribe("health/*", slow_handler, queue_size=queue_size,
+                            overflow_policies=overrides)
+    for _ in range(FAST_SUBSCRIBERS):
+        bus.subscribe("health/*", fast_handler, queue_size=queue_size,
+                      overflow_policies=overrides)
+
+    start = time.perf_counter()
+    for seq in range(1, MESSAGES + 1):
+        sent_at[seq] = time.perf_counter()
+        await bus.publish("health/summary", b"telemetry", qos=QoSLevel.FIRE_FORGET)
+        publish_times.append((time.perf_counter() - sent_at[seq]) * 1000)
+        await asyncio.sleep(PUBLISH_INTERVAL_S)
+    publish_wall = time.perf_counter() - start
+    await bus.drain()
+    total_wall = time.perf_counter() - start
+
+    slow = bus.get_subscriber_metrics().get(str(slow_id.id), {})
+    await bus.close()
+    return {
+        "publish_p50_ms": statistics.median(publish_times),
+        "publish_p99_ms": statistics.quantiles(publish_times, n=100)[98],
+        "fast_p99_ms": statistics.quantiles(fast_latencies, n=100)[98],
+        "publish_wall_s": publish_wall,
+        "total_wall_s": total_wall,
+        "slow_dropped": slow.get("dropped", 0),
+        "slow_max_lag_ms": slow.get("max_lag_ms", 0.0),
+    }
+
+
+def benchmark_dispatch() -> dict:
+    """Run inline dispatch and each queued overflow policy."""
+    results = {"inline": asyncio.run(_run(None, None))}
+    for policy in OverflowPolicy:
+        results[f"queue/{policy.value}"] = asyncio.run(_run(QUEUE_SIZE, policy))
+    return results
+
+
+def print_results():
+    """Run all benchmarks and print results."""
+    print("=" * 96)
+    print("ASTRAGUARD MESSAGE BUS SUBSCRIBER DISPATCH")
+    print("=" * 96)
+    print()
+    print(
+        f"## 1 slow ({SLOW_HANDLER_S * 1000:.0f}ms) + {FAST_SUBSCRIBERS} fast subscribers, "
+        f"{MESSAGES} messages every {PUBLISH_INTERVAL_S * 1000:.0f}ms, queue size {QUEUE_SIZE}\n"
+    )
+    print("| Dispatch          | Publish P50 | Publish P99 | Fast sub P99 | Publish wall | Slow drops | Slow max lag |")
+    print("|-------------------|-------------|-------------|--------------|--------------|------------|--------------|")
+    for name, r in benchmark_dispatch().items():
+        print(
+            f"| {name:17} | {r['publish_p50_ms']:9.3f}ms | {r['publish_p99_ms']:9.3f}ms | "
+            f"{r['fast_p99_ms']:10.3f}ms | {r['publish_wall_s']:11.2f}s | "
+            f"{r['slow_dropped']:10} | {r['slow_max_lag_ms']:10.1f}ms |"
+        )
+    print()
+    print("=" * 96)
+    print("BENCHMARK COMPLETE")
+    print("=" * 96)
+
+
+if __name__ == "__main__":
+    print_results()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+SwarmMessageBus Topic Routing Benchmarks
+
+Measures subscriber lookup cost with 10k subscriptions spread across 1k
+topics (exact, "prefix/*" and a few "*" filters), comparing:
+- linear scan calling TopicFilter.matches on every subscription
+- topic trie lookup with the route memo disabled
+- topic trie lookup with the LRU route memo
+Run with: python benchmarks/bus_topic_routing.py
+
+Output is formatted for inclusion in pull requests.
+"""
+
+import random
+import statistics
+import time
+
+# Add project root to path for imports
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from astraguard.swarm.bus import SwarmMessageBus
+from astraguard.swarm.models import AgentID, SatelliteRole, SwarmConfig
+from astraguard.swarm.serializer import SwarmSerializer
+
+
+NUM_TOPICS = 1000
+NUM_SUBSCRIPTIONS = 10_000
+LOOKUPS = 5000
+PREFIXES = ("health", "intent", "coord", "control")
+
+
+def format_duration(us: float) -> str:
+    """Format duration given in microseconds."""
+    if us < 1000:
+        return f"{us:.2f}μs"
+    return f"{us / 1000:.3f}ms"
+
+
+def build_bus(seed: int = 42) -> tuple:
+    """Create a bus with NUM_SUBSCRIPTIONS filters over NUM_TOPICS topics."""
+    rng = random.Random(seed)
+    config = SwarmConfig(
+        agent_id=AgentID.create("astra-v3.0", "SAT-BENCH"),
+        role=SatelliteRole.PRIMARY,
+        constellation_id="astra-v3.0",
+    )
+    bus = SwarmMessageBus(config, SwarmSerializer(validate=False), latency_ms=0)
+
+    topics = [
+        f"{PREFIXES[i % len(PREFIXES)]}/group{i % 50}/item{i}" for i in range(NUM_TOPICS)
+    ]
+    for i in range(NUM_SUBSCRIPTIONS):
+        roll = rng.random()
+        if roll < 0.0005:
+            pattern = "*"
+        elif roll < 0.1:
+            pattern = rng.choice(topics).rsplit("/", 1)[0] + "/*"
+        else:
+            pattern = rng.choice(topics)
+        bus.subscribe(pattern, lambda message: None)
+    return bus, topics
+
+
+def _linear_match(bus: SwarmMessageBus, topic: str) -> list:
+    """Previous delivery path: scan every subscription."""
+    matches = []
+    for sub_id in list(bus.subscriptions.keys()):
+        topic_filter = bus.topic_filters.get(str(sub_id))
+        if topic_filter and topic_filter.matches(topic):
+            matches.append(sub_id)
+    return matches
+
+
+def _measure(lookup, topics: list, iterations: int) -> dict:
+    """Time individual lookups in microseconds over a zipf-ish topic stream."""
+    rng = random.Random(7)
+    # Hot topics dominate traffic, as heartbeats and health summaries do
+    stream = [topics[min(int(rng.paretovariate(1.2)) - 1, len(topics) - 1)]
+              for _ in range(iterations)]
+    samples = []
+    for topic in stream:
+        start = time.perf_counter_ns()
+        lookup(topic)
+        samples.append((time.perf_counter_ns() - start) / 1000)
+    return {
+        "mean": statistics.mean(samples),
+        "median": statistics.median(samples),
+        "p99": statistics.quantiles(samples, n=100)[98],
+    }
+
+
+def benchmark_routing() -> dict:
+    """Compare the three lookup strategies on the same bus."""
+    bus, topics = build_bus()
+
+    # Sanity check: the trie agrees with the linear scan
+    for topic in topics[:50]:
+        assert set(_linear_match(bus, topic)) == set(bus._match_subscribers(topic))
+
+    results = {"linear scan": _measure(lambda t: _linear_match(bus, t), topics, LOOKUPS // 10)}
+
+    bus.route_cache_size = 0
+    results["trie"] = _measure(bus._match_subscribers, topics, LOOKUPS)
+
+    bus.route_cache_size = 1024
+    bus._route_cache.clear()
+    bus.route_cache_hits = bus.route_cache_misses = 0
+    results["trie + memo"] = _measure(bus._match_subscribers, topics, LOOKUPS)
+    results["trie + memo"]["hit_rate"] = bus.route_cache_hits / LOOKUPS
+    return results
+
+
+def benchmark_churn() -> dict:
+    """Cost of subscribe/unsubscribe with the trie maintained."""
+    bus, topics = build_bus()
+    rng = random.Random(3)
+    subs = list(bus.subscriptions.keys())
+    start = time.perf_counter()
+    for _ in range(1000):
+        bus.unsubscribe(subs.pop(rng.randrange(len(subs))))
+        subs.append(bus.subscribe(rng.choice(topics), lambda message: None))
+    elapsed_us = (time.perf_counter() - start) * 1e6
+    return {"per_pair_us": elapsed_us / 1000}
+
+
+def print_results():
+    """Run all benchmarks and print results."""
+    print("=" * 64)
+    print("ASTRAGUARD MESSAGE BUS TOPIC ROUTING")
+    print("=" * 64)
+    print()
+
+    print(f"## {NUM_SUBSCRIPTIONS:,} subscriptions over {NUM_TOPICS:,} topics\n")
+    print("| Lookup        | Mean       | Median     | P99        |")
+    print("|---------------|------------|------------|------------|")
+    results = benchmark_routing()
+    for name, metrics in results.items():
+        print(
+            f"| {name:13} | "
+            f"{format_duration(metrics['mean']):10} | "
+            f"{format_duration(metrics['median']):10} | "
+            f"{format_duration(metrics['p99']):10} |"
+        )
+    print()
+    speedup = results["linear scan"]["mean"] / results["trie"]["mean"]
+    print(f"Trie speedup over linear scan: {speedup:,.0f}x")
+    print(f"Route memo hit rate: {results['trie + memo']['hit_rate']:.1%}")
+    print()
+
+    churn = benchmark_churn()
+    print(f"Unsubscribe + subscribe pair: {format_duration(churn['per_pair_us'])}")
+    print()
+    print("=" * 64)
+    print("BENCHMARK COMPLETE")
+    print("=" * 64)
+
+
+if __name__ == "__main__":
+    print_results()
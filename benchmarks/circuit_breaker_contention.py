@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Circuit Breaker Concurrency Benchmarks
+
+Compares the lock-based CircuitBreaker with the lock-free AsyncCircuitBreaker
+under many concurrent coroutines while a background thread scrapes metrics
+(as a Prometheus exporter or health endpoint would).
+Run with: python benchmarks/circuit_breaker_contention.py
+
+Output is formatted for inclusion in pull requests.
+"""
+
+import asyncio
+import threading
+import time
+
+# Add project root to path for imports
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.circuit_breaker import CircuitBreaker, AsyncCircuitBreaker
+
+
+CONCURRENCY = 500
+CALLS_PER_TASK = 40
+
+
+class TimedLock:
+    """RLock proxy that records time the event loop thread spends waiting."""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self.loop_thread = threading.get_ident()
+        self.wait_ns = 0
+        self.acquisitions = 0
+        self.contended = 0
+
+    def __enter__(self):
+        if threading.get_ident() != self.loop_thread:
+            self._lock.acquire()
+            return self
+        if self._lock.acquire(blocking=False):
+            self.acquisitions += 1
+            return self
+        start = time.perf_counter_ns()
+        self._lock.acquire()
+        self.wait_ns += time.perf_counter_ns() - start
+        self.acquisitions += 1
+        self.contended += 1
+        return self
+
+    def __exit__(self, *exc):
+        self._lock.release()
+        return False
+
+
+async def _protected_call():
+    await asyncio.sleep(0)
+    return True
+
+
+async def _drive(breaker) -> float:
+    """Run CONCURRENCY tasks through the breaker; return wall seconds."""
+    async def worker():
+        for _ in range(CALLS_PER_TASK):
+            await breaker.call(_protected_call)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(CONCURRENCY)))
+    return time.perf_counter() - start
+
+
+def _run(breaker, scrape: bool) -> dict:
+    """Benchmark one breaker, optionally with a metrics-scraping thread."""
+    stop = threading.Event()
+
+    def scraper():
+        while not stop.is_set():
+            breaker.get_metrics()
+
+    thread = threading.Thread(target=scraper, daemon=True) if scrape else None
+    if thread:
+        thread.start()
+    try:
+        elapsed = asyncio.run(_drive(breaker))
+    finally:
+        stop.set()
+        if thread:
+            thread.join()
+
+    calls = CONCURRENCY * CALLS_PER_TASK
+    result = {"calls_per_sec": calls / elapsed, "wait_ms": 0.0, "contended": 0, "acquisitions": 0}
+    lock = getattr(breaker, "_lock", None)
+    if isinstance(lock, TimedLock):
+        result.update(
+            wait_ms=lock.wait_ns / 1e6,
+            contended=lock.contended,
+            acquisitions=lock.acquisitions,
+        )
+    return result
+
+
+def benchmark_breakers() -> dict:
+    """Run both breakers with and without a concurrent scraper thread."""
+    results = {}
+    for scrape in (False, True):
+        locked = CircuitBreaker(name="locked", failure_threshold=5)
+        locked._lock = TimedLock()
+        results[("CircuitBreaker", scrape)] = _run(locked, scrape)
+        lock_free = AsyncCircuitBreaker(name="lock_free")
+        results[("AsyncCircuitBreaker", scrape)] = _run(lock_free, scrape)
+    return results
+
+
+def print_results():
+    """Run all benchmarks and print results."""
+    print("=" * 72)
+    print("ASTRAGUARD CIRCUIT BREAKER CONTENTION BENCHMARK")
+    print("=" * 72)
+    print()
+    print(f"## {CONCURRENCY} concurrent tasks x {CALLS_PER_TASK} calls\n")
+    print("| Breaker             | Scraper | Calls/sec  | Lock acq. | Contended | Loop wait  |")
+    print("|---------------------|---------|------------|-----------|-----------|------------|")
+    for (name, scrape), r in benchmark_breakers().items():
+        print(
+            f"| {name:19} | {'yes' if scrape else 'no':7} | "
+            f"{r['calls_per_sec']:10,.0f} | {r['acquisitions']:9,} | "
+            f"{r['contended']:9,} | {r['wait_ms']:8.2f}ms |"
+        )
+    print()
+    print("=" * 72)
+    print("BENCHMARK COMPLETE")
+    print("=" * 72)
+
+
+if __name__ == "__main__":
+    print_results()
@@ -8,6 +8,8 @@ Issue #399: Validate compression targets
 - LZ4: 619 bytes (-12%)
 - Total: <800B ✓ 85% compression
 - Roundtrip latency: <10ms
+- Per-stage timings: scalar struct loops vs NumPy stages
+- Per-peer contexts with keyframes under 0% / 1% / 10% loss
 """
 
 import time
@@ -15,7 +17,7 @@ import struct
 from datetime import datetime
 
 from astraguard.swarm.models import HealthSummary
-from astraguard.swarm.compressor import StateCompressor
+from astraguard.swarm.compressor import StateCompressor, lz4_level_for_budget, LZ4_MAX_LEVEL
 
 
 def create_test_summary(index: int = 0) -> HealthSummary:
@@ -197,6 +199,124 @@ def benchmark_latency_distribution():
     print(f"Target (<10ms): {'✓ PASS' if avg_compress + avg_decompress < 10 else '✗ FAIL'}")
 
 
+def _scalar_stages(summary: HealthSummary, prev_sig, level: int) -> tuple:
+    """Previous per-float struct implementation, timed per stage (ns)."""
+    import lz4.frame
+
+    t0 = time.perf_counter_ns()
+    deltas = [c - p for c, p in zip(summary.anomaly_signature, prev_sig)]
+    delta_data = struct.pack("<f", summary.risk_score)
+    delta_data += struct.pack("<f", summary.recurrence_score)
+    for value in deltas:
+        delta_data += struct.pack("<f", value)
+    t1 = time.perf_counter_ns()
+
+    quantized = delta_data[:8]
+    for offset in range(8, len(delta_data), 4):
+        value = struct.unpack_from("<f", delta_data, offset)[0]
+        clamped = max(-1.0, min(1.0, value))
+        quantized += struct.pack("<B", int(round((clamped + 1.0) / 2.0 * 255)))
+    t2 = time.perf_counter_ns()
+
+    lz4.frame.compress(quantized, compression_level=level)
+    t3 = time.perf_counter_ns()
+    return t1 - t0, t2 - t1, t3 - t2
+
+
+def benchmark_stage_timings(iterations: int = 2000):
+    """Per-stage timings: scalar struct loops vs NumPy stages, by LZ4 level."""
+    print("\n=== PER-STAGE TIMINGS (µs, mean of {} messages) ===".format(iterations))
+    summaries = [create_test_summary(i) for i in range(iterations)]
+
+    print("| Implementation       | Delta  | Quantize | LZ4    | Total  |")
+    print("|----------------------|--------|----------|--------|--------|")
+
+    def row(label, totals):
+        delta, quant, lz4_us = (t / iterations / 1000 for t in totals)
+        print(
+            f"| {label:20} | {delta:6.2f} | {quant:8.2f} | {lz4_us:6.2f} | "
+            f"{delta + quant + lz4_us:6.2f} |"
+        )
+
+    totals = [0, 0, 0]
+    prev_sig = summaries[0].anomaly_signature
+    for summary in summaries:
+        for i, t in enumerate(_scalar_stages(summary, prev_sig, LZ4_MAX_LEVEL)):
+            totals[i] += t
+        prev_sig = summary.anomaly_signature
+    row(f"scalar, level {LZ4_MAX_LEVEL}", totals)
+
+    for budget in (None, 50.0, 1000.0):
+        level = lz4_level_for_budget(budget)
+        compressor = StateCompressor(prev_state=summaries[0], latency_budget_us=budget)
+        totals = [0, 0, 0]
+        for summary in summaries:
+            compressor.compress_health(summary)
+            timings = compressor.stats.stage_timings_us
+            totals[0] += timings["delta"] * 1000
+            totals[1] += timings["quantize"] * 1000
+            totals[2] += timings["lz4"] * 1000
+        row(f"numpy, level {level}", totals)
+
+
+def benchmark_peer_loss(messages: int = 3000, keyframe_interval: int = 30):
+    """Per-peer contexts vs the shared context under simulated packet loss."""
+    import random
+    from astraguard.swarm.models import AgentID
+
+    print("\n=== PER-PEER DELTA CONTEXTS UNDER LOSS ({} messages) ===".format(messages))
+    sender = AgentID.create("astra-v3.0", "SAT-001-A")
+    receiver = AgentID.create("astra-v3.0", "SAT-002-A")
+    raw_size = 140
+
+    print("| Loss | Mode      | Avg bytes | Ratio vs raw | Decoded | Mean abs error |")
+    print("|------|-----------|-----------|--------------|---------|----------------|")
+    for loss in (0.0, 0.01, 0.10):
+        rng = random.Random(42)
+        summaries = [create_test_summary(i) for i in range(messages)]
+
+        # Shared context (version 1): receiver silently diverges after loss
+        encoder, decoder = StateCompressor(), StateCompressor()
+        sizes, errors, decoded = [], [], 0
+        for summary in summaries:
+            frame = encoder.compress_health(summary)
+            sizes.append(len(frame))
+            if rng.random() < loss:
+                continue
+            restored = decoder.decompress(frame)
+            decoded += 1
+            errors.append(sum(abs(o - r) for o, r in zip(
+                summary.anomaly_signature, restored.anomaly_signature)) / 32)
+        _print_loss_row(loss, "shared", sizes, raw_size, decoded, messages, errors)
+
+        # Per-peer contexts (version 2): keyframes + resync on gaps
+        rng = random.Random(42)
+        encoder = StateCompressor(keyframe_interval=keyframe_interval)
+        decoder = StateCompressor(resync_callback=lambda peer: encoder.request_keyframe(receiver))
+        sizes, errors, decoded = [], [], 0
+        for summary in summaries:
+            frame = encoder.compress_for_peer(receiver, summary)
+            sizes.append(len(frame))
+            if rng.random() < loss:
+                continue
+            restored = decoder.decompress_from_peer(sender, frame)
+            if restored is None:
+                continue
+            decoded += 1
+            errors.append(sum(abs(o - r) for o, r in zip(
+                summary.anomaly_signature, restored.anomaly_signature)) / 32)
+        _print_loss_row(loss, "per-peer", sizes, raw_size, decoded, messages, errors)
+
+
+def _print_loss_row(loss, mode, sizes, raw_size, decoded, messages, errors):
+    avg = sum(sizes) / len(sizes)
+    mean_error = sum(errors) / len(errors) if errors else float("nan")
+    print(
+        f"| {loss:4.0%} | {mode:9} | {avg:9.1f} | {100 * (1 - avg / raw_size):11.1f}% | "
+        f"{decoded / messages:6.1%} | {mean_error:14.4f} |"
+    )
+
+
 def main():
     """Run all benchmarks."""
     print("=" * 60)
@@ -209,6 +329,8 @@ def main():
     benchmark_full_pipeline()
     benchmark_multi_message()
     benchmark_latency_distribution()
+    benchmark_stage_timings()
+    benchmark_peer_loss()
 
     print("\n" + "=" * 60)
     print("SUMMARY")
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Consensus Throughput Benchmarks
+
+Runs a leader ConsensusEngine against 10, 100 and 1000 peer engines on a
+simulated network with 5ms one-way delay. Compares:
+- polling: the previous _wait_for_quorum (re-check every 100ms) with one
+  vote message per peer per proposal
+- event: quorum futures resolved on vote arrival, votes batched per peer
+Each mode runs sequential proposals and a pipelined burst of concurrent
+proposals, reporting proposals/s, time-to-quorum percentiles and network
+messages per proposal. Votes are routed only to the leader in both modes,
+so broadcast fan-out of votes is not counted against the polling path.
+Run with: python benchmarks/consensus_throughput.py
+
+Output is formatted for inclusion in pull requests.
+"""
+
+import asyncio
+import logging
+import statistics
+import time
+from datetime import datetime
+from types import SimpleNamespace
+
+# Add project root to path for imports
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from astraguard.swarm.consensus import ConsensusEngine
+from astraguard.swarm.models import AgentID, SatelliteRole, SwarmConfig
+from astraguard.swarm.registry import PeerState, SwarmRegistry
+
+
+PEER_COUNTS = (10, 100, 1000)
+LATENCY_MS = 5.0
+SEQUENTIAL_PROPOSALS = 10
+PIPELINED_PROPOSALS = 100
+
+
+class SimNetwork:
+    """Delivers published payloads to subscribed endpoints after LATENCY_MS."""
+
+    def __init__(self):
+        self.endpoints = {}
+        self.topic_endpoints = {}  # topic → subscribed endpoints
+        self.messages = 0
+        self._tasks = set()
+
+    def endpoint(self, agent_id: AgentID) -> "SimEndpoint":
+        self.endpoints[agent_id] = SimEndpoint(self, agent_id)
+        return self.endpoints[agent_id]
+
+    def deliver(self, targets, topic, payload) -> None:
+        for endpoint in targets:
+            for callback in endpoint.handlers.get(topic, ()):
+                task = asyncio.ensure_future(callback(payload))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+
+
+class SimEndpoint:
+    """Minimal bus facade for one agent."""
+
+    def __init__(self, network: SimNetwork, agent_id: AgentID):
+        self.network = network
+        self.agent_id = agent_id
+        self.handlers = {}
+
+    def subscribe(self, topic, callback, **kwargs):
+        self.handlers.setdefault(topic, []).append(callback)
+        self.network.topic_endpoints.setdefault(topic, []).append(self)
+
+    async def publish(self, topic, payload, qos=1, receiver=None, **kwargs):
+        self.network.messages += 1
+        targets = (
+            [self.network.endpoints[receiver]] if receiver is not None
+            else self.network.topic_endpoints.get(topic, [])
+        )
+        asyncio.get_running_loop().call_later(
+            LATENCY_MS / 1000.0, self.network.deliver, targets, topic, payload
+        )
+        return True
+
+
+class PollingConsensusEngine(ConsensusEngine):
+    """Previous quorum wait: re-read the registry every 100ms."""
+
+    async def _wait_for_quorum(self, proposal_id: str, action: str) -> bool:
+        while True:
+            alive_peers = self.registry.get_alive_peers()
+            quorum_fraction = self.PROPOSAL_TYPES.get(action, {}).get("quorum_fraction", 2/3)
+            quorum_size = max(1, int(len(alive_peers) * quorum_fraction))
+            votes = self.proposal_votes.get(proposal_id, set())
+            if len(votes) >= quorum_size:
+                return True
+            denials = self.proposal_denials.get(proposal_id, {})
+            if len(votes) + len(denials) == len(alive_peers):
+                return len(votes) >= quorum_size
+            await asyncio.sleep(0.1)
+
+
+def _build(n_peers: int, mode: str):
+    """Leader engine plus n_peers - 1 voting peers on one SimNetwork."""
+    network = SimNetwork()
+    leader_id = AgentID.create("astra-v3.0", "SAT-0000")
+    election = SimpleNamespace(is_leader=lambda: True, get_leader=lambda: leader_id)
+    registry = SwarmRegistry(
+        SwarmConfig(agent_id=leader_id, role=SatelliteRole.PRIMARY, constellation_id="astra-v3.0"),
+        leader_id,
+    )
+    engine_cls = PollingConsensusEngine if mode == "polling" else ConsensusEngine
+    batch_votes = mode != "polling"
+
+    leader_bus = network.endpoint(leader_id)
+    leader = engine_cls(
+        SimpleNamespace(agent_id=leader_id, SWARM_MODE_ENABLED=True),
+        election, registry, leader_bus, batch_votes=batch_votes,
+    )
+    for topic, handler in (
+        (ConsensusEngine.VOTE_GRANT_TOPIC, leader._handle_vote_grant),
+        (ConsensusEngine.VOTE_DENY_TOPIC, leader._handle_vote_deny),
+        (ConsensusEngine.VOTE_BATCH_TOPIC, leader._handle_vote_batch),
+    ):
+        leader_bus.subscribe(topic, handler)
+
+    now = datetime.utcnow()
+    for i in range(1, n_peers):
+        peer_id = AgentID.create("astra-v3.0", f"SAT-{i:04d}")
+        registry.peers[peer_id] = PeerState(
+            agent_id=peer_id, role=SatelliteRole.PRIMARY, last_heartbeat=now
+        )
+        bus = network.endpoint(peer_id)
+        peer = engine_cls(
+            SimpleNamespace(agent_id=peer_id, SWARM_MODE_ENABLED=True),
+            election, None, bus, batch_votes=batch_votes,
+        )
+        bus.subscribe(ConsensusEngine.PROPOSAL_REQUEST_TOPIC, peer._handle_proposal_request)
+    return network, leader
+
+
+async def _run(n_peers: int, mode: str, pipelined: bool) -> dict:
+    network, leader = _build(n_peers, mode)
+    count = PIPELINED_PROPOSALS if pipelined else SEQUENTIAL_PROPOSALS
+    start = time.perf_counter()
+    if pipelined:
+        results = await asyncio.gather(
+            *(leader.propose("attitude_adjust", {}, timeout=30) for _ in range(count))
+        )
+    else:
+        results = [await leader.propose("attitude_adjust", {}, timeout=30) for _ in range(count)]
+    elapsed = time.perf_counter() - start
+    await asyncio.sleep(LATENCY_MS / 1000.0 * 2)
+
+    assert all(results) and leader.metrics.timeout_count == 0
+    samples = list(leader.metrics.time_to_quorum_ms)
+    return {
+        "proposals_per_s": count / elapsed,
+        "ttq_p50_ms": statistics.median(samples),
+        "ttq_p99_ms": statistics.quantiles(samples, n=100)[98] if len(samples) > 1 else samples[0],
+        "messages_per_proposal": network.messages / count,
+    }
+
+
+def benchmark_consensus() -> dict:
+    """Sequential and pipelined proposals for each mode and peer count."""
+    results = {}
+    for n_peers in PEER_COUNTS:
+        for mode in ("polling", "event"):
+            for pipelined in (False, True):
+                results[(n_peers, mode, pipelined)] = asyncio.run(_run(n_peers, mode, pipelined))
+    return results
+
+
+def print_results():
+    """Run all benchmarks and print results."""
+    logging.disable(logging.INFO)
+    print("=" * 96)
+    print("ASTRAGUARD CONSENSUS THROUGHPUT")
+    print("=" * 96)
+    print()
+    print(
+        f"## {LATENCY_MS:.0f}ms one-way delay; {SEQUENTIAL_PROPOSALS} sequential or "
+        f"{PIPELINED_PROPOSALS} pipelined proposals\n"
+    )
+    print("| Peers | Quorum wait | Proposals  | Proposals/s | TTQ P50    | TTQ P99    | Msgs/proposal |")
+    print("|-------|-------------|------------|-------------|------------|------------|---------------|")
+    for (n_peers, mode, pipelined), r in benchmark_consensus().items():
+        shape = "pipelined" if pipelined else "sequential"
+        print(
+            f"| {n_peers:5} | {mode:11} | {shape:10} | {r['proposals_per_s']:11.1f} | "
+            f"{r['ttq_p50_ms']:8.1f}ms | {r['ttq_p99_ms']:8.1f}ms | {r['messages_per_proposal']:13.1f} |"
+        )
+    print()
+    print("=" * 96)
+    print("BENCHMARK COMPLETE")
+    print("=" * 96)
+
+
+if __name__ == "__main__":
+    print_results()
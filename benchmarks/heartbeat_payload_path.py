@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Heartbeat Payload Path Benchmarks
+
+Compares the previous heartbeat path with the binary payload path:
+- legacy: StateCompressor bytes are hex-encoded into a signed JSON dict,
+  the JSON string is JSON-encoded again by publish(), and the envelope is
+  SwarmMessage.to_dict() (hex payload) serialized as JSON; the receiver
+  reverses every step with fresh copies
+- binary: HealthBroadcaster.encode_broadcast() bytes in a length-prefixed
+  SwarmMessage envelope; the receiver decodes memoryviews into the frame
+Reports wire size, tracemalloc peak bytes per message and end-to-end
+heartbeat cost for a round of 1000 peers.
+Run with: python benchmarks/heartbeat_payload_path.py
+
+Output is formatted for inclusion in pull requests.
+"""
+
+import json
+import random
+import time
+import tracemalloc
+from datetime import datetime
+
+# Add project root to path for imports
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from astraguard.swarm.compressor import StateCompressor
+from astraguard.swarm.health_broadcaster import HealthBroadcaster
+from astraguard.swarm.models import AgentID, HealthSummary, SatelliteRole, SwarmConfig
+from astraguard.swarm.types import SwarmMessage
+
+
+PEERS = 1000
+ALLOC_SAMPLES = 200
+TOPIC = "health/astra-v3.0"
+
+
+def _broadcaster(serial: str) -> HealthBroadcaster:
+    agent_id = AgentID.create("astra-v3.0", serial)
+    config = SwarmConfig(
+        agent_id=agent_id, role=SatelliteRole.PRIMARY, constellation_id="astra-v3.0"
+    )
+    # Registry and bus are not used by the encode/decode path
+    return HealthBroadcaster(config, agent_id, None, None, StateCompressor())
+
+
+def _health(rng: random.Random) -> HealthSummary:
+    return HealthSummary(
+        anomaly_signature=[rng.uniform(-1, 1) for _ in range(32)],
+        risk_score=rng.random(),
+        recurrence_score=rng.random() * 10,
+        timestamp=datetime.utcnow(),
+    )
+
+
+def legacy_send(broadcaster: HealthBroadcaster, health: HealthSummary) -> bytes:
+    """Previous sender path: hex inside JSON, JSON-encoded twice, JSON envelope."""
+    compressed = broadcaster.compressor.compress_health(health)
+    payload = {
+        "agent_id": broadcaster.agent_id.uuid.hex,
+        "constellation": broadcaster.agent_id.constellation,
+        "compressed_health": compressed.hex(),
+        "timestamp": datetime.utcnow().isoformat(),
+    }
+    payload["signature"] = broadcaster._sign_payload(payload)
+    payload_bytes = json.dumps(json.dumps(payload)).encode("utf-8")
+    message = SwarmMessage(topic=TOPIC, payload=payload_bytes, sender=broadcaster.agent_id)
+    return json.dumps(message.to_dict()).encode("utf-8")
+
+
+def legacy_receive(wire: bytes, key: bytes, compressor: StateCompressor) -> HealthSummary:
+    """Previous receiver path."""
+    message = SwarmMessage.from_dict(json.loads(wire))
+    payload = json.loads(json.loads(message.payload))
+    if not HealthBroadcaster.verify_signature(payload, key):
+        raise ValueError("bad signature")
+    return compressor.decompress(bytes.fromhex(payload["compressed_health"]))
+
+
+def binary_send(broadcaster: HealthBroadcaster, health: HealthSummary) -> bytes:
+    """Binary sender path."""
+    compressed = broadcaster.compressor.compress_health(health)
+    payload = broadcaster.encode_broadcast(compressed)
+    return SwarmMessage(topic=TOPIC, payload=payload, sender=broadcaster.agent_id).to_bytes()
+
+
+def binary_receive(wire: bytes, key: bytes, compressor: StateCompressor) -> HealthSummary:
+    """Binary receiver path: views into the received buffer."""
+    message = SwarmMessage.from_bytes(wire)
+    decoded = HealthBroadcaster.decode_broadcast(message.payload, key)
+    if decoded is None:
+        raise ValueError("bad signature")
+    return compressor.decompress(decoded["compressed_health"])
+
+
+PATHS = {
+    "legacy json/hex": (legacy_send, legacy_receive),
+    "binary": (binary_send, binary_receive),
+}
+
+
+def _peak_bytes(fn, *args) -> int:
+    """Transient tracemalloc peak for one call, above the current baseline."""
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    fn(*args)
+    return tracemalloc.get_traced_memory()[1] - baseline
+
+
+def benchmark_allocations() -> dict:
+    """Wire size and tracemalloc peak bytes per message for each path."""
+    rng = random.Random(5)
+    broadcaster = _broadcaster("SAT-000-A")
+    receiver = StateCompressor()
+    results = {}
+    for name, (send, receive) in PATHS.items():
+        healths = [_health(rng) for _ in range(ALLOC_SAMPLES)]
+        wire = send(broadcaster, healths[0])
+        tracemalloc.start()
+        send_peak = recv_peak = 0
+        for health in healths:
+            send_peak += _peak_bytes(send, broadcaster, health)
+            recv_peak += _peak_bytes(receive, wire, broadcaster.private_key, receiver)
+        tracemalloc.stop()
+        results[name] = {
+            "wire_bytes": len(wire),
+            "send_peak": send_peak / ALLOC_SAMPLES,
+            "recv_peak": recv_peak / ALLOC_SAMPLES,
+        }
+    return results
+
+
+def benchmark_round() -> dict:
+    """Every one of PEERS peers heartbeats once; one receiver processes them all."""
+    rng = random.Random(9)
+    broadcasters = [_broadcaster(f"SAT-{i:04d}-A") for i in range(PEERS)]
+    healths = [_health(rng) for _ in range(PEERS)]
+    results = {}
+    for name, (send, receive) in PATHS.items():
+        receiver = StateCompressor()
+        start = time.perf_counter()
+        wires = [send(b, h) for b, h in zip(broadcasters, healths)]
+        sent = time.perf_counter()
+        for b, wire in zip(broadcasters, wires):
+            receive(wire, b.private_key, receiver)
+        done = time.perf_counter()
+        results[name] = {
+            "send_us": (sent - start) / PEERS * 1e6,
+            "recv_us": (done - sent) / PEERS * 1e6,
+            "round_ms": (done - start) * 1000,
+            "round_bytes": sum(len(w) for w in wires),
+        }
+    return results
+
+
+def print_results():
+    """Run all benchmarks and print results."""
+    print("=" * 72)
+    print("ASTRAGUARD HEARTBEAT PAYLOAD PATH")
+    print("=" * 72)
+    print()
+    print(f"## Per message (tracemalloc peak, mean of {ALLOC_SAMPLES})\n")
+    print("| Path            | Wire bytes | Send peak alloc | Receive peak alloc |")
+    print("|-----------------|------------|-----------------|--------------------|")
+    for name, r in benchmark_allocations().items():
+        print(
+            f"| {name:15} | {r['wire_bytes']:10} | {r['send_peak']:13,.0f}B | "
+            f"{r['recv_peak']:16,.0f}B |"
+        )
+    print()
+    print(f"## Heartbeat round, {PEERS} peers\n")
+    print("| Path            | Send/msg   | Receive/msg | Round     | Round bytes |")
+    print("|-----------------|------------|-------------|-----------|-------------|")
+    for name, r in benchmark_round().items():
+        print(
+            f"| {name:15} | {r['send_us']:8.1f}μs | {r['recv_us']:9.1f}μs | "
+            f"{r['round_ms']:7.1f}ms | {r['round_bytes']:11,} |"
+        )
+    print()
+    print("=" * 72)
+    print("BENCHMARK COMPLETE")
+    print("=" * 72)
+
+
+if __name__ == "__main__":
+    print_results()
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Leader Election Scaling Benchmarks
+
+Runs a swarm of LeaderElection agents on a simulated network (2ms one-way
+delay) and compares the previous polled election against lease-based
+leadership with pre-vote and adaptive heartbeats, at several constellation
+sizes:
+- steady state under a stable leader: messages published, per-agent
+  deliveries and follower loop wakeups per second
+- failover: time from leader loss until exactly one survivor is in LEADER
+  state holding the lease, and messages published meanwhile ("never" if
+  that does not happen within 3 leases)
+The "Leaders" column counts agents in LEADER state after the first
+election; above 1 means competing candidates all reached quorum. The
+polled engine is only run up to POLLED_MAX_AGENTS.
+The lease and heartbeat intervals are scaled down by TIME_SCALE so runs
+are short (1s lease, 100ms base heartbeat); election timeouts keep their
+production values. All figures are wall-clock at that scaled timing.
+Run with: python benchmarks/leader_election_scaling.py
+
+Output is formatted for inclusion in pull requests.
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+# Add project root to path for imports
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from astraguard.swarm.leader_election import ElectionState, LeaderElection
+from astraguard.swarm.models import AgentID
+from astraguard.swarm.types import QoSLevel
+
+
+SIZES = (5, 25, 100, 250)
+POLLED_MAX_AGENTS = 25    # Larger polled swarms never elect and take minutes to simulate
+TIME_SCALE = 10
+LATENCY_MS = 2.0
+STEADY_S = 1.0            # Seconds measured under a stable leader
+
+
+class SimNetwork:
+    """Delivers dict payloads to subscribed agents after LATENCY_MS."""
+
+    def __init__(self):
+        self.topic_handlers = {}  # topic → [(agent_id, callback)]
+        self.down = set()
+        self.published = 0
+        self.delivered = 0
+
+    def bus(self, agent_id: AgentID):
+        return SimpleNamespace(
+            subscribe=lambda topic, callback, **kwargs: self.topic_handlers.setdefault(
+                topic, []
+            ).append((agent_id, callback)),
+            publish=lambda topic, payload, qos=None, receiver=None, **kwargs: self._publish(
+                agent_id, topic, payload, receiver
+            ),
+        )
+
+    async def _publish(self, sender, topic, payload, receiver) -> bool:
+        if sender in self.down:
+            return False
+        self.published += 1
+        asyncio.get_running_loop().call_later(
+            LATENCY_MS / 1000.0, self._deliver, topic, payload, receiver
+        )
+        return True
+
+    def _deliver(self, topic, payload, receiver) -> None:
+        for owner, callback in self.topic_handlers.get(topic, ()):
+            if owner in self.down or (receiver is not None and owner != receiver):
+                continue
+            self.delivered += 1
+            asyncio.ensure_future(callback(payload))
+
+
+class _Scaled:
+    """Lease and heartbeat constants divided by TIME_SCALE, plus a follower wakeup counter."""
+
+    HEARTBEAT_INTERVAL_MS = LeaderElection.HEARTBEAT_INTERVAL_MS // TIME_SCALE
+    MAX_HEARTBEAT_INTERVAL_MS = LeaderElection.MAX_HEARTBEAT_INTERVAL_MS // TIME_SCALE
+    LEASE_VALIDITY_SECONDS = LeaderElection.LEASE_VALIDITY_SECONDS / TIME_SCALE
+    wakeups = 0
+
+    async def _follower_loop(self) -> None:
+        self.wakeups += 1
+        await super()._follower_loop()
+
+
+class LeaseElection(_Scaled, LeaderElection):
+    """Current engine at scaled timing."""
+
+
+class PolledElection(_Scaled, LeaderElection):
+    """Previous engine: polled timeouts, fixed heartbeats, no pre-vote or acks."""
+
+    async def _follower_loop(self) -> None:
+        self.wakeups += 1
+        time_until_timeout = (self.lease_expiry - datetime.now()).total_seconds()
+        if time_until_timeout <= 0:
+            await self._become_candidate()
+        else:
+            await asyncio.sleep(min(time_until_timeout, 0.05))
+
+    async def _candidate_loop(self) -> None:
+        if not self.election_start_time:
+            self.election_start_time = datetime.now()
+            self.current_term += 1
+            self.voted_for = self.config.agent_id
+            self.votes_received = {self.config.agent_id}
+            for peer in self.registry.get_alive_peers():
+                if peer != self.config.agent_id:
+                    await self.bus.publish(
+                        self.VOTE_REQUEST_TOPIC,
+                        {"term": self.current_term, "candidate_id": self.config.agent_id.satellite_serial, "candidate_uptime": self._get_uptime_seconds()},
+                        qos=QoSLevel.RELIABLE,
+                    )
+        if len(self.votes_received) >= self._calculate_quorum_size():
+            self.metrics.election_count += 1
+            await self._become_leader()
+            return
+        election_duration = (datetime.now() - self.election_start_time).total_seconds() * 1000
+        if election_duration > self._random_timeout().total_seconds() * 1000:
+            self.election_start_time = None
+            self.votes_received = set()
+        await asyncio.sleep(0.01)
+
+    async def _leader_loop(self) -> None:
+        await asyncio.sleep(0.1)
+
+    async def _heartbeat_loop(self) -> None:
+        while self._running:
+            if self.state == ElectionState.LEADER:
+                await self._send_heartbeat()
+            await asyncio.sleep(self.HEARTBEAT_INTERVAL_MS / 1000)
+
+    async def _send_heartbeat(self) -> None:
+        await self.bus.publish(self.HEARTBEAT_TOPIC, {"leader_id": self.config.agent_id.satellite_serial, "term": self.current_term, "timestamp": datetime.now().isoformat()}, qos=QoSLevel.RELIABLE)
+
+    async def _become_leader(self) -> None:
+        self.state = ElectionState.LEADER
+        self.current_leader = self.config.agent_id
+        self.lease_expiry = datetime.now() + timedelta(seconds=self.LEASE_VALIDITY_SECONDS)
+        self.election_start_time = None
+        await self._send_heartbeat()
+
+    async def _handle_vote_request(self, message: dict) -> None:
+        term = message.get("term", 0)
+        if term > self.current_term:
+            self.current_term = term
+            self.state = ElectionState.FOLLOWER
+            self.voted_for = None
+        if term < self.current_term:
+            return
+        if self.voted_for is None or self._should_vote_for(message["candidate_id"], message["candidate_uptime"]):
+            self.voted_for = AgentID.create("astra-v3.0", message["candidate_id"])
+            await self.bus.publish(self.VOTE_GRANT_TOPIC, {"term": self.current_term, "voter_id": self.config.agent_id.satellite_serial}, qos=QoSLevel.RELIABLE)
+
+    async def _handle_heartbeat(self, message: dict) -> None:
+        term = message.get("term", 0)
+        if term < self.current_term:
+            return
+        if term > self.current_term:
+            self.current_term = term
+            if self.state != ElectionState.FOLLOWER:
+                self.state = ElectionState.FOLLOWER
+                self.election_start_time = None
+        self.current_leader = AgentID.create("astra-v3.0", message["leader_id"])
+        self.lease_expiry = datetime.now() + timedelta(seconds=self.LEASE_VALIDITY_SECONDS)
+        if self.state == ElectionState.CANDIDATE:
+            self.state = ElectionState.FOLLOWER
+            self.election_start_time = None
+
+
+async def _wait_until(predicate, timeout: float) -> bool:
+    deadline = time.perf_counter() + timeout
+    while not predicate():
+        if time.perf_counter() > deadline:
+            return False
+        await asyncio.sleep(0.001)
+    return True
+
+
+def _single_leader(elections) -> bool:
+    leaders = [e for e in elections if e.state == ElectionState.LEADER]
+    return len(leaders) == 1 and leaders[0].is_leader()
+
+
+async def _run(engine_cls, n_agents: int) -> dict:
+    network = SimNetwork()
+    agents = [AgentID.create("astra-v3.0", f"SAT-{i:04d}") for i in range(n_agents)]
+    alive = set(agents)
+    registry = SimpleNamespace(get_alive_peers=lambda: list(alive))
+    elections = [
+        engine_cls(
+            SimpleNamespace(agent_id=agent_id, SWARM_MODE_ENABLED=True),
+            registry,
+            network.bus(agent_id),
+        )
+        for agent_id in agents
+    ]
+    for election in elections:
+        await election.start()
+
+    lease_s = engine_cls.LEASE_VALIDITY_SECONDS
+    try:
+        if not await _wait_until(lambda: any(e.is_leader() for e in elections), 5 * lease_s):
+            return None  # No leader emerged
+        await asyncio.sleep(lease_s)  # Let heartbeat backoff settle
+        leaders = sum(e.state == ElectionState.LEADER for e in elections)
+
+        # Steady state
+        published, delivered = network.published, network.delivered
+        wakeups = sum(e.wakeups for e in elections)
+        await asyncio.sleep(STEADY_S)
+        steady = {
+            "published_per_s": (network.published - published) / STEADY_S,
+            "delivered_per_s": (network.delivered - delivered) / STEADY_S,
+            "wakeups_per_s": (sum(e.wakeups for e in elections) - wakeups) / STEADY_S,
+        }
+
+        # Failover
+        leader = next(e for e in elections if e.is_leader())
+        survivors = [e for e in elections if e is not leader]
+        network.down.add(leader.config.agent_id)
+        alive.discard(leader.config.agent_id)
+        await leader.stop()
+        published = network.published
+        start = time.perf_counter()
+        converged = await _wait_until(lambda: _single_leader(survivors), 3 * lease_s)
+        failover_s = time.perf_counter() - start
+        return {
+            **steady,
+            "leaders": leaders,
+            "failover_s": failover_s if converged else None,
+            "failover_messages": network.published - published,
+            "max_term": max(e.current_term for e in survivors),
+        }
+    finally:
+        for election in elections:
+            await election.stop()
+
+
+def benchmark_election() -> dict:
+    """Steady-state traffic and failover for each engine and swarm size."""
+    results = {}
+    for n_agents in SIZES:
+        for label, engine_cls in (("polled", PolledElection), ("lease", LeaseElection)):
+            if engine_cls is PolledElection and n_agents > POLLED_MAX_AGENTS:
+                continue
+            results[(n_agents, label)] = asyncio.run(_run(engine_cls, n_agents))
+    return results
+
+
+def print_results():
+    """Run all benchmarks and print results."""
+    logging.disable(logging.WARNING)
+    print("=" * 112)
+    print("ASTRAGUARD LEADER ELECTION SCALING")
+    print("=" * 112)
+    print()
+    print(
+        f"## {LATENCY_MS:.0f}ms one-way delay (simulated); lease and heartbeats scaled "
+        f"1/{TIME_SCALE} ({LeaderElection.LEASE_VALIDITY_SECONDS / TIME_SCALE:.0f}s lease)\n"
+    )
+    print("| Agents | Engine | Leaders | Publishes/s | Deliveries/s | Wakeups/s | Failover  | Failover msgs | Term after |")
+    print("|--------|--------|---------|-------------|--------------|-----------|-----------|---------------|------------|")
+    for (n_agents, label), r in benchmark_election().items():
+        if r is None:
+            print(f"| {n_agents:6} | {label:6} | {'none':>7} | {'no leader elected within 5 leases':^88} |")
+            continue
+        failover = f"{r['failover_s']:7.2f}s" if r["failover_s"] is not None else f"{'never':>8}"
+        print(
+            f"| {n_agents:6} | {label:6} | {r['leaders']:7} | {r['published_per_s']:11.2f} | "
+            f"{r['delivered_per_s']:12.1f} | {r['wakeups_per_s']:9.1f} | {failover:9} | "
+            f"{r['failover_messages']:13} | {r['max_term']:10} |"
+        )
+    print()
+    print("=" * 112)
+    print("BENCHMARK COMPLETE")
+    print("=" * 112)
+
+
+if __name__ == "__main__":
+    print_results()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Registry Liveness Benchmarks
+
+Compares the previous full-scan liveness queries (walk every PeerState and
+rebuild the alive list on each call) with the incremental deadline-heap
+tracking in SwarmRegistry, at 5,000 peers:
+- get_alive_peers / get_quorum_size / get_registry_stats per call
+- heartbeat recording cost (listener + heap bookkeeping)
+- queries after 1% of peers time out
+Run with: python benchmarks/registry_liveness.py
+
+Output is formatted for inclusion in pull requests.
+"""
+
+import time
+from datetime import datetime, timedelta
+
+# Add project root to path for imports
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from astraguard.swarm.models import AgentID, SatelliteRole, SwarmConfig
+from astraguard.swarm.registry import HEARTBEAT_TIMEOUT, PeerState, SwarmRegistry
+
+
+PEERS = 5000
+QUERY_ITERATIONS = 200
+
+
+def _registry(peers: int) -> SwarmRegistry:
+    agent_id = AgentID.create("astra-v3.0", "SAT-00000")
+    config = SwarmConfig(
+        agent_id=agent_id, role=SatelliteRole.PRIMARY, constellation_id="astra-v3.0"
+    )
+    registry = SwarmRegistry(config, agent_id)
+    now = datetime.utcnow()
+    for i in range(1, peers):
+        peer_id = AgentID.create("astra-v3.0", f"SAT-{i:05d}")
+        registry.peers[peer_id] = PeerState(
+            agent_id=peer_id, role=SatelliteRole.PRIMARY, last_heartbeat=now
+        )
+    return registry
+
+
+def legacy_alive_peers(registry: SwarmRegistry) -> list:
+    """Previous get_alive_peers: full scan per call."""
+    alive = []
+    now = datetime.utcnow()
+    for peer_state in registry.peers.values():
+        if (now - peer_state.last_heartbeat).total_seconds() <= HEARTBEAT_TIMEOUT:
+            alive.append(peer_state.agent_id)
+    return alive
+
+
+def legacy_stats(registry: SwarmRegistry) -> dict:
+    """Previous get_registry_stats: two full scans (alive list + quorum)."""
+    alive = legacy_alive_peers(registry)
+    quorum = len(legacy_alive_peers(registry)) // 2 + 1
+    return {"alive_peers": len(alive), "quorum_size": quorum}
+
+
+def _per_call_us(fn, iterations: int = QUERY_ITERATIONS) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def benchmark_queries() -> dict:
+    """Per-call query cost, full scan vs incremental."""
+    registry = _registry(PEERS)
+    assert len(legacy_alive_peers(registry)) == len(registry.get_alive_peers()) == PEERS
+    return {
+        "get_alive_peers": (
+            _per_call_us(lambda: legacy_alive_peers(registry)),
+            _per_call_us(registry.get_alive_peers),
+        ),
+        "get_quorum_size": (
+            _per_call_us(lambda: len(legacy_alive_peers(registry)) // 2 + 1),
+            _per_call_us(registry.get_quorum_size),
+        ),
+        "get_registry_stats": (
+            _per_call_us(lambda: legacy_stats(registry)),
+            _per_call_us(registry.get_registry_stats),
+        ),
+    }
+
+
+def benchmark_heartbeats() -> dict:
+    """Cost of a heartbeat round with and without registry bookkeeping."""
+    registry = _registry(PEERS)
+    states = list(registry.peers.values())
+    detached = [
+        PeerState(agent_id=s.agent_id, role=s.role, last_heartbeat=s.last_heartbeat)
+        for s in states
+    ]
+    start = time.perf_counter()
+    for state in detached:
+        state.record_heartbeat()
+    plain = time.perf_counter() - start
+    start = time.perf_counter()
+    for state in states:
+        state.record_heartbeat()
+    tracked = time.perf_counter() - start
+    return {"plain_us": plain / PEERS * 1e6, "tracked_us": tracked / PEERS * 1e6}
+
+
+def benchmark_churn() -> dict:
+    """1% of peers time out; first query after expiry vs steady state."""
+    registry = _registry(PEERS)
+    stale = datetime.utcnow() - timedelta(seconds=HEARTBEAT_TIMEOUT - 0.05)
+    victims = list(registry.peers.values())[1:PEERS // 100 + 1]
+    for state in victims:
+        state.last_heartbeat = stale
+    time.sleep(0.06)
+    version = registry.alive_version
+    start = time.perf_counter()
+    alive = registry.get_alive_peers()
+    first = (time.perf_counter() - start) * 1e6
+    return {
+        "expired": PEERS - len(alive),
+        "version_bumps": registry.alive_version - version,
+        "first_query_us": first,
+        "steady_query_us": _per_call_us(registry.get_alive_peers),
+        "legacy_query_us": _per_call_us(lambda: legacy_alive_peers(registry), 20),
+    }
+
+
+def print_results():
+    """Run all benchmarks and print results."""
+    print("=" * 72)
+    print("ASTRAGUARD REGISTRY LIVENESS")
+    print("=" * 72)
+    print()
+    print(f"## Query cost, {PEERS:,} alive peers (mean of {QUERY_ITERATIONS})\n")
+    print("| Query              | Full scan   | Incremental | Speedup |")
+    print("|--------------------|-------------|-------------|---------|")
+    for name, (legacy, incremental) in benchmark_queries().items():
+        print(
+            f"| {name:18} | {legacy:9.1f}μs | {incremental:9.2f}μs | "
+            f"{legacy / incremental:6.0f}x |"
+        )
+    print()
+    r = benchmark_heartbeats()
+    print(f"## Heartbeat recording, {PEERS:,} peers\n")
+    print("| Path                    | Per heartbeat |")
+    print("|-------------------------|---------------|")
+    print(f"| detached PeerState      | {r['plain_us']:11.2f}μs |")
+    print(f"| registry-tracked        | {r['tracked_us']:11.2f}μs |")
+    print()
+    r = benchmark_churn()
+    print(f"## Churn: {r['expired']} of {PEERS:,} peers time out\n")
+    print("| Metric                          | Value       |")
+    print("|---------------------------------|-------------|")
+    print(f"| Version bumps (one per sweep)   | {r['version_bumps']:11} |")
+    print(f"| First query after expiry        | {r['first_query_us']:9.1f}μs |")
+    print(f"| Steady-state query              | {r['steady_query_us']:9.2f}μs |")
+    print(f"| Full-scan query                 | {r['legacy_query_us']:9.1f}μs |")
+    print()
+    print("=" * 72)
+    print("BENCHMARK COMPLETE")
+    print("=" * 72)
+
+
+if __name__ == "__main__":
+    print_results()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Safety Simulator Scaling Benchmarks
+
+Validation latency of SwarmImpactSimulator.validate_action versus
+constellation size, against a SwarmRegistry populated with N alive peers.
+Each size runs a mix of attitude_adjust, load_shed and thermal_maneuver
+validations. Compares:
+- legacy: the previous simulator, where every satellite neighbored every
+  other one and cascade risk was accumulated one neighbor at a time
+- sparse (cold): the ISL ring graph with CASCADE_HOPS sparse matrix-vector
+  products, with fresh parameters on every call so nothing is memoized
+- sparse (memoized): repeated validations of the same actions on an
+  unchanged topology
+Also reports the load_shed cascade risk, which the complete-graph model
+saturated at 1.0 once the constellation grew.
+Run with: python benchmarks/safety_simulator_scaling.py
+
+Output is formatted for inclusion in pull requests.
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import List
+from unittest.mock import Mock
+
+# Add project root to path for imports
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from astraguard.swarm.models import AgentID, SatelliteRole, SwarmConfig
+from astraguard.swarm.registry import PeerState, SwarmRegistry
+from astraguard.swarm.safety_simulator import ActionType, SwarmImpactSimulator
+
+
+SIZES = (5, 100, 1_000, 5_000)
+LEGACY_MAX_SIZE = 1_000   # Larger sizes take seconds per load_shed validation
+ROUNDS = 20               # Validations per action type
+ACTIONS = (
+    ("attitude_adjust", "angle_degrees", 0.5),
+    ("load_shed", "shed_percent", 20.0),
+    ("thermal_maneuver", "delta_temperature", 8.0),
+)
+
+
+class LegacySwarmImpactSimulator(SwarmImpactSimulator):
+    """Previous behaviour: complete neighbor graph, no memoization."""
+
+    def _topology_key(self):
+        self._results.clear()  # Nothing is ever reused
+        return None
+
+    async def _propagate_to_neighbors(self, base_risk: float, affected_agents: List[str]) -> float:
+        if not affected_agents or base_risk == 0:
+            return 0.0
+        total_cascade_risk = 0.0
+        for agent_serial in affected_agents:
+            for _ in await self._get_agent_neighbors(agent_serial):
+                total_cascade_risk += base_risk * 0.15
+        return min(1.0, total_cascade_risk / len(affected_agents))
+
+    async def _get_agent_neighbors(self, agent_serial: str) -> List[str]:
+        peers = self.registry.get_alive_peers()
+        return [p.satellite_serial for p in peers if p.satellite_serial != agent_serial]
+
+
+def _make_registry(size: int) -> SwarmRegistry:
+    agent_id = AgentID.create("astra-v3.0", "SAT-00000")
+    config = SwarmConfig(
+        agent_id=agent_id,
+        constellation_id="astra-v3.0",
+        role=SatelliteRole.PRIMARY,
+        bandwidth_limit_kbps=10,
+        peers={},
+    )
+    registry = SwarmRegistry(config, agent_id)
+    now = datetime.utcnow()
+    for i in range(1, size):
+        peer_id = AgentID.create("astra-v3.0", f"SAT-{i:05d}")
+        registry.peers[peer_id] = PeerState(
+            agent_id=peer_id, role=SatelliteRole.BACKUP, last_heartbeat=now
+        )
+    return registry
+
+
+async def _run(simulator: SwarmImpactSimulator, vary_params: bool) -> float:
+    """Mean validation latency in ms."""
+    elapsed = 0.0
+    for round_index in range(ROUNDS):
+        for action, param, value in ACTIONS:
+            if vary_params:
+                value = value * (1 + round_index * 1e-6)
+            t0 = time.perf_counter()
+            await simulator.validate_action(action, {param: value}, "constellation")
+            elapsed += time.perf_counter() - t0
+    return elapsed / (ROUNDS * len(ACTIONS)) * 1000
+
+
+def benchmark_scaling() -> dict:
+    """Legacy vs sparse validation latency for each constellation size."""
+    results = {}
+    for size in SIZES:
+        registry = _make_registry(size)
+        config = Mock(spec=SwarmConfig)
+        row = {}
+        if size <= LEGACY_MAX_SIZE:
+            legacy = LegacySwarmImpactSimulator(registry=registry, config=config)
+            row["legacy_ms"] = asyncio.run(_run(legacy, vary_params=True))
+            row["legacy_cascade"] = asyncio.run(
+                legacy._simulate_action(ActionType.LOAD_SHED, {"shed_percent": 20.0})
+            ).cascade_risk
+        sparse = SwarmImpactSimulator(registry=registry, config=config)
+        row["cold_ms"] = asyncio.run(_run(sparse, vary_params=True))
+        row["warm_ms"] = asyncio.run(_run(sparse, vary_params=False))
+        row["cascade"] = asyncio.run(
+            sparse._simulate_action(ActionType.LOAD_SHED, {"shed_percent": 20.0})
+        ).cascade_risk
+        row["links"] = sparse._get_graph().link_count
+        results[size] = row
+    return results
+
+
+def print_results():
+    """Run all benchmarks and print results."""
+    logging.disable(logging.WARNING)
+    print("=" * 112)
+    print("ASTRAGUARD SAFETY SIMULATOR SCALING")
+    print("=" * 112)
+    print()
+    print(
+        f"## Mean validate_action latency over {ROUNDS} rounds of "
+        f"{', '.join(a for a, _, _ in ACTIONS)}; "
+        f"{SwarmImpactSimulator.CASCADE_HOPS} cascade hops, "
+        f"{2 * SwarmImpactSimulator.ISL_NEIGHBORS_PER_SIDE} ISLs per satellite\n"
+    )
+    print("| Satellites | ISL links | Legacy    | Sparse cold | Sparse memoized | Speedup (cold) | load_shed cascade (legacy → sparse) |")
+    print("|------------|-----------|-----------|-------------|-----------------|----------------|-------------------------------------|")
+    for size, r in benchmark_scaling().items():
+        if "legacy_ms" in r:
+            legacy = f"{r['legacy_ms']:7.2f}ms"
+            speedup = f"{r['legacy_ms'] / r['cold_ms']:13.1f}x"
+            cascade = f"{r['legacy_cascade']:.4f} → {r['cascade']:.4f}"
+        else:
+            legacy = "  skipped"
+            speedup = f"{'-':>14}"
+            cascade = f"     - → {r['cascade']:.4f}"
+        print(
+            f"| {size:10,} | {r['links']:9,} | {legacy} | {r['cold_ms']:9.3f}ms | "
+            f"{r['warm_ms']:13.3f}ms | {speedup} | {cascade:>35} |"
+        )
+    print()
+    print("=" * 112)
+    print("BENCHMARK COMPLETE")
+    print("=" * 112)
+
+
+if __name__ == "__main__":
+    print_results()
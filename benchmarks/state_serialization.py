@@ -172,11 +172,49 @@ def benchmark_large_constellation() -> Dict[str, Any]:
     }
 
 
+def benchmark_codec_comparison() -> Dict[str, Any]:
+    """Compare size and ns/msg of JSON, JSON+LZ4 and binary HealthSummary codecs."""
+    summary = HealthSummary(
+        anomaly_signature=[0.1 * i for i in range(32)],
+        risk_score=0.75,
+        recurrence_score=5.2,
+        timestamp=datetime.utcnow(),
+    )
+    iterations = 5000
+    variants = [
+        ("json", SwarmSerializer(validate=False), {"compress": False}),
+        ("json_validated", SwarmSerializer(validate=True), {"compress": False}),
+        ("binary_f32", SwarmSerializer(validate=False), {"codec": "binary"}),
+        ("binary_f16", SwarmSerializer(validate=False, signature_float16=True), {"codec": "binary"}),
+    ]
+    if SwarmSerializer()._use_lz4:
+        variants.insert(2, ("json_lz4", SwarmSerializer(validate=False), {"compress": True}))
+
+    result: Dict[str, Any] = {"test": "HealthSummary Codec Comparison"}
+    for name, serializer, kwargs in variants:
+        compressed = kwargs.get("compress", False)
+        start = time.perf_counter_ns()
+        for _ in range(iterations):
+            data = serializer.serialize_health(summary, **kwargs)
+        encode_ns = (time.perf_counter_ns() - start) / iterations
+
+        start = time.perf_counter_ns()
+        for _ in range(iterations):
+            serializer.deserialize_health(data, compressed=compressed)
+        decode_ns = (time.perf_counter_ns() - start) / iterations
+
+        result[f"{name}_size_bytes"] = len(data)
+        result[f"{name}_encode_ns_per_msg"] = f"{encode_ns:,.0f}"
+        result[f"{name}_decode_ns_per_msg"] = f"{decode_ns:,.0f}"
+    return result
+
+
 def run_all_benchmarks() -> List[Dict[str, Any]]:
     """Run all benchmarks and return results."""
     return [
         benchmark_json_serialization(),
         benchmark_lz4_compression(),
+        benchmark_codec_comparison(),
         benchmark_swarm_config_serialization(),
         benchmark_large_constellation(),
     ]
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Swarm Decision Context Benchmarks
+
+Times SwarmDecisionLoop.step() against a real SwarmRegistry holding N alive
+peers that all report health, with the context cache disabled (cache_ttl=0)
+so every step rebuilds the GlobalContext. Between steps HEALTH_UPDATES peers
+record a fresh heartbeat. Compares:
+- scan: context built from get_alive_peers() + get_peer_health() per peer
+- aggregates: context read from the registry's ConstellationAggregates,
+  which are updated on each heartbeat
+Reports step cost, update cost (the registry-side price of the aggregates)
+and the exported p50/p95/p99 step latency.
+Run with: python benchmarks/swarm_decision_context.py
+
+Output is formatted for inclusion in pull requests.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+# Add project root to path for imports
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from astraguard.swarm.models import AgentID, HealthSummary, SatelliteRole, SwarmConfig
+from astraguard.swarm.registry import PeerState, SwarmRegistry
+from astraguard.swarm.swarm_decision_loop import Decision, DecisionType, SwarmDecisionLoop
+
+
+CONSTELLATION_SIZES = (10, 100, 1_000, 10_000)
+STEPS = 500
+HEALTH_UPDATES = 5  # Heartbeats between steps
+
+
+class ScanDecisionLoop(SwarmDecisionLoop):
+    """Previous behaviour: scan every alive peer on each context refresh."""
+
+    def _get_aggregates(self):
+        return None
+
+
+def _health(rng: random.Random) -> HealthSummary:
+    return HealthSummary(
+        anomaly_signature=[0.0] * 32,
+        risk_score=rng.random(),
+        recurrence_score=0.0,
+        timestamp=datetime.utcnow(),
+    )
+
+
+async def _run(cls, size: int) -> dict:
+    rng = random.Random(size)
+    me = AgentID.create("astra-v3.0", "SAT-00000")
+    config = SwarmConfig(
+        agent_id=me, constellation_id="astra-v3.0", role=SatelliteRole.PRIMARY,
+        bandwidth_limit_kbps=10, peers={},
+    )
+    registry = SwarmRegistry(config, me)
+    peers = []
+    for i in range(1, size):
+        peer = AgentID.create("astra-v3.0", f"SAT-{i:05d}")
+        registry.peers[peer] = PeerState(
+            agent_id=peer,
+            role=rng.choice(list(SatelliteRole)),
+            last_heartbeat=datetime.utcnow(),
+            health_summary=_health(rng),
+        )
+        peers.append(peer)
+
+    inner = AsyncMock()
+    inner.reason = AsyncMock(return_value=Decision(DecisionType.NORMAL, "hold", 0.9, "bench"))
+    election = MagicMock()
+    election.is_leader = MagicMock(return_value=False)
+    election.get_leader = AsyncMock(return_value=None)
+    loop = cls(inner, registry, election, AsyncMock(), me, config={"cache_ttl": 0})
+
+    step_s = update_s = 0.0
+    for _ in range(STEPS):
+        t0 = time.perf_counter()
+        for peer in rng.sample(peers, min(HEALTH_UPDATES, len(peers))):
+            registry.peers[peer].record_heartbeat(_health(rng))
+        t1 = time.perf_counter()
+        await loop.step({"temperature": 45.0})
+        step_s += time.perf_counter() - t1
+        update_s += t1 - t0
+
+    metrics = loop.get_metrics()
+    return {
+        "step_us": step_s / STEPS * 1e6,
+        "update_us": update_s / (STEPS * HEALTH_UPDATES) * 1e6,
+        "p50": metrics.latency_percentile(50),
+        "p95": metrics.latency_percentile(95),
+        "p99": metrics.latency_percentile(99),
+        "health": loop.global_context_cache.constellation_health,
+    }
+
+
+def benchmark_step_cost() -> dict:
+    """Scan vs aggregates per constellation size."""
+    asyncio.run(_run(SwarmDecisionLoop, CONSTELLATION_SIZES[0]))  # Warm-up
+    return {
+        (size, mode): asyncio.run(_run(cls, size))
+        for size in CONSTELLATION_SIZES
+        for mode, cls in (("scan", ScanDecisionLoop), ("aggregates", SwarmDecisionLoop))
+    }
+
+
+def print_results():
+    """Run all benchmarks and print results."""
+    logging.disable(logging.WARNING)
+    print("=" * 100)
+    print("ASTRAGUARD SWARM DECISION CONTEXT")
+    print("=" * 100)
+    print()
+    print(f"## {STEPS} steps with cache_ttl=0, {HEALTH_UPDATES} peer heartbeats between steps\n")
+    print("| Peers  | Context    | Step cost | Heartbeat cost | p50 ms | p95 ms | p99 ms | Health |")
+    print("|--------|------------|-----------|----------------|--------|--------|--------|--------|")
+    for (size, mode), r in benchmark_step_cost().items():
+        print(
+            f"| {size:6,} | {mode:10} | {r['step_us']:7.1f}μs | {r['update_us']:12.1f}μs | "
+            f"{r['p50']:6.3f} | {r['p95']:6.3f} | {r['p99']:6.3f} | {r['health']:6.3f} |"
+        )
+    print()
+    print("=" * 100)
+    print("BENCHMARK COMPLETE")
+    print("=" * 100)
+
+
+if __name__ == "__main__":
+    print_results()
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Swarm Memory Load Benchmarks
+
+Put-heavy load against one SwarmAdaptiveMemory node with 3 peers on a
+counting bus. Each run issues puts at a fixed rate for DURATION_S, plus one
+get per GETS_EVERY puts, with keys drawn from a Zipf-like distribution over
+KEYSPACE keys. Peers answer every query with a miss. Compares:
+- legacy: the previous node, with an unbounded cache, json.dumps to size
+  each pattern, and one replication message per peer per put
+- batched: a byte-budgeted LRU cache of CACHE_BUDGET bytes, and a
+  replication queue flushed in per-peer batches under the default
+  REPLICATION_BYTES_PER_SECOND token bucket
+Reports cache memory (size estimate of cached patterns), local hit ratio,
+replication messages and bytes per second, put CPU cost and patterns
+dropped from the replication queue.
+Run with: python benchmarks/swarm_memory_load.py
+
+Output is formatted for inclusion in pull requests.
+"""
+
+import asyncio
+import json
+import logging
+import random
+import tempfile
+import time
+from datetime import datetime
+from unittest.mock import MagicMock
+
+# Add project root to path for imports
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from astraguard.swarm.models import AgentID
+from astraguard.swarm.swarm_memory import AnomalyPattern, SwarmAdaptiveMemory
+
+
+PUT_RATES = (50, 500)     # Puts per second
+DURATION_S = 4.0
+TICK_S = 0.01
+GETS_EVERY = 4
+KEYSPACE = 20_000
+ZIPF_S = 1.1
+CACHE_BUDGET = 512 * 1024
+
+
+class LegacySwarmMemory(SwarmAdaptiveMemory):
+    """Previous behaviour: unbounded cache, json sizing, one message per peer per put."""
+
+    async def put(self, key: str, pattern: AnomalyPattern) -> None:
+        self._local_pattern_cache[key] = pattern
+        if self._running:
+            asyncio.create_task(self._legacy_replicate(key, pattern))
+
+    async def _legacy_replicate(self, key: str, pattern: AnomalyPattern) -> None:
+        for peer_id in self._get_nearest_peers():
+            len(json.dumps(pattern.to_dict()).encode())  # Previous _estimate_pattern_size
+            await self.bus.publish(
+                self.CACHE_REPLICATE_TOPIC,
+                {"source": self._serial, "pattern_key": key, "pattern": pattern.to_dict()},
+                qos=self.MEMORY_REPLICATION_QOS,
+            )
+            self.metrics.replication_messages += 1
+
+
+class CountingBus:
+    """Counts replication traffic; peers answer every query with a miss."""
+
+    def __init__(self):
+        self.memory = None
+        self.messages = 0
+        self.bytes = 0
+
+    async def subscribe(self, topic, handler, **kwargs):
+        pass
+
+    async def publish(self, topic, payload, qos=1, receiver=None, **kwargs):
+        if topic == SwarmAdaptiveMemory.CACHE_REPLICATE_TOPIC:
+            self.messages += 1
+            self.bytes += len(json.dumps(payload).encode())
+        elif topic == SwarmAdaptiveMemory.CACHE_QUERY_TOPIC:
+            asyncio.get_running_loop().call_soon(
+                asyncio.ensure_future,
+                self.memory._handle_cache_response({
+                    "responder": receiver.satellite_serial,
+                    "requester": payload["requester"],
+                    "pattern_key": payload["pattern_key"],
+                    "pattern": None,
+                }),
+            )
+        return True
+
+
+def _zipf_keys(rng: random.Random, count: int) -> list:
+    weights = [1.0 / (rank + 1) ** ZIPF_S for rank in range(KEYSPACE)]
+    return rng.choices(range(KEYSPACE), weights=weights, k=count)
+
+
+async def _run(mode: str, put_rate: int) -> dict:
+    rng = random.Random(put_rate)
+    total_puts = int(put_rate * DURATION_S)
+    keys = _zipf_keys(rng, total_puts + total_puts // GETS_EVERY)
+    agents = [AgentID.create("astra-v3.0", f"SAT-{i:03d}") for i in range(4)]
+    registry = MagicMock()
+    registry.config.agent_id = agents[0]
+    registry.get_alive_peers = MagicMock(return_value=agents)
+    bus = CountingBus()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        engine_cls = LegacySwarmMemory if mode == "legacy" else SwarmAdaptiveMemory
+        memory = engine_cls(
+            local_path=f"{workdir}/memory.pkl",
+            registry=registry,
+            bus=bus,
+            compressor=MagicMock(),
+            config={
+                "digest_interval": 3600,
+                "max_cache_bytes": float("inf") if mode == "legacy" else CACHE_BUDGET,
+            },
+        )
+        bus.memory = memory
+        memory.local_cache.save = lambda: None
+        await memory.start()
+
+        put_cpu = 0.0
+        issued = 0
+        per_tick = put_rate * TICK_S
+        start = time.perf_counter()
+        key_iter = iter(keys)
+        while issued < total_puts:
+            due = min(total_puts, int((time.perf_counter() - start) / TICK_S * per_tick) + 1)
+            while issued < due:
+                key = f"pattern-{next(key_iter):05d}"
+                pattern = AnomalyPattern(
+                    pattern_id=key,
+                    anomaly_signature=[rng.random() for _ in range(32)],
+                    recurrence_score=rng.random(),
+                    risk_score=rng.random(),
+                    last_seen=datetime.utcnow(),
+                )
+                t0 = time.perf_counter()
+                await memory.put(key, pattern)
+                put_cpu += time.perf_counter() - t0
+                issued += 1
+                if issued % GETS_EVERY == 0:
+                    await memory.get(f"pattern-{next(key_iter):05d}")
+            await asyncio.sleep(TICK_S)
+        elapsed = time.perf_counter() - start
+        await asyncio.sleep(0.05)  # Let fire-and-forget replication tasks finish
+
+        metrics = memory.get_metrics()
+        cached = len(memory._local_pattern_cache)
+        cache_bytes = memory._cache_bytes
+        await memory.stop()
+        return {
+            "cache_bytes": cache_bytes,
+            "cached_patterns": cached,
+            "hit_ratio": metrics.cache_hit_rate,
+            "messages_per_s": bus.messages / elapsed,
+            "bytes_per_s": bus.bytes / elapsed,
+            "put_us": put_cpu / total_puts * 1e6,
+            "dropped": metrics.replication_dropped,
+            "evictions": metrics.eviction_count_local,
+        }
+
+
+def benchmark_load() -> dict:
+    """Legacy vs batched node for each put rate."""
+    return {
+        (put_rate, mode): asyncio.run(_run(mode, put_rate))
+        for put_rate in PUT_RATES
+        for mode in ("legacy", "batched")
+    }
+
+
+def print_results():
+    """Run all benchmarks and print results."""
+    logging.disable(logging.WARNING)
+    print("=" * 118)
+    print("ASTRAGUARD SWARM MEMORY LOAD")
+    print("=" * 118)
+    print()
+    print(
+        f"## {DURATION_S:.0f}s put-heavy load, 3 peers, Zipf({ZIPF_S}) keys over {KEYSPACE:,}, "
+        f"1 get per {GETS_EVERY} puts; batched cache budget {CACHE_BUDGET // 1024}KB, "
+        f"replication budget {SwarmAdaptiveMemory.REPLICATION_BYTES_PER_SECOND / 1000:.0f}KB/s\n"
+    )
+    print("| Puts/s | Node    | Cache KB | Patterns | Evictions | Hit ratio | Repl msgs/s | Repl KB/s | Put cost | Dropped |")
+    print("|--------|---------|----------|----------|-----------|-----------|-------------|-----------|----------|---------|")
+    for (put_rate, mode), r in benchmark_load().items():
+        print(
+            f"| {put_rate:6} | {mode:7} | {r['cache_bytes'] / 1024:8.0f} | {r['cached_patterns']:8,} | "
+            f"{r['evictions']:9,} | {r['hit_ratio']:9.1%} | {r['messages_per_s']:11.1f} | "
+            f"{r['bytes_per_s'] / 1000:9.1f} | {r['put_us']:6.1f}μs | {r['dropped']:7,} |"
+        )
+    print()
+    print("=" * 118)
+    print("BENCHMARK COMPLETE")
+    print("=" * 118)
+
+
+if __name__ == "__main__":
+    print_results()
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Swarm Memory Sync Benchmarks
+
+Runs SwarmAdaptiveMemory nodes on a simulated network (1ms one-way delay,
+unicast honoured, payloads over the bus's 10,240B limit rejected as
+SwarmMessageBus.publish does) and measures:
+- query routing: local misses in a 10-node swarm where each pattern is held
+  by one node. "blind" queries the 3 nearest peers (no digests received);
+  "bloom" queries only peers whose Bloom digest may hold the key. Reports
+  lookups served by a peer, queries per lookup, query hit rate (positive
+  answers / queries sent) and bytes per lookup (queries + responses)
+- convergence: two replicas share SHARED_PATTERNS and then diverge by d
+  patterns (half new on one side, half updated on the other). Merkle
+  anti-entropy (one digest each + one sync exchange) against full
+  re-replication of every pattern in both directions. Reports bytes on the
+  link, bytes per converged pattern, the largest message and rejected
+  messages
+Run with: python benchmarks/swarm_memory_sync.py
+
+Output is formatted for inclusion in pull requests.
+"""
+
+import asyncio
+import json
+import logging
+import random
+import tempfile
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+# Add project root to path for imports
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from astraguard.swarm.models import AgentID
+from astraguard.swarm.swarm_memory import AnomalyPattern, SwarmAdaptiveMemory
+from astraguard.swarm.types import SwarmMessage
+
+
+LATENCY_MS = 1.0
+NODES = 10
+PATTERNS_PER_NODE = 200
+LOOKUPS = 500
+ABSENT_FRACTION = 0.2     # Lookups for keys no node holds
+SHARED_PATTERNS = 2000
+DIVERGENCE = (1, 10, 100, 1000)
+BUS_PAYLOAD_LIMIT = 10_240  # SwarmMessageBus.publish rejects larger payloads
+
+
+class SimNetwork:
+    """Delivers payloads after LATENCY_MS and counts bytes per topic."""
+
+    def __init__(self):
+        self.handlers = {}  # serial → {topic: handler}
+        self.bytes = {}     # topic → bytes published
+        self.largest = 0    # Largest payload offered to the bus
+        self.rejected = 0   # Payloads over BUS_PAYLOAD_LIMIT
+        self.in_flight = 0
+        self._tasks = set()
+
+    def bus(self, agent: AgentID) -> "SimBus":
+        return SimBus(self, agent)
+
+    def deliver(self, message: SwarmMessage) -> None:
+        self.in_flight -= 1
+        sender = message.sender.satellite_serial
+        receiver = message.receiver.satellite_serial if message.receiver is not None else None
+        for owner, handlers in self.handlers.items():
+            if owner == sender or (receiver is not None and owner != receiver):
+                continue
+            if message.topic in handlers:
+                task = asyncio.ensure_future(handlers[message.topic](message))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+
+    async def drain(self) -> None:
+        """Wait until no message is in flight and every handler has finished."""
+        while self.in_flight or self._tasks:
+            if self._tasks:
+                await asyncio.gather(*list(self._tasks))
+            else:
+                await asyncio.sleep(LATENCY_MS / 1000.0)
+
+    def total(self, *topics) -> int:
+        return sum(self.bytes.get(topic, 0) for topic in topics)
+
+
+class SimBus:
+    """Minimal bus facade for one node, with SwarmMessageBus's interface."""
+
+    def __init__(self, network: SimNetwork, agent: AgentID):
+        self.network = network
+        self.agent = agent
+        self.serial = agent.satellite_serial
+
+    def subscribe(self, topic, handler, **kwargs):
+        self.network.handlers.setdefault(self.serial, {})[topic] = handler
+        return topic
+
+    def unsubscribe(self, subscription) -> bool:
+        return self.network.handlers.get(self.serial, {}).pop(subscription, None) is not None
+
+    async def acknowledge(self, message) -> None:
+        pass
+
+    async def publish(self, topic, payload, qos=1, receiver=None, **kwargs):
+        encoded = json.dumps(payload).encode()
+        size = len(encoded)
+        self.network.largest = max(self.network.largest, size)
+        if size > BUS_PAYLOAD_LIMIT:
+            self.network.rejected += 1
+            return False
+        self.network.bytes[topic] = self.network.bytes.get(topic, 0) + size
+        message = SwarmMessage(
+            topic=topic, payload=encoded, sender=self.agent, qos=qos, receiver=receiver
+        )
+        self.network.in_flight += 1
+        asyncio.get_running_loop().call_later(LATENCY_MS / 1000.0, self.network.deliver, message)
+        return True
+
+
+def _pattern(key: str, rng: random.Random, last_seen: datetime, count: int = 1) -> AnomalyPattern:
+    return AnomalyPattern(
+        pattern_id=key,
+        anomaly_signature=[round(rng.random(), 4) for _ in range(32)],
+        recurrence_score=round(rng.random(), 4),
+        risk_score=round(rng.random(), 4),
+        last_seen=last_seen,
+        recurrence_count=count,
+    )
+
+
+async def _nodes(count: int, workdir: str):
+    network = SimNetwork()
+    agents = [AgentID.create("astra-v3.0", f"SAT-{i:03d}") for i in range(count)]
+    nodes = []
+    for agent in agents:
+        registry = MagicMock()
+        registry.config.agent_id = agent
+        registry.get_alive_peers = MagicMock(return_value=list(agents))
+        node = SwarmAdaptiveMemory(
+            local_path=f"{workdir}/{agent.satellite_serial}.pkl",
+            registry=registry,
+            bus=network.bus(agent),
+            compressor=MagicMock(),
+            config={"digest_interval": 3600},  # Rounds are driven by the benchmark
+        )
+        await node.start()
+        node.local_cache.save = lambda: None
+        nodes.append(node)
+    await asyncio.sleep(0)  # Let each node's first anti-entropy round run
+    await network.drain()  # Start-up digests of the empty caches
+    network.bytes.clear()
+    network.largest = network.rejected = 0
+    return network, nodes
+
+
+async def _query_routing(mode: str) -> dict:
+    rng = random.Random(7)
+    with tempfile.TemporaryDirectory() as workdir:
+        network, nodes = await _nodes(NODES, workdir)
+        now = datetime.utcnow()
+        held = []
+        for index, node in enumerate(nodes):
+            for i in range(PATTERNS_PER_NODE):
+                key = f"pattern-{index:03d}-{i:04d}"
+                node._local_pattern_cache[key] = _pattern(key, rng, now)
+                held.append((index, key))
+        if mode == "bloom":
+            for node in nodes:
+                await node._broadcast_digest()
+            await network.drain()
+        else:
+            for node in nodes:
+                for info in node.peer_caches.values():
+                    info.bloom = None
+        digest_bytes = network.total(SwarmAdaptiveMemory.DIGEST_TOPIC)
+
+        present = served = 0
+        for n in range(LOOKUPS):
+            requester = rng.randrange(NODES)
+            if rng.random() < ABSENT_FRACTION:
+                key = f"absent-{n}"
+            else:
+                owner, key = rng.choice(held)
+                while owner == requester:
+                    owner, key = rng.choice(held)
+                present += 1
+            if await nodes[requester].get(key) is not None:
+                served += 1
+        await network.drain()
+
+        sent = sum(node.metrics.peer_queries_sent for node in nodes)
+        hits = sum(node.metrics.peer_query_hits for node in nodes)
+        for node in nodes:
+            await node.stop()
+        return {
+            "served": served / present,
+            "queries_per_lookup": sent / LOOKUPS,
+            "query_hit_rate": hits / sent if sent else 0.0,
+            "bytes_per_lookup": network.total(
+                SwarmAdaptiveMemory.CACHE_QUERY_TOPIC, SwarmAdaptiveMemory.CACHE_RESPONSE_TOPIC
+            ) / LOOKUPS,
+            "digest_bytes": digest_bytes,
+            "largest": network.largest,
+            "rejected": network.rejected,
+        }
+
+
+async def _convergence(divergence: int, mode: str) -> dict:
+    rng = random.Random(divergence)
+    with tempfile.TemporaryDirectory() as workdir:
+        network, (a, b) = await _nodes(2, workdir)
+        now = datetime.utcnow()
+        for i in range(SHARED_PATTERNS):
+            key = f"pattern-{i:05d}"
+            pattern = _pattern(key, rng, now)
+            a._local_pattern_cache[key] = pattern
+            b._local_pattern_cache[key] = pattern
+        new_on_a = divergence // 2
+        for i in range(new_on_a):
+            key = f"new-{i:05d}"
+            a._local_pattern_cache[key] = _pattern(key, rng, now)
+        for i in range(divergence - new_on_a):
+            key = f"pattern-{i:05d}"
+            b._local_pattern_cache[key] = _pattern(key, rng, now + timedelta(seconds=1), 2)
+
+        if mode == "merkle":
+            await a._broadcast_digest()
+            await b._broadcast_digest()
+            await network.drain()
+            await a._anti_entropy_round()
+        else:
+            for node in (a, b):
+                for key, pattern in list(node._local_pattern_cache.items()):
+                    await node._replicate_to_peers(key, pattern)
+        await network.drain()
+
+        converged = a._digest.root() == b._digest.root()
+        total = network.total(*network.bytes)
+        for node in (a, b):
+            await node.stop()
+        return {
+            "converged": converged,
+            "bytes": total,
+            "bytes_per_pattern": total / divergence,
+            "largest": network.largest,
+            "rejected": network.rejected,
+        }
+
+
+def benchmark_query_routing() -> dict:
+    """Blind vs Bloom-routed peer queries."""
+    return {mode: asyncio.run(_query_routing(mode)) for mode in ("blind", "bloom")}
+
+
+def benchmark_convergence() -> dict:
+    """Merkle anti-entropy vs full re-replication for each divergence."""
+    return {
+        (divergence, mode): asyncio.run(_convergence(divergence, mode))
+        for divergence in DIVERGENCE
+        for mode in ("full", "merkle")
+    }
+
+
+def print_results():
+    """Run all benchmarks and print results."""
+    logging.disable(logging.WARNING)
+    print("=" * 90)
+    print("ASTRAGUARD SWARM MEMORY SYNC")
+    print("=" * 90)
+    print()
+    print(
+        f"## Query routing: {NODES} nodes x {PATTERNS_PER_NODE} patterns, {LOOKUPS} lookups "
+        f"({ABSENT_FRACTION:.0%} absent keys)\n"
+    )
+    print(
+        "| Routing | Served by peer | Queries/lookup | Query hit rate | Bytes/lookup | Digest bytes "
+        "| Largest msg | Rejected |"
+    )
+    print(
+        "|---------|----------------|----------------|----------------|--------------|--------------"
+        "|-------------|----------|"
+    )
+    for mode, r in benchmark_query_routing().items():
+        print(
+            f"| {mode:7} | {r['served']:14.1%} | {r['queries_per_lookup']:14.2f} | "
+            f"{r['query_hit_rate']:14.1%} | {r['bytes_per_lookup']:12.0f} | {r['digest_bytes']:12,} | "
+            f"{r['largest']:11,} | {r['rejected']:8} |"
+        )
+    print()
+    print(f"## Convergence: 2 replicas sharing {SHARED_PATTERNS:,} patterns\n")
+    print(
+        "| Divergent | Method        | Converged | Bytes on link | Bytes/converged pattern "
+        "| Largest msg | Rejected |"
+    )
+    print(
+        "|-----------|---------------|-----------|---------------|-------------------------"
+        "|-------------|----------|"
+    )
+    for (divergence, mode), r in benchmark_convergence().items():
+        label = "Merkle sync" if mode == "merkle" else "re-replicate"
+        print(
+            f"| {divergence:9} | {label:13} | {str(r['converged']):9} | {r['bytes']:13,} | "
+            f"{r['bytes_per_pattern']:23,.0f} | {r['largest']:11,} | {r['rejected']:8} |"
+        )
+    print()
+    print("=" * 90)
+    print("BENCHMARK COMPLETE")
+    print("=" * 90)
+
+
+if __name__ == "__main__":
+    print_results()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Multi-Process Swarm Harness
+
+Launches N agent processes on this machine, each running a SwarmMessageBus
+attached to a DatagramTransport (UDP on 127.0.0.1 or Unix-domain sockets).
+Every agent broadcasts timestamped health messages at a fixed rate through
+an optional LinkModel (latency, jitter, loss, bandwidth); receivers record
+publish → delivery latency. Reports aggregate delivered throughput, delivery
+ratio and P50/P99 latency per scenario.
+Run with: python benchmarks/swarm_multiprocess.py [--agents 8 --duration 5]
+
+Output is formatted for inclusion in pull requests.
+"""
+
+import argparse
+import asyncio
+import multiprocessing as mp
+import socket
+import statistics
+import struct
+import tempfile
+import time
+
+# Add project root to path for imports
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from astraguard.swarm.bus import SwarmMessageBus
+from astraguard.swarm.models import AgentID, SatelliteRole, SwarmConfig
+from astraguard.swarm.serializer import SwarmSerializer
+from astraguard.swarm.transport import DatagramTransport, LinkModel
+from astraguard.swarm.types import QoSLevel
+
+
+PAYLOAD_BYTES = 200
+RATE_PER_AGENT = 20          # msg/s broadcast by each agent
+SETTLE_S = 0.5               # Wait after publishing for in-flight frames
+_STAMP = struct.Struct("<d")
+
+
+def _free_udp_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _agent(index, agents, addresses, link_kwargs, duration, ready, start_at):
+    """One agent: bind, wait for the swarm, broadcast, then report latencies."""
+    agent_id = agents[index]
+    config = SwarmConfig(
+        agent_id=agent_id, role=SatelliteRole.PRIMARY, constellation_id="astra-v3.0"
+    )
+    bus = SwarmMessageBus(config, SwarmSerializer(validate=False), latency_ms=0)
+    peers = {a: addr for a, addr in zip(agents, addresses) if a != agent_id}
+    link = LinkModel(seed=index, **link_kwargs) if link_kwargs else None
+    transport = DatagramTransport(agent_id, addresses[index], peers, link, loopback=False)
+    await bus.attach_transport(transport)
+
+    latencies = []
+    bus.subscribe(
+        "health/*",
+        lambda m: latencies.append((time.time() - _STAMP.unpack_from(m.payload)[0]) * 1000),
+    )
+
+    ready.wait()  # Every socket is bound before anyone sends
+    await asyncio.sleep(max(0.0, start_at.value - time.time()))
+
+    interval = 1.0 / RATE_PER_AGENT
+    start = time.monotonic()
+    sent = 0
+    padding = b"\0" * (PAYLOAD_BYTES - _STAMP.size)
+    while time.monotonic() - start < duration:
+        payload = _STAMP.pack(time.time()) + padding
+        await bus.publish("health/summary", payload, qos=QoSLevel.FIRE_FORGET)
+        sent += 1
+        await asyncio.sleep(max(0.0, start + sent * interval - time.monotonic()))
+
+    await asyncio.sleep(SETTLE_S + (link_kwargs or {}).get("latency_ms", 0) / 1000 * 2)
+    stats = transport.get_stats()
+    await bus.close()
+    return {"sent": sent, "latencies": latencies, "lost": stats["frames_lost"]}
+
+
+def _agent_process(index, agents, addresses, link_kwargs, duration, ready, start_at, results):
+    results.put(asyncio.run(
+        _agent(index, agents, addresses, link_kwargs, duration, ready, start_at)
+    ))
+
+
+def run_swarm(n_agents: int, family: str = "udp", link_kwargs=None, duration: float = 3.0) -> dict:
+    """Launch n_agents processes and aggregate their delivery statistics."""
+    ctx = mp.get_context("spawn")
+    agents = [AgentID.create("astra-v3.0", f"SAT-{i:03d}-A") for i in range(n_agents)]
+    tmpdir = tempfile.TemporaryDirectory()
+    if family == "unix":
+        addresses = [f"{tmpdir.name}/agent-{i}.sock" for i in range(n_agents)]
+    else:
+        addresses = [("127.0.0.1", _free_udp_port()) for _ in range(n_agents)]
+
+    ready = ctx.Barrier(n_agents + 1)
+    start_at = ctx.Value("d", 0.0)
+    results = ctx.Queue()
+    procs = [
+        ctx.Process(
+            target=_agent_process,
+            args=(i, agents, addresses, link_kwargs, duration, ready, start_at, results),
+        )
+        for i in range(n_agents)
+    ]
+    for p in procs:
+        p.start()
+    start_at.value = time.time() + 0.2 + 0.05 * n_agents
+    ready.wait()
+    reports = [results.get(timeout=duration + 60) for _ in procs]
+    for p in procs:
+        p.join()
+    tmpdir.cleanup()
+
+    latencies = [lat for r in reports for lat in r["latencies"]]
+    sent = sum(r["sent"] for r in reports)
+    expected = sent * (n_agents - 1)
+    return {
+        "delivered": len(latencies),
+        "expected": expected,
+        "link_lost": sum(r["lost"] for r in reports),
+        "throughput": len(latencies) / duration,
+        "p50_ms": statistics.median(latencies) if latencies else 0.0,
+        "p99_ms": statistics.quantiles(latencies, n=100)[98] if len(latencies) > 1 else 0.0,
+    }
+
+
+def scenarios(max_agents: int):
+    """(label, agents, family, link kwargs) for the default sweep."""
+    sizes = sorted({2, max(2, max_agents // 2), max_agents})
+    for n in sizes:
+        yield ("udp ideal", n, "udp", None)
+    yield ("unix ideal", max_agents, "unix", None)
+    yield (
+        "udp 50ms/1%/10KB/s", max_agents, "udp",
+        {"latency_ms": 50, "jitter_ms": 10, "loss_rate": 0.01, "bandwidth_kbps": 10},
+    )
+
+
+def print_results(max_agents: int = 8, duration: float = 3.0):
+    """Run all scenarios and print results."""
+    print("=" * 96)
+    print("ASTRAGUARD MULTI-PROCESS SWARM")
+    print("=" * 96)
+    print()
+    print(
+        f"## {RATE_PER_AGENT} msg/s per agent, {PAYLOAD_BYTES}B broadcasts, "
+        f"{duration:.0f}s per run, one OS process per agent\n"
+    )
+    print("| Transport          | Agents | Delivered       | Ratio  | Throughput   | P50       | P99       |")
+    print("|--------------------|--------|-----------------|--------|--------------|-----------|-----------|")
+    for label, n, family, link_kwargs in scenarios(max_agents):
+        r = run_swarm(n, family, link_kwargs, duration)
+        ratio = r["delivered"] / r["expected"] if r["expected"] else 0.0
+        print(
+            f"| {label:18} | {n:6} | {r['delivered']:6}/{r['expected']:<8} | {ratio:6.1%} | "
+            f"{r['throughput']:8.0f}/s   | {r['p50_ms']:7.2f}ms | {r['p99_ms']:7.2f}ms |"
+        )
+    print()
+    print("=" * 96)
+    print("BENCHMARK COMPLETE")
+    print("=" * 96)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--agents", type=int, default=8, help="Largest swarm size")
+    parser.add_argument("--duration", type=float, default=3.0, help="Seconds per run")
+    args = parser.parse_args()
+    print_results(args.agents, args.duration)
@@ -23,6 +23,8 @@ from .component_health import (
 from .rate_limiter import (
     RateLimiter,
     RateLimitMiddleware,
+    SlidingWindowCounter,
+    SharedMemorySlidingWindowCounter,
     rate_limit_hits,
     rate_limit_blocks,
     rate_limit_latency,
@@ -47,6 +49,8 @@ __all__ = [
     # Rate limiting
     "RateLimiter",
     "RateLimitMiddleware",
+    "SlidingWindowCounter",
+    "SharedMemorySlidingWindowCounter",
     "rate_limit_hits",
     "rate_limit_blocks",
     "rate_limit_latency",
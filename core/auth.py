@@ -28,6 +28,7 @@ from pydantic import BaseModel, Field
 from astraguard.logging_config import get_logger
 from core.audit_logger import get_audit_logger, AuditEventType
 from core.secrets import get_secret
+from core.rate_limiter import SlidingWindowCounter, SharedMemorySlidingWindowCounter
 
 # Constants
 API_KEY_LENGTH = 32
@@ -168,7 +169,7 @@ class APIKeyManager:
         self.keys_file = keys_file
         self.api_keys: Dict[str, APIKey] = {}
         self.key_hashes: Dict[str, str] = {}  # Store hashed versions for security
-        self.rate_limits: Dict[str, List[datetime]] = {}  # Track request timestamps
+        self.rate_limits = self._create_rate_limit_counter()  # Per-key hourly request counts
 
         # Load existing keys
         self._load_keys()
@@ -177,6 +178,21 @@ class APIKeyManager:
         if not self.api_keys:
             self._create_default_key()
 
+    def _create_rate_limit_counter(self) -> SlidingWindowCounter:
+        """
+        Create the per-key hourly counter (60 one-minute buckets).
+
+        Setting the ``rate_limit_shared_memory`` secret to a segment name makes
+        all workers on this host share one counter table.
+        """
+        shm_name = get_secret("rate_limit_shared_memory")
+        if shm_name:
+            try:
+                return SharedMemorySlidingWindowCounter(name=shm_name, window_seconds=3600, num_buckets=60)
+            except (OSError, ValueError) as e:
+                self.logger.warning(f"Shared rate limit table unavailable, using per-process counter: {e}")
+        return SlidingWindowCounter(window_seconds=3600, num_buckets=60)
+
     def _load_keys(self) -> None:
         """Load API keys from file."""
         if os.path.exists(self.keys_file):
@@ -611,6 +627,23 @@ class APIKeyManager:
             )
             return None
 
+    def check_rate_limit(self, api_key: str) -> None:
+        """
+        Check if the API key has exceeded its rate limit.
+
+        Args:
+            api_key: The API key to check
+
+        Raises:
+            ValueError: If rate limit exceeded
+        """
+        if api_key not in self.api_keys:
+            return  # Invalid keys are caught elsewhere
+
+        key = self.api_keys[api_key]
+        if not self.rate_limits.hit(api_key, key.rate_limit):
+            raise ValueError(f"Rate limit exceeded. Maximum {key.rate_limit} requests per hour.")
+
     def get_user_rate_limit(self, user_id: str) -> Optional[int]:
         """Get rate limit for user (from their API keys)."""
         user_keys = [k for k in self._api_keys.values() if k.user_id == user_id and k.is_active]
@@ -693,39 +726,6 @@ class UserResponse(BaseModel):
     last_login: Optional[datetime]
     is_active: bool
 
-    def check_rate_limit(self, api_key: str) -> None:
-        """
-        Check if the API key has exceeded its rate limit.
-
-        Args:
-            api_key: The API key to check
-
-        Raises:
-            ValueError: If rate limit exceeded
-        """
-        if api_key not in self.api_keys:
-            return  # Invalid keys are caught elsewhere
-
-        key = self.api_keys[api_key]
-        now = datetime.now()
-
-        # Initialize rate tracking for this key
-        if api_key not in self.rate_limits:
-            self.rate_limits[api_key] = []
-
-        # Clean old timestamps (older than 1 hour)
-        cutoff = now - timedelta(hours=1)
-        self.rate_limits[api_key] = [
-            ts for ts in self.rate_limits[api_key] if ts > cutoff
-        ]
-
-        # Check rate limit
-        if len(self.rate_limits[api_key]) >= key.rate_limit:
-            raise ValueError(f"Rate limit exceeded. Maximum {key.rate_limit} requests per hour.")
-
-        # Add current request timestamp
-        self.rate_limits[api_key].append(now)
-
     def revoke_key(self, api_key: str) -> bool:
         """
         Revoke an API key.
@@ -7,13 +7,16 @@ when a service becomes unavailable. Implements three-state pattern:
 - OPEN: Service unavailable, fail fast
 - HALF_OPEN: Testing if service recovered
 
+AsyncCircuitBreaker is a lock-free asyncio variant that trips on sliding
+window failure and slow-call rates.
+
 Follows Netflix Hystrix and AWS patterns for production reliability.
 """
 
 import asyncio
 import time
 import logging
-from typing import Callable, Any, Optional, Tuple, Set
+from typing import Callable, Any, Optional, Tuple, Set, Union
 from enum import Enum
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -271,6 +274,402 @@ class CircuitBreaker:
             )
 
 
+class SlidingWindowType(str, Enum):
+    """How AsyncCircuitBreaker aggregates recent call outcomes"""
+    COUNT_BASED = "COUNT_BASED"  # Last N calls
+    TIME_BASED = "TIME_BASED"    # Calls in the last N seconds
+
+
+class _CountWindow:
+    """Ring buffer over the last `size` call outcomes with running totals."""
+
+    def __init__(self, size: int):
+        self.size = size
+        self._outcomes = bytearray(size)  # bit 0 = failure, bit 1 = slow
+        self._index = 0
+        self.total = 0
+        self.failures = 0
+        self.slow = 0
+
+    def record(self, failed: bool, slow: bool, now: float) -> None:
+        if self.total == self.size:
+            evicted = self._outcomes[self._index]
+            self.failures -= evicted & 1
+            self.slow -= evicted >> 1
+        else:
+            self.total += 1
+        outcome = int(failed) | (int(slow) << 1)
+        self._outcomes[self._index] = outcome
+        self.failures += failed
+        self.slow += slow
+        self._index = (self._index + 1) % self.size
+
+    def expire(self, now: float) -> None:
+        pass
+
+    def snapshot(self, now: float) -> Tuple[int, int, int]:
+        """(total, failures, slow) without modifying the window."""
+        return self.total, self.failures, self.slow
+
+    def reset(self) -> None:
+        self.__init__(self.size)
+
+
+class _TimeWindow:
+    """Per-second buckets over the last `size` seconds with running totals."""
+
+    def __init__(self, size: int):
+        self.size = size
+        self._calls = [0] * size
+        self._failures = [0] * size
+        self._slow = [0] * size
+        self._epoch = 0  # Last second recorded
+        self.total = 0
+        self.failures = 0
+        self.slow = 0
+
+    def expire(self, now: float) -> None:
+        """Drop buckets older than the window (amortized O(1))."""
+        second = int(now)
+        elapsed = second - self._epoch
+        if elapsed <= 0:
+            return
+        if elapsed >= self.size:
+            self.reset()
+        else:
+            for s in range(self._epoch + 1, second + 1):
+                slot = s % self.size
+                self.total -= self._calls[slot]
+                self.failures -= self._failures[slot]
+                self.slow -= self._slow[slot]
+                self._calls[slot] = self._failures[slot] = self._slow[slot] = 0
+        self._epoch = second
+
+    def snapshot(self, now: float) -> Tuple[int, int, int]:
+        """(total, failures, slow) as of `now`, computed without expiring buckets."""
+        second = int(now)
+        elapsed = second - self._epoch
+        total, failures, slow = self.total, self.failures, self.slow
+        if elapsed <= 0:
+            return total, failures, slow
+        if elapsed >= self.size:
+            return 0, 0, 0
+        for s in range(self._epoch + 1, second + 1):
+            slot = s % self.size
+            total -= self._calls[slot]
+            failures -= self._failures[slot]
+            slow -= self._slow[slot]
+        return total, failures, slow
+
+    def record(self, failed: bool, slow: bool, now: float) -> None:
+        self.expire(now)
+        slot = int(now) % self.size
+        self._calls[slot] += 1
+        self._failures[slot] += failed
+        self._slow[slot] += slow
+        self.total += 1
+        self.failures += failed
+        self.slow += slow
+
+    def reset(self) -> None:
+        self._calls = [0] * self.size
+        self._failures = [0] * self.size
+        self._slow = [0] * self.size
+        self.total = self.failures = self.slow = 0
+
+
+class AsyncCircuitBreaker:
+    """
+    Asyncio-native circuit breaker with sliding-window failure-rate trips.
+    
+    Unlike CircuitBreaker, it takes no threading lock: all state lives on the
+    event loop thread and is only mutated between awaits, so the hot path is
+    a few integer updates. Trips when, over a count- or time-based window
+    of at least `minimum_calls` calls:
+    - the failure rate reaches failure_rate_threshold, or
+    - the rate of calls slower than slow_call_duration reaches
+      slow_call_rate_threshold
+    
+    In HALF_OPEN at most half_open_max_calls probes run concurrently; once
+    that many have completed the window decides between CLOSED and OPEN.
+    
+    Not thread-safe: use one instance per event loop.
+    """
+    
+    def __init__(
+        self,
+        name: str = "default",
+        window_type: SlidingWindowType = SlidingWindowType.COUNT_BASED,
+        window_size: int = 100,
+        minimum_calls: int = 10,
+        failure_rate_threshold: float = 0.5,
+        slow_call_rate_threshold: float = 1.0,
+        slow_call_duration: float = 5.0,
+        recovery_timeout: float = 30,
+        half_open_max_calls: int = 3,
+        expected_exceptions: Tuple[type, ...] = (Exception,),
+    ):
+        """
+        Initialize async circuit breaker.
+        
+        Args:
+            name: Circuit breaker identifier
+            window_type: COUNT_BASED (last N calls) or TIME_BASED (last N seconds)
+            window_size: Calls or seconds covered by the sliding window
+            minimum_calls: Calls required in the window before rates are evaluated
+            failure_rate_threshold: Failure rate (0-1) that trips the circuit
+            slow_call_rate_threshold: Slow-call rate (0-1) that trips the circuit
+            slow_call_duration: Seconds after which a call counts as slow
+            recovery_timeout: Seconds before attempting recovery
+            half_open_max_calls: Concurrent probes allowed in HALF_OPEN
+            expected_exceptions: Exception types to count as failures
+        """
+        self.name = name
+        self.window_type = SlidingWindowType(window_type)
+        self.window_size = window_size
+        self.minimum_calls = minimum_calls
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.slow_call_duration = slow_call_duration
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.expected_exceptions = expected_exceptions
+        
+        count_based = self.window_type == SlidingWindowType.COUNT_BASED
+        window_cls = _CountWindow if count_based else _TimeWindow
+        self._window = window_cls(window_size)
+        self._half_open_window = _CountWindow(half_open_max_calls)
+        self._half_open_in_flight = 0
+        self._half_open_cycle = 0  # Bumped whenever probe accounting restarts
+        self._opened_at = 0.0
+        self.metrics = CircuitBreakerMetrics()
+        
+        logger.info(
+            f"Async circuit breaker '{name}' initialized: "
+            f"window={self.window_type.value}/{window_size}, "
+            f"failure_rate={failure_rate_threshold}, recovery={recovery_timeout}s"
+        )
+    
+    @property
+    def state(self) -> CircuitState:
+        """Get current circuit state"""
+        return self.metrics.state
+    
+    @property
+    def is_closed(self) -> bool:
+        """Check if circuit is closed (normal operation)"""
+        return self.metrics.state == CircuitState.CLOSED
+    
+    @property
+    def is_open(self) -> bool:
+        """Check if circuit is open (failing fast)"""
+        return self.metrics.state == CircuitState.OPEN
+    
+    @property
+    def is_half_open(self) -> bool:
+        """Check if circuit is half-open (testing recovery)"""
+        return self.metrics.state == CircuitState.HALF_OPEN
+    
+    @property
+    def failure_rate(self) -> float:
+        """Failure rate over the sliding window (0 if below minimum_calls)"""
+        total, failures, _ = self._window.snapshot(time.monotonic())
+        if total < self.minimum_calls:
+            return 0.0
+        return failures / total
+    
+    @property
+    def slow_call_rate(self) -> float:
+        """Slow-call rate over the sliding window (0 if below minimum_calls)"""
+        total, _, slow = self._window.snapshot(time.monotonic())
+        if total < self.minimum_calls:
+            return 0.0
+        return slow / total
+    
+    def _acquire_permission(self, now: float) -> bool:
+        """Decide whether a call may proceed, updating half-open probe count."""
+        state = self.metrics.state
+        if state == CircuitState.CLOSED:
+            return True
+        if state == CircuitState.OPEN:
+            if now - self._opened_at < self.recovery_timeout:
+                return False
+            self._transition_to_half_open()
+        if self._half_open_in_flight + self._half_open_window.total >= self.half_open_max_calls:
+            return False
+        self._half_open_in_flight += 1
+        return True
+    
+    async def call(
+        self,
+        func: Callable,
+        *args,
+        fallback: Optional[Callable] = None,
+        **kwargs
+    ) -> Any:
+        """
+        Execute function through circuit breaker.
+        
+        Args:
+            func: Async function to call
+            *args: Positional arguments
+            fallback: Fallback function if circuit is open
+            **kwargs: Keyword arguments
+            
+        Returns:
+            Function result or fallback result
+            
+        Raises:
+            CircuitOpenError: If the call is rejected and no fallback provided
+        """
+        start = time.monotonic()
+        if not self._acquire_permission(start):
+            if fallback:
+                logger.warning(
+                    f"Circuit '{self.name}' is {self.metrics.state.value}, using fallback"
+                )
+                return await fallback(*args, **kwargs)
+            raise CircuitOpenError(
+                f"Circuit breaker '{self.name}' is {self.metrics.state.value}. "
+                f"Service recovery in ~{self.recovery_timeout}s",
+                state=self.metrics.state
+            )
+        
+        # Probes remember their half-open cycle so a late one cannot skew the next
+        probe = self._half_open_cycle if self.metrics.state == CircuitState.HALF_OPEN else None
+        try:
+            result = await func(*args, **kwargs)
+        except BaseException as e:
+            if isinstance(e, self.expected_exceptions) and not isinstance(
+                e, (KeyboardInterrupt, SystemExit, asyncio.CancelledError)
+            ):
+                self._on_result(True, start, probe)
+            elif probe is not None:
+                self._release_probe(probe)
+            raise
+        self._on_result(False, start, probe)
+        return result
+    
+    def _release_probe(self, cycle: int) -> bool:
+        """Free a half-open probe slot; False if the probe outlived its cycle."""
+        if cycle != self._half_open_cycle:
+            return False
+        self._half_open_in_flight -= 1
+        return True
+    
+    def _on_result(self, failed: bool, start: float, probe: Optional[int]) -> None:
+        """Record a completed call and apply state transitions."""
+        now = time.monotonic()
+        slow = now - start >= self.slow_call_duration
+        metrics = self.metrics
+        if failed:
+            metrics.failures_total += 1
+            metrics.consecutive_failures += 1
+            metrics.consecutive_successes = 0
+            metrics.last_failure_time = datetime.now()
+        else:
+            metrics.successes_total += 1
+            metrics.consecutive_successes += 1
+            metrics.consecutive_failures = 0
+        
+        if probe is not None:
+            if not self._release_probe(probe) or metrics.state != CircuitState.HALF_OPEN:
+                return  # A concurrent probe or a reset already decided
+            window = self._half_open_window
+            window.record(failed, slow, now)
+            if window.total >= self.half_open_max_calls:
+                if self._rates_exceeded(window, window.total):
+                    self._transition_to_open(now)
+                else:
+                    self._transition_to_closed()
+            return
+        
+        window = self._window
+        window.record(failed, slow, now)
+        if metrics.state == CircuitState.CLOSED and window.total >= self.minimum_calls:
+            if self._rates_exceeded(window, window.total):
+                self._transition_to_open(now)
+    
+    def _rates_exceeded(self, window, total: int) -> bool:
+        return (
+            window.failures >= self.failure_rate_threshold * total
+            or window.slow >= self.slow_call_rate_threshold * total
+        )
+    
+    def _transition_to_open(self, now: float):
+        """Transition circuit to OPEN state"""
+        self.metrics.state = CircuitState.OPEN
+        self.metrics.trips_total += 1
+        self.metrics.state_change_time = datetime.now()
+        self._opened_at = now
+        logger.error(
+            f"Circuit '{self.name}' OPENED: "
+            f"failure_rate={self._window.failures}/{self._window.total}, "
+            f"slow={self._window.slow}/{self._window.total}"
+        )
+    
+    def _transition_to_half_open(self):
+        """Transition circuit to HALF_OPEN state"""
+        self.metrics.state = CircuitState.HALF_OPEN
+        self.metrics.consecutive_successes = 0
+        self.metrics.consecutive_failures = 0
+        self.metrics.state_change_time = datetime.now()
+        self._half_open_window.reset()
+        self._half_open_in_flight = 0
+        self._half_open_cycle += 1
+        logger.info(f"Circuit '{self.name}' -> HALF_OPEN (testing recovery)")
+    
+    def _transition_to_closed(self):
+        """Transition circuit to CLOSED state"""
+        self.metrics.state = CircuitState.CLOSED
+        self.metrics.consecutive_failures = 0
+        self.metrics.consecutive_successes = 0
+        self.metrics.state_change_time = datetime.now()
+        self._window.reset()
+        logger.info(f"Circuit '{self.name}' CLOSED (recovered)")
+    
+    def reset(self):
+        """Reset circuit to CLOSED state (manual override)"""
+        self.metrics = CircuitBreakerMetrics()
+        self._window.reset()
+        self._half_open_window.reset()
+        self._half_open_in_flight = 0
+        self._half_open_cycle += 1
+        logger.info(f"Circuit '{self.name}' manually reset to CLOSED")
+    
+    def get_metrics(self) -> CircuitBreakerMetrics:
+        """Get current metrics snapshot"""
+        m = self.metrics
+        return CircuitBreakerMetrics(
+            state=m.state,
+            failures_total=m.failures_total,
+            successes_total=m.successes_total,
+            trips_total=m.trips_total,
+            last_failure_time=m.last_failure_time,
+            state_change_time=m.state_change_time,
+            consecutive_successes=m.consecutive_successes,
+            consecutive_failures=m.consecutive_failures,
+        )
+    
+    def get_window_stats(self) -> dict:
+        """
+        Get sliding-window rates and half-open probe usage.
+        
+        Read-only, so a metrics thread may call it while the loop is running;
+        the values may lag an in-progress update by one call.
+        """
+        total, failures, slow = self._window.snapshot(time.monotonic())
+        evaluated = total >= self.minimum_calls
+        return {
+            'state': self.metrics.state.value,
+            'window_type': self.window_type.value,
+            'window_calls': total,
+            'failure_rate': failures / total if evaluated else 0.0,
+            'slow_call_rate': slow / total if evaluated else 0.0,
+            'half_open_in_flight': self._half_open_in_flight,
+        }
+
+
 class CircuitBreakerRegistry:
     """
     Registry for managing multiple circuit breakers.
@@ -278,21 +677,21 @@ class CircuitBreakerRegistry:
     """
     
     def __init__(self):
-        self._breakers: dict[str, CircuitBreaker] = {}
+        self._breakers: dict[str, Union[CircuitBreaker, AsyncCircuitBreaker]] = {}
         self._lock = threading.RLock()
     
-    def register(self, breaker: CircuitBreaker) -> None:
+    def register(self, breaker: Union[CircuitBreaker, AsyncCircuitBreaker]) -> None:
         """Register a circuit breaker"""
         with self._lock:
             self._breakers[breaker.name] = breaker
             logger.debug(f"Registered circuit breaker: {breaker.name}")
     
-    def get(self, name: str) -> Optional[CircuitBreaker]:
+    def get(self, name: str) -> Optional[Union[CircuitBreaker, AsyncCircuitBreaker]]:
         """Get circuit breaker by name"""
         with self._lock:
             return self._breakers.get(name)
     
-    def get_all(self) -> dict[str, CircuitBreaker]:
+    def get_all(self) -> dict[str, Union[CircuitBreaker, AsyncCircuitBreaker]]:
         """Get all circuit breakers"""
         with self._lock:
             return dict(self._breakers)
@@ -304,13 +703,25 @@ class CircuitBreakerRegistry:
                 name: breaker.get_metrics()
                 for name, breaker in self._breakers.items()
             }
+    
+    def get_window_stats(self) -> dict[str, dict]:
+        """Get sliding-window stats for all async circuit breakers"""
+        with self._lock:
+            breakers = list(self._breakers.items())
+        return {
+            name: breaker.get_window_stats()
+            for name, breaker in breakers
+            if isinstance(breaker, AsyncCircuitBreaker)
+        }
 
 
 # Global registry
 _global_registry = CircuitBreakerRegistry()
 
 
-def register_circuit_breaker(breaker: CircuitBreaker) -> CircuitBreaker:
+def register_circuit_breaker(
+    breaker: Union[CircuitBreaker, AsyncCircuitBreaker],
+) -> Union[CircuitBreaker, AsyncCircuitBreaker]:
     """Register a circuit breaker globally"""
     _global_registry.register(breaker)
     return breaker
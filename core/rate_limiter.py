@@ -8,7 +8,16 @@ and shared state across multiple instances.
 
 import time
 import os
+import sys
+import struct
+import hashlib
+import tempfile
+from array import array
+from collections import OrderedDict
+from multiprocessing import resource_tracker, shared_memory
 from typing import Optional, Dict, Any
+
+import fasteners
 from fastapi import Request, Response
 from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -252,3 +261,275 @@ def get_rate_limit_config() -> Dict[str, tuple[float, int]]:
         "telemetry": parse_rate_limit_config(telemetry_rate_str),
         "api": parse_rate_limit_config(api_rate_str)
     }
+
+
+class SlidingWindowCounter:
+    """
+    Bucketed sliding-window request counter with constant memory per key.
+
+    The window is split into ``num_buckets`` fixed slots (e.g. 60 one-minute
+    buckets for a one-hour window). Each key keeps a fixed-size array of
+    bucket counts plus a running total, so ``hit`` and ``count`` are O(1)
+    amortized regardless of the configured limit. Keys that have been idle
+    for a full window hold no information and are evicted.
+    """
+
+    def __init__(
+        self,
+        window_seconds: float = 3600.0,
+        num_buckets: int = 60,
+        max_keys: int = 100_000,
+    ):
+        """
+        Initialize sliding window counter.
+
+        Args:
+            window_seconds: Length of the sliding window in seconds
+            num_buckets: Number of buckets the window is divided into
+            max_keys: Upper bound on tracked keys (least recently used evicted)
+        """
+        if window_seconds <= 0 or num_buckets <= 0:
+            raise ValueError("window_seconds and num_buckets must be positive")
+        self.window_seconds = float(window_seconds)
+        self.num_buckets = int(num_buckets)
+        self.bucket_seconds = self.window_seconds / self.num_buckets
+        self.max_keys = max_keys
+        # key -> [last_bucket, total, counts]; ordered by last access for eviction
+        self._windows: "OrderedDict[str, list]" = OrderedDict()
+
+    def _bucket_index(self, now: Optional[float]) -> int:
+        return int((time.time() if now is None else now) // self.bucket_seconds)
+
+    def _advance(self, state: list, bucket: int) -> None:
+        """Zero the buckets that slid out of the window since the last access."""
+        elapsed = bucket - state[0]
+        if elapsed <= 0:
+            return
+        counts = state[2]
+        if elapsed >= self.num_buckets:
+            for i in range(self.num_buckets):
+                counts[i] = 0
+            state[1] = 0
+        else:
+            for b in range(state[0] + 1, bucket + 1):
+                slot = b % self.num_buckets
+                state[1] -= counts[slot]
+                counts[slot] = 0
+        state[0] = bucket
+
+    def _evict_idle(self, bucket: int) -> None:
+        """Drop keys idle for a whole window (oldest first) and enforce max_keys."""
+        windows = self._windows
+        while windows:
+            key, state = next(iter(windows.items()))
+            if bucket - state[0] < self.num_buckets and len(windows) <= self.max_keys:
+                break
+            del windows[key]
+
+    def _state(self, key: str, bucket: int, create: bool) -> Optional[list]:
+        state = self._windows.get(key)
+        if state is None:
+            if not create:
+                return None
+            state = [bucket, 0, array("L", [0]) * self.num_buckets]
+            self._windows[key] = state
+        else:
+            self._windows.move_to_end(key)
+            self._advance(state, bucket)
+        return state
+
+    def hit(self, key: str, limit: int, now: Optional[float] = None) -> bool:
+        """
+        Record a request for ``key`` if it is under ``limit``.
+
+        Args:
+            key: Identifier being limited (API key, client id, ...)
+            limit: Maximum requests allowed within the window
+            now: Optional timestamp override (seconds since epoch)
+
+        Returns:
+            True if the request was counted, False if the limit is reached
+        """
+        bucket = self._bucket_index(now)
+        state = self._state(key, bucket, create=True)
+        self._evict_idle(bucket)
+        if state[1] >= limit:
+            return False
+        state[2][bucket % self.num_buckets] += 1
+        state[1] += 1
+        return True
+
+    def count(self, key: str, now: Optional[float] = None) -> int:
+        """Return the number of requests recorded for ``key`` in the window."""
+        state = self._state(key, self._bucket_index(now), create=False)
+        return state[1] if state else 0
+
+    def reset(self, key: str) -> None:
+        """Forget all requests recorded for ``key``."""
+        self._windows.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._windows)
+
+
+class SharedMemorySlidingWindowCounter(SlidingWindowCounter):
+    """
+    Sliding-window counter stored in a named shared-memory segment.
+
+    Lets several uvicorn workers on one host enforce a single global limit
+    without Redis. Keys are hashed into a fixed open-addressed slot table, so
+    memory is fixed at creation time; slots idle for a full window are reused.
+    Updates are serialized with an inter-process file lock.
+    """
+
+    _SLOT_HEADER = struct.Struct("<QqQ")  # key hash, last bucket, total
+    _MAX_PROBES = 16
+
+    def __init__(
+        self,
+        name: str = "astraguard_rate_limits",
+        window_seconds: float = 3600.0,
+        num_buckets: int = 60,
+        max_keys: int = 4096,
+        lock_path: Optional[str] = None,
+    ):
+        """
+        Create or attach to a shared-memory counter table.
+
+        Args:
+            name: Shared memory segment name (same across workers)
+            window_seconds: Length of the sliding window in seconds
+            num_buckets: Number of buckets the window is divided into
+            max_keys: Number of slots in the table
+            lock_path: File used for the inter-process lock
+        """
+        super().__init__(window_seconds, num_buckets, max_keys)
+        self._slot_size = self._SLOT_HEADER.size + 4 * self.num_buckets
+        size = self._slot_size * max_keys
+        try:
+            self._shm = self._open(name, create=True, size=size)
+            self._owner = True
+        except FileExistsError:
+            self._shm = self._open(name)
+            self._owner = False
+            if self._shm.size < size:
+                raise ValueError(f"Shared memory segment '{name}' is smaller than requested layout")
+        self._lock = fasteners.InterProcessLock(
+            lock_path or os.path.join(tempfile.gettempdir(), f"{name}.lock")
+        )
+
+    @staticmethod
+    def _open(name: str, create: bool = False, size: int = 0) -> shared_memory.SharedMemory:
+        """Create or attach to a segment without handing it to the resource_tracker.
+
+        Before Python 3.13 every process that creates or attaches to a segment
+        registers it with its resource_tracker, which unlinks the segment when
+        that process exits -- the creating worker included -- and leaves the
+        remaining workers counting in a fresh, separate segment. The segment is
+        only removed by an explicit ``close(unlink=True)``.
+        """
+        if sys.version_info >= (3, 13):
+            return shared_memory.SharedMemory(name=name, create=create, size=size, track=False)
+        shm = shared_memory.SharedMemory(name=name, create=create, size=size)
+        resource_tracker.unregister(shm._name, "shared_memory")
+        return shm
+
+    def _key_hash(self, key: str) -> int:
+        # 0 marks an empty slot
+        return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "little") or 1
+
+    def _find_slot(self, key_hash: int, bucket: int, create: bool) -> Optional[int]:
+        """Linear-probe for the key's slot, reusing empty or expired slots on insert."""
+        buf = self._shm.buf
+        start = key_hash % self.max_keys
+        free = None
+        for probe in range(min(self._MAX_PROBES, self.max_keys)):
+            offset = ((start + probe) % self.max_keys) * self._slot_size
+            slot_hash, last_bucket, _ = self._SLOT_HEADER.unpack_from(buf, offset)
+            if slot_hash == key_hash:
+                return offset
+            if free is None and (slot_hash == 0 or bucket - last_bucket >= self.num_buckets):
+                free = offset
+        if free is None or not create:
+            return None
+        self._SLOT_HEADER.pack_into(buf, free, key_hash, bucket, 0)
+        buf[free + self._SLOT_HEADER.size:free + self._slot_size] = bytes(4 * self.num_buckets)
+        return free
+
+    def _load(self, offset: int) -> list:
+        _, last_bucket, total = self._SLOT_HEADER.unpack_from(self._shm.buf, offset)
+        counts = self._shm.buf[offset + self._SLOT_HEADER.size:offset + self._slot_size].cast("I")
+        return [last_bucket, total, counts]
+
+    def _store(self, offset: int, key_hash: int, state: list) -> None:
+        self._SLOT_HEADER.pack_into(self._shm.buf, offset, key_hash, state[0], state[1])
+
+    def hit(self, key: str, limit: int, now: Optional[float] = None) -> bool:
+        bucket = self._bucket_index(now)
+        key_hash = self._key_hash(key)
+        with self._lock:
+            offset = self._find_slot(key_hash, bucket, create=True)
+            if offset is None:
+                # Table full: fail open, matching RateLimiter's behaviour on backend errors
+                return True
+            state = self._load(offset)
+            try:
+                self._advance(state, bucket)
+                allowed = state[1] < limit
+                if allowed:
+                    state[2][bucket % self.num_buckets] += 1
+                    state[1] += 1
+                self._store(offset, key_hash, state)
+            finally:
+                state[2].release()
+            return allowed
+
+    def count(self, key: str, now: Optional[float] = None) -> int:
+        bucket = self._bucket_index(now)
+        key_hash = self._key_hash(key)
+        with self._lock:
+            offset = self._find_slot(key_hash, bucket, create=False)
+            if offset is None:
+                return 0
+            state = self._load(offset)
+            try:
+                self._advance(state, bucket)
+                self._store(offset, key_hash, state)
+            finally:
+                state[2].release()
+            return state[1]
+
+    def reset(self, key: str) -> None:
+        key_hash = self._key_hash(key)
+        with self._lock:
+            offset = self._find_slot(key_hash, 0, create=False)
+            if offset is not None:
+                # Keep the hash so probe chains stay intact; an expired bucket is zeroed on next use
+                self._SLOT_HEADER.pack_into(self._shm.buf, offset, key_hash, -self.num_buckets, 0)
+
+    def __len__(self) -> int:
+        bucket = self._bucket_index(None)
+        return sum(
+            1 for i in range(self.max_keys)
+            if self._is_live(i * self._slot_size, bucket)
+        )
+
+    def _is_live(self, offset: int, bucket: int) -> bool:
+        slot_hash, last_bucket, _ = self._SLOT_HEADER.unpack_from(self._shm.buf, offset)
+        return slot_hash != 0 and bucket - last_bucket < self.num_buckets
+
+    def close(self, unlink: bool = False) -> None:
+        """Detach from the segment; ``unlink`` removes it for all workers."""
+        self._shm.close()
+        if not unlink:
+            return
+        tracked = sys.version_info < (3, 13)
+        if tracked:
+            # unlink() unregisters the name, which _open() already did
+            resource_tracker.register(self._shm._name, "shared_memory")
+        try:
+            self._shm.unlink()
+        except FileNotFoundError:
+            # Already removed by another worker
+            if tracked:
+                resource_tracker.unregister(self._shm._name, "shared_memory")
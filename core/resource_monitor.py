@@ -11,15 +11,23 @@ Features:
 - Integration with health monitor
 - Automatic alerts when thresholds exceeded
 - Non-blocking CPU monitoring
+- Low-overhead per-operation accounting (wall/CPU time histograms)
 """
 
 import psutil
 import logging
+import math
 import os
+import sys
+import time
+import bisect
+import random
 import threading
 import functools
+import tracemalloc
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Callable, Any, TypeVar
+from typing import Dict, List, Optional, Callable, Any, Tuple, TypeVar
 from datetime import datetime, timedelta
 from enum import Enum
 
@@ -31,84 +39,401 @@ T = TypeVar('T')
 logger = logging.getLogger(__name__)
 
 
+# Prometheus metrics (optional)
+try:
+    from prometheus_client import Counter, Gauge
+    OPERATION_CALLS_TOTAL = Counter(
+        'astra_operation_calls_total',
+        'Calls recorded by per-operation resource accounting',
+        ['operation']
+    )
+    OPERATION_WALL_SECONDS_TOTAL = Counter(
+        'astra_operation_wall_seconds_total',
+        'Wall-clock time spent in accounted operations',
+        ['operation']
+    )
+    OPERATION_CPU_SECONDS_TOTAL = Counter(
+        'astra_operation_cpu_seconds_total',
+        'Thread CPU time spent in accounted operations',
+        ['operation']
+    )
+    OPERATION_LATENCY_P99_SECONDS = Gauge(
+        'astra_operation_latency_p99_seconds',
+        'Estimated p99 latency of accounted operations',
+        ['operation']
+    )
+except (ImportError, ValueError):
+    OPERATION_CALLS_TOTAL = None
+    OPERATION_WALL_SECONDS_TOTAL = None
+    OPERATION_CPU_SECONDS_TOTAL = None
+    OPERATION_LATENCY_P99_SECONDS = None
+
+
+# Latency histogram bucket upper bounds in microseconds (last bucket is +Inf)
+OPERATION_LATENCY_BUCKETS_US = (
+    10, 50, 100, 500, 1_000, 5_000, 10_000, 50_000, 100_000, 500_000, 1_000_000, 5_000_000
+)
+
+
+class OperationStats:
+    """
+    Aggregated resource usage for one named operation.
+
+    Wall time is recorded on every call; CPU time and memory deltas only
+    on sampled calls. Unsampled calls are queued lock-free with add() and
+    folded into the aggregates in batches.
+    """
+
+    FOLD_BATCH = 256  # Queued wall times folded per lock acquisition
+
+    __slots__ = (
+        'name', 'calls', 'errors', 'wall_ns', 'cpu_ns', 'histogram',
+        'sampled_calls', 'memory_delta_bytes', 'memory_peak_delta_bytes', '_lock',
+        '_pending',
+    )
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        # Unsampled wall times; failures are stored as -(wall_ns + 1).
+        # deque.append/popleft are atomic, so queuing needs no lock.
+        self._pending: deque = deque()
+        self._reset_counters()
+
+    def _reset_counters(self) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.wall_ns = 0
+        self.cpu_ns = 0
+        self.histogram = [0] * (len(OPERATION_LATENCY_BUCKETS_US) + 1)
+        self.sampled_calls = 0
+        self.memory_delta_bytes = 0
+        self.memory_peak_delta_bytes = 0
+
+    def add(self, wall_ns: int, failed: bool) -> None:
+        """Queue an unsampled call without taking the lock."""
+        pending = self._pending
+        pending.append(~wall_ns if failed else wall_ns)
+        if len(pending) >= self.FOLD_BATCH:
+            self.fold()
+
+    def fold(self) -> None:
+        """Move queued calls into the aggregates."""
+        pending = self._pending
+        if not pending:
+            return
+        buckets = OPERATION_LATENCY_BUCKETS_US
+        histogram = self.histogram
+        with self._lock:
+            calls = errors = wall = 0
+            for _ in range(len(pending)):
+                wall_ns = pending.popleft()
+                if wall_ns < 0:
+                    wall_ns = ~wall_ns
+                    errors += 1
+                histogram[bisect.bisect_left(buckets, wall_ns // 1000)] += 1
+                calls += 1
+                wall += wall_ns
+            self.calls += calls
+            self.errors += errors
+            self.wall_ns += wall
+
+    def reset(self) -> None:
+        """Zero the aggregates in place (decorated functions keep this object)."""
+        with self._lock:
+            self._pending.clear()
+            self._reset_counters()
+
+    def record(self, wall_ns: int, cpu_ns: Optional[int], failed: bool,
+               memory_delta: Optional[int] = None) -> None:
+        """Add one call to the aggregates (cpu_ns/memory_delta only when sampled)."""
+        bucket = bisect.bisect_left(OPERATION_LATENCY_BUCKETS_US, wall_ns // 1000)
+        with self._lock:
+            self.calls += 1
+            self.wall_ns += wall_ns
+            self.histogram[bucket] += 1
+            if failed:
+                self.errors += 1
+            if cpu_ns is not None:
+                self.sampled_calls += 1
+                self.cpu_ns += cpu_ns
+            if memory_delta is not None:
+                self.memory_delta_bytes += memory_delta
+                if memory_delta > self.memory_peak_delta_bytes:
+                    self.memory_peak_delta_bytes = memory_delta
+
+    def percentile_us(self, q: float) -> float:
+        """Estimate a latency percentile (upper bucket bound, in microseconds)."""
+        total = sum(self.histogram)
+        if total == 0:
+            return 0.0
+        rank = q * total
+        seen = 0
+        for bound, count in zip(OPERATION_LATENCY_BUCKETS_US, self.histogram):
+            seen += count
+            if seen >= rank:
+                return float(bound)
+        return float('inf')
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization"""
+        self.fold()
+        with self._lock:
+            calls = self.calls
+            return {
+                'calls': calls,
+                'errors': self.errors,
+                'avg_wall_us': round(self.wall_ns / calls / 1000, 3) if calls else 0.0,
+                'avg_cpu_us': (
+                    round(self.cpu_ns / self.sampled_calls / 1000, 3) if self.sampled_calls else 0.0
+                ),
+                'p50_us': self.percentile_us(0.50),
+                'p95_us': self.percentile_us(0.95),
+                'p99_us': self.percentile_us(0.99),
+                'histogram': dict(zip(
+                    [str(b) for b in OPERATION_LATENCY_BUCKETS_US] + ['+Inf'],
+                    self.histogram
+                )),
+                'sampled_calls': self.sampled_calls,
+                'avg_memory_delta_bytes': (
+                    self.memory_delta_bytes // self.sampled_calls if self.sampled_calls else 0
+                ),
+                'peak_memory_delta_bytes': self.memory_peak_delta_bytes,
+            }
+
+
+class OperationResourceAccounting:
+    """
+    Per-operation resource accounting used by @monitor_operation_resources.
+
+    Replaces system-wide psutil snapshots around each call with cheap
+    per-call measurements:
+    - wall time via time.perf_counter_ns on every call
+    - CPU time of the calling thread via time.thread_time_ns, and a memory
+      delta via tracemalloc when it is tracing, only for a sampled fraction
+      of calls
+
+    Aggregates are logged (and pushed to Prometheus when available) every
+    export_interval seconds, checked lazily on the call path.
+    """
+
+    def __init__(self, sample_rate: float = 0.01, export_interval: float = 60.0,
+                 enabled: bool = True):
+        """
+        Initialize accounting.
+
+        Args:
+            sample_rate: Fraction of calls (0-1) that also measure CPU and memory
+            export_interval: Seconds between periodic exports
+            enabled: Whether accounting is active
+        """
+        self.sample_rate = sample_rate  # Also arms the sampling countdown
+        self.export_interval = export_interval
+        self.enabled = enabled
+        self._operations: Dict[str, OperationStats] = {}
+        self._lock = threading.Lock()
+        self._export_interval_ns = int(export_interval * 1e9)
+        self._next_export_ns = time.perf_counter_ns() + self._export_interval_ns
+        self._exported: Dict[str, Tuple[int, int, int]] = {}
+
+    def stats_for(self, name: str) -> OperationStats:
+        """Get (or create) the aggregates for an operation."""
+        stats = self._operations.get(name)
+        if stats is None:
+            with self._lock:
+                stats = self._operations.setdefault(name, OperationStats(name))
+        return stats
+
+    @property
+    def sample_rate(self) -> float:
+        """Fraction of calls (0-1) that also measure CPU and memory."""
+        return self._sample_rate
+
+    @sample_rate.setter
+    def sample_rate(self, rate: float) -> None:
+        self._sample_rate = rate
+        self._sample_countdown = self._sample_gap()
+
+    def _sample_gap(self) -> int:
+        """Calls until the next sample: geometric with mean 1/sample_rate."""
+        rate = self._sample_rate
+        if rate <= 0:
+            return sys.maxsize
+        if rate >= 1:
+            return 1
+        # Random gaps keep periodic call patterns from aliasing with the sampler
+        return int(math.log(1.0 - random.random()) / math.log1p(-rate)) + 1
+
+    def should_sample(self) -> bool:
+        """Decide whether the next call measures CPU time and memory.
+
+        A countdown rather than a random draw per call; races between
+        threads only perturb the sampling interval.
+        """
+        self._sample_countdown -= 1
+        if self._sample_countdown > 0:
+            return False
+        self._sample_countdown = self._sample_gap()
+        return self._sample_rate > 0
+
+    def maybe_export(self, now_ns: int) -> None:
+        """Export aggregates if the export interval has elapsed."""
+        if now_ns < self._next_export_ns:
+            return
+        with self._lock:
+            if now_ns < self._next_export_ns:
+                return
+            self._next_export_ns = now_ns + self._export_interval_ns
+        self.export()
+
+    def export(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Log current aggregates and push deltas to Prometheus.
+
+        Returns:
+            Snapshot of all operation statistics
+        """
+        snapshot = self.snapshot()
+        for name, stats in snapshot.items():
+            stats_obj = self._operations[name]
+            prev_calls, prev_wall, prev_cpu = self._exported.get(name, (0, 0, 0))
+            calls, wall_ns, cpu_ns = stats_obj.calls, stats_obj.wall_ns, stats_obj.cpu_ns
+            self._exported[name] = (calls, wall_ns, cpu_ns)
+            if OPERATION_CALLS_TOTAL is not None:
+                OPERATION_CALLS_TOTAL.labels(operation=name).inc(calls - prev_calls)
+                OPERATION_WALL_SECONDS_TOTAL.labels(operation=name).inc((wall_ns - prev_wall) / 1e9)
+                OPERATION_CPU_SECONDS_TOTAL.labels(operation=name).inc((cpu_ns - prev_cpu) / 1e9)
+                OPERATION_LATENCY_P99_SECONDS.labels(operation=name).set(stats['p99_us'] / 1e6)
+            logger.debug(
+                f"Operation '{name}': calls={stats['calls']}, errors={stats['errors']}, "
+                f"avg_wall={stats['avg_wall_us']}us, avg_cpu={stats['avg_cpu_us']}us, "
+                f"p99<={stats['p99_us']}us, peak_mem_delta={stats['peak_memory_delta_bytes']}B"
+            )
+            if stats['peak_memory_delta_bytes'] > 100 * 1024 * 1024:
+                logger.warning(
+                    f"High memory usage in '{name}': "
+                    f"+{stats['peak_memory_delta_bytes'] / (1024 * 1024):.1f}MB peak per call"
+                )
+        return snapshot
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Get statistics for all recorded operations."""
+        return {name: stats.to_dict() for name, stats in list(self._operations.items())}
+
+    def reset(self) -> None:
+        """Zero all aggregates (for testing).
+
+        Stats objects are reset in place rather than dropped: decorated
+        functions hold on to the ones they were created with.
+        """
+        with self._lock:
+            for stats in self._operations.values():
+                stats.reset()
+            self._exported.clear()
+
+
+def _memory_usage_bytes() -> Optional[int]:
+    """Traced memory for sampled deltas, or None when tracemalloc is off.
+
+    Peak RSS (getrusage ru_maxrss) only ever grows, so its delta around a
+    call is almost always zero and is not used as a fallback.
+    """
+    if tracemalloc.is_tracing():
+        return tracemalloc.get_traced_memory()[0]
+    return None
+
+
+_operation_accounting: Optional[OperationResourceAccounting] = None
+_operation_accounting_lock = threading.Lock()
+
+
+def get_operation_accounting() -> OperationResourceAccounting:
+    """
+    Get global per-operation accounting singleton.
+
+    Sample rate and export interval come from the resource_sample_rate and
+    resource_export_interval secrets (defaults: 0.01 and 60s).
+    """
+    global _operation_accounting
+    if _operation_accounting is None:
+        with _operation_accounting_lock:
+            if _operation_accounting is None:
+                sample_rate = float(get_secret('resource_sample_rate', default='0.01') or '0.01')
+                export_interval = float(get_secret('resource_export_interval', default='60') or '60')
+                _operation_accounting = OperationResourceAccounting(
+                    sample_rate=sample_rate,
+                    export_interval=export_interval,
+                )
+    return _operation_accounting
+
+
 def monitor_operation_resources(operation_name: Optional[str] = None):
     """
-    Decorator to monitor CPU and memory usage during operation execution.
+    Decorator to account CPU, wall time and memory used by an operation.
 
-    Logs resource usage before and after the operation, and warns if usage
-    exceeds thresholds during the operation.
+    Every call records wall time (perf_counter_ns) into per-operation
+    histograms; a sampled fraction of calls also records thread CPU time
+    (thread_time_ns) and, while tracemalloc is tracing, a memory delta. No system-wide snapshots are taken
+    on the call path. See get_operation_accounting() for the aggregates.
 
     Args:
         operation_name: Optional name for the operation (defaults to function name)
 
     Returns:
-        Decorated function that monitors resource usage
+        Decorated function that accounts resource usage
 
     Example:
         @monitor_operation_resources()
         def heavy_computation():
-            # Resource usage will be monitored
+            # Resource usage will be accounted
             pass
     """
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        op_name = operation_name or func.__name__
+        accounting = get_operation_accounting()
+        stats = accounting.stats_for(op_name)
+        perf_counter_ns = time.perf_counter_ns
+        thread_time_ns = time.thread_time_ns
+        should_sample = accounting.should_sample
+        add = stats.add
+
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> T:
-            op_name = operation_name or func.__name__
-            monitor = get_resource_monitor()
-
-            # Get initial metrics
-            initial_metrics = monitor.get_current_metrics()
-
-            logger.debug(
-                f"Starting operation '{op_name}' - "
-                f"CPU: {initial_metrics.cpu_percent:.1f}%, "
-                f"Memory: {initial_metrics.memory_percent:.1f}% "
-                f"({initial_metrics.process_memory_mb:.1f}MB)"
-            )
+            if not accounting.enabled:
+                return func(*args, **kwargs)
+
+            if not should_sample():
+                # Fast path: wall time only, queued without a lock
+                start = perf_counter_ns()
+                try:
+                    result = func(*args, **kwargs)
+                except BaseException:
+                    add(perf_counter_ns() - start, True)
+                    raise
+                end = perf_counter_ns()
+                add(end - start, False)
+                if end >= accounting._next_export_ns:
+                    accounting.maybe_export(end)
+                return result
 
+            memory_before = _memory_usage_bytes()
+            failed = True
+            start_cpu = thread_time_ns()
+            start = perf_counter_ns()
             try:
-                # Execute the function
                 result = func(*args, **kwargs)
-
-                # Get final metrics
-                final_metrics = monitor.get_current_metrics()
-
-                # Calculate resource usage during operation
-                cpu_used = final_metrics.cpu_percent - initial_metrics.cpu_percent
-                memory_used = final_metrics.process_memory_mb - initial_metrics.process_memory_mb
-
-                logger.debug(
-                    f"Completed operation '{op_name}' - "
-                    f"CPU delta: {cpu_used:+.1f}%, "
-                    f"Memory delta: {memory_used:+.1f}MB"
-                )
-
-                # Check for excessive resource usage
-                if cpu_used > 50.0:  # More than 50% CPU increase
-                    logger.warning(
-                        f"High CPU usage in '{op_name}': +{cpu_used:.1f}% "
-                        f"(final: {final_metrics.cpu_percent:.1f}%)"
-                    )
-
-                if memory_used > 100.0:  # More than 100MB memory increase
-                    logger.warning(
-                        f"High memory usage in '{op_name}': +{memory_used:.1f}MB "
-                        f"(final: {final_metrics.process_memory_mb:.1f}MB)"
-                    )
-
+                failed = False
                 return result
-
-            except Exception as e:
-                # Log resource usage even on failure
-                final_metrics = monitor.get_current_metrics()
-                cpu_used = final_metrics.cpu_percent - initial_metrics.cpu_percent
-                memory_used = final_metrics.process_memory_mb - initial_metrics.process_memory_mb
-
-                logger.error(
-                    f"Operation '{op_name}' failed after using "
-                    f"CPU: +{cpu_used:.1f}%, Memory: +{memory_used:.1f}MB - {e}"
+            finally:
+                end = perf_counter_ns()
+                cpu_ns = thread_time_ns() - start_cpu
+                memory_after = _memory_usage_bytes()
+                memory_delta = (
+                    memory_after - memory_before
+                    if memory_before is not None and memory_after is not None else None
                 )
-                raise
+                stats.record(end - start, cpu_ns, failed, memory_delta)
+                accounting.maybe_export(end)
 
         return wrapper
 
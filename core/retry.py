@@ -1,12 +1,18 @@
 """
 Self-Healing Retry Logic with Exponential Backoff + Full Jitter
 Implements automatic retry with exponential backoff before circuit breaker engagement.
+
+Retries can draw from a shared per-operation RetryBudget so a degraded
+dependency cannot be hit with (max_attempts x traffic), and async calls can
+be hedged: a second attempt starts after the operation's recent p95 latency.
 """
 import asyncio
 import random
+import threading
 import time
+from collections import deque
 from functools import wraps
-from typing import Callable, Any, Tuple, Optional
+from typing import Callable, Any, Deque, Dict, Tuple, Optional, Union
 from datetime import datetime
 import logging
 
@@ -43,6 +49,128 @@ RETRY_BACKOFF_LEVEL = Gauge(
     ['function']
 )
 
+RETRY_BUDGET_EXHAUSTED_TOTAL = Counter(
+    'astra_retry_budget_exhausted_total',
+    'Retries or hedges skipped because the retry budget was empty',
+    ['operation']
+)
+
+RETRY_HEDGES_TOTAL = Counter(
+    'astra_retry_hedges_total',
+    'Hedged requests launched, by which attempt won',
+    ['function', 'winner']  # primary, hedge
+)
+
+
+# ============================================================================
+# RETRY BUDGET
+# ============================================================================
+
+class RetryBudget:
+    """
+    Token bucket limiting retries to a fraction of recent successful calls.
+    
+    Every success deposits `ratio` tokens and every retry (or hedge) spends
+    one, so retries stay at roughly `ratio` of successful traffic. A small
+    `min_per_second` trickle keeps low-traffic operations able to retry.
+    
+    Example:
+        budget = get_retry_budget("redis", ratio=0.1)
+
+        @Retry(max_attempts=3, budget=budget)
+        async def get_value(key):
+            ...
+    """
+    
+    def __init__(
+        self,
+        operation: str = "default",
+        ratio: float = 0.1,
+        min_per_second: float = 1.0,
+        max_tokens: float = 100.0,
+    ):
+        """
+        Initialize retry budget.
+        
+        Args:
+            operation: Operation name used in metrics
+            ratio: Retry tokens deposited per successful call
+            min_per_second: Retry tokens added per second regardless of traffic
+            max_tokens: Bucket capacity (bounds retry bursts)
+        """
+        self.operation = operation
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+        self.exhausted_total = 0
+    
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._last_refill
+        if elapsed > 0:
+            self._tokens = min(self.max_tokens, self._tokens + elapsed * self.min_per_second)
+            self._last_refill = now
+    
+    def record_success(self) -> None:
+        """Deposit tokens for a successful call."""
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+    
+    def try_spend(self) -> bool:
+        """Spend one token for a retry; False (and counted) if the budget is empty."""
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return True
+            self.exhausted_total += 1
+        RETRY_BUDGET_EXHAUSTED_TOTAL.labels(operation=self.operation).inc()
+        return False
+    
+    @property
+    def tokens(self) -> float:
+        """Currently available retry tokens"""
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens
+
+
+_retry_budgets: Dict[str, RetryBudget] = {}
+_retry_budgets_lock = threading.Lock()
+
+
+def get_retry_budget(operation: str, **kwargs: Any) -> RetryBudget:
+    """
+    Get the shared retry budget for an operation, creating it on first use.
+    
+    Keyword arguments are passed to RetryBudget on creation only.
+    """
+    with _retry_budgets_lock:
+        budget = _retry_budgets.get(operation)
+        if budget is None:
+            budget = _retry_budgets[operation] = RetryBudget(operation, **kwargs)
+        return budget
+
+
+class _LatencyTracker:
+    """Recent successful-call latencies with a periodically refreshed p95."""
+    
+    def __init__(self, size: int = 200, refresh_every: int = 20):
+        self._samples: Deque[float] = deque(maxlen=size)
+        self._refresh_every = refresh_every
+        self._since_refresh = 0
+        self.p95: Optional[float] = None
+    
+    def observe(self, seconds: float) -> None:
+        self._samples.append(seconds)
+        self._since_refresh += 1
+        if self.p95 is None or self._since_refresh >= self._refresh_every:
+            ordered = sorted(self._samples)
+            self.p95 = ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))]
+            self._since_refresh = 0
+
 
 # ============================================================================
 # RETRY DECORATOR
@@ -60,6 +188,8 @@ class Retry:
     Features:
     - Configurable exception filtering
     - Full jitter to prevent thundering herd
+    - Optional shared retry budget to prevent retry storms
+    - Optional hedging of slow async calls
     - Prometheus metrics integration
     - Async/await compatible
     
@@ -67,6 +197,10 @@ class Retry:
         @Retry(max_attempts=3, base_delay=0.5)
         async def fetch_data():
             return await api.call()
+
+        @Retry(max_attempts=3, budget="model_loader", hedge=True)
+        async def load_shard(shard_id):
+            return await loader.fetch(shard_id)
     """
     
     def __init__(
@@ -75,7 +209,11 @@ class Retry:
         base_delay: float = 0.5,
         max_delay: float = 8.0,
         allowed_exceptions: Optional[Tuple] = None,
-        jitter_type: str = "full"
+        jitter_type: str = "full",
+        budget: Optional[Union[RetryBudget, str]] = None,
+        hedge: bool = False,
+        hedge_delay: Optional[float] = None,
+        hedge_min_samples: int = 20,
     ):
         """
         Initialize retry decorator.
@@ -87,6 +225,12 @@ class Retry:
             allowed_exceptions: Tuple of exception types to retry on
                                (default: TimeoutError, ConnectionError)
             jitter_type: Type of jitter - "full" (default), "equal", "decorrelated"
+            budget: RetryBudget, or operation name for get_retry_budget();
+                    retries and hedges are skipped when it is empty
+            hedge: Launch a second attempt for slow async calls and take
+                   whichever finishes first
+            hedge_delay: Fixed hedge delay in seconds (default: recent p95)
+            hedge_min_samples: Latency samples needed before p95 hedging starts
         """
         self.max_attempts = max_attempts
         self.base_delay = base_delay
@@ -99,6 +243,11 @@ class Retry:
         )
         self.jitter_type = jitter_type
         self.last_exception: Optional[Exception] = None
+        self.budget = get_retry_budget(budget) if isinstance(budget, str) else budget
+        self.hedge = hedge
+        self.hedge_delay = hedge_delay
+        self.hedge_min_samples = hedge_min_samples
+        self._latency = _LatencyTracker()
     
     def __call__(self, func: Callable) -> Callable:
         """Decorate async function with retry logic."""
@@ -129,10 +278,14 @@ class Retry:
         
         for attempt in range(self.max_attempts):
             try:
-                # Execute function
-                result = await func(*args, **kwargs)
+                # Execute function (possibly hedged)
+                if self.hedge:
+                    result = await self._hedged_call(func, args, kwargs, func_name)
+                else:
+                    result = await func(*args, **kwargs)
                 
                 # Success
+                self._record_success()
                 RETRY_ATTEMPTS_TOTAL.labels(outcome='success').inc()
                 if attempt > 0:
                     logger.debug(
@@ -154,6 +307,14 @@ class Retry:
                     )
                     raise
                 
+                # Shared budget: don't amplify load on a degraded dependency
+                if self.budget is not None and not self.budget.try_spend():
+                    logger.warning(
+                        f"Retry budget exhausted for {func_name} "
+                        f"({self.budget.operation}), not retrying: {str(e)}"
+                    )
+                    raise
+                
                 # Calculate backoff delay
                 delay = self._calculate_delay(attempt)
                 RETRY_BACKOFF_LEVEL.labels(function=func_name).set(attempt + 1)
@@ -195,6 +356,7 @@ class Retry:
                 result = func(*args, **kwargs)
                 
                 # Success
+                self._record_success()
                 RETRY_ATTEMPTS_TOTAL.labels(outcome='success').inc()
                 if attempt > 0:
                     logger.debug(
@@ -216,6 +378,14 @@ class Retry:
                     )
                     raise
                 
+                # Shared budget: don't amplify load on a degraded dependency
+                if self.budget is not None and not self.budget.try_spend():
+                    logger.warning(
+                        f"Retry budget exhausted for {func_name} "
+                        f"({self.budget.operation}), not retrying: {str(e)}"
+                    )
+                    raise
+                
                 # Calculate backoff delay
                 delay = self._calculate_delay(attempt)
                 RETRY_BACKOFF_LEVEL.labels(function=func_name).set(attempt + 1)
@@ -241,6 +411,62 @@ class Retry:
             raise last_exception
         raise RuntimeError(f"Unexpected retry exhaustion for {func_name}")
     
+    def _record_success(self) -> None:
+        if self.budget is not None:
+            self.budget.record_success()
+    
+    def _current_hedge_delay(self) -> Optional[float]:
+        """Hedge delay: fixed if configured, else p95 once enough samples exist."""
+        if self.hedge_delay is not None:
+            return self.hedge_delay
+        if len(self._latency._samples) < self.hedge_min_samples:
+            return None
+        return self._latency.p95
+    
+    async def _hedged_call(
+        self,
+        func: Callable,
+        args: tuple,
+        kwargs: dict,
+        func_name: str
+    ) -> Any:
+        """
+        Run one attempt, hedging it with a second call after the hedge delay.
+        
+        Returns the first successful result and cancels the other call. If
+        both fail, the primary's exception is raised.
+        """
+        start = time.monotonic()
+        delay = self._current_hedge_delay()
+        primary = asyncio.ensure_future(func(*args, **kwargs))
+        pending = {primary}
+        try:
+            if delay is not None:
+                done, _ = await asyncio.wait(pending, timeout=delay)
+                if not done and (self.budget is None or self.budget.try_spend()):
+                    pending.add(asyncio.ensure_future(func(*args, **kwargs)))
+            
+            if len(pending) == 1:
+                result = await primary
+                self._latency.observe(time.monotonic() - start)
+                return result
+            
+            errors: Dict[bool, BaseException] = {}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    error = task.exception()
+                    if error is None:
+                        winner = 'primary' if task is primary else 'hedge'
+                        RETRY_HEDGES_TOTAL.labels(function=func_name, winner=winner).inc()
+                        self._latency.observe(time.monotonic() - start)
+                        return task.result()
+                    errors[task is primary] = error
+            raise errors.get(True) or errors[False]
+        finally:
+            for task in pending:
+                task.cancel()
+    
     def _calculate_delay(self, attempt: int) -> float:
         """
         Calculate exponential backoff with jitter.
@@ -281,6 +507,8 @@ class Retry:
         """Reset all metrics (for testing)."""
         RETRY_ATTEMPTS_TOTAL._metrics.clear()
         RETRY_EXHAUSTIONS_TOTAL._metrics.clear()
+        RETRY_BUDGET_EXHAUSTED_TOTAL._metrics.clear()
+        RETRY_HEDGES_TOTAL._metrics.clear()
 
 
 # ============================================================================
@@ -313,6 +541,8 @@ def get_retry_metrics() -> dict:
     return {
         'attempts_total': RETRY_ATTEMPTS_TOTAL._metrics,
         'exhaustions_total': RETRY_EXHAUSTIONS_TOTAL._metrics,
+        'budget_exhausted_total': RETRY_BUDGET_EXHAUSTED_TOTAL._metrics,
+        'hedges_total': RETRY_HEDGES_TOTAL._metrics,
     }
 
 # merge coflicts
@@ -7,16 +7,22 @@ asynchronous operations to prevent hanging processes.
 Features:
 - @with_timeout decorator for sync functions
 - @async_timeout decorator for async functions
+- Shared bounded worker pool, inline and cooperative deadline modes
 - Cross-platform support (Windows, Linux, macOS)
 - Graceful timeout exceptions with context
 - Integration with circuit breaker and retry logic
 """
 
 import asyncio
+import contextvars
 import threading
 import functools
 import logging
-from typing import Callable, Any, Optional, TypeVar, cast
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from enum import Enum
+from typing import Callable, Any, Dict, Optional, TypeVar, cast
 from datetime import datetime
 
 # Import centralized secrets management
@@ -27,6 +33,31 @@ logger = logging.getLogger(__name__)
 # Type variable for generic function returns
 T = TypeVar('T')
 
+# Prometheus metrics (optional)
+try:
+    from prometheus_client import Counter, Gauge
+    TIMEOUT_ABANDONED_WORKERS_TOTAL = Counter(
+        'astra_timeout_abandoned_workers_total',
+        'Worker threads left running after their caller timed out',
+        ['mode']
+    )
+    TIMEOUT_ABANDONED_WORKERS_ACTIVE = Gauge(
+        'astra_timeout_abandoned_workers_active',
+        'Abandoned worker threads still running',
+        ['mode']
+    )
+except (ImportError, ValueError):
+    TIMEOUT_ABANDONED_WORKERS_TOTAL = None
+    TIMEOUT_ABANDONED_WORKERS_ACTIVE = None
+
+
+class TimeoutMode(str, Enum):
+    """How @with_timeout enforces its limit."""
+    POOL = "pool"                # Run in the shared bounded worker pool
+    THREAD = "thread"            # Dedicated thread per call (default)
+    INLINE = "inline"            # No enforcement, zero overhead for known-fast calls
+    COOPERATIVE = "cooperative"  # Run inline; the function polls check_deadline()
+
 
 class TimeoutError(Exception):
     """
@@ -52,16 +83,197 @@ class TimeoutError(Exception):
         super().__init__(msg)
 
 
-def with_timeout(seconds: float, operation_name: Optional[str] = None):
+class _AbandonedWorkerStats:
+    """Counts workers whose caller gave up waiting on them."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.abandoned_total: Dict[str, int] = {}
+        self.abandoned_active: Dict[str, int] = {}
+        self.cancelled_before_start = 0
+
+    def abandon(self, mode: str) -> None:
+        with self._lock:
+            self.abandoned_total[mode] = self.abandoned_total.get(mode, 0) + 1
+            self.abandoned_active[mode] = self.abandoned_active.get(mode, 0) + 1
+        if TIMEOUT_ABANDONED_WORKERS_TOTAL is not None:
+            TIMEOUT_ABANDONED_WORKERS_TOTAL.labels(mode=mode).inc()
+            TIMEOUT_ABANDONED_WORKERS_ACTIVE.labels(mode=mode).inc()
+
+    def finish(self, mode: str) -> None:
+        with self._lock:
+            self.abandoned_active[mode] = self.abandoned_active.get(mode, 1) - 1
+        if TIMEOUT_ABANDONED_WORKERS_ACTIVE is not None:
+            TIMEOUT_ABANDONED_WORKERS_ACTIVE.labels(mode=mode).dec()
+
+    def cancelled(self) -> None:
+        with self._lock:
+            self.cancelled_before_start += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'abandoned_total': dict(self.abandoned_total),
+                'abandoned_active': dict(self.abandoned_active),
+                'cancelled_before_start': self.cancelled_before_start,
+            }
+
+
+_worker_stats = _AbandonedWorkerStats()
+_worker_pool: Optional[ThreadPoolExecutor] = None
+_worker_pool_lock = threading.Lock()
+_in_pool_worker = threading.local()
+
+
+def _get_worker_pool() -> ThreadPoolExecutor:
+    """Get the shared timeout worker pool, creating it on first use."""
+    global _worker_pool
+    if _worker_pool is None:
+        with _worker_pool_lock:
+            if _worker_pool is None:
+                max_workers = int(get_secret('timeout_pool_workers', default='8') or '8')
+                _worker_pool = ThreadPoolExecutor(
+                    max_workers=max_workers,
+                    thread_name_prefix='astraguard-timeout'
+                )
+    return _worker_pool
+
+
+def _reset_worker_pool_after_fork() -> None:
+    """Drop the inherited pool in a forked child; its worker threads don't exist there."""
+    global _worker_pool, _worker_pool_lock
+    _worker_pool = None
+    _worker_pool_lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_worker_pool_after_fork)
+
+
+def get_timeout_metrics() -> Dict[str, Any]:
+    """Get abandoned/leaked worker counts for the timeout decorators."""
+    return _worker_stats.snapshot()
+
+
+def _run_in_thread(func: Callable[..., T], args: tuple, kwargs: dict,
+                   seconds: float, op_name: str) -> T:
+    """Legacy mode: run in a dedicated daemon thread per call."""
+    start_time = datetime.now()
+
+    # Container to hold result or exception
+    result_container: dict = {'exception': None, 'result': None, 'completed': False}
+    abandoned = threading.Event()
+
+    def target():
+        """Execute function in thread"""
+        try:
+            result_container['result'] = func(*args, **kwargs)
+        except Exception as e:
+            result_container['exception'] = e
+        finally:
+            result_container['completed'] = True
+            if abandoned.is_set():
+                _worker_stats.finish(TimeoutMode.THREAD.value)
+
+    # Start function in separate thread, inheriting the caller's deadline
+    thread = threading.Thread(target=contextvars.copy_context().run, args=(target,), daemon=True)
+    thread.start()
+
+    # Wait for completion or timeout
+    thread.join(timeout=seconds)
+
+    if not result_container['completed']:
+        # Timeout occurred; the thread keeps running until func returns
+        abandoned.set()
+        _worker_stats.abandon(TimeoutMode.THREAD.value)
+        elapsed = (datetime.now() - start_time).total_seconds()
+        logger.warning(
+            f"Timeout: {op_name} exceeded {seconds}s (elapsed: {elapsed:.2f}s)"
+        )
+        raise TimeoutError(op_name, seconds, start_time)
+
+    # Check for exception in thread
+    if result_container['exception']:
+        raise result_container['exception']
+
+    return cast(T, result_container['result'])
+
+
+def _run_in_pool(func: Callable[..., T], args: tuple, kwargs: dict,
+                 seconds: float, op_name: str) -> T:
+    """Pool mode: run in the shared bounded worker pool."""
+    if getattr(_in_pool_worker, 'active', False):
+        # Nested call from a pool worker: waiting on the same bounded pool
+        # could deadlock, so bound it cooperatively in this thread instead.
+        return _run_cooperative(func, args, kwargs, seconds, op_name)
+
+    start_time = datetime.now()
+
+    def target():
+        _in_pool_worker.active = True
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _in_pool_worker.active = False
+
+    # Run in a copy of the caller's context so an enclosing cooperative
+    # deadline is still visible to check_deadline() in the worker
+    future = _get_worker_pool().submit(contextvars.copy_context().run, target)
+    try:
+        return future.result(timeout=seconds)
+    except FutureTimeoutError:
+        if future.cancel():
+            # Never started (pool saturated); nothing is left running
+            _worker_stats.cancelled()
+        else:
+            _worker_stats.abandon(TimeoutMode.POOL.value)
+            future.add_done_callback(lambda _: _worker_stats.finish(TimeoutMode.POOL.value))
+        elapsed = (datetime.now() - start_time).total_seconds()
+        logger.warning(
+            f"Timeout: {op_name} exceeded {seconds}s (elapsed: {elapsed:.2f}s)"
+        )
+        raise TimeoutError(op_name, seconds, start_time)
+
+
+def _run_cooperative(func: Callable[..., T], args: tuple, kwargs: dict,
+                     seconds: float, op_name: str) -> T:
+    """Cooperative mode: run inline under a deadline the function checks.
+
+    Only check_deadline() raises; a call that finishes its work returns its
+    result even if it ran past the deadline after the last check.
+    """
+    with TimeoutContext(seconds, op_name, raise_on_exit=False):
+        return func(*args, **kwargs)
+
+
+_MODE_RUNNERS = {
+    TimeoutMode.POOL: _run_in_pool,
+    TimeoutMode.THREAD: _run_in_thread,
+    TimeoutMode.COOPERATIVE: _run_cooperative,
+}
+
+
+def with_timeout(seconds: float, operation_name: Optional[str] = None,
+                 mode: TimeoutMode = TimeoutMode.THREAD):
     """
     Decorator to enforce timeout on synchronous functions.
     
-    Uses threading.Timer for cross-platform compatibility.
-    When timeout is reached, raises TimeoutError.
+    When timeout is reached, raises TimeoutError. Modes:
+    - THREAD: run in a new thread per call (default)
+    - POOL: run in a shared, bounded worker pool (no thread creation per call);
+      once every worker is stuck in a timed-out call, new calls queue behind
+      them, so opt in only for calls that reliably finish
+    - INLINE: call the function directly with no enforcement
+    - COOPERATIVE: run inline; the function calls check_deadline() in its
+      loops, which raises once the deadline has passed
+    
+    In POOL and THREAD modes a timed-out call keeps running in its worker;
+    those workers are counted by get_timeout_metrics().
     
     Args:
         seconds: Maximum execution time in seconds
         operation_name: Optional name for logging (defaults to function name)
+        mode: Enforcement mode (default: TimeoutMode.THREAD)
     
     Returns:
         Decorated function that raises TimeoutError on timeout
@@ -72,46 +284,18 @@ def with_timeout(seconds: float, operation_name: Optional[str] = None):
             # Will raise TimeoutError if exceeds 5 seconds
             pass
     """
+    mode = TimeoutMode(mode)
+
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        if mode is TimeoutMode.INLINE:
+            return func
+
+        runner = _MODE_RUNNERS[mode]
+        op_name = operation_name or func.__name__
+
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> T:
-            op_name = operation_name or func.__name__
-            start_time = datetime.now()
-            
-            # Container to hold result or exception
-            result_container: dict = {'exception': None, 'result': None, 'completed': False}
-            timeout_triggered = threading.Event()
-            
-            def target():
-                """Execute function in thread"""
-                try:
-                    result_container['result'] = func(*args, **kwargs)
-                    result_container['completed'] = True
-                except Exception as e:
-                    result_container['exception'] = e
-                    result_container['completed'] = True
-            
-            # Start function in separate thread
-            thread = threading.Thread(target=target, daemon=True)
-            thread.start()
-            
-            # Wait for completion or timeout
-            thread.join(timeout=seconds)
-            
-            if not result_container['completed']:
-                # Timeout occurred
-                timeout_triggered.set()
-                elapsed = (datetime.now() - start_time).total_seconds()
-                logger.warning(
-                    f"Timeout: {op_name} exceeded {seconds}s (elapsed: {elapsed:.2f}s)"
-                )
-                raise TimeoutError(op_name, seconds, start_time)
-            
-            # Check for exception in thread
-            if result_container['exception']:
-                raise result_container['exception']
-            
-            return cast(T, result_container['result'])
+            return runner(func, args, kwargs, seconds, op_name)
         
         return wrapper
     
@@ -179,56 +363,86 @@ def async_timeout(seconds: float, operation_name: Optional[str] = None):
     return decorator
 
 
+_current_deadline: contextvars.ContextVar[Optional["TimeoutContext"]] = contextvars.ContextVar(
+    "astraguard_timeout_deadline", default=None
+)
+
+
 class TimeoutContext:
     """
     Context manager for timeout enforcement.
     
-    Useful for wrapping blocks of code with timeout protection.
+    Useful for wrapping blocks of code with timeout protection. The deadline
+    is checked cooperatively: call check_timeout() (or the module-level
+    check_deadline()) inside long loops. Unless raise_on_exit is False it
+    is checked again on exit. No timer thread is started.
     
     Example:
         with TimeoutContext(seconds=5.0, operation="data_processing"):
-            # Code here will timeout after 5 seconds
-            process_data()
+            for item in items:
+                check_deadline()
+                process(item)
     """
     
-    def __init__(self, seconds: float, operation: str = "operation"):
+    def __init__(self, seconds: float, operation: str = "operation",
+                 raise_on_exit: bool = True):
         self.seconds = seconds
         self.operation = operation
+        self.raise_on_exit = raise_on_exit
         self.start_time: Optional[datetime] = None
-        self._timer: Optional[threading.Timer] = None
-        self._timed_out = False
+        self._deadline: Optional[float] = None
+        self._token: Optional[contextvars.Token] = None
     
     def __enter__(self):
         self.start_time = datetime.now()
-        
-        def timeout_handler():
-            self._timed_out = True
-            logger.warning(
-                f"Context timeout: {self.operation} exceeded {self.seconds}s"
-            )
-        
-        self._timer = threading.Timer(self.seconds, timeout_handler)
-        self._timer.daemon = True
-        self._timer.start()
-        
+        self._deadline = time.monotonic() + self.seconds
+        self._token = _current_deadline.set(self)
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if self._timer:
-            self._timer.cancel()
+        if self._token is not None:
+            _current_deadline.reset(self._token)
+            self._token = None
         
-        if self._timed_out and exc_type is None:
+        if exc_type is None and self.raise_on_exit and self.timed_out:
             # Timeout occurred but no exception was raised
+            logger.warning(
+                f"Context timeout: {self.operation} exceeded {self.seconds}s"
+            )
             raise TimeoutError(self.operation, self.seconds, self.start_time)
         
         return False  # Don't suppress exceptions
     
+    @property
+    def timed_out(self) -> bool:
+        """Whether the deadline has passed."""
+        return self._deadline is not None and time.monotonic() >= self._deadline
+    
+    @property
+    def remaining(self) -> float:
+        """Seconds left before the deadline (0 once expired)."""
+        if self._deadline is None:
+            return self.seconds
+        return max(0.0, self._deadline - time.monotonic())
+    
     def check_timeout(self):
         """Manually check if timeout has been exceeded"""
-        if self._timed_out:
+        if self.timed_out:
             raise TimeoutError(self.operation, self.seconds, self.start_time)
 
 
+def check_deadline() -> None:
+    """
+    Raise TimeoutError if the innermost active TimeoutContext has expired.
+    
+    No-op when called outside any TimeoutContext, so functions decorated
+    with a COOPERATIVE @with_timeout can call it unconditionally.
+    """
+    ctx = _current_deadline.get()
+    if ctx is not None:
+        ctx.check_timeout()
+
+
 # Singleton for global timeout configuration
 class TimeoutConfig:
     """
@@ -23,7 +23,7 @@ if TYPE_CHECKING:
     import numpy as np
 
 # Import timeout and resource monitoring decorators
-from core.timeout_handler import with_timeout
+from core.timeout_handler import with_timeout, check_deadline, TimeoutMode
 from core.resource_monitor import monitor_operation_resources
 
 
@@ -143,7 +143,7 @@ class AdaptiveMemoryStore:
             if len(self.memory) > self.max_capacity:
                 self.prune(keep_critical=True)
 
-    @with_timeout(seconds=30.0)
+    @with_timeout(seconds=30.0, mode=TimeoutMode.COOPERATIVE)
     @monitor_operation_resources()
     def retrieve(
         self, query_embedding: Union[List[float], "np.ndarray"], top_k: int = DEFAULT_TOP_K
@@ -171,6 +171,8 @@ class AdaptiveMemoryStore:
 
         scores = []
         for event in self.memory:
+            check_deadline()
+
             # Calculate similarity
             similarity = self._cosine_similarity(query_embedding, event.embedding)
 
@@ -191,7 +193,9 @@ class AdaptiveMemoryStore:
         scores.sort(reverse=True, key=lambda x: x[0])
         return scores[:top_k]
 
-    @with_timeout(seconds=60.0)
+    # Cooperative: write() calls prune() while holding self._lock, which a
+    # worker thread could not acquire.
+    @with_timeout(seconds=60.0, mode=TimeoutMode.COOPERATIVE)
     @monitor_operation_resources()
     def prune(self, max_age_hours: int = DEFAULT_MAX_AGE_HOURS, keep_critical: bool = True) -> int:
         """
@@ -213,21 +217,19 @@ class AdaptiveMemoryStore:
             cutoff = datetime.now() - timedelta(hours=max_age_hours)
             initial_count = len(self.memory)
 
-            if keep_critical:
-                # Keep critical events and recent events
-                self.memory = [
-                    event
-                    for event in self.memory
-                    if event.is_critical or event.timestamp > cutoff
-                ]
-            else:
-                # Only keep recent events
-                self.memory = [event for event in self.memory if event.timestamp > cutoff]
+            # Build the survivors first so a timeout leaves the store unchanged
+            kept = []
+            for event in self.memory:
+                check_deadline()
+                # Keep recent events, and critical ones too if requested
+                if event.timestamp > cutoff or (keep_critical and event.is_critical):
+                    kept.append(event)
+            self.memory = kept
 
             pruned_count = initial_count - len(self.memory)
             return pruned_count
 
-    @with_timeout(seconds=30.0)
+    @with_timeout(seconds=30.0, mode=TimeoutMode.COOPERATIVE)
     @monitor_operation_resources()
     def replay(self, start_time: datetime, end_time: datetime) -> List[Dict]:
         """
@@ -247,11 +249,11 @@ class AdaptiveMemoryStore:
             raise ValueError("start_time must be before or equal to end_time")
         with self._lock:
             # Filter events in time range and sort by timestamp
-            filtered_events = [
-                event
-                for event in self.memory
-                if start_time <= event.timestamp <= end_time
-            ]
+            filtered_events = []
+            for event in self.memory:
+                check_deadline()
+                if start_time <= event.timestamp <= end_time:
+                    filtered_events.append(event)
 
             # Sort chronologically by event timestamp
             filtered_events.sort(key=lambda event: event.timestamp)
@@ -259,7 +261,7 @@ class AdaptiveMemoryStore:
             # Extract metadata
             return [event.metadata for event in filtered_events]
 
-    @with_timeout(seconds=60.0)
+    @with_timeout(seconds=60.0, mode=TimeoutMode.POOL)
     @monitor_operation_resources()
     def save(self) -> None:
         """Persist memory to disk with path validation."""
@@ -289,7 +291,7 @@ class AdaptiveMemoryStore:
                 logger.error(f"Failed to save memory store: {e}", exc_info=True)
                 raise
 
-    @with_timeout(seconds=60.0)
+    @with_timeout(seconds=60.0, mode=TimeoutMode.POOL)
     @monitor_operation_resources()
     def load(self) -> bool:
         """Load memory from disk with validation, error handling, and file locking."""
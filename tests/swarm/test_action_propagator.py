@@ -18,7 +18,7 @@ from unittest.mock import Mock, AsyncMock, patch
 from uuid import uuid5, NAMESPACE_DNS
 
 from astraguard.swarm.action_propagator import (
-    ActionPropagator, ActionState, ActionPropagatorMetrics
+    ActionPropagator, ActionState, ActionPropagatorMetrics, AgentIndex
 )
 from astraguard.swarm.types import ActionCommand, ActionCompleted, PriorityEnum
 from astraguard.swarm.models import AgentID
@@ -749,3 +749,192 @@ class TestUtilities:
         """Test get_compliance_status with non-existent action."""
         status = propagator.get_compliance_status("non_existent")
         assert status is None
+
+
+# ============================================================================
+# Test Bitset Tracking and Reverse Indexes
+# ============================================================================
+
+def _completion(action_id, agent, status="success"):
+    return {
+        "action_id": action_id,
+        "agent_id": agent.to_dict(),
+        "status": status,
+        "timestamp": datetime.utcnow().isoformat(),
+        "error": None if status == "success" else "failed",
+    }
+
+
+def _agents(count):
+    return [
+        AgentID(constellation="astra-v3.0", satellite_serial=f"SAT-{i:04d}",
+                uuid=uuid5(NAMESPACE_DNS, f"astra-v3.0:SAT-{i:04d}"))
+        for i in range(count)
+    ]
+
+
+class TestBitsetTracking:
+    """Test dense agent indices, bitset views and per-agent reverse indexes."""
+
+    def test_agent_index_round_trip(self):
+        index = AgentIndex()
+        mask = index.mask(["SAT-A", "SAT-B", "SAT-C"])
+        assert mask == 0b111
+        assert index.id("SAT-B") == 1
+        assert index.get("SAT-Z") is None
+        assert list(index.serials(0b101)) == ["SAT-A", "SAT-C"]
+
+    def test_set_views_track_bitsets(self, agent_id_1, agent_id_2, agent_id_3):
+        state = ActionState(
+            action_id="act",
+            action="safe_mode",
+            target_agents=[agent_id_1, agent_id_2, agent_id_3],
+            deadline=datetime.utcnow() + timedelta(seconds=30),
+        )
+        state.completed_agents.add("SAT-001")
+        state.failed_agents.add("SAT-002")
+        assert state.completed_mask == 1 << state.agent_index.get("SAT-001")
+        assert state.remaining_agents == {"SAT-003"}
+        assert state.remaining_agents | state.failed_agents == {"SAT-002", "SAT-003"}
+        assert "SAT-001" in state.completed_agents and "SAT-999" not in state.completed_agents
+        assert not state.all_responded
+
+        state.escalated_agents = {"SAT-002", "SAT-003"}
+        assert sorted(state.to_dict()["escalated_agents"]) == ["SAT-002", "SAT-003"]
+        state.completed_agents.discard("SAT-001")
+        assert state.compliance_percent == 0.0
+
+    def test_constructor_accepts_agent_sets(self, agent_id_1, agent_id_2, agent_id_3):
+        """completed/failed/escalated agents can still be passed in."""
+        deadline = datetime.utcnow() + timedelta(seconds=30)
+        state = ActionState(
+            "act", "safe_mode", [agent_id_1, agent_id_2, agent_id_3], deadline,
+            {"SAT-001"}, {"SAT-002"}, {"SAT-002"}, PriorityEnum.SAFETY,
+        )
+        assert state.completed_agents == {"SAT-001"}
+        assert state.failed_agents == {"SAT-002"}
+        assert state.escalated_agents == {"SAT-002"}
+        assert state.remaining_agents == {"SAT-003"}
+        assert state.priority == PriorityEnum.SAFETY
+
+    def test_set_views_support_set_api(self, agent_id_1, agent_id_2, agent_id_3):
+        state = ActionState(
+            action_id="act",
+            action="safe_mode",
+            target_agents=[agent_id_1, agent_id_2, agent_id_3],
+            deadline=datetime.utcnow() + timedelta(seconds=30),
+        )
+        state.completed_agents |= {"SAT-001"}
+        state.completed_agents.update(["SAT-002"], {"SAT-003"})
+        snapshot = state.completed_agents.copy()
+        state.completed_agents.difference_update({"SAT-002"})
+        assert snapshot == {"SAT-001", "SAT-002", "SAT-003"}
+        assert state.completed_agents == {"SAT-001", "SAT-003"}
+
+    @pytest.mark.asyncio
+    async def test_reverse_indexes_follow_merge_and_view_updates(self, propagator):
+        agents = _agents(3)
+        state = ActionState(
+            action_id="act_1",
+            action="safe_mode",
+            target_agents=agents,
+            deadline=datetime.utcnow() + timedelta(seconds=30),
+            agent_index=propagator.agent_index,
+        )
+        propagator.pending_actions |= {"act_1": state}
+        assert propagator.get_actions_behind(agents[0]) == {"act_1"}
+
+        state.completed_agents |= {"SAT-0000"}
+        state.escalated_agents.update(["SAT-0001"])
+        assert propagator.get_actions_behind(agents[0]) == set()
+        assert propagator.is_escalated(agents[1])
+
+        assert type(propagator.pending_actions.copy()) is dict
+        propagator.pending_actions.popitem()
+        assert propagator._behind == {} and propagator._escalated == {}
+
+    @pytest.mark.asyncio
+    async def test_waiter_wakes_on_last_completion(self, propagator, mock_bus):
+        """propagate_action returns as soon as every target has responded."""
+        agents = _agents(20)
+
+        async def respond(topic, payload, qos=2):
+            async def reply():
+                for agent in agents:
+                    await propagator._handle_action_completed(_completion(payload["action_id"], agent))
+            asyncio.ensure_future(reply())
+
+        mock_bus.publish = AsyncMock(side_effect=respond)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        action_id = await propagator.propagate_action(
+            action="safe_mode", parameters={}, target_agents=agents, deadline_seconds=10
+        )
+        assert loop.time() - start < 1.0
+        assert propagator.get_compliance_status(action_id)["compliance_percent"] == 100.0
+        assert propagator.get_non_compliant_agents(action_id) == set()
+
+    @pytest.mark.asyncio
+    async def test_reverse_indexes(self, propagator):
+        agents = _agents(4)
+        state = ActionState(
+            action_id="act_1",
+            action="safe_mode",
+            target_agents=agents[:3],
+            deadline=datetime.utcnow() + timedelta(seconds=30),
+            agent_index=propagator.agent_index,
+        )
+        propagator.pending_actions["act_1"] = state
+        other = ActionState(  # Private index: bits are translated
+            action_id="act_2",
+            action="attitude_adjust",
+            target_agents=agents[1:],
+            deadline=datetime.utcnow() + timedelta(seconds=30),
+        )
+        propagator.pending_actions["act_2"] = other
+
+        assert propagator.get_actions_behind(agents[0]) == {"act_1"}
+        assert propagator.get_actions_behind(agents[1]) == {"act_1", "act_2"}
+        assert propagator.get_actions_behind("SAT-0003") == {"act_2"}
+        assert propagator.get_actions_behind("SAT-UNKNOWN") == set()
+
+        await propagator._handle_action_completed(_completion("act_1", agents[1]))
+        await propagator._handle_action_completed(_completion("act_1", agents[2], "failed"))
+        assert propagator.get_actions_behind(agents[1]) == {"act_2"}
+
+        await propagator._evaluate_compliance("act_1")
+        assert state.escalated_agents == {"SAT-0000", "SAT-0002"}
+        assert propagator.get_escalated_actions(agents[2]) == {"act_1"}
+        assert propagator.is_escalated(agents[0])
+        assert not propagator.is_escalated(agents[1])
+
+        propagator.clear_action("act_1")
+        assert propagator.get_actions_behind(agents[0]) == set()
+        assert not propagator.is_escalated(agents[2])
+        del propagator.pending_actions["act_2"]
+        assert propagator._behind == {} and propagator._escalated == {}
+
+    @pytest.mark.asyncio
+    async def test_1000_agent_compliance(self, propagator):
+        """Compliance over 1000 agents matches set arithmetic."""
+        agents = _agents(1000)
+        state = ActionState(
+            action_id="big",
+            action="safe_mode",
+            target_agents=agents,
+            deadline=datetime.utcnow() + timedelta(seconds=30),
+            agent_index=propagator.agent_index,
+        )
+        propagator.pending_actions["big"] = state
+        for i, agent in enumerate(agents):
+            if i % 10 < 8:
+                await propagator._handle_action_completed(_completion("big", agent))
+            elif i % 10 == 8:
+                await propagator._handle_action_completed(_completion("big", agent, "failed"))
+        assert state.compliance_percent == 80.0
+        await propagator._evaluate_compliance("big")
+        expected = {agent.satellite_serial for i, agent in enumerate(agents) if i % 10 >= 8}
+        assert propagator.get_non_compliant_agents("big") == expected
+        assert propagator.metrics.escalation_count == 200
+        assert propagator.get_actions_behind(agents[9]) == {"big"}
+        assert propagator.get_actions_behind(agents[0]) == set()
@@ -171,6 +171,21 @@ class TestTokenAcquisition:
         result = governor.acquire_tokens(peer, 600, MessagePriority.NORMAL)
         
         assert result is False
+    
+    def test_oversized_message_admitted_as_debt(self):
+        """Test a message above the peer burst passes once the bucket is full."""
+        config, agent_id = create_config()
+        governor = BandwidthGovernor(config)
+        peer = create_agent_id("SAT001")
+        
+        assert governor.admission_tokens(peer, 600) == 500
+        assert governor.can_admit(peer, 600)
+        assert not governor.can_admit(peer, 600, reserved_peer=1)
+        assert governor.acquire_tokens(peer, 600, MessagePriority.CRITICAL, allow_debt=True)
+        assert not governor.can_admit(peer, 1)
+        assert governor.get_peer_utilization(peer) == 1.0
+        # Nothing more to this peer until the debt is repaid
+        assert not governor.acquire_tokens(peer, 100, MessagePriority.CRITICAL, allow_debt=True)
 
 
 class TestPriorityQueues:
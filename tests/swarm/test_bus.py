@@ -27,7 +27,8 @@ from astraguard.swarm.types import (
     SubscriptionID,
     MessageAck,
 )
-from astraguard.swarm.bus import SwarmMessageBus
+from astraguard.swarm.bus import SwarmMessageBus, TopicTrie
+from astraguard.swarm.types import OverflowPolicy
 
 
 class TestSwarmMessage:
@@ -98,6 +99,52 @@ class TestSwarmMessage:
         assert restored.payload == original.payload
         assert restored.qos == original.qos
 
+    def test_envelope_roundtrip(self):
+        """Binary envelope roundtrips every field."""
+        receiver = AgentID.create("astra-v3.0", "SAT-002-A")
+        original = SwarmMessage(
+            topic="intent/plan",
+            payload=bytes(range(256)),
+            sender=AgentID.create("astra-v3.0", "SAT-001-A"),
+            qos=2,
+            sequence=42,
+            receiver=receiver,
+        )
+        restored = SwarmMessage.from_bytes(original.to_bytes())
+        assert restored == original
+        assert restored.timestamp == original.timestamp
+        assert restored.receiver == receiver
+
+    def test_envelope_payload_is_zero_copy(self):
+        """Decoded payload is a read-only view into the received buffer."""
+        data = bytearray(self.create_valid_message(payload=b"heartbeat").to_bytes())
+        restored = SwarmMessage.from_bytes(data)
+        assert isinstance(restored.payload, memoryview)
+        assert restored.payload.readonly
+        data[-9:] = b"HEARTBEAT"
+        assert restored.payload == b"HEARTBEAT"
+
+    def test_envelope_smaller_than_json(self):
+        """Envelope carries the payload raw instead of hex inside JSON."""
+        msg = self.create_valid_message(payload=b"x" * 200)
+        assert len(msg.to_bytes()) < 300
+        assert len(json.dumps(msg.to_dict())) > 400
+
+    def test_envelope_rejects_bad_data(self):
+        """Truncated or foreign data raises ValueError."""
+        data = self.create_valid_message().to_bytes()
+        assert SwarmMessage.is_envelope(data)
+        with pytest.raises(ValueError):
+            SwarmMessage.from_bytes(data[:-1])
+        with pytest.raises(ValueError):
+            SwarmMessage.from_bytes(b"{}" + data[2:])
+
+    def test_memoryview_payload_accepted(self):
+        """Messages can be built directly on a memoryview payload."""
+        msg = self.create_valid_message(payload=memoryview(b"view"))
+        assert msg.payload == b"view"
+        assert msg.to_dict()["payload"] == b"view".hex()
+
 
 class TestTopicFilter:
     """Test suite for topic filtering."""
@@ -195,6 +242,29 @@ class TestSwarmMessageBus:
 
         bus.unsubscribe(sub_id)
 
+    @pytest.mark.asyncio
+    async def test_memoryview_payload_passthrough(self, bus_with_agents):
+        """memoryview payloads reach subscribers without a copy."""
+        bus, _ = bus_with_agents
+        received = []
+        bus.subscribe("health/summary", received.append)
+
+        view = memoryview(b"binary-heartbeat")
+        assert await bus.publish("health/summary", view, qos=QoSLevel.FIRE_FORGET)
+        assert received[0].payload is view
+
+    @pytest.mark.asyncio
+    async def test_receive_envelope(self, bus_with_agents):
+        """receive_frame accepts a single binary envelope."""
+        bus, agents = bus_with_agents
+        received = []
+        bus.subscribe("health/*", received.append)
+
+        message = SwarmMessage(topic="health/beat", payload=b"\x00\x01", sender=agents[0])
+        assert await bus.receive_frame(message.to_bytes()) == 1
+        assert received[0].payload == b"\x00\x01"
+        assert isinstance(received[0].payload, memoryview)
+
     @pytest.mark.asyncio
     async def test_topic_filtering(self, bus_with_agents):
         """Test topic filter matching."""
@@ -429,3 +499,254 @@ class TestQoSLevels:
     def test_qos_reliable(self):
         """Test QoS 2 enumeration."""
         assert QoSLevel.RELIABLE == 2
+
+
+class TestTopicTrie:
+    """Test suite for trie-indexed topic routing."""
+
+    @pytest.fixture
+    def bus(self):
+        agent = AgentID.create("astra-v3.0", "SAT-001-A")
+        config = SwarmConfig(
+            agent_id=agent,
+            role=SatelliteRole.PRIMARY,
+            constellation_id="astra-v3.0",
+        )
+        return SwarmMessageBus(config, SwarmSerializer(validate=False), latency_ms=0)
+
+    def test_trie_matches_topic_filter_semantics(self):
+        """Trie results agree with TopicFilter.matches for every pattern."""
+        patterns = [
+            "*", "health/*", "health/summary", "health/summary/*",
+            "intent/plan", "coord/*", "control/a/b",
+        ]
+        topics = [
+            "health/summary", "health/summary/detail", "health/", "health",
+            "intent/plan", "intent/plan/x", "coord/sync", "control/a/b", "control/a",
+        ]
+        trie = TopicTrie()
+        subs = {}
+        for pattern in patterns:
+            sub_id = SubscriptionID(topic_filter=pattern)
+            subs[sub_id] = TopicFilter(pattern)
+            trie.add(sub_id, pattern)
+
+        for topic in topics:
+            expected = {s for s, f in subs.items() if f.matches(topic)}
+            assert trie.match(topic) == expected, topic
+
+    def test_trie_remove_prunes_nodes(self):
+        """Removing the last subscription on a branch prunes it."""
+        trie = TopicTrie()
+        sub_id = SubscriptionID(topic_filter="health/summary/*")
+        trie.add(sub_id, "health/summary/*")
+        assert len(trie) == 1
+
+        assert trie.remove(sub_id, "health/summary/*") is True
+        assert trie.remove(sub_id, "health/summary/*") is False
+        assert len(trie) == 0
+        assert trie._root.children == {}
+
+    @pytest.mark.asyncio
+    async def test_delivery_preserves_subscription_order(self, bus):
+        """Matching subscribers are called in subscription order."""
+        order = []
+        bus.subscribe("health/summary", lambda m: order.append("exact"))
+        bus.subscribe("*", lambda m: order.append("all"))
+        bus.subscribe("health/*", lambda m: order.append("prefix"))
+
+        await bus.publish("health/summary", b"x", qos=0)
+        assert order == ["exact", "all", "prefix"]
+
+    @pytest.mark.asyncio
+    async def test_route_cache_invalidated_on_subscribe(self, bus):
+        """Memoized routes are hit on repeats and dropped on (un)subscribe."""
+        received = []
+        bus.subscribe("health/*", lambda m: received.append("first"))
+
+        await bus.publish("health/summary", b"x", qos=0)
+        await bus.publish("health/summary", b"x", qos=0)
+        metrics = bus.get_metrics()
+        assert metrics["route_cache_misses"] == 1
+        assert metrics["route_cache_hits"] == 1
+
+        second = bus.subscribe("health/summary", lambda m: received.append("second"))
+        await bus.publish("health/summary", b"x", qos=0)
+        assert received[-2:] == ["first", "second"]
+
+        bus.unsubscribe(second)
+        received.clear()
+        await bus.publish("health/summary", b"x", qos=0)
+        assert received == ["first"]
+
+    def test_route_cache_bounded(self, bus):
+        """Route memo evicts least recently used topics."""
+        bus.route_cache_size = 4
+        bus.subscribe("*", lambda m: None)
+        for i in range(10):
+            bus._match_subscribers(f"health/t{i}")
+        assert len(bus._route_cache) == 4
+        assert "health/t9" in bus._route_cache
+        assert "health/t0" not in bus._route_cache
+
+
+class TestSubscriberQueues:
+    """Test suite for per-subscriber queues and overflow policies."""
+
+    @pytest.fixture
+    async def bus(self):
+        agent = AgentID.create("astra-v3.0", "SAT-001-A")
+        config = SwarmConfig(
+            agent_id=agent,
+            role=SatelliteRole.PRIMARY,
+            constellation_id="astra-v3.0",
+        )
+        bus = SwarmMessageBus(config, SwarmSerializer(validate=False), latency_ms=0)
+        yield bus
+        await bus.close()
+
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_does_not_block_others(self, bus):
+        """A slow queued handler does not delay fast subscribers or the publisher."""
+        gate = asyncio.Event()
+        fast, slow = [], []
+
+        async def slow_handler(msg):
+            await gate.wait()
+            slow.append(msg)
+
+        bus.subscribe("health/*", slow_handler, queue_size=10)
+        bus.subscribe("health/*", lambda m: fast.append(m), queue_size=10)
+
+        for _ in range(3):
+            assert await bus.publish("health/summary", b"x", qos=0)
+        await asyncio.sleep(0.01)
+        assert len(fast) == 3
+        assert slow == []
+
+        gate.set()
+        await bus.drain()
+        assert len(slow) == 3
+
+    @pytest.mark.asyncio
+    async def test_drop_oldest(self, bus):
+        """Fire-forget overflow keeps the newest messages by default."""
+        gate = asyncio.Event()
+        seen = []
+
+        async def handler(msg):
+            await gate.wait()
+            seen.append(msg.sequence)
+
+        sub_id = bus.subscribe("health/*", handler, queue_size=2)
+        for _ in range(5):
+            await bus.publish("health/summary", b"x", qos=0)
+        gate.set()
+        await bus.drain()
+
+        # Publisher never yielded, so the worker only sees the newest two
+        assert seen == [4, 5]
+        metrics = bus.get_subscriber_metrics()[str(sub_id.id)]
+        assert metrics["dropped"] == 3
+        assert bus.get_metrics()["queue_dropped"] == 3
+
+    @pytest.mark.asyncio
+    async def test_drop_newest(self, bus):
+        """DROP_NEWEST discards incoming messages when full."""
+        gate = asyncio.Event()
+        seen = []
+
+        async def handler(msg):
+            await gate.wait()
+            seen.append(msg.sequence)
+
+        bus.subscribe(
+            "health/*", handler, queue_size=2,
+            overflow_policies={QoSLevel.FIRE_FORGET: OverflowPolicy.DROP_NEWEST},
+        )
+        for _ in range(5):
+            await bus.publish("health/summary", b"x", qos=0)
+        gate.set()
+        await bus.drain()
+        assert seen == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_block_applies_backpressure(self, bus):
+        """BLOCK makes the publisher wait for queue space."""
+        gate = asyncio.Event()
+        seen = []
+
+        async def handler(msg):
+            await gate.wait()
+            seen.append(msg.sequence)
+
+        bus.subscribe(
+            "health/*", handler, queue_size=1,
+            overflow_policies={QoSLevel.FIRE_FORGET: OverflowPolicy.BLOCK},
+        )
+        await bus.publish("health/summary", b"x", qos=0)
+        await bus.publish("health/summary", b"x", qos=0)
+        blocked = asyncio.ensure_future(bus.publish("health/summary", b"x", qos=0))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+
+        gate.set()
+        assert await blocked is True
+        await bus.drain()
+        assert seen == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_handler_errors_isolated(self, bus):
+        """A failing queued handler keeps its worker alive and is counted."""
+        seen = []
+
+        def handler(msg):
+            if msg.sequence == 1:
+                raise RuntimeError("boom")
+            seen.append(msg.sequence)
+
+        sub_id = bus.subscribe("health/*", handler, queue_size=4)
+        await bus.publish("health/summary", b"x", qos=0)
+        await bus.publish("health/summary", b"x", qos=0)
+        await bus.drain()
+
+        assert seen == [2]
+        metrics = bus.get_subscriber_metrics()[str(sub_id.id)]
+        assert metrics["errors"] == 1
+        assert metrics["delivered"] == 1
+
+    @pytest.mark.asyncio
+    async def test_ack_through_queue(self, bus):
+        """QoS 1 ACKs sent from a queued handler reach the publisher."""
+        async def handler(msg):
+            await bus.acknowledge(msg)
+
+        bus.subscribe("health/summary", handler, queue_size=4)
+        assert await bus.publish("health/summary", b"x", qos=QoSLevel.ACK, timeout_ms=1000)
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_stops_worker(self, bus):
+        """Unsubscribing cancels the worker task."""
+        sub_id = bus.subscribe("health/*", lambda m: None, queue_size=4)
+        await bus.publish("health/summary", b"x", qos=0)
+        worker = bus.subscriber_queues[sub_id]._worker
+        bus.unsubscribe(sub_id)
+        await asyncio.sleep(0)
+        assert worker.cancelled() or worker.done()
+        assert sub_id not in bus.subscriber_queues
+
+    @pytest.mark.asyncio
+    async def test_invalid_queue_options_register_nothing(self, bus):
+        delivered = []
+        for kwargs in (
+            {"queue_size": 0},
+            {"queue_size": 4, "overflow_policies": {QoSLevel.ACK: "spill"}},
+        ):
+            with pytest.raises(ValueError):
+                bus.subscribe("health/summary", delivered.append, **kwargs)
+        assert not bus.subscriptions
+        assert not bus.subscriber_queues
+        assert not bus.topic_index.match("health/summary")
+
+        await bus.publish("health/summary", b"x", qos=QoSLevel.FIRE_FORGET)
+        assert delivered == []
@@ -0,0 +1,202 @@
+"""
+Tests for ISL frame coalescing.
+
+Validates:
+- Frames round-trip every SwarmMessage field
+- Topics and agent ids are stored once per frame
+- Flush on size limit and on deadline
+- Transparent delivery through SwarmMessageBus
+- Payload efficiency metrics
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from astraguard.swarm.coalescer import FrameCoalescer, FLAG_LZ4
+from astraguard.swarm.models import AgentID, SatelliteRole, SwarmConfig
+from astraguard.swarm.serializer import SwarmSerializer
+from astraguard.swarm.bus import SwarmMessageBus
+from astraguard.swarm.types import SwarmMessage, QoSLevel
+
+
+SENDER = AgentID.create("astra-v3.0", "SAT-001-A")
+PEER = AgentID.create("astra-v3.0", "SAT-002-A")
+
+
+def make_message(seq: int, topic: str = "health/heartbeat", receiver=PEER, size: int = 24):
+    return SwarmMessage(
+        topic=topic,
+        payload=bytes([seq % 256]) * size,
+        sender=SENDER,
+        qos=0,
+        sequence=seq,
+        receiver=receiver,
+    )
+
+
+class FrameSink:
+    """Collects frames sent by the coalescer."""
+
+    def __init__(self):
+        self.frames = []
+
+    async def __call__(self, peer, frame):
+        self.frames.append((peer, frame))
+
+
+class TestFrameCoalescer:
+    """Test FrameCoalescer packing and flushing."""
+
+    @pytest.mark.asyncio
+    async def test_roundtrip_preserves_fields(self):
+        sink = FrameSink()
+        coalescer = FrameCoalescer(sink, flush_deadline_ms=1000)
+        originals = [make_message(i) for i in range(1, 6)]
+        originals.append(make_message(6, topic="intent/plan", receiver=None))
+        for message in originals:
+            await coalescer.add(message)
+        await coalescer.flush()
+
+        decoded = [m for _, frame in sink.frames for m in FrameCoalescer.unpack(frame)]
+        assert sorted(decoded, key=lambda m: m.sequence) == originals
+
+    @pytest.mark.asyncio
+    async def test_one_frame_per_peer(self):
+        sink = FrameSink()
+        coalescer = FrameCoalescer(sink, flush_deadline_ms=1000)
+        await coalescer.add(make_message(1, receiver=PEER))
+        await coalescer.add(make_message(2, receiver=None))
+        await coalescer.add(make_message(3, receiver=PEER))
+        await coalescer.flush()
+
+        peers = {peer: len(FrameCoalescer.unpack(frame)) for peer, frame in sink.frames}
+        assert peers == {PEER: 2, None: 1}
+
+    @pytest.mark.asyncio
+    async def test_shared_dictionary(self):
+        sink = FrameSink()
+        coalescer = FrameCoalescer(sink, flush_deadline_ms=1000, compress=False)
+        for i in range(20):
+            await coalescer.add(make_message(i))
+        await coalescer.flush()
+
+        frame = sink.frames[0][1]
+        assert frame.count(b"health/heartbeat") == 1
+        assert frame.count(b"SAT-001-A") == 1
+
+    @pytest.mark.asyncio
+    async def test_flush_on_size(self):
+        sink = FrameSink()
+        coalescer = FrameCoalescer(sink, max_frame_bytes=1024, flush_deadline_ms=1000,
+                                   compress=False)
+        for i in range(40):
+            await coalescer.add(make_message(i, size=100))
+        assert all(len(frame) <= 1024 for _, frame in sink.frames)
+        assert coalescer.get_stats().flushes["size"] >= 3
+
+        await coalescer.flush()
+        total = sum(len(FrameCoalescer.unpack(f)) for _, f in sink.frames)
+        assert total == 40
+
+    @pytest.mark.asyncio
+    async def test_flush_on_deadline(self):
+        sink = FrameSink()
+        coalescer = FrameCoalescer(sink, flush_deadline_ms=10)
+        await coalescer.add(make_message(1))
+        assert sink.frames == []
+        await asyncio.sleep(0.05)
+        assert len(sink.frames) == 1
+        assert coalescer.get_stats().flushes["deadline"] == 1
+        assert coalescer.pending_messages() == 0
+
+    @pytest.mark.asyncio
+    async def test_compression_single_pass(self):
+        sink = FrameSink()
+        coalescer = FrameCoalescer(sink, flush_deadline_ms=1000)
+        for i in range(50):
+            await coalescer.add(make_message(i, size=64))
+        await coalescer.flush()
+        frame = sink.frames[0][1]
+        assert frame[3] & FLAG_LZ4
+        assert len(FrameCoalescer.unpack(frame)) == 50
+
+    @pytest.mark.asyncio
+    async def test_efficiency_beats_json_envelopes(self):
+        sink = FrameSink()
+        coalescer = FrameCoalescer(sink, flush_deadline_ms=1000)
+        messages = [make_message(i) for i in range(50)]
+        for message in messages:
+            await coalescer.add(message)
+        await coalescer.flush()
+
+        json_bytes = sum(len(json.dumps(m.to_dict())) for m in messages) / len(messages)
+        stats = coalescer.get_stats().to_dict()
+        assert stats["messages_sent"] == 50
+        assert stats["bytes_per_message"] < json_bytes / 3
+
+    @pytest.mark.asyncio
+    async def test_unpacked_payloads_are_views(self):
+        sink = FrameSink()
+        coalescer = FrameCoalescer(sink, flush_deadline_ms=1000, compress=False)
+        await coalescer.add(make_message(1))
+        await coalescer.add(make_message(2, topic="intent/plan", size=8))
+        await coalescer.flush()
+
+        decoded = FrameCoalescer.unpack(sink.frames[0][1])
+        assert all(isinstance(m.payload, memoryview) for m in decoded)
+        assert decoded[0].payload.obj is sink.frames[0][1]
+        assert decoded[1].payload == bytes([2]) * 8
+
+    def test_unpack_rejects_garbage(self):
+        with pytest.raises(ValueError):
+            FrameCoalescer.unpack(b"XX\x01\x00\x00\x00")
+
+
+class TestBusCoalescing:
+    """Test transparent coalescing through SwarmMessageBus."""
+
+    @pytest.fixture
+    def bus(self):
+        config = SwarmConfig(
+            agent_id=SENDER,
+            role=SatelliteRole.PRIMARY,
+            constellation_id="astra-v3.0",
+        )
+        return SwarmMessageBus(config, SwarmSerializer(validate=False), latency_ms=0)
+
+    @pytest.mark.asyncio
+    async def test_subscribers_receive_unpacked_messages(self, bus):
+        received = []
+        bus.subscribe("health/*", lambda m: received.append(m))
+        bus.enable_coalescing(flush_deadline_ms=5)
+
+        for _ in range(10):
+            assert await bus.publish("health/heartbeat", b"beat", qos=0)
+        assert received == []
+        await asyncio.sleep(0.03)
+
+        assert [m.sequence for m in received] == list(range(1, 11))
+        assert all(m.payload == b"beat" for m in received)
+        coalescing = bus.get_metrics()["coalescing"]
+        assert coalescing["frames_sent"] == 1
+        assert coalescing["messages_sent"] == 10
+
+    @pytest.mark.asyncio
+    async def test_ack_qos_through_coalescer(self, bus):
+        async def ack_subscriber(message):
+            await bus.acknowledge(message)
+
+        bus.subscribe("health/summary", ack_subscriber)
+        bus.enable_coalescing(flush_deadline_ms=5)
+        assert await bus.publish("health/summary", b"x", qos=QoSLevel.ACK, timeout_ms=1000)
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_pending(self, bus):
+        received = []
+        bus.subscribe("health/*", lambda m: received.append(m))
+        bus.enable_coalescing(flush_deadline_ms=10_000)
+        await bus.publish("health/heartbeat", b"beat", qos=0)
+        await bus.close()
+        assert len(received) == 1
@@ -12,10 +12,30 @@ Issue #399: Compression tests
 import pytest
 import time
 import json
+import random
+import struct
 from datetime import datetime
 
 from astraguard.swarm.models import HealthSummary
-from astraguard.swarm.compressor import StateCompressor, CompressionStats
+from astraguard.swarm.compressor import (
+    StateCompressor,
+    CompressionStats,
+    lz4_level_for_budget,
+    LZ4_MAX_LEVEL,
+)
+
+
+def reference_encode(summary: HealthSummary, prev_sig) -> bytes:
+    """Scalar struct-based encoder the vectorized stages must match (no LZ4)."""
+    sig = summary.anomaly_signature
+    deltas = sig if prev_sig is None else [c - p for c, p in zip(sig, prev_sig)]
+    out = struct.pack("<BBH", 1, 0, 140)
+    out += struct.pack("<ff", summary.risk_score, summary.recurrence_score)
+    for value in deltas:
+        value = struct.unpack("<f", struct.pack("<f", value))[0]
+        clamped = max(-1.0, min(1.0, value))
+        out += struct.pack("<B", int(round((clamped + 1.0) / 2.0 * 255)))
+    return out
 
 
 class TestStateCompressor:
@@ -339,3 +359,160 @@ class TestCompressionPipeline:
         # Should achieve decent compression
         avg_ratio = 100.0 * (1.0 - total_compressed / total_original)
         assert avg_ratio > 50  # At least 50% compression on batch
+
+
+class TestVectorizedStages:
+    """Vectorized stages stay byte-compatible with the scalar format."""
+
+    def test_matches_reference_encoder(self):
+        rng = random.Random(1234)
+        compressor = StateCompressor()
+        prev_sig = None
+        for _ in range(200):
+            summary = HealthSummary(
+                anomaly_signature=[rng.uniform(-1.5, 1.5) for _ in range(32)],
+                risk_score=rng.random(),
+                recurrence_score=rng.uniform(0, 10),
+                timestamp=datetime.utcnow(),
+            )
+            assert compressor.compress_health(summary, use_lz4=False) == \
+                reference_encode(summary, prev_sig)
+            prev_sig = summary.anomaly_signature
+
+    def test_rounding_half_to_even(self):
+        """Exact .5 quantization steps round like Python's round()."""
+        # (x + 1) / 2 * 255 == 127.5 exactly at x = 0.0 (after clamping math)
+        sig = [0.0, 1.0 / 255.0, -1.0 / 255.0] + [0.5] * 29
+        summary = HealthSummary(
+            anomaly_signature=sig, risk_score=0.5, recurrence_score=1.0,
+            timestamp=datetime.utcnow(),
+        )
+        assert StateCompressor().compress_health(summary, use_lz4=False) == \
+            reference_encode(summary, None)
+
+    def test_stage_timings_recorded(self):
+        compressor = StateCompressor()
+        compressor.compress_health(TestStateCompressor.create_health_summary())
+        assert set(compressor.stats.stage_timings_us) == {"delta", "quantize", "lz4"}
+
+    def test_compression_level_from_budget(self):
+        assert lz4_level_for_budget(None) == 0
+        assert lz4_level_for_budget(5.0) == 0
+        assert lz4_level_for_budget(50.0) == 3
+        assert lz4_level_for_budget(1000.0) == LZ4_MAX_LEVEL
+        assert StateCompressor(latency_budget_us=1000.0).compression_level == LZ4_MAX_LEVEL
+        assert StateCompressor(compression_level=9, latency_budget_us=1.0).compression_level == 9
+
+    @pytest.mark.parametrize("level", [0, 3, 12])
+    def test_roundtrip_any_level(self, level):
+        summary = TestStateCompressor.create_health_summary()
+        data = StateCompressor(compression_level=level).compress_health(summary)
+        restored = StateCompressor().decompress(data)
+        for orig, rest in zip(summary.anomaly_signature, restored.anomaly_signature):
+            assert abs(orig - rest) <= 0.01
+
+
+class TestPeerContexts:
+    """Per-peer delta contexts with keyframes and resync."""
+
+    @staticmethod
+    def summary(step: int) -> HealthSummary:
+        return HealthSummary(
+            anomaly_signature=[0.3 * ((i + step) % 7) / 7 for i in range(32)],
+            risk_score=0.4,
+            recurrence_score=2.0,
+            timestamp=datetime.utcnow(),
+        )
+
+    @staticmethod
+    def agent(serial: str):
+        from astraguard.swarm.models import AgentID
+        return AgentID.create("astra-v3.0", serial)
+
+    def test_version2_header_and_keyframes(self):
+        peer = self.agent("SAT-002-A")
+        encoder = StateCompressor(keyframe_interval=3)
+        frames = [encoder.compress_for_peer(peer, self.summary(i)) for i in range(7)]
+
+        versions = {f[0] for f in frames}
+        keyframes = [bool(f[1] & 0x02) for f in frames]
+        seqs = [struct.unpack_from("<H", f, 4)[0] for f in frames]
+        assert versions == {2}
+        assert keyframes == [True, False, False, True, False, False, True]
+        assert seqs == list(range(7))
+
+    def test_decoders_isolated_per_sender(self):
+        a, b, receiver = self.agent("SAT-00A-A"), self.agent("SAT-00B-A"), self.agent("SAT-00R-A")
+        enc_a, enc_b = StateCompressor(), StateCompressor()
+        decoder = StateCompressor()
+
+        for step in range(5):
+            sa, sb = self.summary(step), self.summary(step + 3)
+            ra = decoder.decompress_from_peer(a, enc_a.compress_for_peer(receiver, sa))
+            rb = decoder.decompress_from_peer(b, enc_b.compress_for_peer(receiver, sb))
+            for orig, rest in zip(sa.anomaly_signature, ra.anomaly_signature):
+                assert abs(orig - rest) <= 0.01
+            for orig, rest in zip(sb.anomaly_signature, rb.anomaly_signature):
+                assert abs(orig - rest) <= 0.01
+
+    def test_closed_loop_error_does_not_accumulate(self):
+        peer = self.agent("SAT-002-A")
+        encoder = StateCompressor(keyframe_interval=1000)
+        decoder = StateCompressor()
+        for step in range(200):
+            summary = self.summary(step)
+            restored = decoder.decompress_from_peer(peer, encoder.compress_for_peer(peer, summary))
+            worst = max(abs(o - r) for o, r in zip(summary.anomaly_signature,
+                                                  restored.anomaly_signature))
+            assert worst <= 0.01
+
+    def test_gap_requests_resync_once(self):
+        sender = self.agent("SAT-001-A")
+        resyncs = []
+        encoder = StateCompressor(keyframe_interval=100)
+        decoder = StateCompressor(resync_callback=resyncs.append)
+
+        frames = [encoder.compress_for_peer(None, self.summary(i)) for i in range(5)]
+        assert decoder.decompress_from_peer(sender, frames[0]) is not None
+        # frames[1] lost
+        assert decoder.decompress_from_peer(sender, frames[2]) is None
+        assert decoder.decompress_from_peer(sender, frames[3]) is None
+        assert resyncs == [sender]
+
+        encoder.request_keyframe(None)
+        keyframe = encoder.compress_for_peer(None, self.summary(5))
+        assert decoder.decompress_from_peer(sender, keyframe) is not None
+        assert decoder.decompress_from_peer(
+            sender, encoder.compress_for_peer(None, self.summary(6))
+        ) is not None
+
+        stats = decoder.get_peer_stats()
+        assert stats["gaps_detected"] == 1
+        assert stats["resync_requests"] == 1
+        assert stats["frames_dropped"] == 2
+
+    def test_duplicate_frame_ignored(self):
+        sender = self.agent("SAT-001-A")
+        encoder, decoder = StateCompressor(), StateCompressor()
+        first = encoder.compress_for_peer(None, self.summary(0))
+        second = encoder.compress_for_peer(None, self.summary(1))
+        decoder.decompress_from_peer(sender, first)
+        assert decoder.decompress_from_peer(sender, second) is not None
+        assert decoder.decompress_from_peer(sender, second) is None
+        assert decoder.decompress_from_peer(
+            sender, encoder.compress_for_peer(None, self.summary(2))
+        ) is not None
+        assert decoder.get_peer_stats()["resync_requests"] == 0
+
+    def test_lru_eviction_bounds_contexts(self):
+        encoder = StateCompressor(max_peers=4)
+        for i in range(10):
+            encoder.compress_for_peer(self.agent(f"SAT-{i:03d}-A"), self.summary(i))
+        stats = encoder.get_peer_stats()
+        assert stats["encoder_contexts"] == 4
+        assert stats["evictions"] == 6
+
+    def test_legacy_decompress_accepts_keyframe(self):
+        frame = StateCompressor().compress_for_peer(None, self.summary(0))
+        restored = StateCompressor().decompress(frame)
+        assert len(restored.anomaly_signature) == 32
@@ -23,9 +23,10 @@ from astraguard.swarm.consensus import (
     ConsensusEngine, ProposalRequest, ProposalState, ConsensusMetrics, NotLeaderError
 )
 from astraguard.swarm.leader_election import LeaderElection, ElectionState
-from astraguard.swarm.models import AgentID, SwarmConfig
+from astraguard.swarm.models import AgentID, SatelliteRole, SwarmConfig
 from astraguard.swarm.bus import SwarmMessageBus
-from astraguard.swarm.registry import SwarmRegistry
+from astraguard.swarm.registry import PeerState, SwarmRegistry
+from astraguard.swarm.serializer import SwarmSerializer
 from astraguard.swarm.types import QoSLevel
 
 
@@ -45,6 +46,15 @@ def mock_registry():
     registry.get_alive_peers = Mock(return_value=[
         AgentID.create("astra-v3.0", f"SAT-{i:03d}") for i in range(1, 6)
     ])
+    registry.get_alive_count = Mock(side_effect=lambda: len(registry.get_alive_peers()))
+    registry.alive_version = 0
+
+    async def wait_for_change(since_version=None, timeout=None):
+        # Membership stays fixed unless a test changes it
+        await asyncio.sleep(3600 if timeout is None else timeout)
+        return registry.alive_version
+
+    registry.wait_for_change = wait_for_change
     return registry
 
 
@@ -293,11 +303,11 @@ class TestProposalExecution:
             # Get the proposal ID from pending
             for prop_id in consensus_engine.pending_proposals:
                 # Add 2 more votes to reach quorum of 3
-                consensus_engine.proposal_votes[prop_id].add(
-                    AgentID.create("astra-v3.0", "SAT-002-B")
+                consensus_engine._record_grant(
+                    prop_id, AgentID.create("astra-v3.0", "SAT-002-B")
                 )
-                consensus_engine.proposal_votes[prop_id].add(
-                    AgentID.create("astra-v3.0", "SAT-003-C")
+                consensus_engine._record_grant(
+                    prop_id, AgentID.create("astra-v3.0", "SAT-003-C")
                 )
 
         vote_task = asyncio.create_task(auto_vote())
@@ -389,6 +399,136 @@ class TestVoteHandling:
         assert True
 
 
+# ============================================================================
+# Event-Driven Quorum and Vote Batching Tests
+# ============================================================================
+
+class TestEventDrivenQuorum:
+    """Test vote-driven quorum futures and batched votes."""
+
+    @pytest.mark.asyncio
+    async def test_quorum_resolves_on_vote_arrival(self, consensus_engine):
+        """Quorum is reported as soon as the deciding vote arrives."""
+        async def vote_later():
+            await asyncio.sleep(0.01)
+            for prop_id in list(consensus_engine.pending_proposals):
+                await consensus_engine._handle_vote_batch(
+                    {"voter_id": "SAT-002", "grants": [prop_id], "denials": {}}
+                )
+                await consensus_engine._handle_vote_batch(
+                    {"voter_id": "SAT-003", "grants": [prop_id], "denials": {}}
+                )
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        voter = asyncio.create_task(vote_later())
+        assert await consensus_engine.propose("safe_mode", {}, timeout=2) is True
+        await voter
+
+        # No 100ms polling quantum
+        assert loop.time() - start < 0.08
+        metrics = consensus_engine.get_metrics()
+        assert metrics.timeout_count == 0
+        assert metrics.in_flight == 0
+        assert 0 < metrics.to_dict()["time_to_quorum_p99_ms"] < 80
+
+    @pytest.mark.asyncio
+    async def test_denials_resolve_false(self, consensus_engine):
+        """All peers responding without quorum resolves the proposal False."""
+        async def deny_later():
+            await asyncio.sleep(0.01)
+            for prop_id in list(consensus_engine.pending_proposals):
+                for i in range(2, 6):
+                    await consensus_engine._handle_vote_batch({
+                        "voter_id": f"SAT-{i:03d}",
+                        "grants": [],
+                        "denials": {prop_id: "battery_critical"},
+                    })
+
+        voter = asyncio.create_task(deny_later())
+        assert await consensus_engine.propose("safe_mode", {}, timeout=2) is False
+        await voter
+        assert consensus_engine.metrics.denied_count == 1
+        assert consensus_engine.metrics.timeout_count == 0
+
+    @pytest.mark.asyncio
+    async def test_pipelined_proposals_share_vote_batches(
+        self, mock_config, mock_election, mock_registry, mock_bus
+    ):
+        """A peer answers many in-flight proposals with one batched message."""
+        peer_config = Mock(spec=SwarmConfig)
+        peer_config.agent_id = AgentID.create("astra-v3.0", "SAT-002")
+        peer_config.SWARM_MODE_ENABLED = True
+        peer = ConsensusEngine(peer_config, mock_election, mock_registry, mock_bus)
+
+        for i in range(20):
+            await peer._handle_proposal_request(
+                {"proposal_id": f"p{i}", "action": "safe_mode", "params": {}}
+            )
+        await peer._flush_task
+
+        batches = [
+            c for c in mock_bus.publish.call_args_list
+            if c.args[0] == ConsensusEngine.VOTE_BATCH_TOPIC
+        ]
+        assert len(batches) == 1
+        payload = batches[0].args[1]
+        assert payload["voter_id"] == "SAT-002"
+        assert payload["grants"] == [f"p{i}" for i in range(20)]
+        assert batches[0].kwargs["receiver"] == mock_election.get_leader()
+        assert peer.metrics.vote_batches_sent == 1
+        assert peer.metrics.votes_sent == 20
+
+    @pytest.mark.asyncio
+    async def test_concurrent_proposals_tracked_in_flight(self, consensus_engine):
+        """Concurrent proposals resolve independently."""
+        async def vote_all():
+            while len(consensus_engine.pending_proposals) < 5:
+                await asyncio.sleep(0.001)
+            ids = list(consensus_engine.pending_proposals)
+            for serial in ("SAT-002", "SAT-003"):
+                await consensus_engine._handle_vote_batch(
+                    {"voter_id": serial, "grants": ids, "denials": {}}
+                )
+
+        voter = asyncio.create_task(vote_all())
+        results = await asyncio.gather(
+            *(consensus_engine.propose("safe_mode", {}, timeout=2) for _ in range(5))
+        )
+        await voter
+        assert results == [True] * 5
+        assert consensus_engine.metrics.max_in_flight == 5
+        assert consensus_engine.metrics.timeout_count == 0
+
+    @pytest.mark.asyncio
+    async def test_membership_change_rechecks_quorum(self, mock_config, mock_election, mock_bus):
+        """A peer leaving the registry can complete a waiting proposal."""
+        config = SwarmConfig(
+            agent_id=mock_config.agent_id,
+            role=SatelliteRole.PRIMARY,
+            constellation_id="astra-v3.0",
+        )
+        registry = SwarmRegistry(config, mock_config.agent_id)
+        peers = [AgentID.create("astra-v3.0", f"SAT-{i:03d}") for i in (2, 3)]
+        for peer_id in peers:
+            registry.peers[peer_id] = PeerState(
+                agent_id=peer_id, role=SatelliteRole.PRIMARY, last_heartbeat=datetime.utcnow()
+            )
+        engine = ConsensusEngine(mock_config, mock_election, registry, mock_bus)
+        engine.proposal_votes["test"] = {mock_config.agent_id}
+        engine.proposal_denials["test"] = {}
+
+        # 3 alive → quorum 2; only self has voted
+        waiter = asyncio.create_task(engine._wait_for_quorum("test", "safe_mode"))
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+
+        # 2 alive → quorum 1
+        del registry.peers[peers[0]]
+        assert await asyncio.wait_for(waiter, timeout=1.0) is True
+        await engine.stop()
+
+
 # ============================================================================
 # Metrics Tests
 # ============================================================================
@@ -510,5 +650,57 @@ class TestScalability:
         assert approved is True
 
 
+
+# ============================================================================
+# Real Bus Tests
+# ============================================================================
+
+class TestRealBus:
+    """Elections and consensus wired through a real SwarmMessageBus."""
+
+    @pytest.mark.asyncio
+    async def test_elected_leader_reaches_quorum_over_bus(self, mock_registry):
+        """Nodes sharing one bus elect a leader whose proposal gets real votes."""
+        agents = [AgentID.create("astra-v3.0", f"SAT-{i:03d}") for i in range(1, 4)]
+        mock_registry.get_alive_peers.return_value = agents
+        bus = SwarmMessageBus(
+            SwarmConfig(agent_id=agents[0], role=SatelliteRole.PRIMARY, constellation_id="astra-v3.0"),
+            SwarmSerializer(validate=False),
+            latency_ms=0,
+        )
+        nodes = []
+        for agent_id in agents:
+            config = Mock(spec=SwarmConfig)
+            config.agent_id = agent_id
+            config.SWARM_MODE_ENABLED = True
+            election = LeaderElection(config, mock_registry, bus)
+            nodes.append((election, ConsensusEngine(config, election, mock_registry, bus)))
+        for election, engine in nodes:
+            await election.start()
+            await engine.start()
+        try:
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + 5.0
+            while not any(election.is_leader() for election, _ in nodes):
+                assert loop.time() < deadline, "no leader elected"
+                await asyncio.sleep(0.01)
+            leader_engine = next(engine for election, engine in nodes if election.is_leader())
+
+            assert await leader_engine.propose("safe_mode", {}, timeout=2) is True
+            assert leader_engine.get_metrics().timeout_count == 0
+            await asyncio.sleep(0.02)
+            proposal_id = leader_engine.get_metrics().last_proposal_id
+            assert all(
+                proposal_id in engine.executed_proposals
+                for _, engine in nodes if engine is not leader_engine
+            )
+        finally:
+            for election, engine in nodes:
+                await engine.stop()
+                await election.stop()
+            await bus.close()
+            assert not bus.subscriptions
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])
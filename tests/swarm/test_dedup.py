@@ -0,0 +1,92 @@
+"""
+Tests for the bounded FIFO deduplication window.
+
+Validates:
+- Duplicate detection within the window
+- Strict oldest-first eviction at capacity
+- Memory bound holds with discards
+- Sharing between SwarmMessageBus and ReliableDelivery
+"""
+
+import pytest
+
+from astraguard.swarm.dedup import DedupWindow
+from astraguard.swarm.models import AgentID, SatelliteRole, SwarmConfig
+from astraguard.swarm.serializer import SwarmSerializer
+from astraguard.swarm.bus import SwarmMessageBus
+from astraguard.swarm.reliable_delivery import ReliableDelivery
+
+
+class TestDedupWindow:
+    """Test DedupWindow behaviour."""
+
+    def test_duplicate_rejected(self):
+        window = DedupWindow(capacity=10)
+        assert window.add("a") is True
+        assert window.add("a") is False
+        assert "a" in window
+        assert len(window) == 1
+
+    def test_evicts_oldest_first(self):
+        window = DedupWindow(capacity=3)
+        for key in ("a", "b", "c", "d"):
+            window.add(key)
+        assert "a" not in window
+        assert list(window) == ["b", "c", "d"]
+        assert window.evictions == 1
+
+    def test_eviction_follows_arrival_not_value(self):
+        """Sequences arriving out of order are evicted by arrival time."""
+        window = DedupWindow(capacity=3)
+        for seq in (5, 1, 9, 2):
+            window.add(seq)
+        assert 5 not in window
+        assert 1 in window
+
+    def test_bounded_with_discards(self):
+        window = DedupWindow(capacity=4)
+        for i in range(100):
+            window.add(i)
+            if i % 3 == 0:
+                window.discard(i)
+            assert len(window) <= 4
+
+    def test_readd_after_discard(self):
+        window = DedupWindow(capacity=3)
+        window.add("a")
+        window.discard("a")
+        assert window.add("a") is True
+        window.add("b")
+        window.add("c")
+        # Stale slot from the first "a" must not evict the live one
+        assert "a" in window
+
+    def test_clear(self):
+        window = DedupWindow(capacity=3)
+        window.add("a")
+        window.clear()
+        assert len(window) == 0
+        assert window.add("a") is True
+
+    def test_invalid_capacity(self):
+        with pytest.raises(ValueError):
+            DedupWindow(capacity=0)
+
+
+class TestSharedWindow:
+    """Test sharing one window across bus and reliable delivery."""
+
+    def test_reliable_delivery_uses_shared_window(self):
+        agent = AgentID.create("astra-v3.0", "SAT-001-A")
+        config = SwarmConfig(
+            agent_id=agent,
+            role=SatelliteRole.PRIMARY,
+            constellation_id="astra-v3.0",
+        )
+        bus = SwarmMessageBus(config, SwarmSerializer(validate=False), latency_ms=0)
+        delivery = ReliableDelivery(bus, agent, dedup_window=bus.received_messages)
+
+        assert delivery.mark_received(7) is True
+        assert delivery.mark_received(7) is False
+        assert 7 in bus.received_messages
+        assert bus.get_metrics()["deduplication_cache"] == 1
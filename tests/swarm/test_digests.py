@@ -0,0 +1,157 @@
+"""
+Tests for swarm anti-entropy digests.
+
+Validates:
+- Bloom filter has no false negatives and stays near its target FP rate
+- Bloom filter wire roundtrip
+- Partitioned Bloom filter treats missing partitions as unknown
+- Merkle root is order independent and tracks updates and removals
+- Descending the tree localizes differences to the changed buckets
+"""
+
+import pytest
+
+from astraguard.swarm.digests import BloomFilter, MerkleDigest, PartitionedBloomFilter
+
+
+class TestBloomFilter:
+    """Test BloomFilter behaviour."""
+
+    def test_no_false_negatives(self):
+        bloom = BloomFilter.for_capacity(1000, 0.01)
+        keys = [f"pattern-{i}" for i in range(1000)]
+        for key in keys:
+            bloom.add(key)
+        assert all(key in bloom for key in keys)
+        assert len(bloom) == 1000
+
+    def test_false_positive_rate_near_target(self):
+        bloom = BloomFilter.for_capacity(1000, 0.01)
+        for i in range(1000):
+            bloom.add(f"pattern-{i}")
+        false_positives = sum(f"absent-{i}" in bloom for i in range(10000))
+        assert false_positives / 10000 < 0.03
+
+    def test_empty_filter_rejects_everything(self):
+        bloom = BloomFilter(1024, 3)
+        assert "anything" not in bloom
+
+    def test_roundtrip(self):
+        bloom = BloomFilter.for_capacity(100, 0.05)
+        for i in range(100):
+            bloom.add(f"k{i}")
+        data = bloom.to_bytes()
+        assert len(data) == bloom.size_bytes
+        restored = BloomFilter.from_bytes(data)
+        assert restored.num_bits == bloom.num_bits
+        assert restored.num_hashes == bloom.num_hashes
+        assert all(f"k{i}" in restored for i in range(100))
+
+    def test_truncated_payload_rejected(self):
+        data = BloomFilter(1024, 3).to_bytes()
+        with pytest.raises(ValueError):
+            BloomFilter.from_bytes(data[:-1])
+
+    def test_invalid_parameters(self):
+        with pytest.raises(ValueError):
+            BloomFilter(0, 3)
+        with pytest.raises(ValueError):
+            BloomFilter.for_capacity(10, 1.5)
+
+
+class TestPartitionedBloomFilter:
+    """Test PartitionedBloomFilter behaviour."""
+
+    def test_partitions_split_capacity(self):
+        whole = BloomFilter.for_capacity(40000, 0.01)
+        bloom = PartitionedBloomFilter.for_capacity(40000, 0.01, partitions=4)
+        assert len(bloom.partitions) == 4
+        assert all(p.size_bytes <= whole.size_bytes // 4 + 16 for p in bloom.partitions)
+
+    def test_no_false_negatives_and_fp_rate(self):
+        bloom = PartitionedBloomFilter.for_capacity(4000, 0.01, partitions=3)
+        keys = [f"pattern-{i}" for i in range(4000)]
+        for key in keys:
+            bloom.add(key)
+        assert all(key in bloom for key in keys)
+        false_positives = sum(f"absent-{i}" in bloom for i in range(10000))
+        assert false_positives / 10000 < 0.03
+
+    def test_missing_partition_is_unknown(self):
+        full = PartitionedBloomFilter.for_capacity(1000, 0.01, partitions=2)
+        for i in range(1000):
+            full.add(f"k{i}")
+        partial = PartitionedBloomFilter([full.partitions[0], None])
+        absent = [f"absent-{i}" for i in range(1000)]
+        unknown = [k for k in absent if PartitionedBloomFilter.partition_of(k, 2) == 1]
+        known = [k for k in absent if PartitionedBloomFilter.partition_of(k, 2) == 0]
+        assert all(k in partial for k in unknown)
+        assert sum(k in partial for k in known) < len(known) * 0.05
+        partial.add("late")  # Unknown partition: ignored, still answers True
+        assert all(f"k{i}" in partial for i in range(1000))
+
+    def test_requires_a_partition(self):
+        with pytest.raises(ValueError):
+            PartitionedBloomFilter([])
+
+
+class TestMerkleDigest:
+    """Test MerkleDigest behaviour."""
+
+    def test_root_is_order_independent(self):
+        a, b = MerkleDigest(), MerkleDigest()
+        entries = [(f"p{i}", f"v{i}") for i in range(200)]
+        for key, version in entries:
+            a.set(key, version)
+        for key, version in reversed(entries):
+            b.set(key, version)
+        assert a.root() == b.root()
+
+    def test_version_change_alters_root(self):
+        digest = MerkleDigest()
+        digest.set("p1", "v1")
+        before = digest.root()
+        digest.set("p1", "v2")
+        assert digest.root() != before
+        digest.set("p1", "v1")
+        assert digest.root() == before
+
+    def test_discard_restores_root(self):
+        digest = MerkleDigest()
+        digest.set("p1", "v1")
+        before = digest.root()
+        digest.set("p2", "v1")
+        digest.discard("p2")
+        digest.discard("missing")
+        assert digest.root() == before
+        assert len(digest) == 1 and "p1" in digest and "p2" not in digest
+
+    def test_clear(self):
+        empty = MerkleDigest().root()
+        digest = MerkleDigest()
+        digest.set("p1", "v1")
+        digest.clear()
+        assert digest.root() == empty
+        assert len(digest) == 0
+
+    def test_descent_localizes_difference(self):
+        a, b = MerkleDigest(), MerkleDigest()
+        for i in range(500):
+            a.set(f"p{i}", "v1")
+            b.set(f"p{i}", "v1")
+        b.set("p42", "v2")
+
+        branches = [i for i, (x, y) in enumerate(zip(a.children(0), b.children(0))) if x != y]
+        assert len(branches) == 1
+        leaves = [
+            branches[0] * MerkleDigest.FANOUT + i
+            for i, (x, y) in enumerate(zip(a.children(1, branches[0]), b.children(1, branches[0])))
+            if x != y
+        ]
+        assert leaves == [MerkleDigest.bucket_of("p42")]
+        assert b.bucket_versions(leaves[0])["p42"] == "v2"
+        assert a.bucket_versions(leaves[0])["p42"] == "v1"
+
+    def test_children_depth_bounds(self):
+        with pytest.raises(ValueError):
+            MerkleDigest().children(2)
@@ -9,6 +9,8 @@ Issue #401: Communication protocols - health broadcasting tests
 - No broadcasts during unchanged health
 """
 
+import asyncio
+
 import pytest
 from datetime import datetime
 from unittest.mock import Mock, AsyncMock
@@ -19,6 +21,7 @@ from astraguard.swarm.registry import SwarmRegistry
 from astraguard.swarm.bus import SwarmMessageBus
 from astraguard.swarm.compressor import StateCompressor
 from astraguard.swarm.serializer import SwarmSerializer
+from astraguard.swarm.transport import InProcessHub, InProcessTransport
 
 
 def create_agent_id(serial: str = "SAT0000") -> AgentID:
@@ -449,3 +452,200 @@ class TestIntegration:
         
         # Verify fails with different key
         assert not HealthBroadcaster.verify_signature(payload, b"wrong")
+
+
+class TestBinaryBroadcast:
+    """Test the binary broadcast payload."""
+
+    def _broadcaster(self):
+        config, agent_id = create_config()
+        registry = SwarmRegistry(config, agent_id)
+        return HealthBroadcaster(
+            config, agent_id, registry, create_bus(config), StateCompressor()
+        )
+
+    def test_encode_decode_roundtrip(self):
+        """Binary broadcast roundtrips and keeps health bytes raw."""
+        broadcaster = self._broadcaster()
+        compressed = broadcaster.compressor.compress_health(create_health())
+        timestamp = datetime(2026, 5, 1, 8, 0, 0, 250)
+
+        data = broadcaster.encode_broadcast(compressed, timestamp)
+        decoded = HealthBroadcaster.decode_broadcast(data, broadcaster.private_key)
+
+        assert decoded["agent_id"] == broadcaster.agent_id.uuid
+        assert decoded["constellation"] == "astra-v3.0"
+        assert decoded["timestamp"] == timestamp
+        assert isinstance(decoded["compressed_health"], memoryview)
+        assert decoded["compressed_health"] == compressed
+        # Raw bytes: fixed overhead only, no hex doubling
+        assert len(data) - len(compressed) < 80
+        restored = StateCompressor().decompress(decoded["compressed_health"])
+        assert restored.risk_score == pytest.approx(0.5, abs=0.01)
+
+    def test_tampered_or_wrong_key_rejected(self):
+        """Bad signatures decode to None."""
+        broadcaster = self._broadcaster()
+        data = bytearray(broadcaster.encode_broadcast(b"\x01\x02\x03"))
+        assert HealthBroadcaster.decode_broadcast(bytes(data), b"wrong") is None
+        data[-40] ^= 0xFF
+        assert HealthBroadcaster.decode_broadcast(data, broadcaster.private_key) is None
+
+    def test_malformed_payload_raises(self):
+        """Truncated or foreign payloads raise ValueError."""
+        broadcaster = self._broadcaster()
+        data = broadcaster.encode_broadcast(b"\x01\x02\x03")
+        with pytest.raises(ValueError):
+            HealthBroadcaster.decode_broadcast(data[:-1], broadcaster.private_key)
+        with pytest.raises(ValueError):
+            HealthBroadcaster.decode_broadcast(b"{}" + data[2:], broadcaster.private_key)
+
+    @pytest.mark.asyncio
+    async def test_broadcast_publishes_binary_payload(self):
+        """_broadcast_health publishes bytes, not a JSON string."""
+        broadcaster = self._broadcaster()
+        broadcaster.bus.publish = AsyncMock(return_value=True)
+
+        await broadcaster._broadcast_health()
+
+        payload = broadcaster.bus.publish.call_args.kwargs["payload"]
+        assert isinstance(payload, bytes)
+        decoded = HealthBroadcaster.decode_broadcast(payload, broadcaster.private_key)
+        assert decoded is not None
+
+
+class TestDeltaStream:
+    """Test the keyframed per-sender stream and resync over the bus."""
+
+    def _broadcaster(self):
+        config, agent_id = create_config()
+        registry = SwarmRegistry(config, agent_id)
+        return HealthBroadcaster(
+            config, agent_id, registry, create_bus(config), StateCompressor()
+        )
+
+    @pytest.mark.asyncio
+    async def test_broadcasts_keyframe_then_deltas(self):
+        """First broadcast is a keyframe, later ones are deltas."""
+        broadcaster = self._broadcaster()
+        broadcaster.bus.publish = AsyncMock(return_value=True)
+        peer_state = broadcaster.registry.peers[broadcaster.agent_id]
+
+        for risk in (0.2, 0.3, 0.4):
+            peer_state.record_heartbeat(create_health(risk))
+            await broadcaster._broadcast_health()
+
+        stats = broadcaster.compressor.get_peer_stats()
+        assert stats["keyframes_sent"] == 1
+        assert stats["deltas_sent"] == 2
+
+    @pytest.mark.asyncio
+    async def test_rejected_publish_counts_as_failure(self):
+        """A publish the bus refuses is not reported as delivered."""
+        broadcaster = self._broadcaster()
+        broadcaster.bus.publish = AsyncMock(return_value=False)
+
+        await broadcaster._broadcast_health()
+
+        assert broadcaster.metrics.failed_broadcasts == 1
+        assert broadcaster.metrics.successful_broadcasts == 0
+
+    def test_keeps_existing_resync_callback(self):
+        """A compressor already wired elsewhere keeps its callback."""
+        config, agent_id = create_config()
+        callback = Mock()
+        compressor = StateCompressor(resync_callback=callback)
+        HealthBroadcaster(
+            config, agent_id, SwarmRegistry(config, agent_id),
+            create_bus(config), compressor,
+        )
+        assert compressor.resync_callback is callback
+
+    @pytest.mark.asyncio
+    async def test_forged_broadcast_rejected(self):
+        """Broadcasts signed with the wrong key never reach the registry."""
+        sender = self._broadcaster()
+        config, _ = create_config()
+        receiver_id = create_agent_id("SAT0099")
+        config.agent_id = receiver_id
+        receiver = HealthBroadcaster(
+            config, receiver_id, SwarmRegistry(config, receiver_id),
+            create_bus(config), StateCompressor(),
+            peer_keys={sender.agent_id: b"other-key"},
+        )
+        payload = sender.encode_broadcast(
+            sender.compressor.compress_for_peer(None, create_health())
+        )
+        message = Mock(sender=sender.agent_id, payload=payload, qos=0, receiver=None)
+
+        await receiver._on_health_broadcast(message)
+
+        assert receiver.metrics.rejected_broadcasts == 1
+        assert receiver.registry.get_peer_health(sender.agent_id) is None
+
+    @pytest.mark.asyncio
+    async def test_dropped_frame_resyncs_over_bus(self):
+        """A lost broadcast is repaired by a resync request and a keyframe."""
+        hub = InProcessHub()
+        agents = [create_agent_id("SAT0001"), create_agent_id("SAT0002")]
+        buses, broadcasters = [], []
+        for agent in agents:
+            config = SwarmConfig(
+                agent_id=agent,
+                constellation_id="astra-v3.0",
+                role=SatelliteRole.PRIMARY,
+                bandwidth_limit_kbps=10,
+            )
+            bus = SwarmMessageBus(config, SwarmSerializer(validate=False), latency_ms=0)
+            await bus.attach_transport(InProcessTransport(agent, hub))
+            buses.append(bus)
+            broadcasters.append(HealthBroadcaster(
+                config, agent, SwarmRegistry(config, agent), bus, StateCompressor()
+            ))
+        sender, receiver = broadcasters
+        sender_state = sender.registry.peers[sender.agent_id]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + 10
+
+        async def received_risk(risk):
+            while True:
+                health = receiver.registry.get_peer_health(sender.agent_id)
+                if health is not None and health.risk_score == pytest.approx(risk, abs=0.01):
+                    return
+                assert loop.time() < deadline
+                await asyncio.sleep(0.01)
+
+        try:
+            await receiver.start()
+            sender_state.record_heartbeat(create_health(0.2))
+            await sender.start()  # First broadcast is a keyframe
+            await received_risk(0.2)
+
+            # Lose one delta on the way out
+            publish = sender.bus.publish
+            sender.bus.publish = AsyncMock(return_value=True)
+            sender_state.record_heartbeat(create_health(0.4))
+            await sender._broadcast_health()
+            sender.bus.publish = publish
+
+            # Next delta cannot be applied; the receiver asks for a keyframe
+            sender_state.record_heartbeat(create_health(0.6))
+            await sender._broadcast_health()
+            await received_risk(0.6)
+
+            receiver_stats = receiver.compressor.get_peer_stats()
+            assert receiver_stats["gaps_detected"] == 1
+            assert receiver_stats["frames_dropped"] == 1
+            assert receiver.metrics.resync_requests_sent == 1
+            assert sender.metrics.resync_requests_received == 1
+            assert sender.compressor.get_peer_stats()["keyframes_sent"] == 2
+            assert receiver.metrics.received_broadcasts == 2
+            assert sender.metrics.failed_broadcasts == 0
+            while any(bus.pending_acks for bus in buses):
+                assert loop.time() < deadline
+                await asyncio.sleep(0.01)
+        finally:
+            for broadcaster in broadcasters:
+                await broadcaster.stop()
+            for bus in buses:
+                await bus.close()
@@ -504,3 +504,82 @@ class TestIntegration:
         
         # Should detect conflict with intent_1 (45.0°)
         assert score > 0.5
+
+
+class TestConflictIndex:
+    """Test the indexed conflict search against a full pairwise scan."""
+    
+    def _brute_force(self, broadcaster, intent):
+        active = broadcaster._get_active_intents()
+        if not active:
+            return 0.0
+        return max(broadcaster._compute_pairwise_conflict(intent, known) for known in active)
+    
+    def _random_intent(self, rng, now, actions):
+        priority = rng.choice(list(PriorityEnum))
+        intent = create_intent(
+            action=rng.choice(actions),
+            target_angle=rng.uniform(-180.0, 360.0),
+            duration=rng.choice([0.0, rng.uniform(1.0, 60.0)]),
+            priority=priority,
+            agent_id=create_agent_id(f"SAT{rng.randrange(20):03d}"),
+        )
+        intent.timestamp = now - timedelta(seconds=rng.uniform(-30.0, 320.0))
+        return intent
+    
+    @pytest.mark.parametrize("actions", [
+        ["attitude_adjust"],
+        ["orbit_raise"],
+        ["attitude_adjust", "orbit_raise", "payload_off"],
+    ])
+    def test_matches_pairwise_scan(self, actions):
+        import random
+        config, agent_id = create_config()
+        broadcaster = IntentBroadcaster(SwarmRegistry(config, agent_id), create_bus(config), StateCompressor())
+        rng = random.Random(len(actions))
+        now = datetime.utcnow()
+        
+        for _ in range(600):
+            broadcaster._store_intent(self._random_intent(rng, now, actions))
+        for _ in range(200):
+            probe = self._random_intent(rng, now, actions)
+            assert broadcaster._compute_conflict_score(probe) == self._brute_force(broadcaster, probe)
+        
+        assert broadcaster.stats.candidates_scored < broadcaster.stats.conflict_checks * len(
+            broadcaster._get_active_intents()
+        )
+    
+    def test_irregular_parameters_scored_directly(self):
+        config, agent_id = create_config()
+        broadcaster = IntentBroadcaster(SwarmRegistry(config, agent_id), create_bus(config), StateCompressor())
+        odd = create_intent(target_angle=10.0)
+        odd.parameters["duration"] = "soon"
+        broadcaster._store_intent(odd)
+        broadcaster._store_intent(create_intent(target_angle=100.0))
+        
+        probe = create_intent(target_angle=12.0)
+        assert broadcaster._compute_conflict_score(probe) == self._brute_force(broadcaster, probe)
+        probe.parameters["target_angle"] = "north"
+        assert broadcaster._compute_conflict_score(probe) == self._brute_force(broadcaster, probe)
+    
+    def test_history_trim_and_expiry_leave_index(self):
+        from astraguard.swarm.intent_broadcaster import INTENT_HISTORY_SIZE, INTENT_TIMEOUT
+        config, agent_id = create_config()
+        broadcaster = IntentBroadcaster(SwarmRegistry(config, agent_id), create_bus(config), StateCompressor())
+        sender = create_agent_id("SAT001")
+        
+        stale = create_intent(agent_id=sender)
+        stale.timestamp = datetime.utcnow() - timedelta(seconds=299.9)
+        broadcaster._store_intent(stale)
+        for _ in range(INTENT_HISTORY_SIZE + 5):
+            broadcaster._store_intent(create_intent(agent_id=sender))
+        
+        assert len(broadcaster.intent_history[sender]) == INTENT_HISTORY_SIZE
+        assert len(broadcaster._get_active_intents()) == INTENT_HISTORY_SIZE
+        assert stale not in broadcaster._get_active_intents()
+        
+        broadcaster._expire(datetime.utcnow() + timedelta(seconds=INTENT_TIMEOUT))
+        assert broadcaster._active == {}
+        assert broadcaster._expiry_heap == []
+        assert broadcaster._by_action == {}
+        assert broadcaster._compute_conflict_score(create_intent()) == 0.0
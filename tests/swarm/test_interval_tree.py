@@ -0,0 +1,60 @@
+"""
+Tests for the dynamic interval tree.
+
+Validates:
+- Overlap queries match a brute-force scan under random inserts/removals
+- Half-open interval semantics
+- Removal of unknown intervals
+"""
+
+import random
+
+from astraguard.swarm.interval_tree import IntervalTree
+
+
+class TestIntervalTree:
+    """Test IntervalTree behaviour."""
+
+    def test_half_open_overlap(self):
+        tree = IntervalTree()
+        tree.add(0, 10, "a", key=1)
+        tree.add(10, 20, "b", key=2)
+        assert sorted(tree.overlapping(9, 11)) == ["a", "b"]
+        assert list(tree.overlapping(10, 10.5)) == ["b"]
+        assert list(tree.overlapping(20, 30)) == []
+
+    def test_duplicate_starts(self):
+        tree = IntervalTree()
+        for key in range(5):
+            tree.add(0, key + 1, key, key=key)
+        assert sorted(tree.overlapping(2.5, 3)) == [2, 3, 4]
+        assert tree.remove(0, 3)
+        assert sorted(tree.overlapping(2.5, 3)) == [2, 4]
+        assert len(tree) == 4
+
+    def test_remove_unknown(self):
+        tree = IntervalTree()
+        tree.add(0, 1, "a", key=1)
+        assert not tree.remove(0, 2)
+        assert not tree.remove(5, 1)
+        assert len(tree) == 1
+
+    def test_matches_brute_force(self):
+        rng = random.Random(3)
+        tree = IntervalTree(seed=3)
+        intervals = {}
+        for key in range(2000):
+            start = rng.uniform(0, 1000)
+            end = start + rng.uniform(0, 50)
+            tree.add(start, end, key, key=key)
+            intervals[key] = (start, end)
+            if rng.random() < 0.3:
+                victim = rng.choice(list(intervals))
+                assert tree.remove(intervals.pop(victim)[0], victim)
+        assert len(tree) == len(intervals)
+
+        for _ in range(200):
+            lo = rng.uniform(0, 1000)
+            hi = lo + rng.uniform(0, 40)
+            expected = sorted(k for k, (s, e) in intervals.items() if s < hi and e > lo)
+            assert sorted(tree.overlapping(lo, hi)) == expected
@@ -13,6 +13,7 @@ Issue #405: Coordination layer leader election tests
 """
 
 import asyncio
+import json
 import pytest
 from datetime import datetime, timedelta
 from unittest.mock import Mock, AsyncMock, MagicMock, patch
@@ -21,8 +22,9 @@ from random import randint
 from astraguard.swarm.leader_election import LeaderElection, ElectionState, ElectionMetrics
 from astraguard.swarm.models import AgentID, SwarmConfig, SatelliteRole
 from astraguard.swarm.bus import SwarmMessageBus
+from astraguard.swarm.serializer import SwarmSerializer
 from astraguard.swarm.registry import SwarmRegistry, PeerState
-from astraguard.swarm.types import QoSLevel
+from astraguard.swarm.types import QoSLevel, SwarmMessage
 
 
 @pytest.fixture
@@ -44,6 +46,7 @@ def mock_registry():
         AgentID.create("astra-v3.0", "SAT-003-C"),
     ])
     registry.get_peer_state = Mock(return_value=Mock(spec=PeerState, is_alive=True))
+    registry.alive_version = 0
     return registry
 
 
@@ -660,6 +663,296 @@ class TestScalability:
         assert quorum == 26
 
 
+# ============================================================================
+# Leases, Pre-Vote and Adaptive Heartbeats
+# ============================================================================
+
+class MemoryNetwork:
+    """In-memory pub/sub delivering JSON SwarmMessages between LeaderElection agents."""
+
+    def __init__(self):
+        self.handlers = {}
+        self.published = 0
+        self.down = set()
+
+    def bus(self, agent_id: AgentID):
+        network = self
+
+        class _Bus:
+            def subscribe(self, topic, callback, **kwargs):
+                network.handlers.setdefault(topic, []).append((agent_id, callback))
+                return (topic, callback)
+
+            def unsubscribe(self, subscription):
+                topic, callback = subscription
+                network.handlers[topic].remove((agent_id, callback))
+                return True
+
+            async def acknowledge(self, message):
+                pass
+
+            async def publish(self, topic, payload, qos=1, receiver=None, **kwargs):
+                if agent_id in network.down:
+                    return False
+                network.published += 1
+                message = SwarmMessage(
+                    topic=topic, payload=json.dumps(payload).encode(),
+                    sender=agent_id, qos=qos, receiver=receiver,
+                )
+                for owner, callback in network.handlers.get(topic, []):
+                    if owner in network.down or (receiver is not None and owner != receiver):
+                        continue
+                    asyncio.get_running_loop().call_soon(
+                        asyncio.ensure_future, callback(message)
+                    )
+                return True
+
+        return _Bus()
+
+
+def make_swarm(n: int):
+    """n fast-timer LeaderElection agents sharing one MemoryNetwork."""
+    network = MemoryNetwork()
+    agents = [AgentID.create("astra-v3.0", f"SAT-{i:03d}-A") for i in range(1, n + 1)]
+    alive = set(agents)
+    registry = Mock(spec=SwarmRegistry)
+    registry.get_alive_peers = Mock(side_effect=lambda: list(alive))
+    elections = []
+    for agent_id in agents:
+        config = Mock(spec=SwarmConfig)
+        config.agent_id = agent_id
+        config.SWARM_MODE_ENABLED = True
+        election = LeaderElection(config, registry, network.bus(agent_id))
+        election.LEASE_VALIDITY_SECONDS = 0.3
+        election.HEARTBEAT_INTERVAL_MS = 20
+        election.MAX_HEARTBEAT_INTERVAL_MS = 80
+        election.ELECTION_TIMEOUT_MIN_MS = 20
+        election.ELECTION_TIMEOUT_MAX_MS = 60
+        elections.append(election)
+    return network, alive, elections
+
+
+async def wait_until(predicate, timeout: float = 3.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline, "condition not met before timeout"
+        await asyncio.sleep(0.01)
+
+
+class TestLeasesAndPreVote:
+    """Leader leases, pre-vote and heartbeat backoff."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_pre_voters_on_one_bus_count_only_own_grants(self):
+        """Grants addressed to another pre-voter on a shared bus are ignored."""
+        agents = [AgentID.create("astra-v3.0", f"SAT-{i:03d}-A") for i in range(1, 5)]
+        registry = Mock(spec=SwarmRegistry)
+        registry.get_alive_peers = Mock(return_value=agents)  # Quorum of 3
+        registry.alive_version = 0
+        bus = SwarmMessageBus(
+            SwarmConfig(agent_id=agents[0], role=SatelliteRole.PRIMARY, constellation_id="astra-v3.0"),
+            SwarmSerializer(validate=False),
+            latency_ms=0,
+        )
+        elections = []
+        for agent_id in agents[:3]:
+            config = Mock(spec=SwarmConfig)
+            config.agent_id = agent_id
+            config.SWARM_MODE_ENABLED = True
+            election = LeaderElection(config, registry, bus)
+            election._election_not_before = datetime.now() + timedelta(hours=1)
+            election._election_jitter = timedelta(hours=1)
+            elections.append(election)
+        first, second, voter = elections
+        # The voter still promises a lease to the first pre-voter only
+        voter.current_leader = agents[0]
+        voter.lease_expiry = datetime.now() + timedelta(seconds=30)
+        for election in elections:
+            await election.start()
+        try:
+            second_round = asyncio.create_task(second._pre_vote())
+            await asyncio.sleep(0)  # Second round is open before the first one's grants flow
+            first_round = asyncio.create_task(first._pre_vote())
+            assert await asyncio.wait_for(first_round, timeout=1.0)
+            await asyncio.sleep(0.02)
+
+            assert not second_round.done()
+            assert second.pre_votes_received == {agents[1], agents[0]}
+            second_round.cancel()
+            await asyncio.gather(second_round, return_exceptions=True)
+        finally:
+            for election in elections:
+                await election.stop()
+            await bus.close()
+
+    @pytest.mark.asyncio
+    async def test_pre_vote_denied_while_lease_held(self, leader_election, mock_bus):
+        """A follower with a live leader ignores pre-votes from others."""
+        await leader_election._handle_heartbeat({"term": 1, "leader_id": "SAT-002-B", "seq": 1})
+        mock_bus.publish.reset_mock()
+
+        await leader_election._handle_pre_vote_request({"term": 2, "candidate_id": "SAT-003-C"})
+        mock_bus.publish.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_pre_vote_granted_without_bumping_term(self, leader_election, mock_bus):
+        """Pre-vote grant is unicast and leaves our term untouched."""
+        leader_election.current_term = 1
+        await leader_election._handle_pre_vote_request({"term": 2, "candidate_id": "SAT-003-C"})
+
+        assert leader_election.current_term == 1
+        assert leader_election.voted_for is None
+        args, kwargs = mock_bus.publish.call_args
+        assert args[0] == LeaderElection.PRE_VOTE_GRANT_TOPIC
+        assert kwargs["receiver"].satellite_serial == "SAT-003-C"
+
+    @pytest.mark.asyncio
+    async def test_vote_request_ignored_while_lease_held(self, leader_election, mock_bus):
+        """Leader stickiness: a higher term does not override a live lease."""
+        await leader_election._handle_heartbeat({"term": 1, "leader_id": "SAT-002-B", "seq": 1})
+        mock_bus.publish.reset_mock()
+
+        await leader_election._handle_vote_request(
+            {"term": 5, "candidate_id": "SAT-003-C", "candidate_uptime": 1.0}
+        )
+        assert leader_election.current_term == 1
+        mock_bus.publish.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_vote_grant_is_unicast(self, leader_election, mock_bus):
+        await leader_election._handle_vote_request(
+            {"term": 1, "candidate_id": "SAT-002-B", "candidate_uptime": 1.0}
+        )
+        args, kwargs = mock_bus.publish.call_args
+        assert args[0] == LeaderElection.VOTE_GRANT_TOPIC
+        assert kwargs["receiver"].satellite_serial == "SAT-002-B"
+
+    @pytest.mark.asyncio
+    async def test_vote_grant_for_other_candidate_ignored(self, leader_election):
+        leader_election.state = ElectionState.CANDIDATE
+        leader_election.current_term = 1
+        await leader_election._handle_vote_grant(
+            {"term": 1, "voter_id": "SAT-002-B", "candidate_id": "SAT-003-C"}
+        )
+        assert leader_election.votes_received == set()
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_acked_to_leader(self, leader_election, mock_bus):
+        await leader_election._handle_heartbeat({"term": 1, "leader_id": "SAT-002-B", "seq": 7})
+
+        args, kwargs = mock_bus.publish.call_args
+        assert args[0] == LeaderElection.LEASE_ACK_TOPIC
+        assert args[1]["seq"] == 7
+        assert kwargs["receiver"].satellite_serial == "SAT-002-B"
+
+    @pytest.mark.asyncio
+    async def test_own_heartbeat_does_not_renew_lease(self, leader_election, mock_config):
+        leader_election.lease_expiry = datetime.now() - timedelta(seconds=1)
+        await leader_election._handle_heartbeat(
+            {"term": 0, "leader_id": mock_config.agent_id.satellite_serial, "seq": 1}
+        )
+        assert leader_election.get_leader() is None
+
+    @pytest.mark.asyncio
+    async def test_same_term_leaders_resolved_by_tiebreaker(self, mock_registry, mock_bus):
+        """Two leaders in one term: the lower AgentID yields, the higher keeps leading."""
+        elections = {}
+        for serial in ("SAT-002-B", "SAT-003-C"):
+            config = Mock(spec=SwarmConfig)
+            config.agent_id = AgentID.create("astra-v3.0", serial)
+            elections[serial] = LeaderElection(config, mock_registry, mock_bus)
+            elections[serial].current_term = 1
+            await elections[serial]._become_leader()
+
+        await elections["SAT-003-C"]._handle_heartbeat({"term": 1, "leader_id": "SAT-002-B", "seq": 1})
+        await elections["SAT-002-B"]._handle_heartbeat({"term": 1, "leader_id": "SAT-003-C", "seq": 1})
+
+        assert elections["SAT-003-C"].is_leader()
+        assert elections["SAT-002-B"].state == ElectionState.FOLLOWER
+        assert elections["SAT-002-B"].get_leader().satellite_serial == "SAT-003-C"
+
+    @pytest.mark.asyncio
+    async def test_quorum_acks_renew_lease_and_back_off(self, leader_election):
+        """Confirmed rounds renew the drift-shortened lease and double the interval."""
+        leader_election.current_term = 1
+        await leader_election._become_leader()
+        assert leader_election.heartbeat_interval_ms == LeaderElection.HEARTBEAT_INTERVAL_MS
+
+        for _ in range(4):
+            await leader_election._send_heartbeat()
+            await leader_election._handle_lease_ack(
+                {"term": 1, "seq": leader_election._heartbeat_seq, "voter_id": "SAT-002-B"}
+            )
+        assert leader_election.heartbeat_interval_ms == LeaderElection.MAX_HEARTBEAT_INTERVAL_MS
+        assert leader_election.metrics.lease_acks_received == 4
+
+        lease = (leader_election.lease_expiry - leader_election._round_started).total_seconds()
+        expected = LeaderElection.LEASE_VALIDITY_SECONDS * (1 - 2 * LeaderElection.CLOCK_DRIFT_BOUND)
+        assert lease == pytest.approx(expected)
+        assert lease < LeaderElection.LEASE_VALIDITY_SECONDS
+
+    @pytest.mark.asyncio
+    async def test_unconfirmed_round_resets_interval(self, leader_election):
+        leader_election.current_term = 1
+        await leader_election._become_leader()
+        leader_election.heartbeat_interval_ms = LeaderElection.MAX_HEARTBEAT_INTERVAL_MS
+
+        await leader_election._send_heartbeat()   # No acks arrive
+        await leader_election._send_heartbeat()
+        assert leader_election.heartbeat_interval_ms == LeaderElection.HEARTBEAT_INTERVAL_MS
+
+    @pytest.mark.asyncio
+    async def test_stale_ack_ignored(self, leader_election):
+        leader_election.current_term = 1
+        await leader_election._become_leader()
+        await leader_election._send_heartbeat()
+        await leader_election._handle_lease_ack(
+            {"term": 1, "seq": leader_election._heartbeat_seq - 1, "voter_id": "SAT-002-B"}
+        )
+        assert leader_election._round_confirmed is False
+
+    @pytest.mark.asyncio
+    async def test_swarm_elects_single_leader_and_fails_over(self):
+        network, alive, elections = make_swarm(5)
+        for election in elections:
+            await election.start()
+        try:
+            await wait_until(lambda: sum(e.is_leader() for e in elections) == 1)
+            leader = next(e for e in elections if e.is_leader())
+            followers = [e for e in elections if e is not leader]
+            await wait_until(lambda: all(e.get_leader() == leader.config.agent_id for e in followers))
+
+            # Stable leadership: interval backs off to the cap
+            await wait_until(
+                lambda: leader.heartbeat_interval_ms == leader.MAX_HEARTBEAT_INTERVAL_MS
+            )
+            assert all(e.current_term == leader.current_term for e in followers)
+
+            # Leader dies; a survivor takes over after the lease lapses
+            network.down.add(leader.config.agent_id)
+            alive.discard(leader.config.agent_id)
+            await leader.stop()
+            await wait_until(lambda: sum(e.is_leader() for e in followers) == 1)
+            assert sum(e.metrics.election_count for e in followers) == 1
+        finally:
+            for election in elections:
+                await election.stop()
+
+    @pytest.mark.asyncio
+    async def test_partitioned_agent_does_not_bump_term(self):
+        """Failed pre-votes keep a cut-off agent's term stable."""
+        network, alive, elections = make_swarm(3)
+        isolated = elections[0]
+        network.down.update(e.config.agent_id for e in elections[1:])
+        await isolated.start()
+        try:
+            await wait_until(lambda: isolated.metrics.pre_vote_count >= 3)
+            assert isolated.current_term == 0
+            assert isolated.state == ElectionState.FOLLOWER
+        finally:
+            await isolated.stop()
+
+
 # ============================================================================
 # Run Tests
 # ============================================================================
@@ -444,6 +444,165 @@ class TestSwarmSerializer:
         assert stats["compression_ratio"] == 0.0
 
 
+class TestBinaryCodec:
+    """Test suite for the compact binary HealthSummary codec."""
+
+    @staticmethod
+    def _summary(**overrides):
+        fields = dict(
+            anomaly_signature=[0.01 * i - 0.1 for i in range(32)],
+            risk_score=0.75,
+            recurrence_score=5.25,
+            timestamp=datetime(2026, 3, 1, 12, 30, 15, 123456),
+            compressed_size=300,
+        )
+        fields.update(overrides)
+        return HealthSummary(**fields)
+
+    def test_binary_roundtrip_float32(self):
+        """Binary codec roundtrips within float32 precision."""
+        serializer = SwarmSerializer(codecs={"HealthSummary": "binary"})
+        original = self._summary()
+
+        data = serializer.serialize_health(original)
+        restored = serializer.deserialize_health(data)
+
+        assert data[0] == 0xA5
+        assert restored.timestamp == original.timestamp
+        assert restored.compressed_size == 300
+        assert restored.risk_score == pytest.approx(0.75)
+        assert restored.recurrence_score == pytest.approx(5.25)
+        assert restored.anomaly_signature == pytest.approx(
+            original.anomaly_signature, abs=1e-6
+        )
+
+    def test_binary_float16_is_smaller(self):
+        """float16 signatures halve the signature bytes."""
+        summary = self._summary()
+        f32 = SwarmSerializer(codecs={"HealthSummary": "binary"}).serialize_health(summary)
+        f16 = SwarmSerializer(
+            codecs={"HealthSummary": "binary"}, signature_float16=True
+        ).serialize_health(summary)
+
+        assert len(f32) - len(f16) == 64
+        restored = SwarmSerializer().deserialize_health(f16)
+        assert restored.anomaly_signature == pytest.approx(
+            summary.anomaly_signature, abs=1e-3
+        )
+
+    def test_binary_much_smaller_than_json(self):
+        """Binary payload is a fraction of the JSON payload."""
+        serializer = SwarmSerializer()
+        summary = self._summary()
+        json_size = len(serializer.serialize_health(summary, compress=False))
+        binary_size = len(serializer.serialize_health(summary, codec="binary"))
+        assert binary_size < 160
+        assert binary_size * 3 < json_size
+
+    def test_json_remains_default(self):
+        """Without a codec map, HealthSummary stays JSON."""
+        data = SwarmSerializer().serialize_health(self._summary(), compress=False)
+        assert data.startswith(b"{")
+
+    def test_aware_timestamp_normalized_to_utc(self):
+        """Timezone-aware timestamps are encoded as UTC."""
+        from datetime import timezone
+        aware = datetime(2026, 3, 1, 14, 30, tzinfo=timezone(timedelta(hours=2)))
+        serializer = SwarmSerializer(codecs={"HealthSummary": "binary"})
+        restored = serializer.deserialize_health(
+            serializer.serialize_health(self._summary(timestamp=aware))
+        )
+        assert restored.timestamp == datetime(2026, 3, 1, 12, 30)
+
+    def test_binary_rejects_bad_frames(self):
+        """Truncated or unknown-version frames raise ValueError."""
+        serializer = SwarmSerializer()
+        data = serializer.serialize_health(self._summary(), codec="binary")
+        with pytest.raises(ValueError):
+            serializer.decode_health_binary(data[:5])
+        with pytest.raises(ValueError):
+            serializer.decode_health_binary(data[:1] + b"\x09" + data[2:])
+
+    def test_binary_only_for_supported_types(self):
+        """Unknown codecs and types without a binary layout are rejected."""
+        with pytest.raises(ValueError):
+            SwarmSerializer(codecs={"SwarmConfig": "binary"})
+        with pytest.raises(ValueError):
+            SwarmSerializer(codecs={"HealthSummary": "msgpack"})
+
+    def test_varint_roundtrip(self):
+        """LEB128 helpers roundtrip small and large values."""
+        from astraguard.swarm.serializer import _decode_varint, _encode_varint
+        for value in (0, 1, 127, 128, 300, 2**40 + 7):
+            encoded = _encode_varint(value)
+            assert _decode_varint(encoded, 0) == (value, len(encoded))
+
+
+class TestCompiledValidation:
+    """Test suite for cached validators and sampled validation."""
+
+    def test_validator_compiled_once(self):
+        """The same compiled validator is reused across calls and instances."""
+        first = SwarmSerializer._get_validator("HealthSummary")
+        assert SwarmSerializer._get_validator("HealthSummary") is first
+        SwarmSerializer().validate_schema(
+            SwarmConfig(
+                agent_id=AgentID.create("astra-v3.0", "SAT-001-A"),
+                role=SatelliteRole.PRIMARY,
+                constellation_id="astra-v3.0",
+            ).to_dict(),
+            "SwarmConfig",
+        )
+        assert SwarmSerializer._get_validator("HealthSummary") is first
+
+    def test_unknown_schema_type(self):
+        """Unknown schema types still raise ValueError."""
+        with pytest.raises(ValueError):
+            SwarmSerializer().validate_schema({}, "Nope")
+
+    def test_sample_rate_bounds(self):
+        """Sample rates outside [0, 1] are rejected."""
+        with pytest.raises(ValueError):
+            SwarmSerializer(validation_sample_rate=1.5)
+
+    def test_sampled_validation_skips_calls(self):
+        """A 0.25 sample rate validates one in four hot-path calls."""
+        serializer = SwarmSerializer(validation_sample_rate=0.25)
+        summary = HealthSummary(
+            anomaly_signature=[0.1] * 32,
+            risk_score=0.5,
+            recurrence_score=3.5,
+            timestamp=datetime.utcnow(),
+        )
+        for _ in range(8):
+            serializer.serialize_health(summary, compress=False)
+        assert serializer.validations_skipped == 6
+
+    def test_sampled_validation_above_half(self):
+        """A 0.75 sample rate validates three in four hot-path calls."""
+        serializer = SwarmSerializer(validation_sample_rate=0.75)
+        summary = HealthSummary(
+            anomaly_signature=[0.1] * 32,
+            risk_score=0.5,
+            recurrence_score=3.5,
+            timestamp=datetime.utcnow(),
+        )
+        for _ in range(8):
+            serializer.serialize_health(summary, compress=False)
+        assert serializer.validations_skipped == 2
+
+    def test_zero_sample_rate_never_validates_hot_path(self):
+        """Rate 0 skips hot-path validation but validate_schema still checks."""
+        serializer = SwarmSerializer(validation_sample_rate=0.0)
+        bad = b'{"anomaly_signature": [0.1], "risk_score": 0.5}'
+        with pytest.raises(Exception):
+            serializer.validate_schema({"anomaly_signature": [0.1]}, "HealthSummary")
+        # Skipped schema check falls through to model validation
+        with pytest.raises(Exception):
+            serializer.deserialize_health(bad, compressed=False)
+        assert serializer.validations_skipped == 1
+
+
 class TestPerformance:
     """Performance tests for serialization."""
 
@@ -0,0 +1,120 @@
+"""
+Tests for the observed containers.
+
+Validates:
+- Every mutating dict method reports to the hooks, including |= and popitem
+- Copies and pickles are plain dicts that no longer report
+- LRU reordering on write
+- Field observation on assignment and augmented assignment
+"""
+
+import copy
+import pickle
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+import pytest
+
+from astraguard.swarm.observed import ObservedDict, ObservedFields
+
+
+class RecordingDict(ObservedDict):
+    """ObservedDict that logs its hook calls."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self.log = []
+        self.update(*args, **kwargs)
+
+    def _on_set(self, key, value, previous):
+        self.log.append(("set", key, value, previous))
+
+    def _on_delete(self, key, value):
+        self.log.append(("delete", key, value))
+
+
+class TestObservedDict:
+    """Test ObservedDict hook coverage."""
+
+    def test_writes_report_previous_value(self):
+        table = RecordingDict()
+        table["a"] = 1
+        table["a"] = 2
+        assert table.log == [("set", "a", 1, None), ("set", "a", 2, 1)]
+
+    def test_every_mutation_reports(self):
+        table = RecordingDict(a=1)
+        table |= {"b": 2}
+        table.update([("c", 3)], d=4)
+        table.setdefault("e", 5)
+        table.setdefault("a", 9)
+        assert table.pop("b") == 2
+        assert table.pop("missing", None) is None
+        assert table.popitem() == ("e", 5)
+        del table["c"]
+        assert [entry[:2] for entry in table.log] == [
+            ("set", "a"), ("set", "b"), ("set", "c"), ("set", "d"), ("set", "e"),
+            ("delete", "b"), ("delete", "e"), ("delete", "c"),
+        ]
+        table.log.clear()
+        table.clear()
+        assert sorted(table.log) == [("delete", "a", 1), ("delete", "d", 4)]
+        with pytest.raises(KeyError):
+            table.popitem()
+        with pytest.raises(KeyError):
+            table.pop("a")
+
+    def test_copies_are_plain_dicts(self):
+        table = RecordingDict(a=1)
+        for snapshot in (
+            table.copy(),
+            copy.copy(table),
+            copy.deepcopy(table),
+            pickle.loads(pickle.dumps(table)),
+            table | {"b": 2},
+            RecordingDict.fromkeys("ab", 0),
+        ):
+            assert type(snapshot) is dict
+        snapshot = table.copy()
+        snapshot["b"] = 2
+        assert table.log == [("set", "a", 1, None)]
+
+    def test_reorder_on_write(self):
+        class LruDict(RecordingDict):
+            reorder_on_write = True
+
+        table = LruDict(a=1, b=2)
+        table["a"] = 3
+        assert list(table) == ["b", "a"]
+        plain = RecordingDict(a=1, b=2)
+        plain["a"] = 3
+        assert list(plain) == ["a", "b"]
+
+
+@dataclass
+class Counter(ObservedFields):
+    """Dataclass with one observed field."""
+
+    _observed_fields = frozenset({"count"})
+
+    count: int = 0
+    label: str = ""
+    _listener: Optional[Callable] = field(default=None, repr=False, compare=False)
+
+
+class TestObservedFields:
+    """Test ObservedFields notifications."""
+
+    def test_observed_assignment_reports_old_value(self):
+        calls = []
+        counter = Counter()
+        counter._listener = lambda obj, name, old: calls.append((name, old, obj.count))
+        counter.count = 3
+        counter.count += 2
+        counter.label = "ignored"
+        assert calls == [("count", 0, 3), ("count", 3, 5)]
+
+    def test_no_listener_during_init(self):
+        counter = Counter(count=4)
+        assert counter.count == 4
+        assert counter == Counter(count=4)
@@ -8,6 +8,7 @@ Issue #400 tests:
 - Network partition detection
 """
 
+import asyncio
 import pytest
 from datetime import datetime, timedelta
 
@@ -373,3 +374,265 @@ class TestScalability:
         assert stats["total_peers"] == 50
         assert stats["alive_peers"] == 31
         assert stats["dead_peers"] == 19
+
+
+class TestIncrementalLiveness:
+    """Test deadline-heap liveness tracking and change notifications."""
+    
+    def _add(self, registry, serial, age_seconds=0.0):
+        peer_id = create_agent_id(serial)
+        registry.peers[peer_id] = PeerState(
+            agent_id=peer_id,
+            role=SatelliteRole.PRIMARY,
+            last_heartbeat=datetime.utcnow() - timedelta(seconds=age_seconds)
+        )
+        return peer_id
+    
+    def test_version_bumps_on_join_and_leave_only(self):
+        """Joins and leaves bump the version; refreshing an alive peer does not."""
+        config = create_config()
+        registry = SwarmRegistry(config, config.agent_id)
+        version = registry.alive_version
+        
+        peer_id = self._add(registry, "SAT001")
+        assert registry.alive_version == version + 1
+        
+        registry.peers[peer_id].record_heartbeat()
+        assert registry.alive_version == version + 1
+        
+        del registry.peers[peer_id]
+        assert registry.alive_version == version + 2
+        assert peer_id not in registry.get_alive_peers()
+        
+        # Dead peers joining do not change the alive set
+        self._add(registry, "SAT002", age_seconds=100)
+        assert registry.alive_version == version + 2
+    
+    def test_timeout_detected_from_heap(self):
+        """A peer expires once its heartbeat deadline passes."""
+        config = create_config()
+        registry = SwarmRegistry(config, config.agent_id)
+        peer_id = self._add(registry, "SAT001", age_seconds=HEARTBEAT_TIMEOUT - 0.05)
+        assert registry.is_peer_alive(peer_id)
+        version = registry.alive_version
+        
+        registry._expire(datetime.utcnow() + timedelta(seconds=1))
+        assert registry.alive_version == version + 1
+        assert peer_id not in registry.get_alive_peers()
+        assert registry.get_alive_count() == 1
+
+    def test_version_applies_pending_timeouts(self):
+        """Reading alive_version alone picks up an elapsed deadline."""
+        config = create_config()
+        registry = SwarmRegistry(config, config.agent_id)
+        peer_id = self._add(registry, "SAT001")
+        version = registry.alive_version
+
+        registry.peers[peer_id].last_heartbeat = (
+            datetime.utcnow() - timedelta(seconds=HEARTBEAT_TIMEOUT + 1)
+        )
+        assert registry.alive_version == version + 1
+        assert not registry.is_peer_alive(peer_id)
+
+    def test_refresh_extends_deadline(self):
+        """A heartbeat recorded before the deadline keeps the peer alive."""
+        config = create_config()
+        registry = SwarmRegistry(config, config.agent_id)
+        peer_id = self._add(registry, "SAT001", age_seconds=HEARTBEAT_TIMEOUT - 1)
+        
+        registry.peers[peer_id].record_heartbeat()
+        registry._expire(datetime.utcnow() + timedelta(seconds=5))
+        assert registry.is_peer_alive(peer_id)
+        assert registry.next_deadline() > datetime.utcnow() + timedelta(seconds=HEARTBEAT_TIMEOUT - 5)
+    
+    def test_backdated_heartbeat_expires_early(self):
+        """Moving last_heartbeat backwards schedules an earlier deadline."""
+        config = create_config()
+        registry = SwarmRegistry(config, config.agent_id)
+        peer_ids = [self._add(registry, f"SAT{i:03d}") for i in range(1, 4)]
+        version = registry.alive_version
+        
+        for peer_id in peer_ids[:2]:
+            registry.peers[peer_id].last_heartbeat = (
+                datetime.utcnow() - timedelta(seconds=HEARTBEAT_TIMEOUT - 1)
+            )
+        registry._expire(datetime.utcnow() + timedelta(seconds=2))
+        
+        # Both expiries land in one sweep
+        assert registry.alive_version == version + 1
+        assert registry.get_alive_peers() == [config.agent_id, peer_ids[2]]
+    
+    def test_dead_peer_revives_on_heartbeat(self):
+        """A heartbeat from a timed-out peer brings it back."""
+        config = create_config()
+        registry = SwarmRegistry(config, config.agent_id)
+        peer_id = self._add(registry, "SAT001", age_seconds=100)
+        assert peer_id not in registry.get_alive_peers()
+        
+        registry.peers[peer_id].record_heartbeat()
+        assert peer_id in registry.get_alive_peers()
+        assert registry.get_quorum_size() == 2
+    
+    def test_clear_and_replace(self):
+        """Replacing or clearing peers keeps the alive set consistent."""
+        config = create_config()
+        registry = SwarmRegistry(config, config.agent_id)
+        peer_id = self._add(registry, "SAT001")
+        old_state = registry.peers[peer_id]
+        
+        self._add(registry, "SAT001", age_seconds=100)
+        assert not registry.is_peer_alive(peer_id)
+        # Detached states no longer affect the registry
+        old_state.record_heartbeat()
+        assert not registry.is_peer_alive(peer_id)
+        
+        registry.peers.clear()
+        assert registry.get_alive_peers() == []
+        assert registry.get_registry_stats()["total_peers"] == 0
+    
+    def test_merge_and_copy_keep_alive_set(self):
+        """|= joins peers; copies are detached plain dicts."""
+        config = create_config()
+        registry = SwarmRegistry(config, config.agent_id)
+        peer_id = create_agent_id("SAT001")
+        registry.peers |= {peer_id: PeerState(
+            agent_id=peer_id,
+            role=SatelliteRole.PRIMARY,
+            last_heartbeat=datetime.utcnow()
+        )}
+        assert registry.is_peer_alive(peer_id)
+        
+        snapshot = registry.peers.copy()
+        assert type(snapshot) is dict
+        del snapshot[peer_id]
+        assert registry.is_peer_alive(peer_id)
+        assert registry.peers.popitem()[0] == peer_id
+        assert peer_id not in registry.get_alive_peers()
+    
+    @pytest.mark.asyncio
+    async def test_wait_for_change_on_join(self):
+        """Waiters wake when a peer joins."""
+        config = create_config()
+        registry = SwarmRegistry(config, config.agent_id)
+        version = registry.alive_version
+        
+        waiter = asyncio.create_task(registry.wait_for_change(version, timeout=2))
+        await asyncio.sleep(0)
+        self._add(registry, "SAT001")
+        assert await waiter == version + 1
+    
+    @pytest.mark.asyncio
+    async def test_wait_for_change_on_timeout(self):
+        """Waiters wake when a deadline elapses, without polling."""
+        config = create_config()
+        registry = SwarmRegistry(config, config.agent_id)
+        peer_id = self._add(registry, "SAT001", age_seconds=HEARTBEAT_TIMEOUT - 0.05)
+        version = registry.alive_version
+        
+        assert await registry.wait_for_change(version, timeout=2) == version + 1
+        assert peer_id not in registry.get_alive_peers()
+    
+    @pytest.mark.asyncio
+    async def test_wait_for_change_times_out(self):
+        """wait_for_change returns the unchanged version after timeout."""
+        config = create_config()
+        registry = SwarmRegistry(config, config.agent_id)
+        version = registry.alive_version
+        assert await registry.wait_for_change(timeout=0.01) == version
+
+
+class TestConstellationAggregates:
+    """Test incrementally maintained alive/role/risk aggregates."""
+    
+    def _health(self, risk):
+        return HealthSummary(
+            anomaly_signature=[0.0] * 32,
+            risk_score=risk,
+            recurrence_score=0.0,
+            timestamp=datetime.utcnow(),
+        )
+    
+    def _add(self, registry, serial, role=SatelliteRole.PRIMARY, risk=None, age_seconds=0.0):
+        peer_id = create_agent_id(serial)
+        registry.peers[peer_id] = PeerState(
+            agent_id=peer_id,
+            role=role,
+            last_heartbeat=datetime.utcnow() - timedelta(seconds=age_seconds),
+            health_summary=None if risk is None else self._health(risk),
+        )
+        return peer_id
+    
+    def _scan(self, registry):
+        alive = [registry.peers[p] for p in registry.get_alive_peers()]
+        risks = [s.health_summary.risk_score for s in alive if s.health_summary]
+        roles = {}
+        for state in alive:
+            roles[state.role] = roles.get(state.role, 0) + 1
+        return len(alive), roles, (sum(risks) / len(risks) if risks else 0.0), max(risks, default=0.0)
+    
+    def _check(self, registry):
+        aggregates = registry.get_constellation_aggregates()
+        count, roles, mean, worst = self._scan(registry)
+        assert aggregates.alive_count == count
+        assert aggregates.role_counts == roles
+        assert aggregates.risk_mean == pytest.approx(mean, abs=1e-9)
+        assert aggregates.risk_max == pytest.approx(worst, abs=1e-9)
+    
+    def test_health_and_role_updates(self):
+        config = create_config()
+        registry = SwarmRegistry(config, config.agent_id)
+        a = self._add(registry, "SAT001", risk=0.2)
+        b = self._add(registry, "SAT002", role=SatelliteRole.BACKUP, risk=0.8)
+        self._check(registry)
+        assert registry.aggregates.reporting_count == 2
+        assert registry.aggregates.health == pytest.approx(0.5)
+        
+        registry.peers[b].record_heartbeat(self._health(0.1))
+        self._check(registry)
+        assert registry.aggregates.risk_max == pytest.approx(0.2)
+        
+        registry.peers[a].role = SatelliteRole.STANDBY
+        self._check(registry)
+        assert registry.get_agent_role(a) == SatelliteRole.STANDBY
+    
+    def test_leave_timeout_and_clear(self):
+        config = create_config()
+        registry = SwarmRegistry(config, config.agent_id)
+        a = self._add(registry, "SAT001", risk=0.9)
+        self._add(registry, "SAT002", risk=0.3, age_seconds=HEARTBEAT_TIMEOUT - 0.05)
+        self._add(registry, "SAT003", risk=0.7, age_seconds=100)  # Dead on arrival
+        self._check(registry)
+        
+        del registry.peers[a]
+        self._check(registry)
+        assert registry.aggregates.risk_max == pytest.approx(0.3)
+        
+        registry._expire(datetime.utcnow() + timedelta(seconds=1))
+        self._check(registry)
+        assert registry.aggregates.reporting_count == 0
+        assert registry.aggregates.health == 1.0
+        
+        registry.peers.clear()
+        assert registry.aggregates.alive_count == 0
+        assert registry.aggregates.role_counts == {}
+    
+    def test_matches_scan_under_churn(self):
+        import random
+        rng = random.Random(5)
+        config = create_config()
+        registry = SwarmRegistry(config, config.agent_id)
+        ids = [self._add(registry, f"SAT{i:03d}", risk=rng.random()) for i in range(1, 60)]
+        for _ in range(500):
+            peer_id = rng.choice(ids)
+            op = rng.random()
+            if op < 0.5 and peer_id in registry.peers:
+                registry.peers[peer_id].record_heartbeat(self._health(rng.random()))
+            elif op < 0.7 and peer_id in registry.peers:
+                registry.peers[peer_id].role = rng.choice(list(SatelliteRole))
+            elif op < 0.85:
+                registry.peers.pop(peer_id, None)
+            else:
+                self._add(registry, peer_id.satellite_serial, risk=rng.random(),
+                          age_seconds=rng.choice([0, 100]))
+        self._check(registry)
+        assert len(registry.aggregates._risk_heap) <= 2 * registry.aggregates.alive_count + 17
@@ -24,6 +24,7 @@ from astraguard.swarm.types import SwarmTopic, QoSLevel
 from astraguard.swarm.models import AgentID, SatelliteRole, SwarmConfig
 from astraguard.swarm.bus import SwarmMessageBus
 from astraguard.swarm.serializer import SwarmSerializer
+from astraguard.swarm.transport import InProcessHub, InProcessTransport
 
 
 def create_agent_id(serial: str = "SAT0000") -> AgentID:
@@ -571,3 +572,206 @@ class TestEdgeCases:
         )
         
         assert msg.retries > 3
+
+
+class _Link:
+    """Two ReliableDelivery endpoints joined by a lossy, delayed link."""
+
+    def __init__(self, loss: float = 0.0, latency: float = 0.005, drop=None, seed: int = 1):
+        self.loss = loss
+        self.latency = latency
+        self.drop = drop or (lambda topic, payload: False)
+        self.rng = random.Random(seed)
+        self.sender_id = create_agent_id("SAT001")
+        self.receiver_id = create_agent_id("SAT002")
+        self.sender = ReliableDelivery(self._bus(self.sender_id), self.sender_id)
+        self.receiver = ReliableDelivery(self._bus(self.receiver_id), self.receiver_id)
+        self.delivered = []
+        self.data_frames = 0
+
+    def _bus(self, agent_id):
+        link = self
+        bus = Mock()
+
+        async def publish(topic, payload, qos=1, receiver=None, **kwargs):
+            if topic != ReliableDelivery.ACK_TOPIC:
+                link.data_frames += 1
+            if link.drop(topic, payload) or link.rng.random() < link.loss:
+                return True
+            asyncio.get_running_loop().call_later(
+                link.latency, lambda: asyncio.ensure_future(link._arrive(agent_id, topic, payload))
+            )
+            return True
+
+        bus.publish = publish
+        return bus
+
+    async def _arrive(self, source, topic, payload):
+        if topic == ReliableDelivery.ACK_TOPIC:
+            self.sender.handle_window_ack(source, payload)
+        else:
+            data = await self.receiver.receive_windowed(source, payload)
+            if data is not None:
+                self.delivered.append(bytes(data))
+
+    def enable(self, **kwargs):
+        self.sender.enable_windowing(subscribe_acks=False, **kwargs)
+        self.receiver.enable_windowing(subscribe_acks=False, **kwargs)
+
+    async def send_all(self, count, **kwargs):
+        futures = [
+            await self.sender.send_windowed(self.receiver_id, "coord/test", f"m{i}".encode(), **kwargs)
+            for i in range(count)
+        ]
+        return await asyncio.gather(*futures)
+
+
+class TestWindowedDelivery:
+    """Test the sliding-window mode (cumulative ACK + SACK, timer wheel)."""
+
+    @pytest.mark.asyncio
+    async def test_lossless_delivery_and_ack_coalescing(self):
+        link = _Link()
+        link.enable(window_size=16, ack_every=4)
+        results = await link.send_all(64)
+        assert all(results)
+        assert sorted(link.delivered) == sorted(f"m{i}".encode() for i in range(64))
+        stats = link.sender.get_stats()
+        assert stats.successful_acks == 64
+        assert link.receiver.get_stats().acks_sent <= 64 // 4 + 4
+        assert link.sender.get_pending_count() == 0
+        assert link.sender.get_window_state(link.receiver_id)["srtt"] is not None
+        await link.sender.close_windowing()
+        await link.receiver.close_windowing()
+
+    @pytest.mark.asyncio
+    async def test_window_bounds_in_flight(self):
+        link = _Link(latency=0.02)
+        link.enable(window_size=8)
+        peak = 0
+
+        async def sample():
+            nonlocal peak
+            while True:
+                peak = max(peak, link.sender.get_pending_count())
+                await asyncio.sleep(0.001)
+
+        sampler = asyncio.ensure_future(sample())
+        assert all(await link.send_all(40))
+        sampler.cancel()
+        assert 0 < peak <= 8
+        await link.sender.close_windowing()
+
+    @pytest.mark.asyncio
+    async def test_exactly_once_under_20_percent_loss(self):
+        link = _Link(loss=0.20, seed=5)
+        link.enable(window_size=32)
+        results = await link.send_all(200, max_retries=8)
+        assert all(results)
+        assert len(link.delivered) == 200
+        assert len(set(link.delivered)) == 200
+        assert link.sender.get_stats().retries_performed > 0
+        await link.sender.close_windowing()
+        await link.receiver.close_windowing()
+
+    @pytest.mark.asyncio
+    async def test_sack_fast_retransmit_beats_timeout(self):
+        """A single lost frame is resent from SACK info, not after the 1s RTO."""
+        dropped = []
+
+        def drop_seq_3(topic, payload):
+            if topic != ReliableDelivery.ACK_TOPIC and payload.endswith(b"m3") and not dropped:
+                dropped.append(payload)
+                return True
+            return False
+
+        link = _Link(drop=drop_seq_3)
+        link.enable(window_size=16)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        assert all(await link.send_all(10))
+        assert loop.time() - start < 0.5
+        assert link.sender.get_stats().fast_retransmits == 1
+        assert not link.sender._retransmit_tasks  # References released once sent
+        await link.sender.close_windowing()
+        await link.receiver.close_windowing()
+
+    @pytest.mark.asyncio
+    async def test_abandoned_sequence_does_not_stall_receiver(self):
+        """After max_retries the receiver skips the lost sequence."""
+        link = _Link(drop=lambda topic, payload: topic != ReliableDelivery.ACK_TOPIC and payload.endswith(b"dead"))
+        link.enable(window_size=4, tick=0.005)
+        future = await link.sender.send_windowed(link.receiver_id, "coord/test", b"dead", max_retries=0)
+        assert await future is False
+        assert link.sender.get_stats().timeouts == 1
+
+        assert await link.sender.publish_windowed(link.receiver_id, "coord/test", b"alive")
+        window = link.receiver._receive_windows[link.sender_id]
+        assert window.bitmap.base == 2
+        assert link.delivered == [b"alive"]
+        await link.sender.close_windowing()
+        await link.receiver.close_windowing()
+
+    @pytest.mark.asyncio
+    async def test_duplicate_frames_rejected(self):
+        link = _Link()
+        link.enable(window_size=8)
+        frame = None
+
+        async def capture(topic, payload, qos=1, receiver=None, **kwargs):
+            nonlocal frame
+            frame = payload
+            return True
+
+        link.sender.bus.publish = capture
+        await link.sender.send_windowed(link.receiver_id, "coord/test", b"once")
+        link.receiver.bus.publish = AsyncMock()
+        assert bytes(await link.receiver.receive_windowed(link.sender_id, frame)) == b"once"
+        assert await link.receiver.receive_windowed(link.sender_id, frame) is None
+        assert link.receiver.get_stats().duplicates_rejected == 1
+        await link.sender.close_windowing()
+        await link.receiver.close_windowing()
+
+    @pytest.mark.asyncio
+    async def test_requires_enable(self):
+        config, agent_id = create_config()
+        delivery = ReliableDelivery(create_bus(config), agent_id)
+        with pytest.raises(RuntimeError):
+            await delivery.send_windowed(create_agent_id("SAT001"), "coord/test", b"x")
+
+    @pytest.mark.asyncio
+    async def test_over_message_bus(self):
+        """Data and ACK frames travel between two buses joined by a transport."""
+        hub = InProcessHub()
+        agents = [create_agent_id("SAT001"), create_agent_id("SAT002")]
+        buses = []
+        for agent in agents:
+            config = SwarmConfig(
+                agent_id=agent,
+                constellation_id="astra-v3.0",
+                role=SatelliteRole.PRIMARY,
+                bandwidth_limit_kbps=10,
+                peers={},
+            )
+            bus = SwarmMessageBus(config, SwarmSerializer(), latency_ms=0)
+            await bus.attach_transport(InProcessTransport(agent, hub))
+            buses.append(bus)
+        sender = ReliableDelivery(buses[0], agents[0])
+        receiver = ReliableDelivery(buses[1], agents[1])
+        sender.enable_windowing(window_size=8)
+        receiver.enable_windowing(window_size=8)
+        received = []
+
+        async def on_data(message):
+            payload = await receiver.receive_windowed(message.sender, bytes(message.payload))
+            if payload is not None:
+                received.append(bytes(payload))
+
+        buses[1].subscribe("coord/data", on_data)
+        assert await sender.publish_windowed(agents[1], "coord/data", b"hello")
+        assert received == [b"hello"]
+        assert sender.get_stats().acks_received >= 1
+        await sender.close_windowing()
+        await receiver.close_windowing()
+        for bus in buses:
+            await bus.close()
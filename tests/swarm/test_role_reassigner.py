@@ -551,6 +551,30 @@ class TestComplianceDemotion:
         is_failing = reassigner._is_compliance_failing(primary_agent_id)
         assert is_failing is True
 
+    async def test_compliance_failure_uses_propagator_index(
+        self, reassigner, primary_agent_id, backup_agent_id
+    ):
+        """A real ActionPropagator answers from its per-agent escalation index."""
+        from astraguard.swarm.action_propagator import ActionPropagator, ActionState
+
+        propagator = ActionPropagator(Mock(), Mock(), Mock())
+        reassigner.propagator = propagator
+        state = ActionState(
+            action_id="action_1",
+            action="safe_mode",
+            target_agents=[primary_agent_id, backup_agent_id],
+            deadline=datetime.utcnow() + timedelta(seconds=30),
+        )
+        propagator.pending_actions["action_1"] = state
+        assert reassigner._is_compliance_failing(primary_agent_id) is False
+
+        state.escalated_agents.add(primary_agent_id.satellite_serial)
+        assert reassigner._is_compliance_failing(primary_agent_id) is True
+        assert reassigner._is_compliance_failing(backup_agent_id) is False
+
+        propagator.clear_action("action_1")
+        assert reassigner._is_compliance_failing(primary_agent_id) is False
+
     async def test_compliance_demotion_proposal(self, reassigner, primary_agent_id):
         """Test compliance demotion proposal structure."""
         proposal = reassigner._propose_compliance_demotion(primary_agent_id)
@@ -20,13 +20,17 @@ import pytest
 from unittest.mock import Mock, AsyncMock
 from datetime import datetime
 
+import numpy as np
+
 from astraguard.swarm.safety_simulator import (
     SwarmImpactSimulator,
     SimulationResult,
     SafetyMetrics,
     ActionType,
+    ConstellationGraph,
 )
-from astraguard.swarm.models import AgentID, SwarmConfig
+from astraguard.swarm.models import AgentID, SwarmConfig, SatelliteRole
+from astraguard.swarm.registry import SwarmRegistry, PeerState
 
 
 @pytest.fixture
@@ -680,3 +684,214 @@ class TestRiskThresholdEnforcement:
 
         # Should be blocked
         assert result is False
+
+
+class TestConstellationGraph:
+    """Test the sparse ISL graph used for cascade propagation."""
+
+    def _dense(self, graph):
+        n = len(graph)
+        dense = np.zeros((n, n))
+        dense[graph.rows, graph.cols] = 1.0
+        return dense
+
+    def test_ring_degree_and_symmetry(self):
+        """Each satellite has two links per side; adjacency is symmetric."""
+        graph = ConstellationGraph.ring([f"SAT-{i}" for i in range(20)], 2)
+        dense = self._dense(graph)
+        assert (dense == dense.T).all()
+        assert np.trace(dense) == 0
+        assert (graph.degree == 4).all()
+        assert graph.link_count == 40
+        assert sorted(graph.neighbors("SAT-0")) == ["SAT-1", "SAT-18", "SAT-19", "SAT-2"]
+
+    def test_small_ring_is_complete_graph(self):
+        """Up to 5 satellites, a 2-per-side ring links everyone."""
+        for n in range(1, 6):
+            graph = ConstellationGraph.ring([f"SAT-{i}" for i in range(n)], 2)
+            assert (graph.degree == n - 1).all()
+
+    def test_matvec_matches_dense(self):
+        """Sparse product equals the dense adjacency product."""
+        graph = ConstellationGraph.ring([f"SAT-{i}" for i in range(50)], 3)
+        x = np.random.default_rng(7).random(50)
+        np.testing.assert_allclose(graph.matvec(x), self._dense(graph) @ x)
+
+    def test_cascade_matches_dense_frontier(self):
+        """Hop 1 crosses every source link; later hops only reach new nodes."""
+        graph = ConstellationGraph.ring([f"SAT-{i}" for i in range(30)], 2)
+        dense = self._dense(graph)
+        sources = [0, 5, 6]
+        r = np.zeros(30)
+        r[sources] = 0.2
+        reached = r > 0
+        expected = 0.0
+        for hop in range(3):
+            r = 0.15 * dense @ r
+            if hop:
+                r[reached] = 0.0
+            expected += r.sum()
+            reached |= r > 0
+        assert graph.cascade(sources, 0.2, 0.15, 3) == pytest.approx(expected / 3)
+
+    def test_cascade_single_source_on_ten_ring(self):
+        """Each satellite takes risk once: 4 at hop 1, 4 at hop 2, 1 at hop 3."""
+        graph = ConstellationGraph.ring([f"SAT-{i}" for i in range(10)], 2)
+        hop1 = 4 * 0.05 * 0.15
+        hop2 = 2 * (0.15 * 0.015) + 2 * (0.15 * 0.0075)
+        hop3 = 0.15 * 2 * (0.00225 + 0.001125)
+        assert graph.cascade([0], 0.05, 0.15, 3) == pytest.approx(hop1 + hop2 + hop3)
+
+    def test_complete_graph_extra_hops_add_nothing(self):
+        """Up to 5 satellites the ring is complete, so 3 hops equal 1 hop."""
+        graph = ConstellationGraph.ring([f"SAT-{i}" for i in range(5)], 2)
+        assert graph.cascade([0], 0.05, 0.15, 3) == pytest.approx(0.03)
+        assert graph.cascade([0, 1, 2, 3, 4], 0.05, 0.15, 3) == pytest.approx(
+            graph.cascade([0, 1, 2, 3, 4], 0.05, 0.15, 1)
+        )
+
+    def test_unknown_serial_and_empty_graph(self):
+        """Lookups on unknown serials and empty graphs are harmless."""
+        graph = ConstellationGraph.ring([], 2)
+        assert len(graph) == 0
+        assert graph.neighbors("SAT-X") == []
+        assert graph.cascade([], 0.5, 0.15, 3) == 0.0
+
+
+class TestMemoizationAndTopology:
+    """Test result memoization, topology versioning and bounded samples."""
+
+    @pytest.mark.asyncio
+    async def test_hop_one_matches_complete_graph_model(self, simulator):
+        """With 5 agents and one hop, cascade is 0.15 · base · (n - 1)."""
+        simulator.CASCADE_HOPS = 1
+        agents = await simulator._get_all_agents()
+        assert await simulator._propagate_to_neighbors(0.1, agents[:2]) == pytest.approx(0.06)
+
+    @pytest.mark.asyncio
+    async def test_five_agent_decisions_unchanged_by_extra_hops(self, simulator):
+        """Default hops keep the single-hop risks and decisions at 5 agents."""
+        cases = [
+            (ActionType.ATTITUDE_ADJUST, {"angle_degrees": 1.5}, 0.072, True),
+            (ActionType.ATTITUDE_ADJUST, {"angle_degrees": 2.0}, 0.096, True),
+            (ActionType.LOAD_SHED, {"shed_percent": 20.0}, 0.08, True),
+            (ActionType.THERMAL_MANEUVER, {"delta_temperature": 8.0}, 0.256, False),
+        ]
+        for action_type, params, total_risk, is_safe in cases:
+            result = await simulator._simulate_action(action_type, params)
+            assert result.total_risk == pytest.approx(total_risk)
+            assert result.is_safe is is_safe
+
+    @pytest.mark.asyncio
+    async def test_ring_order_independent_of_alive_order(self, simulator, mock_registry):
+        """ISL neighbors follow serial order, not join/alive order."""
+        agents = [AgentID.create("astra-v3.0", f"SAT-{i:03d}-A") for i in range(1, 9)]
+        mock_registry.get_alive_peers.return_value = agents
+        before = {a.satellite_serial: await simulator._get_agent_neighbors(a.satellite_serial) for a in agents}
+
+        mock_registry.get_alive_peers.return_value = agents[3:] + agents[:3]
+        after = {a.satellite_serial: await simulator._get_agent_neighbors(a.satellite_serial) for a in agents}
+        assert simulator.metrics.topology_rebuilds == 2
+        assert after == before
+        assert sorted(before["SAT-001-A"]) == ["SAT-002-A", "SAT-003-A", "SAT-007-A", "SAT-008-A"]
+
+    @pytest.mark.asyncio
+    async def test_large_constellation_does_not_saturate(self, mock_config):
+        """Cascade depends on ISL degree, not on constellation size."""
+        registry = Mock()
+        registry.get_alive_peers = Mock(return_value=[
+            AgentID.create("astra-v3.0", f"SAT-{i:04d}-A") for i in range(1000)
+        ])
+        simulator = SwarmImpactSimulator(registry=registry, config=mock_config)
+        result = await simulator._simulate_action(
+            ActionType.LOAD_SHED, {"shed_percent": 20.0}
+        )
+        assert result.cascade_risk < 1.0
+        assert len(result.affected_agents) == 1000
+
+    @pytest.mark.asyncio
+    async def test_repeat_validation_hits_cache(self, simulator):
+        """Same action, params and topology reuse the memoized result."""
+        params = {"angle_degrees": 1.0}
+        assert await simulator.validate_action("attitude_adjust", params, "constellation")
+        assert await simulator.validate_action("attitude_adjust", dict(params), "constellation")
+        assert simulator.metrics.simulation_cache_hits == 1
+        assert simulator.metrics.topology_rebuilds == 1
+
+        await simulator.validate_action("attitude_adjust", {"angle_degrees": 2.0}, "constellation")
+        assert simulator.metrics.simulation_cache_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_threshold_change_applies_to_cached_risk(self, simulator):
+        """A cached risk is judged against the threshold in force at call time."""
+        simulator.risk_threshold = 0.5
+        params = {"angle_degrees": 10}
+        assert await simulator.validate_action("attitude_adjust", params, "constellation")
+
+        simulator.risk_threshold = 0.01
+        assert not await simulator.validate_action("attitude_adjust", params, "constellation")
+        assert simulator.metrics.simulation_cache_hits == 1
+
+        simulator.risk_threshold = 0.5
+        assert await simulator.validate_action("attitude_adjust", params, "constellation")
+
+    @pytest.mark.asyncio
+    async def test_peer_list_change_invalidates_cache(self, simulator, mock_registry):
+        """Registries without alive_version are keyed by the alive list."""
+        params = {"shed_percent": 5.0}
+        await simulator.validate_action("load_shed", params, "constellation")
+        mock_registry.get_alive_peers.return_value = mock_registry.get_alive_peers()[:3]
+        await simulator.validate_action("load_shed", params, "constellation")
+        assert simulator.metrics.simulation_cache_hits == 0
+        assert simulator.metrics.topology_rebuilds == 2
+
+    @pytest.mark.asyncio
+    async def test_alive_version_invalidates_cache(self, mock_config):
+        """A real registry is keyed by alive_version."""
+        agent_id = AgentID.create("astra-v3.0", "SAT-000-A")
+        config = SwarmConfig(
+            agent_id=agent_id,
+            constellation_id="astra-v3.0",
+            role=SatelliteRole.PRIMARY,
+            bandwidth_limit_kbps=10,
+            peers={},
+        )
+        registry = SwarmRegistry(config, agent_id)
+        simulator = SwarmImpactSimulator(registry=registry, config=mock_config)
+        params = {"angle_degrees": 1.0}
+
+        await simulator.validate_action("attitude_adjust", params, "constellation")
+        await simulator.validate_action("attitude_adjust", params, "constellation")
+        assert simulator.metrics.simulation_cache_hits == 1
+
+        peer_id = AgentID.create("astra-v3.0", "SAT-001-A")
+        registry.peers[peer_id] = PeerState(
+            agent_id=peer_id,
+            role=SatelliteRole.BACKUP,
+            last_heartbeat=datetime.utcnow(),
+        )
+        await simulator.validate_action("attitude_adjust", params, "constellation")
+        assert simulator.metrics.simulation_cache_hits == 1
+        assert simulator.metrics.topology_rebuilds == 2
+        assert len(simulator._get_graph()) == 2
+
+    @pytest.mark.asyncio
+    async def test_result_cache_is_bounded(self, simulator):
+        """Least recently used results are evicted past RESULT_CACHE_SIZE."""
+        simulator.RESULT_CACHE_SIZE = 4
+        for angle in range(10):
+            await simulator.validate_action(
+                "attitude_adjust", {"angle_degrees": angle / 10}, "constellation"
+            )
+        assert len(simulator._results) == 4
+
+    @pytest.mark.asyncio
+    async def test_latency_samples_bounded(self, simulator):
+        """Latency ring keeps only the newest samples; average covers all runs."""
+        simulator.latency_samples = type(simulator.latency_samples)(maxlen=8)
+        for _ in range(30):
+            await simulator.validate_action("safe_mode", {}, "constellation")
+        assert len(simulator.latency_samples) == 8
+        assert simulator.metrics.simulations_run == 30
+        assert simulator.metrics.avg_simulation_latency_ms > 0
+        assert simulator.metrics.max_simulation_latency_ms >= max(simulator.latency_samples)
@@ -0,0 +1,235 @@
+"""
+Tests for OutboundScheduler weighted fair scheduling of outbound traffic.
+"""
+
+import asyncio
+
+import pytest
+
+from astraguard.swarm.bandwidth_governor import BandwidthGovernor
+from astraguard.swarm.bus import SwarmMessageBus
+from astraguard.swarm.models import AgentID, SatelliteRole, SwarmConfig
+from astraguard.swarm.scheduler import OutboundScheduler
+from astraguard.swarm.serializer import SwarmSerializer
+from astraguard.swarm.types import QoSLevel, SwarmMessage, TrafficClass
+
+
+SENDER = AgentID.create("astra-v3.0", "SAT-001-A")
+
+
+def make_config() -> SwarmConfig:
+    return SwarmConfig(
+        agent_id=SENDER,
+        role=SatelliteRole.PRIMARY,
+        constellation_id="astra-v3.0",
+    )
+
+
+def make_message(topic: str, seq: int = 0, size: int = 100, receiver=None) -> SwarmMessage:
+    return SwarmMessage(
+        topic=topic, payload=b"x" * size, sender=SENDER, qos=0, sequence=seq,
+        receiver=receiver,
+    )
+
+
+class Sink:
+    """Records sent messages in order."""
+
+    def __init__(self):
+        self.sent = []
+
+    async def __call__(self, message):
+        self.sent.append(message)
+
+
+class TestClassification:
+    """Topic prefix classification."""
+
+    @pytest.mark.parametrize("topic,expected", [
+        ("coord/vote_grant", TrafficClass.CONSENSUS),
+        ("coord/proposal_request", TrafficClass.CONSENSUS),
+        ("coord/heartbeat", TrafficClass.HEARTBEAT),
+        ("control/safe_mode", TrafficClass.SAFETY),
+        ("intent/plan", TrafficClass.INTENT),
+        ("health/summary", TrafficClass.HEALTH),
+        ("health/heartbeat", TrafficClass.HEARTBEAT),
+    ])
+    def test_default_topic_classes(self, topic, expected):
+        scheduler = OutboundScheduler(Sink())
+        assert scheduler.classify(make_message(topic)) == expected
+
+    def test_overrides(self):
+        scheduler = OutboundScheduler(
+            Sink(), topic_classes={"health/critical": TrafficClass.SAFETY}
+        )
+        assert scheduler.classify(make_message("health/critical")) == TrafficClass.SAFETY
+        assert scheduler.classify(make_message("health/summary")) == TrafficClass.HEALTH
+
+        fifo = OutboundScheduler(Sink(), classifier=lambda m: TrafficClass.HEARTBEAT)
+        assert fifo.classify(make_message("coord/vote_grant")) == TrafficClass.HEARTBEAT
+
+
+class TestOutboundScheduler:
+    """Draining order, governor gating and metrics."""
+
+    @pytest.fixture
+    async def make_scheduler(self):
+        schedulers = []
+
+        def factory(sink, **kwargs):
+            schedulers.append(OutboundScheduler(sink, **kwargs))
+            return schedulers[-1]
+
+        yield factory
+        workers = [w for w in (s.stop() for s in schedulers) if w is not None]
+        await asyncio.gather(*workers, return_exceptions=True)
+
+    @pytest.mark.asyncio
+    async def test_weighted_share_under_backlog(self, make_scheduler):
+        sink = Sink()
+        scheduler = make_scheduler(sink, quantum_bytes=164)
+        for i in range(40):
+            await scheduler.enqueue(make_message("health/heartbeat", i))
+        for i in range(10):
+            await scheduler.enqueue(make_message("coord/vote_grant", i))
+        await scheduler.drain()
+
+        order = [scheduler.classify(m) for m in sink.sent]
+        assert len(order) == 50
+        # Consensus (weight 8) finishes within the first couple of rounds
+        last_vote = max(i for i, c in enumerate(order) if c == TrafficClass.CONSENSUS)
+        assert last_vote < 15
+        # FIFO order preserved within a class
+        votes = [m.sequence for m in sink.sent if m.topic == "coord/vote_grant"]
+        assert votes == sorted(votes)
+
+    @pytest.mark.asyncio
+    async def test_heartbeats_not_starved(self, make_scheduler):
+        sink = Sink()
+        scheduler = make_scheduler(sink, quantum_bytes=164)
+        for i in range(100):
+            await scheduler.enqueue(make_message("coord/vote_grant", i))
+        await scheduler.enqueue(make_message("health/heartbeat", 0))
+        await scheduler.drain()
+
+        position = next(i for i, m in enumerate(sink.sent) if m.topic == "health/heartbeat")
+        assert position < 20
+
+    @pytest.mark.asyncio
+    async def test_queue_limit_drops_oldest(self, make_scheduler):
+        sink = Sink()
+        scheduler = make_scheduler(sink, queue_limit=3)
+        results = [
+            await scheduler.enqueue(make_message("health/heartbeat", i)) for i in range(5)
+        ]
+        assert results == [True, True, True, False, False]
+        await scheduler.drain()
+
+        assert [m.sequence for m in sink.sent] == [2, 3, 4]
+        stats = scheduler.get_stats()["heartbeat"]
+        assert stats["dropped"] == 2
+        assert stats["sent"] == 3
+        assert stats["max_queue_depth"] == 3
+
+    @pytest.mark.asyncio
+    async def test_governor_paces_and_prioritizes(self, make_scheduler):
+        governor = BandwidthGovernor(make_config())
+        governor.set_peer_limit(None, 100)
+        governor.global_bucket._tokens = 0.0  # Link saturated
+        sink = Sink()
+        scheduler = make_scheduler(sink, governor=governor, retry_interval_ms=1)
+
+        for i in range(5):
+            await scheduler.enqueue(make_message("health/heartbeat", i))
+        await scheduler.enqueue(make_message("coord/vote_grant", 0))
+        await scheduler.drain()
+
+        assert scheduler.governor_waits > 0
+        assert sink.sent[0].topic == "coord/vote_grant"
+        assert len(sink.sent) == 6
+        assert governor.stats.total_messages == 6
+
+    @pytest.mark.asyncio
+    async def test_oversized_message_with_default_limits(self, make_scheduler):
+        """A message above the 500B peer burst is sent once the bucket is full."""
+        governor = BandwidthGovernor(make_config())
+        sink = Sink()
+        scheduler = make_scheduler(sink, governor=governor, retry_interval_ms=1)
+
+        await scheduler.enqueue(make_message("coord/vote", 0, size=600))
+        await scheduler.enqueue(make_message("coord/heartbeat", 1))
+        await asyncio.wait_for(scheduler.drain(), timeout=2.0)
+
+        assert [m.sequence for m in sink.sent] == [0, 1]
+        assert governor.stats.total_messages == 2
+
+    @pytest.mark.asyncio
+    async def test_throttled_class_does_not_block_others(self, make_scheduler):
+        """A class waiting on one peer's bucket doesn't hold up traffic to others."""
+        governor = BandwidthGovernor(make_config())
+        busy = AgentID.create("astra-v3.0", "SAT-002-A")
+        idle = AgentID.create("astra-v3.0", "SAT-003-A")
+        governor._get_peer_bucket(busy)._tokens = -1000.0  # ~1.5s until refilled
+        sink = Sink()
+        scheduler = make_scheduler(sink, governor=governor, retry_interval_ms=1)
+
+        await scheduler.enqueue(make_message("coord/vote", 0, receiver=busy))
+        for i in range(1, 4):
+            await scheduler.enqueue(make_message("health/summary", i, receiver=idle))
+        await asyncio.sleep(0.1)
+
+        assert [m.sequence for m in sink.sent] == [1, 2, 3]
+        assert scheduler.queue_depths()["consensus"] == 1
+        await asyncio.wait_for(scheduler.drain(), timeout=3.0)
+        assert sink.sent[-1].sequence == 0
+
+    @pytest.mark.asyncio
+    async def test_latency_metrics_and_stop(self, make_scheduler):
+        sink = Sink()
+        scheduler = make_scheduler(sink)
+        await scheduler.enqueue(make_message("intent/plan"))
+        await scheduler.drain()
+        stats = scheduler.get_stats()["intent"]
+        assert stats["sent"] == 1
+        assert stats["latency_p99_ms"] >= 0.0
+
+        await scheduler.enqueue(make_message("intent/plan"))
+        scheduler.stop()
+        assert scheduler.get_stats()["intent"]["dropped"] == 1
+        assert scheduler.get_stats()["intent"]["queue_depth"] == 0
+
+
+class TestBusScheduling:
+    """SwarmMessageBus integration."""
+
+    @pytest.fixture
+    async def bus(self):
+        bus = SwarmMessageBus(make_config(), SwarmSerializer(validate=False), latency_ms=0)
+        yield bus
+        await bus.close()
+
+    @pytest.mark.asyncio
+    async def test_publish_goes_through_scheduler(self, bus):
+        scheduler = bus.enable_scheduler()
+        received = []
+        bus.subscribe("*", received.append)
+
+        await bus.publish("health/heartbeat", b"hb", qos=QoSLevel.FIRE_FORGET)
+        await bus.publish("coord/vote_grant", b"vote", qos=QoSLevel.FIRE_FORGET)
+        await bus.drain()
+
+        assert {m.topic for m in received} == {"health/heartbeat", "coord/vote_grant"}
+        metrics = bus.get_metrics()["scheduling"]
+        assert metrics["consensus"]["sent"] == 1
+        assert metrics["heartbeat"]["sent"] == 1
+        assert scheduler is bus.scheduler
+
+    @pytest.mark.asyncio
+    async def test_ack_qos_through_scheduler(self, bus):
+        bus.enable_scheduler()
+
+        async def ack(message):
+            await bus.acknowledge(message)
+
+        bus.subscribe("control/*", ack)
+        assert await bus.publish("control/safe_mode", b"on", qos=QoSLevel.ACK, timeout_ms=1000)
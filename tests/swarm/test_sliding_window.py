@@ -0,0 +1,143 @@
+"""
+Tests for sliding-window primitives: TimerWheel and ReceiveBitmap.
+"""
+
+import random
+
+import pytest
+
+from astraguard.swarm.sliding_window import ReceiveBitmap, TimerWheel
+
+
+class TestTimerWheel:
+    """Test hashed timing wheel scheduling."""
+
+    def test_fires_in_deadline_order(self):
+        wheel = TimerWheel(tick=0.01, slots=16)
+        wheel.schedule("late", 0.09)
+        wheel.schedule("early", 0.03)
+        assert wheel.advance(0.02) == []
+        assert wheel.advance(0.10) == ["early", "late"]
+        assert len(wheel) == 0
+
+    def test_multiple_rotations(self):
+        """Timers beyond one rotation stay until their own deadline."""
+        wheel = TimerWheel(tick=0.01, slots=4)
+        wheel.schedule("far", 0.105)
+        for step in range(1, 11):
+            assert wheel.advance(step * 0.01) == []
+        assert wheel.advance(0.11) == ["far"]
+
+    def test_large_jump(self):
+        """Advancing past several rotations fires everything due."""
+        wheel = TimerWheel(tick=0.01, slots=8)
+        for i in range(20):
+            wheel.schedule(i, 0.01 * (i + 1))
+        wheel.schedule("later", 5.0)
+        assert wheel.advance(1.0) == list(range(20))
+        assert "later" in wheel
+
+    def test_cancel_and_reschedule(self):
+        wheel = TimerWheel(tick=0.01, slots=8)
+        wheel.schedule("a", 0.02)
+        wheel.schedule("b", 0.02)
+        assert wheel.cancel("a") is True
+        assert wheel.cancel("a") is False
+        wheel.schedule("b", 0.05)  # Replaces the earlier deadline
+        assert wheel.advance(0.03) == []
+        assert wheel.advance(0.05) == ["b"]
+
+    def test_past_deadline_fires_next_tick(self):
+        wheel = TimerWheel(tick=0.01, slots=8, now=1.0)
+        wheel.schedule("overdue", 0.5)
+        assert wheel.advance(1.01) == ["overdue"]
+
+    def test_matches_sorted_reference(self):
+        """Random schedules fire exactly when a sorted reference says so."""
+        rng = random.Random(3)
+        wheel = TimerWheel(tick=0.01, slots=32)
+        reference = {}
+        now = 0.0
+        for _ in range(500):
+            key = rng.randrange(100)
+            if rng.random() < 0.2:
+                wheel.cancel(key)
+                reference.pop(key, None)
+            else:
+                when = now + rng.uniform(0.0, 1.0)
+                wheel.schedule(key, when)
+                reference[key] = max(wheel._to_tick(when), wheel._current + 1)
+            now += rng.uniform(0.0, 0.05)
+            fired = wheel.advance(now)
+            due = {k for k, tick in reference.items() if tick <= wheel._current}
+            assert set(fired) == due
+            for k in due:
+                del reference[k]
+        assert len(wheel) == len(reference)
+
+    def test_invalid_parameters(self):
+        with pytest.raises(ValueError):
+            TimerWheel(tick=0)
+        with pytest.raises(ValueError):
+            TimerWheel(slots=0)
+
+
+class TestReceiveBitmap:
+    """Test cumulative ACK / SACK bookkeeping."""
+
+    def test_in_order_slides_base(self):
+        bitmap = ReceiveBitmap(capacity=8)
+        for seq in range(20):
+            assert bitmap.mark(seq) is True
+        assert bitmap.base == 20
+        assert not bitmap.has_gaps
+        assert bitmap.sack_ranges() == []
+
+    def test_out_of_order_ranges(self):
+        bitmap = ReceiveBitmap(capacity=16)
+        for seq in (0, 2, 3, 5, 8, 9):
+            bitmap.mark(seq)
+        assert bitmap.base == 1
+        assert bitmap.sack_ranges() == [(2, 4), (5, 6), (8, 10)]
+        assert bitmap.sack_ranges(limit=2) == [(2, 4), (5, 6)]
+        assert bitmap.sack_ranges(limit=2, first=8) == [(8, 10), (2, 4)]
+
+        bitmap.mark(1)
+        assert bitmap.base == 4
+        bitmap.mark(4)
+        assert bitmap.base == 6
+
+    def test_duplicates_and_window_edge(self):
+        bitmap = ReceiveBitmap(capacity=4)
+        assert bitmap.mark(1) is True
+        assert bitmap.mark(1) is False
+        assert bitmap.mark(4) is False  # base 0 + capacity 4
+        assert bitmap.out_of_window == 1
+        assert 1 in bitmap and 2 not in bitmap
+
+    def test_advance_to_skips_abandoned(self):
+        bitmap = ReceiveBitmap(capacity=8)
+        bitmap.mark(0)
+        bitmap.mark(3)
+        bitmap.advance_to(3)
+        assert bitmap.base == 4
+        bitmap.advance_to(100)
+        assert bitmap.base == 100
+        assert bitmap.mark(105) is True
+        assert 99 in bitmap and 101 not in bitmap
+
+    def test_wraparound_matches_set(self):
+        """Circular bitmap agrees with a plain set over many windows."""
+        rng = random.Random(11)
+        bitmap = ReceiveBitmap(capacity=32)
+        received = set()
+        for _ in range(3000):
+            candidate = bitmap.base + min(rng.randrange(32), rng.randrange(32))
+            assert bitmap.mark(candidate) is (candidate not in received)
+            received.add(candidate)
+            base = 0
+            while base in received:
+                base += 1
+            assert bitmap.base == base
+            assert all((seq in bitmap) == (seq in received) for seq in range(base, base + 32))
+        assert bitmap.base > 1000
@@ -32,7 +32,7 @@ from astraguard.swarm.swarm_decision_loop import (
     SwarmDecisionMetrics,
 )
 from astraguard.swarm.models import AgentID, SatelliteRole
-from astraguard.swarm.registry import SwarmRegistry
+from astraguard.swarm.registry import ConstellationAggregates, SwarmRegistry
 from astraguard.swarm.leader_election import LeaderElection
 from astraguard.swarm.swarm_memory import SwarmAdaptiveMemory
 
@@ -65,6 +65,7 @@ def mock_registry(agent_id):
     registry.get_alive_peers = MagicMock(return_value=[])
     registry.get_peer_health = MagicMock(return_value=None)
     registry.get_agent_role = MagicMock(return_value=SatelliteRole.PRIMARY)
+    registry.get_constellation_aggregates = MagicMock(return_value=ConstellationAggregates())
     return registry
 
 
@@ -419,6 +420,7 @@ class TestDecisionConvergence:
         mock_registry.get_alive_peers = MagicMock(return_value=[])
         mock_registry.get_peer_health = MagicMock(return_value=None)
         mock_registry.get_agent_role = MagicMock(return_value=SatelliteRole.PRIMARY)
+        mock_registry.get_constellation_aggregates = MagicMock(return_value=ConstellationAggregates())
         mock_election.is_leader = MagicMock(return_value=False)
         mock_election.get_leader = AsyncMock(return_value=None)
 
@@ -681,5 +683,89 @@ class TestRecentDecisions:
         assert len(recent) == 3
 
 
+# Test: Incremental aggregates and latency percentiles
+
+class TestAggregatesAndPercentiles:
+    """Test registry aggregates in the context and streaming latency quantiles."""
+
+    def test_sketch_quantiles_within_accuracy(self):
+        import random
+        from astraguard.swarm.swarm_decision_loop import LatencySketch
+
+        rng = random.Random(11)
+        values = [rng.lognormvariate(0, 1.5) for _ in range(20000)]
+        sketch = LatencySketch(relative_accuracy=0.01)
+        for value in values:
+            sketch.add(value)
+        ordered = sorted(values)
+        for q in (0.5, 0.95, 0.99):
+            exact = ordered[int(q * (len(ordered) - 1))]
+            assert sketch.quantile(q) == pytest.approx(exact, rel=0.02)
+        assert sketch.quantile(1.0) <= sketch.max == max(values)
+
+    def test_sketch_empty_and_zero(self):
+        from astraguard.swarm.swarm_decision_loop import LatencySketch
+
+        sketch = LatencySketch()
+        assert sketch.quantile(0.95) == 0.0
+        sketch.add(0.0)
+        assert sketch.quantile(0.5) == 0.0
+        with pytest.raises(ValueError):
+            LatencySketch(relative_accuracy=0.0)
+
+    @pytest.mark.asyncio
+    async def test_metrics_export_percentiles(self, swarm_loop):
+        for _ in range(20):
+            await swarm_loop.step(create_test_telemetry())
+        exported = swarm_loop.get_metrics().to_dict()
+        assert (
+            exported["decision_latency_ms_p50"]
+            <= exported["decision_latency_ms_p95"]
+            <= exported["decision_latency_ms_p99"]
+            <= exported["decision_latency_ms_max"]
+        )
+        assert swarm_loop.metrics.latency_sketch.count == 20
+
+    @pytest.mark.asyncio
+    async def test_context_from_registry_aggregates(self, mock_inner_loop, mock_election, mock_memory):
+        from astraguard.swarm.models import HealthSummary, SwarmConfig
+        from astraguard.swarm.registry import PeerState
+
+        me = AgentID.create("astra-v3.0", "SAT000")
+        config = SwarmConfig(
+            agent_id=me, constellation_id="astra-v3.0", role=SatelliteRole.PRIMARY,
+            bandwidth_limit_kbps=10, peers={},
+        )
+        registry = SwarmRegistry(config, me)
+        for i, risk in enumerate((0.2, 0.6), start=1):
+            peer = AgentID.create("astra-v3.0", f"SAT{i:03d}")
+            registry.peers[peer] = PeerState(
+                agent_id=peer,
+                role=SatelliteRole.BACKUP,
+                last_heartbeat=datetime.utcnow(),
+                health_summary=HealthSummary(
+                    anomaly_signature=[0.0] * 32, risk_score=risk,
+                    recurrence_score=0.0, timestamp=datetime.utcnow(),
+                ),
+            )
+        registry.get_alive_peers = MagicMock(side_effect=AssertionError("peer scan"))
+        loop = SwarmDecisionLoop(mock_inner_loop, registry, mock_election, mock_memory, me)
+
+        await loop.step(create_test_telemetry())
+        context = loop.global_context_cache
+
+        assert loop.metrics.reasoning_fallback_count == 0
+        assert context.quorum_size == 3
+        assert context.constellation_health == pytest.approx(0.6)
+        assert context.risk_max == pytest.approx(0.6)
+        assert context.role_counts == {SatelliteRole.PRIMARY: 1, SatelliteRole.BACKUP: 2}
+        assert context.role == SatelliteRole.PRIMARY
+
+    def test_health_fallback_uses_risk_score(self, swarm_loop, mock_registry):
+        mock_registry.get_peer_health.side_effect = [MagicMock(spec=["risk_score"], risk_score=0.25)]
+        peer = AgentID.create("astra-v3.0", "SAT009")
+        assert swarm_loop._calculate_constellation_health([peer]) == pytest.approx(0.75)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])
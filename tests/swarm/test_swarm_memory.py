@@ -17,6 +17,8 @@ Target: 90%+ code coverage, 45+ tests
 
 import pytest
 import asyncio
+import base64
+import json
 from datetime import datetime, timedelta
 from typing import Dict, List
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -32,6 +34,11 @@ from astraguard.swarm.models import AgentID
 from astraguard.swarm.registry import SwarmRegistry
 from astraguard.swarm.bus import SwarmMessageBus
 from astraguard.swarm.compressor import StateCompressor
+from astraguard.swarm.digests import PartitionedBloomFilter
+from astraguard.swarm.models import SatelliteRole, SwarmConfig
+from astraguard.swarm.serializer import SwarmSerializer
+from astraguard.swarm.transport import InProcessHub, InProcessTransport
+from astraguard.swarm.types import SwarmMessage, SwarmTopic
 
 
 # Fixtures
@@ -71,7 +78,7 @@ def mock_bus():
     """Create mock SwarmMessageBus."""
     bus = AsyncMock(spec=SwarmMessageBus)
     bus.publish = AsyncMock()
-    bus.subscribe = AsyncMock()
+    bus.subscribe = MagicMock()
     return bus
 
 
@@ -613,5 +620,628 @@ class TestBackwardCompatibility:
         assert "pattern-001" in swarm_memory._local_pattern_cache
 
 
+# Test: Bloom digests and Merkle anti-entropy
+
+class MemoryNetwork:
+    """In-process bus: unicast honours receiver, broadcast reaches every node."""
+
+    def __init__(self):
+        self.handlers = {}  # serial → {topic: handler}
+        self.sent = []  # (topic, sender serial, receiver serial)
+        self.max_payload = 0  # Largest encoded payload published
+
+    def bus(self, agent: AgentID):
+        network = self
+        serial = agent.satellite_serial
+
+        class _Bus:
+            def subscribe(self, topic, handler, **kwargs):
+                network.handlers.setdefault(serial, {})[topic] = handler
+                return topic
+
+            def unsubscribe(self, subscription):
+                return network.handlers.get(serial, {}).pop(subscription, None) is not None
+
+            async def acknowledge(self, message):
+                pass
+
+            async def publish(self, topic, payload, qos=1, receiver=None, **kwargs):
+                target = receiver.satellite_serial if receiver is not None else None
+                network.sent.append((topic, serial, target))
+                encoded = json.dumps(payload).encode()
+                network.max_payload = max(network.max_payload, len(encoded))
+                message = SwarmMessage(
+                    topic=topic, payload=encoded, sender=agent, qos=qos, receiver=receiver
+                )
+                for owner, handlers in network.handlers.items():
+                    if owner == serial or (target is not None and owner != target):
+                        continue
+                    if topic in handlers:
+                        asyncio.ensure_future(handlers[topic](message))
+                return True
+
+        return _Bus()
+
+    def count(self, topic: str) -> int:
+        return sum(1 for sent_topic, _, _ in self.sent if sent_topic == topic)
+
+
+async def make_nodes(tmp_path, count: int):
+    """Started SwarmAdaptiveMemory nodes on one MemoryNetwork (no background loop)."""
+    network = MemoryNetwork()
+    agents = [AgentID.create("astra-v3.0", f"node-{i}") for i in range(count)]
+    nodes = []
+    for agent in agents:
+        registry = MagicMock()
+        registry.config.agent_id = agent
+        registry.get_alive_peers = MagicMock(return_value=list(agents))
+        node = SwarmAdaptiveMemory(
+            local_path=str(tmp_path / f"{agent.satellite_serial}.pkl"),
+            registry=registry,
+            bus=network.bus(agent),
+            compressor=MagicMock(spec=StateCompressor),
+            config={"digest_interval": 3600},
+        )
+        await node.start()
+        nodes.append(node)
+    return network, nodes
+
+
+async def settle():
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+
+async def stop_nodes(nodes):
+    for node in nodes:
+        node.local_cache.save = MagicMock()
+        await node.stop()
+
+
+class TestDigestsAndAntiEntropy:
+    """Test Bloom-routed queries and Merkle sync between in-process nodes."""
+
+    @pytest.mark.asyncio
+    async def test_peer_query_resolves_from_response(self, tmp_path):
+        network, (a, b) = await make_nodes(tmp_path, 2)
+        try:
+            b._local_pattern_cache["p1"] = create_test_pattern("p1")
+            result = await a.get("p1")
+            assert result is not None and result.pattern_id == "p1"
+            assert "p1" in a._local_pattern_cache
+            metrics = a.get_metrics()
+            assert metrics.peer_queries_sent == 1
+            assert metrics.peer_query_hit_rate == 1.0
+        finally:
+            await stop_nodes([a, b])
+
+    @pytest.mark.asyncio
+    async def test_all_peers_missing_returns_without_timeout(self, tmp_path):
+        network, nodes = await make_nodes(tmp_path, 3)
+        try:
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            assert await nodes[0].get("absent") is None
+            assert loop.time() - start < nodes[0].QUERY_TIMEOUT_SECONDS / 2
+            assert nodes[0].metrics.peer_queries_sent == 2
+        finally:
+            await stop_nodes(nodes)
+
+    @pytest.mark.asyncio
+    async def test_bloom_digest_routes_query_to_holder(self, tmp_path):
+        network, nodes = await make_nodes(tmp_path, 5)
+        try:
+            holder = nodes[3]
+            holder._local_pattern_cache["p1"] = create_test_pattern("p1")
+            for node in nodes:
+                await node._broadcast_digest()
+            await settle()
+
+            result = await nodes[0].get("p1")
+            assert result is not None
+            assert nodes[0].metrics.peer_queries_sent == 1
+            assert nodes[0].metrics.peer_queries_skipped >= 3
+            assert network.sent[-2] == (
+                SwarmAdaptiveMemory.CACHE_QUERY_TOPIC, "node-0", holder._serial
+            )
+
+            # No peer may hold the key: nothing is sent
+            assert await nodes[0].get("absent") is None
+            assert nodes[0].metrics.peer_queries_sent == 1
+        finally:
+            await stop_nodes(nodes)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_queries(self, tmp_path):
+        network, (a, b) = await make_nodes(tmp_path, 2)
+        try:
+            b._local_pattern_cache["p1"] = create_test_pattern("p1")
+            first, second = await asyncio.gather(a._fetch_from_peers("p1"), a._fetch_from_peers("p1"))
+            assert first is not None and second is not None
+            assert a.metrics.peer_queries_sent == 1
+            assert not a._pending_queries
+        finally:
+            await stop_nodes([a, b])
+
+    @pytest.mark.asyncio
+    async def test_merkle_sync_converges_both_directions(self, tmp_path):
+        network, (a, b) = await make_nodes(tmp_path, 2)
+        try:
+            shared = {f"p{i}": create_test_pattern(f"p{i}") for i in range(300)}
+            a._local_pattern_cache.update(shared)
+            b._local_pattern_cache.update(shared)
+            a._local_pattern_cache["only-a"] = create_test_pattern("only-a")
+            b._local_pattern_cache["only-b"] = create_test_pattern("only-b")
+            newer = create_test_pattern("p7")
+            newer.recurrence_count = 9
+            b._local_pattern_cache["p7"] = newer
+
+            await b._broadcast_digest()
+            await settle()
+            await a._anti_entropy_round()
+            await settle()
+
+            assert a._digest.root() == b._digest.root()
+            assert set(a._local_pattern_cache) == set(b._local_pattern_cache)
+            assert a._local_pattern_cache["p7"].recurrence_count == 9
+            assert a.metrics.patterns_synced + b.metrics.patterns_synced == 3
+            # Only the differing patterns crossed the link
+            full_size = sum(a._estimate_pattern_size(p) for p in shared.values())
+            assert a.metrics.sync_bytes_sent + b.metrics.sync_bytes_sent < full_size / 10
+            # Each side now records the other at the merged root
+            assert a.peer_caches[b.registry.config.agent_id].digest_root == a._digest.root()
+            assert a._next_sync_peer() is None
+        finally:
+            await stop_nodes([a, b])
+
+    @pytest.mark.asyncio
+    async def test_sync_converges_with_budget_below_replicated_set(self, tmp_path):
+        network, (a, b) = await make_nodes(tmp_path, 2)
+        try:
+            a.max_cache_bytes = create_test_pattern("p00").size_bytes * 5
+            for i in range(20):
+                b._local_pattern_cache[f"p{i:02d}"] = create_test_pattern(f"p{i:02d}")
+
+            await b._broadcast_digest()
+            await settle()
+            await a._anti_entropy_round()
+            await settle()
+            assert len(a._local_pattern_cache) == 5
+            assert a._digest.root() == b._digest.root()
+
+            # Later rounds find nothing to resend
+            synced = a.metrics.patterns_synced
+            sync_messages = network.count(SwarmAdaptiveMemory.MERKLE_SYNC_TOPIC)
+            for _ in range(3):
+                await b._broadcast_digest()
+                await settle()
+                await a._anti_entropy_round()
+                await settle()
+            assert a.metrics.patterns_synced == synced
+            assert network.count(SwarmAdaptiveMemory.MERKLE_SYNC_TOPIC) == sync_messages
+
+            # Replication of a version we already evicted does not churn the cache
+            evictions = a.metrics.eviction_count_local
+            evicted = next(iter(a._evicted))
+            await a._handle_replication(
+                {"source": b._serial, "patterns": {evicted: b._local_pattern_cache[evicted].to_dict()}}
+            )
+            assert a.metrics.eviction_count_local == evictions
+        finally:
+            await stop_nodes([a, b])
+
+    @pytest.mark.asyncio
+    async def test_evicted_key_missing_everywhere_is_forgotten(self, tmp_path):
+        network, (a, b) = await make_nodes(tmp_path, 2)
+        try:
+            a.max_cache_bytes = create_test_pattern("p00").size_bytes
+            a._local_pattern_cache["p00"] = create_test_pattern("p00")
+            a._local_pattern_cache["p01"] = create_test_pattern("p01")
+            assert "p00" in a._evicted
+
+            await b._broadcast_digest()
+            await settle()
+            await a._anti_entropy_round()
+            await settle()
+            # b now holds p01; nobody can send p00, so a stops advertising it
+            assert "p00" not in a._digest
+            await b._broadcast_digest()
+            await settle()
+            assert a._digest.root() == b._digest.root()
+        finally:
+            await stop_nodes([a, b])
+
+    @pytest.mark.asyncio
+    async def test_identical_replicas_skip_sync(self, tmp_path):
+        network, (a, b) = await make_nodes(tmp_path, 2)
+        try:
+            pattern = create_test_pattern("p1")
+            for node in (a, b):
+                node._local_pattern_cache["p1"] = pattern
+            await b._broadcast_digest()
+            await settle()
+            await a._anti_entropy_round()
+            await settle()
+            assert network.count(SwarmAdaptiveMemory.MERKLE_SYNC_TOPIC) == 0
+            assert a.metrics.sync_rounds == 0
+        finally:
+            await stop_nodes([a, b])
+
+    @pytest.mark.asyncio
+    async def test_large_digest_is_partitioned(self, tmp_path):
+        network, (a, b) = await make_nodes(tmp_path, 2)
+        try:
+            for i in range(8000):
+                b._local_pattern_cache[f"p{i}"] = create_test_pattern(f"p{i}")
+            await b._broadcast_digest()
+            await settle()
+
+            assert network.count(SwarmAdaptiveMemory.DIGEST_TOPIC) > 1
+            assert network.max_payload <= SwarmAdaptiveMemory.MAX_MESSAGE_BYTES
+            info = a.peer_caches[b.registry.config.agent_id]
+            assert info.digest_root == b._digest.root()
+            assert isinstance(info.bloom, PartitionedBloomFilter)
+            assert all(f"p{i}" in info.bloom for i in range(8000))
+            assert sum(f"absent-{i}" in info.bloom for i in range(1000)) < 50
+        finally:
+            await stop_nodes([a, b])
+
+    @pytest.mark.asyncio
+    async def test_missing_digest_partition_stays_queryable(self, tmp_path):
+        network, (a, b) = await make_nodes(tmp_path, 2)
+        try:
+            bloom = PartitionedBloomFilter.for_capacity(1000, 0.01, partitions=2)
+            for i in range(1000):
+                bloom.add(f"p{i}")
+            await a._handle_digest({
+                "source": b._serial, "root": "r1", "count": 1000, "part": 0, "parts": 2,
+                "bloom": base64.b64encode(bloom.partitions[0].to_bytes()).decode("ascii"),
+            })
+            info = a.peer_caches[b.registry.config.agent_id]
+            absent = [f"absent-{i}" for i in range(200)]
+            missing = [k for k in absent if PartitionedBloomFilter.partition_of(k, 2) == 1]
+            # Keys in the partition not received yet may still be queried
+            assert all(key in info.bloom for key in missing)
+            assert all(f"p{i}" in info.bloom for i in range(1000))
+            assert info.digest_root == "r1"
+        finally:
+            await stop_nodes([a, b])
+
+    @pytest.mark.asyncio
+    async def test_large_divergence_sync_stays_within_message_limit(self, tmp_path):
+        network, (a, b) = await make_nodes(tmp_path, 2)
+        try:
+            for i in range(2000):
+                a._local_pattern_cache[f"a{i}"] = create_test_pattern(f"a{i}")
+                b._local_pattern_cache[f"b{i}"] = create_test_pattern(f"b{i}")
+
+            await b._broadcast_digest()
+            await settle()
+            await a._anti_entropy_round()
+            for _ in range(10):
+                await settle()
+
+            assert network.max_payload <= SwarmAdaptiveMemory.MAX_MESSAGE_BYTES
+            assert a._digest.root() == b._digest.root()
+            assert len(a._local_pattern_cache) == 4000
+            assert a.metrics.anti_entropy_send_failures == 0
+        finally:
+            await stop_nodes([a, b])
+
+    @pytest.mark.asyncio
+    async def test_rejected_publish_is_not_counted_as_sent(self, swarm_memory, mock_bus, peer_ids):
+        mock_bus.publish = AsyncMock(return_value=False)
+        await swarm_memory._broadcast_digest()
+        await swarm_memory._send_sync(peer_ids[0], {"stage": "branches", "hashes": []})
+
+        assert swarm_memory.metrics.digest_bytes_sent == 0
+        assert swarm_memory.metrics.sync_bytes_sent == 0
+        assert swarm_memory.metrics.anti_entropy_send_failures == 2
+        assert not await swarm_memory._query_peer(peer_ids[0], "p1")
+        assert swarm_memory.metrics.peer_queries_sent == 0
+
+
+class TestRealMessageBus:
+    """Digests and Merkle sync through SwarmMessageBus and an in-process transport."""
+
+    def test_memory_topics_are_valid(self):
+        for topic in (
+            SwarmAdaptiveMemory.CACHE_REPLICATE_TOPIC,
+            SwarmAdaptiveMemory.CACHE_QUERY_TOPIC,
+            SwarmAdaptiveMemory.CACHE_RESPONSE_TOPIC,
+            SwarmAdaptiveMemory.DIGEST_TOPIC,
+            SwarmAdaptiveMemory.MERKLE_SYNC_TOPIC,
+        ):
+            assert SwarmTopic.is_valid_topic(topic)
+
+    @pytest.mark.asyncio
+    async def test_anti_entropy_converges_over_real_bus(self, tmp_path):
+        hub = InProcessHub()
+        agents = [AgentID.create("astra-v3.0", f"node-{i}") for i in range(2)]
+        buses, nodes = [], []
+        for agent in agents:
+            config = SwarmConfig(agent_id=agent, role=SatelliteRole.PRIMARY, constellation_id="astra-v3.0")
+            bus = SwarmMessageBus(config, SwarmSerializer(validate=False), latency_ms=0)
+            await bus.attach_transport(InProcessTransport(agent, hub))
+            registry = MagicMock()
+            registry.config.agent_id = agent
+            registry.get_alive_peers = MagicMock(return_value=list(agents))
+            node = SwarmAdaptiveMemory(
+                local_path=str(tmp_path / f"{agent.satellite_serial}.pkl"),
+                registry=registry,
+                bus=bus,
+                compressor=MagicMock(spec=StateCompressor),
+                config={"digest_interval": 3600},
+            )
+            buses.append(bus)
+            nodes.append(node)
+        a, b = nodes
+        try:
+            await a.start()
+            await b.start()
+            for i in range(8000):
+                b._local_pattern_cache[f"p{i}"] = create_test_pattern(f"p{i}")
+
+            await b._broadcast_digest()
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + 10
+            while a.peer_caches.get(agents[1]) is None or a.peer_caches[agents[1]].bloom is None:
+                assert loop.time() < deadline
+                await asyncio.sleep(0.01)
+            await a._anti_entropy_round()
+            while a._digest.root() != b._digest.root():
+                assert loop.time() < deadline
+                await asyncio.sleep(0.01)
+
+            assert len(a._local_pattern_cache) == 8000
+            assert "p4321" in a.peer_caches[agents[1]].bloom
+            for node in nodes:
+                assert node.metrics.anti_entropy_send_failures == 0
+            # Let in-flight ACK waits finish before the transports close
+            while any(bus.pending_acks for bus in buses):
+                assert loop.time() < deadline
+                await asyncio.sleep(0.01)
+            for bus in buses:
+                assert bus.metrics["failed"] == 0 and bus.metrics["lost"] == 0
+        finally:
+            await stop_nodes(nodes)
+            for bus in buses:
+                await bus.close()
+
+    @pytest.mark.asyncio
+    async def test_bus_messages_are_acked_and_decoded(self, swarm_memory, mock_bus, peer_ids):
+        swarm_memory.local_cache.save = MagicMock()
+        swarm_memory._handle_replication = AsyncMock()
+        await swarm_memory.start()
+        topic = SwarmAdaptiveMemory.CACHE_REPLICATE_TOPIC
+        try:
+            assert mock_bus.subscribe.call_count == 5
+            await swarm_memory._on_bus_message(
+                SwarmMessage(topic=topic, payload=b'{"source": "test-sat-002"}', sender=peer_ids[0])
+            )
+            swarm_memory._handle_replication.assert_awaited_once_with({"source": "test-sat-002"})
+            mock_bus.acknowledge.assert_awaited_once()
+
+            await swarm_memory._on_bus_message(
+                SwarmMessage(topic=topic, payload=b"not json", sender=peer_ids[0])
+            )
+            assert swarm_memory._handle_replication.await_count == 1
+        finally:
+            await swarm_memory.stop()
+        assert mock_bus.unsubscribe.call_count == 5
+
+    @pytest.mark.asyncio
+    async def test_replication_keeps_newer_local_copy(self, swarm_memory):
+        newer = create_test_pattern("p1")
+        newer.recurrence_count = 5
+        await swarm_memory.put("p1", newer)
+        older = create_test_pattern("p1")
+        older.last_seen = newer.last_seen - timedelta(minutes=1)
+
+        await swarm_memory._handle_replication(
+            {"source": "sat-002", "pattern_key": "p1", "pattern": older.to_dict()}
+        )
+
+        assert swarm_memory._local_pattern_cache["p1"] is newer
+
+    def test_local_cache_tracks_merkle_digest(self, swarm_memory):
+        empty = swarm_memory._digest.root()
+        swarm_memory._local_pattern_cache["p1"] = create_test_pattern("p1")
+        assert "p1" in swarm_memory._digest
+        swarm_memory._local_pattern_cache.pop("p1")
+        assert swarm_memory._digest.root() == empty
+
+    @pytest.mark.asyncio
+    async def test_stop_cancels_anti_entropy_loop(self, swarm_memory, mock_bus):
+        swarm_memory.local_cache.save = MagicMock()
+        await swarm_memory.start()
+        assert swarm_memory._replication_task is not None
+        assert swarm_memory._anti_entropy_task is not None
+        await settle()
+        topics = [call.args[0] for call in mock_bus.publish.call_args_list]
+        assert SwarmAdaptiveMemory.DIGEST_TOPIC in topics
+        await swarm_memory.stop()
+        assert swarm_memory._replication_task is None
+        assert swarm_memory._anti_entropy_task is None
+
+
+# Test: Byte-budgeted cache and batched replication
+
+def sized_memory(mock_registry, mock_bus, tmp_path, patterns: int, **config):
+    """SwarmAdaptiveMemory whose cache budget holds `patterns` test patterns."""
+    budget = create_test_pattern("pattern-000").size_bytes * patterns
+    return SwarmAdaptiveMemory(
+        local_path=str(tmp_path / "memory.pkl"),
+        registry=mock_registry,
+        bus=mock_bus,
+        compressor=MagicMock(spec=StateCompressor),
+        config={"max_cache_bytes": budget, **config},
+    )
+
+
+class TestBoundedCache:
+    """Test size accounting, LRU eviction and congestion-aware victims."""
+
+    def test_size_estimate_tracks_encoded_size(self):
+        import json
+        import random
+        rng = random.Random(1)
+        pattern = create_test_pattern("pattern-001")
+        pattern.anomaly_signature = [rng.random() for _ in range(32)]
+        encoded = len(json.dumps(pattern.to_dict()))
+        assert abs(pattern.size_bytes - encoded) / encoded < 0.1
+
+    @pytest.mark.asyncio
+    async def test_cache_stays_within_budget(self, mock_registry, mock_bus, tmp_path):
+        memory = sized_memory(mock_registry, mock_bus, tmp_path, 10)
+        for i in range(30):
+            await memory.put(f"pattern-{i:03d}", create_test_pattern(f"pattern-{i:03d}"))
+
+        assert len(memory._local_pattern_cache) == 10
+        assert memory._cache_bytes <= memory.max_cache_bytes
+        assert memory.metrics.local_cache_size_bytes == memory._cache_bytes
+        assert memory.metrics.eviction_count_local == 20
+        assert "pattern-000" not in memory._local_pattern_cache
+        assert "pattern-029" in memory._local_pattern_cache
+        # Evicted keys stay in the digest at the version we held
+        assert len(memory._digest) == 30
+        assert len(memory._evicted) == 20
+
+    @pytest.mark.asyncio
+    async def test_reads_refresh_lru_position(self, mock_registry, mock_bus, tmp_path):
+        memory = sized_memory(mock_registry, mock_bus, tmp_path, 3)
+        for i in range(3):
+            await memory.put(f"p{i}", create_test_pattern(f"p{i}"))
+        await memory.get("p0")
+        await memory.put("p3", create_test_pattern("p3"))
+
+        assert "p0" in memory._local_pattern_cache
+        assert "p1" not in memory._local_pattern_cache
+
+    @pytest.mark.asyncio
+    async def test_queued_patterns_are_not_evicted(self, mock_registry, mock_bus, tmp_path):
+        memory = sized_memory(mock_registry, mock_bus, tmp_path, 3)
+        await memory.put("stored", create_test_pattern("stored"))
+        memory._running = True
+        await memory.put("queued", create_test_pattern("queued"))
+        memory._running = False
+        for i in range(4):
+            await memory.put(f"p{i}", create_test_pattern(f"p{i}"))
+
+        assert "queued" in memory._local_pattern_cache
+        assert "stored" not in memory._local_pattern_cache
+
+    @pytest.mark.asyncio
+    async def test_congestion_evicts_least_recurrent(self, mock_registry, mock_bus, tmp_path):
+        memory = sized_memory(mock_registry, mock_bus, tmp_path, 3)
+        for i, count in enumerate((9, 1, 5)):
+            pattern = create_test_pattern(f"p{i}")
+            pattern.recurrence_count = count
+            await memory.put(f"p{i}", pattern)
+
+        memory._congested = True
+        await memory.put("p3", create_test_pattern("p3"))
+        assert "p1" not in memory._local_pattern_cache
+        assert "p0" in memory._local_pattern_cache
+
+        memory._congested = False
+        await memory.put("p4", create_test_pattern("p4"))
+        assert "p0" not in memory._local_pattern_cache
+
+    def test_clear_resets_accounting(self, swarm_memory):
+        swarm_memory._local_pattern_cache["p1"] = create_test_pattern("p1")
+        swarm_memory.reset_metrics()
+        assert swarm_memory._cache_bytes == 0
+        assert not swarm_memory._pattern_sizes
+
+
+class TestBatchedReplication:
+    """Test the replication queue, batching and bandwidth budget."""
+
+    @pytest.mark.asyncio
+    async def test_flush_batches_patterns_per_peer(self, mock_bus, mock_registry, peer_ids, tmp_path):
+        mock_registry.get_alive_peers.return_value = peer_ids[:3]
+        swarm_memory = sized_memory(
+            mock_registry, mock_bus, tmp_path, 100, replication_bytes_per_second=10**6
+        )
+        swarm_memory._running = True
+        for i in range(20):
+            await swarm_memory.put(f"p{i}", create_test_pattern(f"p{i}"))
+
+        await swarm_memory._flush_replication_queue()
+
+        batch = swarm_memory.REPLICATION_BATCH_BYTES // create_test_pattern("p0").size_bytes
+        messages = -(-20 // batch) * 3
+        assert mock_bus.publish.call_count == messages
+        assert swarm_memory.metrics.replication_messages == messages
+        assert swarm_memory.metrics.replication_count == 60
+        assert not swarm_memory._replication_queue
+        assert swarm_memory.metrics.replication_queue_bytes == 0
+        sent = set()
+        for call in mock_bus.publish.call_args_list:
+            assert call.kwargs["receiver"] in peer_ids[:3]
+            sent.update(call.args[1]["patterns"])
+        assert sent == {f"p{i}" for i in range(20)}
+        assert all(len(swarm_memory.peer_caches[p].pattern_ids) == 20 for p in peer_ids[:3])
+
+    @pytest.mark.asyncio
+    async def test_flush_respects_bandwidth_budget(self, mock_registry, mock_bus, tmp_path, peer_ids):
+        mock_registry.get_alive_peers.return_value = peer_ids[:1]
+        memory = sized_memory(
+            mock_registry, mock_bus, tmp_path, 100, replication_bytes_per_second=1,
+            peer_cache_size=1,
+        )
+        memory._running = True
+        for i in range(20):
+            await memory.put(f"p{i}", create_test_pattern(f"p{i}"))
+
+        await memory._flush_replication_queue()
+        await memory._flush_replication_queue()
+
+        assert mock_bus.publish.call_count == 1  # Only the initial burst
+        assert memory._replication_queue
+
+    @pytest.mark.asyncio
+    async def test_congestion_holds_queue(self, swarm_memory, mock_bus, mock_registry, peer_ids):
+        mock_registry.get_alive_peers.return_value = peer_ids[:3]
+        swarm_memory._running = True
+        await swarm_memory.put("p1", create_test_pattern("p1"))
+
+        with patch.object(swarm_memory, "_is_congested", return_value=True):
+            await swarm_memory._flush_replication_queue()
+
+        assert mock_bus.publish.call_count == 0
+        assert "p1" in swarm_memory._replication_queue
+
+    @pytest.mark.asyncio
+    async def test_queue_overflow_drops_oldest(self, swarm_memory):
+        swarm_memory.MAX_REPLICATION_QUEUE_BYTES = create_test_pattern("p0").size_bytes * 5
+        swarm_memory._running = True
+        for i in range(8):
+            await swarm_memory.put(f"p{i}", create_test_pattern(f"p{i}"))
+
+        assert list(swarm_memory._replication_queue) == [f"p{i}" for i in range(3, 8)]
+        assert swarm_memory.metrics.replication_dropped == 3
+
+    @pytest.mark.asyncio
+    async def test_evicted_keys_skipped_in_batch(self, swarm_memory, mock_bus, mock_registry, peer_ids):
+        mock_registry.get_alive_peers.return_value = peer_ids[:1]
+        swarm_memory._running = True
+        await swarm_memory.put("p1", create_test_pattern("p1"))
+        await swarm_memory.put("p2", create_test_pattern("p2"))
+        del swarm_memory._local_pattern_cache["p1"]
+
+        await swarm_memory._flush_replication_queue()
+
+        assert set(mock_bus.publish.call_args.args[1]["patterns"]) == {"p2"}
+        assert not swarm_memory._replication_queue
+
+    @pytest.mark.asyncio
+    async def test_handle_batched_replication(self, swarm_memory):
+        patterns = {f"p{i}": create_test_pattern(f"p{i}").to_dict() for i in range(5)}
+        await swarm_memory._handle_replication({"source": "sat-002", "patterns": patterns})
+        assert set(swarm_memory._local_pattern_cache) == set(patterns)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])
@@ -9,9 +9,11 @@ import pytest
 import asyncio
 import time
 from datetime import datetime, timedelta
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from core.circuit_breaker import (
+    AsyncCircuitBreaker,
+    SlidingWindowType,
     CircuitBreaker,
     CircuitBreakerMetrics,
     CircuitState,
@@ -353,3 +355,187 @@ class TestConcurrentCalls:
         # Circuit should eventually open
         # (may not be exactly at failure_threshold due to timing)
         assert breaker.metrics.failures_total == 10
+
+
+class TestAsyncCircuitBreaker:
+    """Test sliding-window AsyncCircuitBreaker"""
+
+    @pytest.fixture
+    def breaker(self):
+        return AsyncCircuitBreaker(
+            name="async_test",
+            window_size=10,
+            minimum_calls=4,
+            failure_rate_threshold=0.5,
+            recovery_timeout=0.1,
+            half_open_max_calls=2,
+        )
+
+    @pytest.mark.asyncio
+    async def test_no_lock_on_hot_path(self, breaker):
+        """Test that the async breaker holds no threading lock"""
+        assert not hasattr(breaker, "_lock")
+        assert await breaker.call(AsyncMock(return_value="ok")) == "ok"
+        assert breaker.get_metrics().successes_total == 1
+
+    @pytest.mark.asyncio
+    async def test_trips_on_failure_rate(self, breaker):
+        """Test that the failure rate, not consecutive count, trips the circuit"""
+        ok = AsyncMock(return_value="ok")
+        fail = AsyncMock(side_effect=Exception("boom"))
+
+        # Interleaved failures never form a consecutive run
+        for _ in range(2):
+            await breaker.call(ok)
+            with pytest.raises(Exception):
+                await breaker.call(fail)
+        assert breaker.is_open
+        assert breaker.get_metrics().trips_total == 1
+
+    @pytest.mark.asyncio
+    async def test_minimum_calls_respected(self, breaker):
+        """Test that rates are not evaluated below minimum_calls"""
+        fail = AsyncMock(side_effect=Exception("boom"))
+        for _ in range(3):
+            with pytest.raises(Exception):
+                await breaker.call(fail)
+        assert breaker.is_closed
+        assert breaker.failure_rate == 0.0
+
+    @pytest.mark.asyncio
+    async def test_count_window_slides(self):
+        """Test that old outcomes leave a count-based window"""
+        breaker = AsyncCircuitBreaker(name="slide", window_size=4, minimum_calls=4,
+                                      failure_rate_threshold=0.75)
+        fail = AsyncMock(side_effect=Exception("boom"))
+        ok = AsyncMock(return_value="ok")
+        for _ in range(2):
+            with pytest.raises(Exception):
+                await breaker.call(fail)
+        for _ in range(4):
+            await breaker.call(ok)
+        assert breaker.get_window_stats()["window_calls"] == 4
+        assert breaker.failure_rate == 0.0
+
+    @pytest.mark.asyncio
+    async def test_time_window_expires(self):
+        """Test that a time-based window drops expired buckets"""
+        breaker = AsyncCircuitBreaker(name="time", window_type=SlidingWindowType.TIME_BASED,
+                                      window_size=1, minimum_calls=1)
+        with pytest.raises(Exception):
+            await breaker.call(AsyncMock(side_effect=Exception("boom")))
+        assert breaker.is_open
+        breaker.reset()
+        await breaker.call(AsyncMock(return_value="ok"))
+        await asyncio.sleep(1.1)
+        assert breaker.get_window_stats()["window_calls"] == 0
+
+    @pytest.mark.asyncio
+    async def test_window_stats_do_not_mutate_window(self):
+        """Test that reading stats (e.g. from a metrics thread) leaves the window as is"""
+        breaker = AsyncCircuitBreaker(name="time", window_type=SlidingWindowType.TIME_BASED,
+                                      window_size=2, minimum_calls=1)
+        await breaker.call(AsyncMock(return_value="ok"))
+        window = breaker._window
+        before = (window.total, window._epoch, list(window._calls))
+        with patch("core.circuit_breaker.time.monotonic", return_value=time.monotonic() + 5):
+            assert breaker.get_window_stats()["window_calls"] == 0
+        assert (window.total, window._epoch, list(window._calls)) == before
+
+    @pytest.mark.asyncio
+    async def test_rates_match_window_stats_after_expiry(self):
+        """Test that rate properties see expired buckets the same way get_window_stats does"""
+        breaker = AsyncCircuitBreaker(name="time", window_type=SlidingWindowType.TIME_BASED,
+                                      window_size=2, minimum_calls=1, failure_rate_threshold=1.0)
+        await breaker.call(AsyncMock(return_value="ok"))
+        with pytest.raises(Exception):
+            await breaker.call(AsyncMock(side_effect=Exception("boom")))
+        assert breaker.failure_rate == breaker.get_window_stats()["failure_rate"] == 0.5
+        with patch("core.circuit_breaker.time.monotonic", return_value=time.monotonic() + 5):
+            stats = breaker.get_window_stats()
+            assert breaker.failure_rate == stats["failure_rate"] == 0.0
+            assert breaker.slow_call_rate == stats["slow_call_rate"] == 0.0
+
+    @pytest.mark.asyncio
+    async def test_stale_probe_after_reset_keeps_count(self, breaker):
+        """Test that a probe finishing after reset() cannot drive the probe count negative"""
+        breaker._transition_to_open(time.monotonic() - 1)
+        release = asyncio.Event()
+
+        async def probe():
+            await release.wait()
+            return "ok"
+
+        stale = asyncio.create_task(breaker.call(probe))
+        await asyncio.sleep(0)
+        assert breaker.get_window_stats()["half_open_in_flight"] == 1
+        breaker.reset()
+        release.set()
+        assert await stale == "ok"
+        assert breaker.get_window_stats()["half_open_in_flight"] == 0
+        assert breaker.is_closed
+
+    @pytest.mark.asyncio
+    async def test_trips_on_slow_call_rate(self):
+        """Test that slow successful calls can trip the circuit"""
+        breaker = AsyncCircuitBreaker(name="slow", minimum_calls=2,
+                                      slow_call_rate_threshold=1.0, slow_call_duration=0.01)
+
+        async def slow():
+            await asyncio.sleep(0.02)
+            return "late"
+
+        await breaker.call(slow)
+        await breaker.call(slow)
+        assert breaker.is_open
+
+    @pytest.mark.asyncio
+    async def test_half_open_limits_concurrent_probes(self, breaker):
+        """Test that only half_open_max_calls probes run concurrently"""
+        breaker._transition_to_open(time.monotonic() - 1)
+        release = asyncio.Event()
+
+        async def probe():
+            await release.wait()
+            return "ok"
+
+        probes = [asyncio.create_task(breaker.call(probe)) for _ in range(2)]
+        await asyncio.sleep(0)
+        assert breaker.is_half_open
+
+        with pytest.raises(CircuitOpenError) as exc_info:
+            await breaker.call(probe)
+        assert exc_info.value.state == CircuitState.HALF_OPEN
+
+        release.set()
+        assert await asyncio.gather(*probes) == ["ok", "ok"]
+        assert breaker.is_closed
+
+    @pytest.mark.asyncio
+    async def test_half_open_failure_reopens(self, breaker):
+        """Test that failing probes reopen the circuit"""
+        breaker._transition_to_open(time.monotonic() - 1)
+        fail = AsyncMock(side_effect=Exception("still down"))
+        for _ in range(2):
+            with pytest.raises(Exception):
+                await breaker.call(fail)
+        assert breaker.is_open
+        assert breaker.get_metrics().trips_total == 2
+
+    @pytest.mark.asyncio
+    async def test_fallback_when_open(self, breaker):
+        """Test fallback is used when the call is rejected"""
+        breaker._transition_to_open(time.monotonic())
+        fallback = AsyncMock(return_value="fallback")
+        assert await breaker.call(AsyncMock(), fallback=fallback) == "fallback"
+
+    def test_registry_exports_window_stats(self, breaker):
+        """Test registry exposes async breaker state"""
+        registry = CircuitBreakerRegistry()
+        registry.register(breaker)
+        registry.register(CircuitBreaker(name="sync"))
+
+        stats = registry.get_window_stats()
+        assert list(stats) == ["async_test"]
+        assert stats["async_test"]["state"] == "CLOSED"
+        assert registry.get_metrics()["async_test"].state == CircuitState.CLOSED
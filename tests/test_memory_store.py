@@ -112,6 +112,31 @@ class TestAdaptiveMemoryStore:
         assert len(self.memory.memory) == 1
         assert self.memory.memory[0].metadata['type'] == 'new_event'
     
+    def test_prune_timeout_leaves_store_unchanged(self):
+        """Test a prune that hits its deadline mid-scan does not drop events"""
+        from unittest.mock import patch
+        from core.timeout_handler import TimeoutError as CustomTimeoutError
+
+        old_time = datetime.now() - timedelta(hours=48)
+        for i in range(3):
+            self.memory.write(np.random.rand(384), {'severity': 0.5, 'type': f'old_{i}'},
+                              timestamp=old_time)
+
+        calls = []
+
+        def expire_on_second_check():
+            calls.append(1)
+            if len(calls) == 2:
+                raise CustomTimeoutError("prune", 60.0)
+
+        with patch("memory_engine.memory_store.check_deadline", side_effect=expire_on_second_check):
+            with pytest.raises(CustomTimeoutError):
+                self.memory.prune(max_age_hours=24, keep_critical=False)
+            with pytest.raises(CustomTimeoutError):
+                calls.clear()
+                self.memory.replay(old_time, datetime.now())
+        assert len(self.memory.memory) == 3
+
     def test_critical_events_not_pruned(self):
         """Test that critical events are never pruned"""
         # Add old critical event
@@ -0,0 +1,192 @@
+"""
+Tests for the bucketed sliding-window rate limit counters.
+
+Validates:
+- Limits are enforced within the window
+- Buckets expire as the window slides
+- Idle keys are evicted
+- Shared-memory counters are visible across attachments
+- A worker exiting does not remove the shared segment
+- APIKeyManager.check_rate_limit uses the counter
+"""
+
+import subprocess
+import sys
+import time
+import uuid
+from pathlib import Path
+
+import pytest
+
+from core.rate_limiter import SlidingWindowCounter, SharedMemorySlidingWindowCounter
+
+
+class TestSlidingWindowCounter:
+    """Test in-process sliding window counter"""
+
+    def test_limit_enforced_within_window(self):
+        counter = SlidingWindowCounter(window_seconds=60, num_buckets=6)
+        assert all(counter.hit("key", 5, now=100.0) for _ in range(5))
+        assert counter.hit("key", 5, now=100.0) is False
+        assert counter.count("key", now=100.0) == 5
+
+    def test_buckets_slide_out_of_window(self):
+        counter = SlidingWindowCounter(window_seconds=60, num_buckets=6)
+        for _ in range(3):
+            counter.hit("key", 10, now=0.0)
+        for _ in range(2):
+            counter.hit("key", 10, now=30.0)
+        assert counter.count("key", now=59.0) == 5
+        # First bucket (0-10s) leaves the window once we reach 60s
+        assert counter.count("key", now=60.0) == 2
+        assert counter.count("key", now=200.0) == 0
+
+    def test_keys_are_independent(self):
+        counter = SlidingWindowCounter(window_seconds=60, num_buckets=6)
+        assert counter.hit("a", 1, now=0.0)
+        assert counter.hit("a", 1, now=0.0) is False
+        assert counter.hit("b", 1, now=0.0)
+
+    def test_idle_keys_evicted(self):
+        counter = SlidingWindowCounter(window_seconds=60, num_buckets=6)
+        counter.hit("idle", 10, now=0.0)
+        counter.hit("active", 10, now=120.0)
+        assert len(counter) == 1
+        assert counter.count("idle", now=120.0) == 0
+
+    def test_max_keys_bound(self):
+        counter = SlidingWindowCounter(window_seconds=60, num_buckets=6, max_keys=10)
+        for i in range(50):
+            counter.hit(f"key-{i}", 10, now=0.0)
+        assert len(counter) == 10
+
+    def test_reset(self):
+        counter = SlidingWindowCounter(window_seconds=60, num_buckets=6)
+        counter.hit("key", 1, now=0.0)
+        counter.reset("key")
+        assert counter.hit("key", 1, now=0.0)
+
+    def test_invalid_configuration(self):
+        with pytest.raises(ValueError):
+            SlidingWindowCounter(window_seconds=0)
+
+
+class TestSharedMemorySlidingWindowCounter:
+    """Test shared-memory sliding window counter"""
+
+    @pytest.fixture
+    def shm_name(self, tmp_path):
+        name = f"astraguard_test_{uuid.uuid4().hex[:8]}"
+        yield name, str(tmp_path / "rate.lock")
+
+    def test_limit_shared_between_attachments(self, shm_name):
+        name, lock_path = shm_name
+        first = SharedMemorySlidingWindowCounter(name=name, window_seconds=60, num_buckets=6,
+                                                 max_keys=64, lock_path=lock_path)
+        second = SharedMemorySlidingWindowCounter(name=name, window_seconds=60, num_buckets=6,
+                                                  max_keys=64, lock_path=lock_path)
+        try:
+            assert first.hit("key", 3, now=0.0)
+            assert second.hit("key", 3, now=0.0)
+            assert first.hit("key", 3, now=0.0)
+            assert second.hit("key", 3, now=0.0) is False
+            assert second.count("key", now=0.0) == 3
+            assert first.count("key", now=60.0) == 0
+        finally:
+            second.close()
+            first.close(unlink=True)
+
+    def test_segment_survives_attached_worker_exit(self, shm_name):
+        name, lock_path = shm_name
+        owner = SharedMemorySlidingWindowCounter(name=name, window_seconds=60, num_buckets=6,
+                                                 max_keys=64, lock_path=lock_path)
+        worker = (
+            "from core.rate_limiter import SharedMemorySlidingWindowCounter\n"
+            f"c = SharedMemorySlidingWindowCounter(name={name!r}, window_seconds=60, "
+            f"num_buckets=6, max_keys=64, lock_path={lock_path!r})\n"
+            "c.hit('key', 5, now=0.0)\n"
+            "c.close()\n"
+        )
+        try:
+            subprocess.run([sys.executable, "-c", worker], check=True,
+                           cwd=Path(__file__).resolve().parent.parent)
+            time.sleep(0.5)  # The worker's resource_tracker cleans up after it exits
+            late = SharedMemorySlidingWindowCounter(name=name, window_seconds=60, num_buckets=6,
+                                                    max_keys=64, lock_path=lock_path)
+            assert late._owner is False
+            assert late.count("key", now=0.0) == 1
+            late.close()
+        finally:
+            owner.close(unlink=True)
+
+    def test_segment_survives_creator_exit(self, shm_name):
+        name, lock_path = shm_name
+        creator = (
+            "from core.rate_limiter import SharedMemorySlidingWindowCounter\n"
+            f"c = SharedMemorySlidingWindowCounter(name={name!r}, window_seconds=60, "
+            f"num_buckets=6, max_keys=64, lock_path={lock_path!r})\n"
+            "assert c._owner\n"
+            "c.hit('key', 5, now=0.0)\n"
+            "c.close()\n"
+        )
+        result = subprocess.run([sys.executable, "-c", creator], check=True, capture_output=True,
+                                text=True, cwd=Path(__file__).resolve().parent.parent)
+        time.sleep(0.5)  # The creator's resource_tracker cleans up after it exits
+        late = SharedMemorySlidingWindowCounter(name=name, window_seconds=60, num_buckets=6,
+                                                max_keys=64, lock_path=lock_path)
+        try:
+            assert "leaked" not in result.stderr
+            assert late._owner is False
+            assert late.count("key", now=0.0) == 1
+        finally:
+            late.close(unlink=True)
+
+    def test_close_unlink_tolerates_missing_segment(self, shm_name):
+        name, lock_path = shm_name
+        first = SharedMemorySlidingWindowCounter(name=name, window_seconds=60, num_buckets=6,
+                                                 max_keys=8, lock_path=lock_path)
+        second = SharedMemorySlidingWindowCounter(name=name, window_seconds=60, num_buckets=6,
+                                                  max_keys=8, lock_path=lock_path)
+        second.close(unlink=True)
+        first.close(unlink=True)
+
+    def test_expired_slots_reused(self, shm_name):
+        name, lock_path = shm_name
+        counter = SharedMemorySlidingWindowCounter(name=name, window_seconds=60, num_buckets=6,
+                                                   max_keys=4, lock_path=lock_path)
+        try:
+            for i in range(4):
+                assert counter.hit(f"old-{i}", 1, now=0.0)
+            # All slots expire after a full window and can hold new keys
+            for i in range(4):
+                assert counter.hit(f"new-{i}", 1, now=120.0)
+                assert counter.hit(f"new-{i}", 1, now=120.0) is False
+        finally:
+            counter.close(unlink=True)
+
+    def test_reset(self, shm_name):
+        name, lock_path = shm_name
+        counter = SharedMemorySlidingWindowCounter(name=name, window_seconds=60, num_buckets=6,
+                                                   max_keys=8, lock_path=lock_path)
+        try:
+            counter.hit("key", 1, now=0.0)
+            counter.reset("key")
+            assert counter.hit("key", 1, now=0.0)
+        finally:
+            counter.close(unlink=True)
+
+
+class TestAPIKeyManagerRateLimit:
+    """Test APIKeyManager integration"""
+
+    def test_check_rate_limit(self, tmp_path):
+        from core.auth import APIKeyManager
+
+        manager = APIKeyManager(keys_file=str(tmp_path / "api_keys.json"))
+        api_key = next(iter(manager.api_keys))
+        manager.api_keys[api_key].rate_limit = 2
+
+        manager.check_rate_limit(api_key)
+        manager.check_rate_limit(api_key)
+        with pytest.raises(ValueError, match="Rate limit exceeded"):
+            manager.check_rate_limit(api_key)
@@ -6,6 +6,7 @@ Validates:
 - Threshold detection and alerts
 - Warning/critical state transitions
 - Historical metrics tracking
+- Per-operation resource accounting
 """
 
 import pytest
@@ -17,7 +18,10 @@ from core.resource_monitor import (
     ResourceMetrics,
     ResourceThresholds,
     ResourceStatus,
+    OperationResourceAccounting,
+    OperationStats,
     get_resource_monitor,
+    monitor_operation_resources,
 )
 
 
@@ -299,3 +303,119 @@ class TestResourceMonitorSingleton:
         del os.environ['RESOURCE_CPU_WARNING']
         del os.environ['RESOURCE_MEMORY_WARNING']
         rm._resource_monitor = None
+
+
+class TestOperationAccounting:
+    """Test per-operation resource accounting"""
+
+    def test_stats_record_histogram(self):
+        """Test that calls land in latency buckets"""
+        stats = OperationStats("op")
+        stats.record(wall_ns=5_000, cpu_ns=None, failed=False)
+        stats.record(wall_ns=2_000_000, cpu_ns=1_000, failed=True, memory_delta=1024)
+
+        data = stats.to_dict()
+        assert data['calls'] == 2
+        assert data['errors'] == 1
+        assert data['sampled_calls'] == 1
+        assert data['peak_memory_delta_bytes'] == 1024
+        assert data['histogram']['10'] == 1
+        assert data['histogram']['5000'] == 1
+        assert data['p50_us'] == 10.0
+        assert data['p99_us'] == 5000.0
+
+    def test_decorator_records_calls(self):
+        """Test that decorated calls are accounted without psutil snapshots"""
+        from core import resource_monitor as rm
+
+        accounting = OperationResourceAccounting(sample_rate=1.0)
+        with patch.object(rm, 'get_operation_accounting', return_value=accounting), \
+                patch('psutil.cpu_percent') as mock_cpu:
+
+            @monitor_operation_resources(operation_name="accounted_op")
+            def work(n):
+                return sum(range(n))
+
+            @monitor_operation_resources(operation_name="failing_op")
+            def fail():
+                raise ValueError("boom")
+
+            assert work(1000) == sum(range(1000))
+            with pytest.raises(ValueError):
+                fail()
+
+            mock_cpu.assert_not_called()
+
+        snapshot = accounting.snapshot()
+        assert snapshot['accounted_op']['calls'] == 1
+        assert snapshot['accounted_op']['sampled_calls'] == 1
+        assert snapshot['failing_op']['errors'] == 1
+
+    def test_sampling_disabled(self):
+        """Test that sample_rate=0 never measures memory"""
+        accounting = OperationResourceAccounting(sample_rate=0.0)
+        assert not any(accounting.should_sample() for _ in range(100))
+
+    def test_sampling_rate_one_always_samples(self):
+        """Test that the sampling countdown honours sample_rate=1"""
+        accounting = OperationResourceAccounting(sample_rate=1.0)
+        assert all(accounting.should_sample() for _ in range(100))
+        accounting.sample_rate = 0.0
+        assert not any(accounting.should_sample() for _ in range(100))
+
+    def test_unsampled_calls_are_folded(self):
+        """Test that lock-free queued calls reach the aggregates"""
+        stats = OperationStats("op")
+        for _ in range(OperationStats.FOLD_BATCH + 3):
+            stats.add(5_000, False)
+        stats.add(2_000_000, True)
+        data = stats.to_dict()
+        assert data['calls'] == OperationStats.FOLD_BATCH + 4
+        assert data['errors'] == 1
+        assert data['histogram']['10'] == OperationStats.FOLD_BATCH + 3
+        assert data['histogram']['5000'] == 1
+
+    def test_reset_keeps_decorated_stats_live(self):
+        """Test that calls recorded after reset() are still reported"""
+        from core import resource_monitor as rm
+
+        accounting = OperationResourceAccounting(sample_rate=0.0)
+        with patch.object(rm, 'get_operation_accounting', return_value=accounting):
+            @monitor_operation_resources(operation_name="reset_op")
+            def work():
+                return 1
+
+        work()
+        accounting.reset()
+        assert accounting.snapshot()['reset_op']['calls'] == 0
+        work()
+        work()
+        assert accounting.snapshot()['reset_op']['calls'] == 2
+
+    def test_no_memory_delta_without_tracemalloc(self):
+        """Test that sampled calls skip the memory delta unless tracemalloc traces"""
+        import tracemalloc
+        from core import resource_monitor as rm
+
+        if tracemalloc.is_tracing():
+            pytest.skip("tracemalloc already tracing")
+        accounting = OperationResourceAccounting(sample_rate=1.0)
+        with patch.object(rm, 'get_operation_accounting', return_value=accounting):
+            @monitor_operation_resources(operation_name="memory_op")
+            def work():
+                return [0] * 1000
+
+        work()
+        assert rm._memory_usage_bytes() is None
+        data = accounting.snapshot()['memory_op']
+        assert data['sampled_calls'] == 1
+        assert data['peak_memory_delta_bytes'] == 0
+
+    def test_periodic_export(self):
+        """Test that export happens once the interval elapses"""
+        accounting = OperationResourceAccounting(export_interval=0.0)
+        accounting.stats_for("exported_op").record(1_000, 1_000, False)
+        with patch.object(accounting, 'export') as mock_export:
+            accounting.maybe_export(accounting._next_export_ns)
+            mock_export.assert_called_once()
+        assert accounting.export()['exported_op']['calls'] == 1
@@ -12,6 +12,8 @@ from core.retry import (
     RETRY_ATTEMPTS_TOTAL,
     RETRY_EXHAUSTIONS_TOTAL,
     RETRY_DELAYS_SECONDS,
+    RetryBudget,
+    get_retry_budget,
 )
 
 
@@ -446,6 +448,122 @@ async def test_retry_preserves_function_metadata():
     assert decorated.__doc__ == "My docstring"
 
 
+# ============================================================================
+# RETRY BUDGET & HEDGING
+# ============================================================================
+
+def test_retry_budget_spends_and_refills_from_successes():
+    """Test budget tokens are spent by retries and deposited by successes."""
+    budget = RetryBudget("test", ratio=0.5, min_per_second=0.0, max_tokens=1.0)
+    
+    assert budget.try_spend()
+    assert not budget.try_spend()
+    assert budget.exhausted_total == 1
+    
+    budget.record_success()
+    budget.record_success()
+    assert budget.try_spend()
+
+
+def test_get_retry_budget_is_shared_per_operation():
+    """Test budgets are shared by operation name."""
+    assert get_retry_budget("shared_op") is get_retry_budget("shared_op")
+    assert get_retry_budget("shared_op") is not get_retry_budget("other_op")
+
+
+@pytest.mark.asyncio
+async def test_retry_stops_when_budget_exhausted():
+    """Test that an empty budget turns failures into a single attempt."""
+    budget = RetryBudget("exhausted", ratio=0.0, min_per_second=0.0, max_tokens=1.0)
+    func = AsyncMock(side_effect=ConnectionError("down"))
+    decorated = Retry(max_attempts=5, base_delay=0.001, budget=budget)(func)
+    
+    with pytest.raises(ConnectionError):
+        await decorated()
+    # One retry from the initial token, then the budget is empty
+    assert func.call_count == 2
+    
+    func.reset_mock()
+    with pytest.raises(ConnectionError):
+        await decorated()
+    assert func.call_count == 1
+
+
+def test_sync_retry_respects_budget():
+    """Test sync retries also draw from the budget."""
+    budget = RetryBudget("sync", ratio=0.0, min_per_second=0.0, max_tokens=0.0)
+    func = Mock(side_effect=TimeoutError())
+    decorated = Retry(max_attempts=3, base_delay=0.001, budget=budget)(func)
+    
+    with pytest.raises(TimeoutError):
+        decorated()
+    assert func.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_hedged_call_takes_faster_attempt():
+    """Test that a slow primary is beaten by the hedge."""
+    calls = 0
+    
+    async def sometimes_slow():
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await asyncio.sleep(1.0)
+            return "primary"
+        return "hedge"
+    
+    decorated = Retry(hedge=True, hedge_delay=0.05)(sometimes_slow)
+    start = time.monotonic()
+    result = await decorated()
+    
+    assert result == "hedge"
+    assert time.monotonic() - start < 0.5
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_hedge_not_launched_for_fast_calls():
+    """Test that calls finishing before the hedge delay run once."""
+    func = AsyncMock(return_value="fast")
+    decorated = Retry(hedge=True, hedge_delay=0.5)(func)
+    
+    assert await decorated() == "fast"
+    func.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_hedge_waits_for_latency_samples():
+    """Test that p95 hedging only starts after enough samples."""
+    retry = Retry(hedge=True, hedge_min_samples=5)
+    assert retry._current_hedge_delay() is None
+    
+    func = AsyncMock(return_value="ok")
+    decorated = retry(func)
+    for _ in range(5):
+        await decorated()
+    
+    assert retry._current_hedge_delay() is not None
+
+
+@pytest.mark.asyncio
+async def test_hedge_falls_back_when_one_attempt_fails():
+    """Test that a failed primary does not fail the call if the hedge succeeds."""
+    calls = 0
+    
+    async def flaky():
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await asyncio.sleep(0.1)
+            raise ValueError("primary failed")
+        await asyncio.sleep(0.2)
+        return "hedge"
+    
+    decorated = Retry(hedge=True, hedge_delay=0.01)(flaky)
+    assert await decorated() == "hedge"
+
+
 # ============================================================================
 # FIXTURES & HELPERS
 # ============================================================================
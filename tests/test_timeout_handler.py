@@ -16,7 +16,10 @@ from core.timeout_handler import (
     async_timeout,
     TimeoutContext,
     TimeoutError as CustomTimeoutError,
+    TimeoutMode,
+    check_deadline,
     get_timeout_config,
+    get_timeout_metrics,
 )
 
 
@@ -150,6 +153,134 @@ class TestTimeoutContext:
             pass
 
 
+class TestTimeoutModes:
+    """Test pool, thread, inline and cooperative enforcement modes"""
+
+    def test_pool_mode_reuses_workers(self):
+        """Pool mode should not create a thread per call"""
+        import threading
+
+        @with_timeout(seconds=1.0, mode=TimeoutMode.POOL)
+        def current_thread_name():
+            return threading.current_thread().name
+
+        names = {current_thread_name() for _ in range(50)}
+        assert all(name.startswith("astraguard-timeout") for name in names)
+        assert len(names) <= 8
+
+    def test_pool_mode_counts_abandoned_workers(self):
+        """Timed-out pool calls are reported until they finish"""
+        before = get_timeout_metrics()["abandoned_total"].get("pool", 0)
+
+        @with_timeout(seconds=0.1, mode=TimeoutMode.POOL)
+        def slow_operation():
+            time.sleep(0.4)
+
+        with pytest.raises(CustomTimeoutError):
+            slow_operation()
+
+        metrics = get_timeout_metrics()
+        assert metrics["abandoned_total"]["pool"] == before + 1
+        time.sleep(0.5)
+        assert get_timeout_metrics()["abandoned_active"]["pool"] == 0
+
+    def test_nested_pool_calls_do_not_deadlock(self):
+        """A pooled function calling another pooled function runs it inline"""
+        @with_timeout(seconds=1.0, mode=TimeoutMode.POOL)
+        def inner():
+            return "inner"
+
+        @with_timeout(seconds=1.0, mode=TimeoutMode.POOL)
+        def outer():
+            return inner()
+
+        assert outer() == "inner"
+
+    def test_thread_mode(self):
+        """Per-call thread mode still enforces the timeout"""
+        @with_timeout(seconds=0.2, mode=TimeoutMode.THREAD)
+        def slow_operation():
+            time.sleep(1.0)
+
+        with pytest.raises(CustomTimeoutError):
+            slow_operation()
+
+    def test_default_mode_is_thread(self):
+        """Without an explicit mode, a hung call cannot tie up a pool worker"""
+        before = get_timeout_metrics()["abandoned_total"]
+
+        @with_timeout(seconds=0.1)
+        def slow_operation():
+            time.sleep(0.3)
+
+        with pytest.raises(CustomTimeoutError):
+            slow_operation()
+
+        after = get_timeout_metrics()["abandoned_total"]
+        assert after["thread"] == before.get("thread", 0) + 1
+        assert after.get("pool", 0) == before.get("pool", 0)
+
+    def test_inline_mode_returns_function_unchanged(self):
+        """Inline mode adds no wrapper at all"""
+        def fast_operation():
+            return 42
+
+        assert with_timeout(seconds=1.0, mode=TimeoutMode.INLINE)(fast_operation) is fast_operation
+
+    def test_cooperative_mode_checks_deadline(self):
+        """Cooperative mode raises at the next check_deadline() call"""
+        iterations = 0
+
+        @with_timeout(seconds=0.2, mode=TimeoutMode.COOPERATIVE)
+        def scoring_loop():
+            nonlocal iterations
+            while True:
+                check_deadline()
+                iterations += 1
+                time.sleep(0.01)
+
+        with pytest.raises(CustomTimeoutError):
+            scoring_loop()
+        assert iterations > 0
+
+    def test_cooperative_mode_within_deadline(self):
+        """Cooperative mode returns normally inside the deadline"""
+        @with_timeout(seconds=1.0, mode=TimeoutMode.COOPERATIVE)
+        def fast_loop():
+            for _ in range(100):
+                check_deadline()
+            return "done"
+
+        assert fast_loop() == "done"
+
+    def test_cooperative_mode_returns_completed_work(self):
+        """Cooperative mode only raises from check_deadline(), not on return"""
+        @with_timeout(seconds=0.05, mode=TimeoutMode.COOPERATIVE)
+        def finishes_late():
+            check_deadline()
+            time.sleep(0.1)
+            return "done"
+
+        assert finishes_late() == "done"
+
+    def test_pool_worker_sees_enclosing_deadline(self):
+        """check_deadline() in a pool worker honours the caller's deadline"""
+        @with_timeout(seconds=5.0, mode=TimeoutMode.POOL)
+        def pooled():
+            time.sleep(0.1)
+            check_deadline()
+            return "done"
+
+        with TimeoutContext(seconds=0.05, operation="outer", raise_on_exit=False):
+            with pytest.raises(CustomTimeoutError) as exc_info:
+                pooled()
+        assert exc_info.value.operation == "outer"
+
+    def test_check_deadline_outside_context(self):
+        """check_deadline() is a no-op without an active context"""
+        check_deadline()
+
+
 class TestTimeoutConfig:
     """Test timeout configuration loading"""
     